@@ -1,10 +1,17 @@
 """GitStory CLI application with dual output modes (rich/JSON)."""
 
 from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 
+from gitstory.cli.output import OutputFormatter
+
+if TYPE_CHECKING:
+    from gitstory.core.workflow import Workflow
+
 # Initialize typer app with rich markup support
 app = typer.Typer(
     name="gitstory",
@@ -61,9 +68,45 @@ def main(
     ctx.obj = {"json_mode": json_mode}
 
 
+def load_workflow_or_exit(output: OutputFormatter, path: Path | str) -> "Workflow | None":
+    """Load a workflow for a command, exiting with code 2 if the file is invalid.
+
+    The workflow models (and pydantic) are imported here rather than at
+    module level, so that invocations that never load a workflow (e.g.,
+    --help) do not pay for them.
+
+    Returns:
+        Loaded Workflow (None after reporting an error)
+    """
+    import yaml
+    from pydantic import ValidationError
+
+    from gitstory.core.workflow import load_workflow
+
+    try:
+        return load_workflow(path)
+    except (yaml.YAMLError, ValidationError) as e:
+        output.error(f"Invalid workflow {path}: {e}", exit_code=2)
+        return None
+
+
 # Import all commands to register them with the app
 # These imports must come after app is defined
-from gitstory.cli import execute, init, plan, review, test_plugin, validate  # noqa: E402, F401
+from gitstory.cli import (  # noqa: E402, F401
+    events,
+    execute,
+    export,
+    ids,
+    import_tickets,
+    init,
+    next_task,
+    parse_ticket,
+    plan,
+    review,
+    stats,
+    test_plugin,
+    validate,
+)
 
 # Export app for use in __main__.py
-__all__ = ["app"]
+__all__ = ["app", "load_workflow_or_exit"]
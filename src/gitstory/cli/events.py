@@ -0,0 +1,134 @@
+"""Events command for GitStory CLI.
+
+Detects branches created, deleted and merged since the last run from a
+cursor of git refs, and takes the workflow transitions declared `on:` those
+events for the tickets named in the branches.
+"""
+
+from pathlib import Path
+
+import typer
+
+from gitstory.cli import app, load_workflow_or_exit
+from gitstory.cli.output import OutputFormatter
+from gitstory.core.events import (
+    DEFAULT_CURSOR_PATH,
+    DEFAULT_EVENT_TARGET,
+    EventCursor,
+    deliver_events,
+    detect_ref_events,
+)
+from gitstory.core.execute import ExecutionError
+from gitstory.core.git import GitError, commit_paths
+from gitstory.core.snapshot import load_index
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH
+from gitstory.models import DEFAULT_TICKETS_ROOT
+
+
+@app.command()
+def events(
+    ctx: typer.Context,
+    target: str = typer.Option(
+        DEFAULT_EVENT_TARGET, "--target", help="Branch merges are detected into"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show events without taking transitions or moving the cursor"
+    ),
+    reset: bool = typer.Option(False, "--reset", help="Start a new baseline (no events)"),
+    commit: bool = typer.Option(True, "--commit/--no-commit", help="Commit the changed files"),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+    workflow_path: str = typer.Option(
+        DEFAULT_WORKFLOW_PATH, "--workflow", help="Workflow definition file"
+    ),
+) -> None:
+    """Detect branch events since the last run and feed them to the workflow.
+
+    Compares `git for-each-ref` with the cursor in .gitstory/cache/events.json
+    and reports branch_created, branch_deleted and branch_merged (into
+    --target) events. Only refs that changed are examined: a target that
+    moved forward costs one `git rev-list <old>..<new>`, not a history scan.
+    The first run records a baseline and reports nothing.
+
+    Each event naming a ticket in its branch (e.g., gitstory/STORY-0001.2.3)
+    takes the transition declared `on: <event type>` from the ticket's state,
+    guards included; a ticket whose guard fails is skipped, not retried. The
+    cursor moves once the transitions are written.
+
+    Exit codes: 0 success, 2 git error, missing tickets directory, invalid
+    workflow or write failure (the cursor is not moved, so the events are
+    seen again).
+
+    Example:
+        gitstory events
+        gitstory --json events --target develop --dry-run
+    """
+    json_mode = ctx.obj.get("json_mode", False)
+    output = OutputFormatter(json_mode=json_mode)
+
+    tickets_root = Path(path)
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+    workflow = load_workflow_or_exit(output, workflow_path)
+    if workflow is None:
+        return
+    cursor = None if reset else EventCursor.read(DEFAULT_CURSOR_PATH)
+    try:
+        found, cursor = detect_ref_events(Path("."), cursor, target)
+    except GitError as e:
+        output.error(str(e), exit_code=2)
+        return
+
+    data = {
+        "target": target,
+        "events": [e.to_dict() for e in found],
+        "commits_scanned": cursor.scanned,
+        "outcomes": [],
+        "commit": None,
+    }
+    if dry_run:
+        if not json_mode and found:
+            output.table(
+                ["Event", "Branch", "Ticket"],
+                [[e.type, e.branch, e.ticket_id or ""] for e in found],
+            )
+        output.success(
+            f"Dry run: {len(found)} event(s) since the last run",
+            data=data if json_mode else None,
+        )
+        return
+
+    try:
+        outcomes, written = deliver_events(
+            found, tickets_root, workflow, lambda: load_index(tickets_root)
+        )
+        if written and commit:
+            ids = sorted({o["ticket_id"] for o in outcomes if o["status"] == "applied"})
+            data["commit"] = commit_paths(
+                written, f"chore(tickets): branch events for {', '.join(ids)}\n"
+            )
+    except (ExecutionError, GitError, OSError) as e:
+        output.error(f"Events not handled, cursor kept: {e}", exit_code=2)
+        return
+    cursor.write(DEFAULT_CURSOR_PATH)
+
+    data["outcomes"] = outcomes
+    if not json_mode and outcomes:
+        output.table(
+            ["Event", "Branch", "Ticket", "Transition", "Status"],
+            [
+                [
+                    o["type"],
+                    o["branch"],
+                    o["ticket_id"] or "",
+                    o["transition"] or "",
+                    f"{o['status']}: {o['message']}" if o["message"] else o["status"],
+                ]
+                for o in outcomes
+            ],
+        )
+    applied = sum(o["status"] == "applied" for o in outcomes)
+    output.success(
+        f"{len(found)} event(s), {applied} transition(s) taken",
+        data=data if json_mode else None,
+    )
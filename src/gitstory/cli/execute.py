@@ -1,42 +1,340 @@
 """Execute command for GitStory CLI.
 
-This command will eventually handle:
-- Ticket state transitions (Not Started → In Progress → Complete)
-- Git operations (branch creation, commits, PR creation)
-- Workflow validation (check prerequisites, run plugins)
-- Automated task execution
+Handles:
+- Ticket state transitions for one or many tickets (IDs, globs, NDJSON on stdin)
+- Guard evaluation against the whole batch before anything is written
+- One batched write of every touched ticket file and a single commit
+- Re-planning when a concurrent run changed the files first
+- Parallel runs in a pool of git worktrees, one branch per ticket (--worktrees)
 """
 
+import json
+import os
+import sys
+from dataclasses import replace
+from pathlib import Path
+
 import typer
 
-from gitstory.cli import app
+from gitstory.cli import app, load_workflow_or_exit
 from gitstory.cli.output import OutputFormatter
+from gitstory.core.execute import (
+    ExecutionError,
+    ExecutionPlan,
+    ExecutionRequest,
+    apply_with_retry,
+    expand_requests,
+    plan_execution,
+)
+from gitstory.core.git import GitError, commit_paths
+from gitstory.core.graph import TicketGraph
+from gitstory.core.history import load_history
+from gitstory.core.index import TicketIndex
+from gitstory.core.ready import ReadyQueue, creation_times
+from gitstory.core.snapshot import load_index
+from gitstory.core.tickets import read_header
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH, Workflow
+from gitstory.core.worktrees import WORKTREE_POOL_SIZE, WorktreePool, run_in_worktrees
+from gitstory.models import DEFAULT_TICKETS_ROOT
+
+# Commit subjects list at most this many ticket IDs
+COMMIT_SUBJECT_IDS = 3
 
 
 @app.command()
 def execute(
     ctx: typer.Context,
-    ticket_id: str = typer.Argument(..., help="Ticket ID to execute (e.g., TASK-0001.2.4.3)"),
+    ticket_ids: list[str] = typer.Argument(
+        ..., help="Ticket IDs or globs (e.g., TASK-0001.2.4.*), or - to read NDJSON from stdin"
+    ),
+    transition: str = typer.Option(
+        None, "--transition", "-t", help="Transition to take (e.g., complete_work)"
+    ),
+    to_state: str = typer.Option(None, "--to", help="Target state (e.g., done)"),
+    actual_hours: str = typer.Option(
+        None, "--actual-hours", help="Record **Actual Hours** on the transitioned tickets"
+    ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show actions without executing"),
+    commit: bool = typer.Option(True, "--commit/--no-commit", help="Commit the changed files"),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+    workflow_path: str = typer.Option(
+        DEFAULT_WORKFLOW_PATH, "--workflow", help="workflow.yaml defining the transitions"
+    ),
+    worktrees: bool = typer.Option(
+        False, "--worktrees", help="Run each ticket in parallel in its own worktree and branch"
+    ),
+    jobs: int = typer.Option(
+        WORKTREE_POOL_SIZE,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worktrees kept and tickets run at once (with --worktrees)",
+    ),
+    run: str = typer.Option(
+        None, "--run", help="Shell command run in each worktree before its transition"
+    ),
+    base: str = typer.Option("HEAD", "--base", help="Start point of new ticket branches"),
 ) -> None:
-    """Execute ticket workflows: state transitions, git operations, validations.
+    """Execute ticket state transitions as one atomic batch.
+
+    Without --transition/--to, each ticket takes the first transition leaving
+    its current state (e.g., Not Started -> In Progress). All guards are
+    evaluated against the batch's planned states first; if any request is
+    invalid or any guard fails, no file is changed. Otherwise every touched
+    ticket file (status and parent progress) is written once and the batch
+    is committed as a single commit. The ready queue (see `gitstory next`)
+    is then updated with the written tickets only, and the output lists the
+    tasks the batch unblocked and the next task to work on.
+
+    Runs may overlap: if another run changes a ticket file this batch was
+    planned from before it is written, the batch is planned again from the
+    fresh files (up to 5 times) instead of overwriting that change.
 
-    Handles ticket lifecycle:
-    - Create branch for ticket
-    - Update ticket status
-    - Run workflow plugins
-    - Execute state transitions
-    - Create commits and PRs
+    NDJSON lines on stdin are {"ticket_id": ..., "transition": ..., "to": ...,
+    "actual_hours": ...} objects; missing keys default to the command line options.
+
+    With --worktrees, each ticket runs separately on its own branch
+    (gitstory/<ticket ID>, started from --base) in a pooled git worktree
+    under .gitstory/cache/worktrees/, --jobs tickets at a time in separate
+    processes: first the --run command (with GITSTORY_TICKET_ID set), then
+    the transition, committed to the ticket's branch. Worktrees are reused
+    for the same ticket, recycled least recently used first, and pruned
+    down to --jobs afterwards; the JSON output reports every worktree's
+    status.
+
+    Exit codes: 0 success, 1 invalid request, failed guard or failed
+    ticket, 2 error.
 
     Example:
         gitstory execute TASK-0001.2.4.3
-        gitstory execute STORY-0001.2.4 --dry-run
+        gitstory execute 'TASK-0001.2.4.*' STORY-0001.2.4 --to done
+        gitstory next --json | jq -c '{ticket_id: .data.task.id}' | gitstory execute -
+        gitstory --json execute 'TASK-0001.2.4.*' --worktrees -j 4 --run 'make test' --to done
     """
-    # Get json_mode from context and create formatter
     json_mode = ctx.obj.get("json_mode", False)
     output = OutputFormatter(json_mode=json_mode)
 
-    output.info(f"Executing {ticket_id}...")
+    try:
+        requests = _read_requests(
+            ticket_ids, ExecutionRequest("", transition, to_state, actual_hours)
+        )
+    except ValueError as e:
+        output.error(str(e), exit_code=1)
+        return
+    tickets_root = Path(path)
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+
+    if worktrees:
+        if dry_run:
+            output.error("--dry-run cannot be combined with --worktrees", exit_code=1)
+            return
+        _execute_in_worktrees(
+            output, requests, tickets_root, workflow_path, jobs, run, base, commit
+        )
+        return
+
+    workflow = load_workflow_or_exit(output, workflow_path)
+    if workflow is None:
+        return
+    index = load_index(tickets_root)
+    plan = plan_execution(requests, index, tickets_root, workflow)
+    data = plan.to_dict()
+    if not plan.ok:
+        _print_failures(output, plan)
+        output.error("Nothing executed", details=data if output.json_mode else None, exit_code=1)
+        return
+
+    if not output.json_mode:
+        output.table(
+            ["Ticket", "Transition", "From", "To"],
+            [[c.ticket_id, c.transition.id, c.from_state, c.to_state] for c in plan.changes],
+        )
     if dry_run:
-        output.debug("Dry run mode - no changes will be made")
-    output.warning("Coming in EPIC-0001.2: Workflow execution engine")
+        output.success(
+            f"Dry run: {len(plan.changes)} transition(s), {len(plan.files)} file(s)",
+            data=data if output.json_mode else None,
+        )
+        return
+
+    # The index of the plan actually applied (a conflict retry re-plans on a fresh one)
+    indexes = [index]
+
+    def reload() -> TicketIndex:
+        indexes.append(load_index(tickets_root))
+        return indexes[-1]
+
+    try:
+        plan, written = apply_with_retry(requests, plan, tickets_root, workflow, reload)
+    except (ExecutionError, OSError) as e:
+        output.error(f"Write failed, no ticket changed: {e}", exit_code=2)
+        return
+    data = plan.to_dict()
+    if not plan.ok:
+        _print_failures(output, plan)
+        output.error(
+            "Nothing executed: tickets changed concurrently and no longer allow the batch",
+            details=data if output.json_mode else None,
+            exit_code=1,
+        )
+        return
+    data["commit"] = None
+    if not written:
+        output.success(
+            f"Executed {len(plan.changes)} transition(s), no file needed a change",
+            data=data if output.json_mode else None,
+        )
+        return
+    if commit:
+        try:
+            data["commit"] = commit_paths(written, _commit_message(plan))
+        except GitError as e:
+            output.error(
+                f"Tickets updated but not committed: {e}",
+                details=data if output.json_mode else None,
+                exit_code=2,
+            )
+            return
+
+    data["unblocked"], data["next"] = _ready_after(indexes[-1], workflow, tickets_root, written)
+    message = f"Executed {len(plan.changes)} transition(s), wrote {len(written)} file(s)"
+    if data["commit"]:
+        message += f", commit {data['commit'][:7]}"
+    if data["unblocked"]:
+        message += f", unblocked {', '.join(data['unblocked'])}"
+    output.success(message, data=data if output.json_mode else None)
+
+
+def _ready_after(
+    index: TicketIndex, workflow: Workflow, tickets_root: Path, written: list[Path]
+) -> tuple[list[str], str | None]:
+    """Tasks made ready by the written files, and the next task, from the index planned on."""
+    created = creation_times(tickets_root, index, load_history(tickets_root))
+    queue = ReadyQueue(index, TicketGraph.from_index(index), workflow, created=created)
+    before = set(queue)
+    for file_path in written:
+        queue.update(read_header(file_path, file_path.relative_to(tickets_root).as_posix()))
+    return [ticket_id for ticket_id in queue if ticket_id not in before], queue.peek()
+
+
+def _execute_in_worktrees(
+    output: OutputFormatter,
+    requests: list[ExecutionRequest],
+    tickets_root: Path,
+    workflow_path: str,
+    jobs: int,
+    command: str | None,
+    base: str,
+    commit: bool,
+) -> None:
+    """Run every ticket in its own pooled worktree and report results and worktrees."""
+    try:
+        requests = expand_requests(requests, load_index(tickets_root))
+    except ExecutionError as e:
+        output.error(str(e), exit_code=1)
+        return
+    try:
+        pool = WorktreePool.load(Path("."), size=jobs)
+        results = run_in_worktrees(
+            pool,
+            requests,
+            os.path.relpath(tickets_root.resolve(), pool.repo),
+            os.path.relpath(Path(workflow_path).resolve(), pool.repo),
+            command,
+            base,
+            commit,
+        )
+        pruned = pool.prune()
+        pool.refresh()
+        pool.save()
+    except (GitError, OSError) as e:
+        output.error(str(e), exit_code=2)
+        return
+
+    if not output.json_mode:
+        output.table(
+            ["Ticket", "Worktree", "Status", "Time", "Commit / Error"],
+            [
+                [
+                    r.ticket_id,
+                    Path(r.worktree).name,
+                    r.status,
+                    f"{r.seconds:.1f}s",
+                    (r.commit or "")[:7] if r.status != "failed" else "; ".join(r.errors),
+                ]
+                for r in results
+            ],
+        )
+    data = {
+        "results": [r.to_dict() for r in results],
+        "worktrees": pool.to_dict(),
+        "pruned": pruned,
+    }
+    failed = [r.ticket_id for r in results if r.status == "failed"]
+    if failed:
+        output.error(
+            f"{len(failed)} of {len(results)} ticket(s) failed: {', '.join(failed)}",
+            details=data if output.json_mode else None,
+            exit_code=1,
+        )
+        return
+    output.success(
+        f"Ran {len(results)} ticket(s) in {len(pool.slots)} worktree(s)",
+        data=data if output.json_mode else None,
+    )
+
+
+def _read_requests(ticket_ids: list[str], defaults: ExecutionRequest) -> list[ExecutionRequest]:
+    """Build requests from arguments, reading NDJSON from stdin for "-"."""
+    requests = []
+    for arg in ticket_ids:
+        if arg != "-":
+            requests.append(replace(defaults, ticket_id=arg))
+            continue
+        for lineno, line in enumerate(sys.stdin, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                requests.append(
+                    ExecutionRequest(
+                        str(item["ticket_id"]),
+                        item.get("transition", defaults.transition),
+                        item.get("to", defaults.to_state),
+                        _optional_str(item.get("actual_hours", defaults.actual_hours)),
+                    )
+                )
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                raise ValueError(f"Invalid NDJSON on stdin line {lineno}: {e}") from e
+    if not requests:
+        raise ValueError("No tickets to execute")
+    return requests
+
+
+def _optional_str(value: object) -> str | None:
+    """NDJSON numbers are accepted for text fields (e.g., "actual_hours": 3)."""
+    return None if value is None else str(value)
+
+
+def _commit_message(plan: ExecutionPlan) -> str:
+    """Summarize the batch: subject with the first IDs, body with every change."""
+    ids = [c.ticket_id for c in plan.changes]
+    subject = ", ".join(ids[:COMMIT_SUBJECT_IDS])
+    if len(ids) > COMMIT_SUBJECT_IDS:
+        subject += f" and {len(ids) - COMMIT_SUBJECT_IDS} more"
+    body = "\n".join(f"- {c.ticket_id}: {c.from_state} -> {c.to_state}" for c in plan.changes)
+    return f"chore(tickets): update {subject}\n\n{body}\n"
+
+
+def _print_failures(output: OutputFormatter, plan: ExecutionPlan) -> None:
+    """List planning errors and failed guards (rich mode only)."""
+    if output.json_mode:
+        return
+    rows = [[e["ticket_id"], "-", e["message"]] for e in plan.errors]
+    for outcome in plan.failed_guards:
+        reason = outcome.error or ", ".join(
+            f"{key}: {value}" for key, value in outcome.details.items() if value
+        )
+        rows.append([outcome.ticket_id, outcome.guard, reason or "failed"])
+    output.table(["Ticket", "Guard", "Reason"], rows)
@@ -0,0 +1,71 @@
+"""Export command for GitStory CLI.
+
+Streams every ticket of the tree as JSON Lines or CSV for dashboards and
+other tools, straight from the tree snapshot.
+"""
+
+import sys
+from pathlib import Path
+
+import typer
+
+from gitstory.cli import app
+from gitstory.cli.output import OutputFormatter
+from gitstory.core.export import DEFAULT_EXPORT_FIELDS, EXPORT_FORMATS, export_rows, iter_rows
+from gitstory.core.snapshot import load_snapshot
+from gitstory.models import DEFAULT_TICKETS_ROOT
+
+
+@app.command()
+def export(
+    ctx: typer.Context,
+    fmt: str = typer.Option("jsonl", "--format", "-f", help="Output format: jsonl or csv"),
+    fields: str = typer.Option(
+        ",".join(DEFAULT_EXPORT_FIELDS),
+        "--fields",
+        help="Comma-separated fields: ticket_id, type, title, status, parent, path, "
+        "requires, blocks, or any header field (e.g., 'Story Points')",
+    ),
+    output_path: Path = typer.Option(
+        None, "--output", "-o", help="Write to this file instead of stdout"
+    ),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+) -> None:
+    """Export every ticket as JSON Lines or CSV, in tree order.
+
+    Rows are streamed from the tree snapshot (.gitstory/cache/tree.snap,
+    refreshed for changed files first) and written in bounded chunks, so
+    memory stays flat however large the tree is. Without --output the rows
+    go to stdout, even in --json mode.
+
+    Exit codes: 0 success, 2 invalid format or missing tickets directory.
+
+    Example:
+        gitstory export > tickets.jsonl
+        gitstory export --format csv --fields "ticket_id,status,Story Points" -o points.csv
+    """
+    json_mode = ctx.obj.get("json_mode", False)
+    output = OutputFormatter(json_mode=json_mode)
+
+    if fmt not in EXPORT_FORMATS:
+        output.error(
+            f"Unknown format: {fmt} (expected one of {', '.join(EXPORT_FORMATS)})", exit_code=2
+        )
+        return
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    if not names:
+        output.error("--fields needs at least one field", exit_code=2)
+        return
+    tickets_root = Path(path)
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+
+    rows = iter_rows(load_snapshot(tickets_root).records.values(), names)
+    if output_path is None:
+        export_rows(rows, names, fmt, sys.stdout)
+        return
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        count = export_rows(rows, names, fmt, f)
+    data = {"tickets": count, "format": fmt, "path": str(output_path)}
+    output.success(f"Exported {count} tickets to {output_path}", data=data if json_mode else None)
@@ -0,0 +1,143 @@
+"""IDs command for GitStory CLI.
+
+Hands out ticket IDs from counters shared by every process and worktree of
+the repository, so parallel planners never pick the same number, and checks
+or repairs ID inconsistencies left by manual edits.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from gitstory.cli import app
+from gitstory.cli.output import OutputFormatter
+from gitstory.core.ids import IdAllocator, check_ids, repair_ids
+from gitstory.core.snapshot import load_index
+from gitstory.models import DEFAULT_TICKETS_ROOT, InvalidTicketIdError, TicketId
+
+# Parent arguments for tickets without a parent
+_TOP_LEVEL = {"INIT": False, "BUG": True}
+
+
+@app.command()
+def ids(
+    ctx: typer.Context,
+    parent: str = typer.Argument(
+        None, help="Allocate IDs below this ticket (INIT for initiatives, BUG for bugs)"
+    ),
+    count: int = typer.Option(1, "--count", "-n", min=1, help="Number of IDs to allocate"),
+    check: bool = typer.Option(False, "--check", help="Report duplicates, gaps, stale counters"),
+    repair: bool = typer.Option(False, "--repair", help="Repair duplicates and stale counters"),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+) -> None:
+    """Allocate ticket IDs safely across parallel planners, or check and repair IDs.
+
+    Allocated numbers are recorded in counters shared by all worktrees
+    (<git common dir>/gitstory/ids.json) under an exclusive lock, so two
+    agents asking for the next story of an epic always get different IDs,
+    even before either has created its file. Create the tickets with the
+    IDs printed.
+
+    --check reports IDs declared by several files, holes in sibling
+    numbering, and counters behind the tree. --repair raises stale
+    counters and gives duplicates the ID their location implies (or a new
+    one); holes are left alone, since existing IDs may be referenced.
+
+    Exit codes: 0 success, 1 invalid parent or problems found (--check) or
+    left (--repair), 2 missing tickets directory.
+
+    Example:
+        gitstory ids EPIC-0001.2
+        gitstory --json ids STORY-0001.2.4 --count 3
+        gitstory ids --repair
+    """
+    json_mode = ctx.obj.get("json_mode", False)
+    output = OutputFormatter(json_mode=json_mode)
+
+    if (parent is not None) + check + repair != 1:
+        output.error("Give either a parent ticket ID, --check or --repair", exit_code=1)
+        return
+    parent_id: TicketId | None = None
+    bug = False
+    if parent is not None:
+        if parent in _TOP_LEVEL:
+            bug = _TOP_LEVEL[parent]
+        else:
+            try:
+                parent_id = TicketId.parse(parent)
+            except InvalidTicketIdError as e:
+                output.error(str(e), exit_code=1)
+                return
+    tickets_root = Path(path)
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+
+    index = load_index(tickets_root)
+    if parent is not None:
+        if parent_id is not None and str(parent_id) not in index:
+            output.error(f"Ticket not found: {parent_id}", exit_code=1)
+            return
+        if parent_id is not None and (parent_id.type == "task" or parent_id.bug):
+            output.error(f"{parent_id} cannot have children", exit_code=1)
+            return
+        with IdAllocator(index, tickets_root) as allocator:
+            allocated = [str(allocator.allocate(parent_id, bug=bug)) for _ in range(count)]
+        if not json_mode:
+            for ticket_id in allocated:
+                output.info(ticket_id)
+        output.success(
+            f"Allocated {len(allocated)} ID(s) below {parent}",
+            data={"parent": parent, "ids": allocated} if json_mode else None,
+        )
+        return
+
+    with IdAllocator(index, tickets_root) as allocator:
+        report = repair_ids(allocator) if repair else check_ids(allocator)
+    if not json_mode:
+        _show(output, report.to_dict())
+    data = report.to_dict() if json_mode else None
+    if repair:
+        if report.unrepaired:
+            output.error(
+                f"Renumbered {len(report.renumbered)} ticket(s); "
+                f"{len(report.unrepaired)} duplicate(s) need a manual fix",
+                details=data,
+                exit_code=1,
+            )
+            return
+        output.success(
+            f"Renumbered {len(report.renumbered)} ticket(s), "
+            f"resynced {len(report.stale_counters)} counter(s)",
+            data=data,
+        )
+        return
+    if not report.ok:
+        output.error(
+            f"{len(report.duplicates)} duplicate ID(s), "
+            f"{len(report.stale_counters)} stale counter(s)",
+            details=data,
+            exit_code=1,
+        )
+        return
+    output.success(f"No duplicate IDs ({len(report.gaps)} parent(s) with gaps)", data=data)
+
+
+def _show(output: OutputFormatter, report: dict[str, Any]) -> None:
+    """Render the problems of an ID report as a table."""
+    rows = [
+        [ticket_id, "duplicate", ", ".join(paths)]
+        for ticket_id, paths in report["duplicates"].items()
+    ]
+    rows += [[key, "gap", ", ".join(map(str, numbers))] for key, numbers in report["gaps"].items()]
+    rows += [
+        [key, "stale counter", f"{counter} < {last}"]
+        for key, (counter, last) in report["stale_counters"].items()
+    ]
+    rows += [
+        [r["old_id"], "renumbered", f"{r['path']} → {r['new_id']}"] for r in report["renumbered"]
+    ]
+    rows += [["", "unrepaired", path] for path in report["unrepaired"]]
+    if rows:
+        output.table(["Ticket", "Problem", "Details"], rows)
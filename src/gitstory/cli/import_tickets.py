@@ -0,0 +1,98 @@
+"""Import command for GitStory CLI.
+
+Creates tickets in bulk from a JSON Lines dump (e.g., exported from another
+tracker), allocating hierarchical IDs as it goes.
+"""
+
+import sys
+from pathlib import Path
+
+import typer
+
+from gitstory.cli import app, load_workflow_or_exit
+from gitstory.cli.output import OutputFormatter
+from gitstory.core.importer import IMPORT_WORKERS, import_tickets, journal_path
+from gitstory.core.templates import TemplateError
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH
+from gitstory.models import DEFAULT_TICKETS_ROOT
+
+
+@app.command(name="import")
+def import_command(
+    ctx: typer.Context,
+    source: str = typer.Argument(..., help="JSON Lines file to import ('-' for stdin)"),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+    workers: int = typer.Option(IMPORT_WORKERS, "--workers", min=1, help="Writer threads"),
+) -> None:
+    """Import tickets from JSON Lines, one ticket per line.
+
+    Each line is an object with a title and, optionally: key (your own
+    identifier), type, parent (an existing ticket ID) or parent_key (the key
+    of an earlier line), status, fields (extra header fields) and body
+    (markdown sections). IDs are allocated below the parent in one pass;
+    lines without a parent become new initiatives (or bugs with
+    "type": "bug").
+
+    Files are written in atomic batches on a thread pool, and parent
+    `**Progress**` rollups are updated once at the end. An interrupted
+    import resumes where it stopped when run again with the same source
+    (allocated IDs are journaled in .gitstory/cache/import/).
+
+    Tickets are rendered from the built-in templates, or from
+    .gitstory/templates/<type>.md where a project overrides them.
+
+    Exit codes: 0 success, 1 some lines were skipped, 2 missing file or tickets
+    directory, invalid template or workflow, or a failed write (run the same
+    import again to resume).
+
+    Example:
+        gitstory import jira-dump.jsonl
+        echo '{"key": "A", "title": "Billing"}' | gitstory --json import -
+    """
+    json_mode = ctx.obj.get("json_mode", False)
+    output = OutputFormatter(json_mode=json_mode)
+
+    tickets_root = Path(path)
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+    workflow = load_workflow_or_exit(output, DEFAULT_WORKFLOW_PATH)
+    if workflow is None:
+        return
+    try:
+        stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    except OSError as e:
+        output.error(f"Cannot read {source}: {e}", exit_code=2)
+        return
+    try:
+        with stream:
+            report = import_tickets(
+                stream,
+                tickets_root,
+                workflow,
+                journal=journal_path(source),
+                max_workers=workers,
+            )
+    except TemplateError as e:
+        output.error(str(e), exit_code=2)
+        return
+    except OSError as e:
+        output.error(
+            f"Import stopped, written batches are kept: {e}; run it again to resume",
+            exit_code=2,
+        )
+        return
+
+    message = f"Imported {len(report.created)} tickets"
+    if report.resumed:
+        message += f" ({report.resumed} already written by an earlier run)"
+    if report.errors:
+        if not json_mode:
+            output.table(["Line", "Error"], [[str(e["line"]), e["message"]] for e in report.errors])
+        output.error(
+            f"{message}; skipped {len(report.errors)} line(s)",
+            details=report.to_dict() if json_mode else None,
+            exit_code=1,
+        )
+        return
+    output.success(message, data=report.to_dict() if json_mode else None)
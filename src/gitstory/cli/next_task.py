@@ -0,0 +1,235 @@
+"""Next command for GitStory CLI.
+
+Returns the next actionable task from the ready queue together with its
+story branch status and context, replacing the manual ticket scan and
+branch checks of /gitstory:start-next-task with one call. In a monorepo,
+--root/--all-roots lists the next task of every tickets root.
+"""
+
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from gitstory.cli import app, load_workflow_or_exit
+from gitstory.cli.output import OutputFormatter
+from gitstory.core.git import GitError, local_branches
+from gitstory.core.graph import TicketGraph
+from gitstory.core.history import DEFAULT_HISTORY_PATH, load_history
+from gitstory.core.index import TicketIndex
+from gitstory.core.ready import ReadyQueue, creation_times
+from gitstory.core.roots import TicketRoot, load_root_index, map_roots, select_roots
+from gitstory.core.snapshot import load_index
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH, load_workflow
+from gitstory.models import DEFAULT_TICKETS_ROOT, InvalidTicketIdError, TicketId
+
+
+@app.command(name="next")
+def next_task(
+    ctx: typer.Context,
+    scope: str = typer.Argument(
+        None, help="Only consider tasks below this ticket (e.g., STORY-0001.2.4)"
+    ),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+    limit: int = typer.Option(1, "--limit", "-n", min=1, help="Number of queued tasks to list"),
+    roots: list[str] = typer.Option(
+        None, "--root", help="Project directory with its own docs/tickets (repeatable)"
+    ),
+    all_roots: bool = typer.Option(
+        False, "--all-roots", help="List the next task of every docs/tickets below here"
+    ),
+    workflow_path: str = typer.Option(
+        DEFAULT_WORKFLOW_PATH, "--workflow", help="Workflow definition file"
+    ),
+) -> None:
+    """Show the next actionable task, its branch status and context.
+
+    A task is actionable when it is not started, its story is not blocked,
+    and every ticket it (or an ancestor) requires is done. Tasks are ordered
+    by epic order, story points of their story, estimated hours, then age
+    (first commit of the ticket file, or its modification time).
+
+    With --root (repeatable) or --all-roots, every root is indexed
+    concurrently (each with its own workflow, --workflow is ignored) and the
+    next task of each root is listed; a scope only applies to the roots that
+    contain it.
+
+    Exit codes: 0 success (also when nothing is ready), 1 invalid scope, 2 error.
+
+    Example:
+        gitstory next
+        gitstory next STORY-0001.2.4
+        gitstory --json next --limit 5
+        gitstory next --all-roots
+    """
+    json_mode = ctx.obj.get("json_mode", False)
+    output = OutputFormatter(json_mode=json_mode)
+
+    if scope is not None:
+        try:
+            TicketId.parse(scope)
+        except InvalidTicketIdError as e:
+            output.error(str(e), exit_code=1)
+            return
+    try:
+        selected = select_roots(roots, all_roots)
+    except FileNotFoundError as e:
+        output.error(str(e), exit_code=2)
+        return
+    if selected is not None:
+        _next_in_roots(output, selected, scope, limit)
+        return
+
+    tickets_root = Path(path)
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+
+    index = load_index(tickets_root)
+    if scope is not None and scope not in index:
+        output.error(f"Ticket not found: {scope}", exit_code=1)
+        return
+    workflow = load_workflow_or_exit(output, workflow_path)
+    if workflow is None:
+        return
+    graph = TicketGraph.from_index(index)
+    created = creation_times(tickets_root, index, load_history(tickets_root))
+    queue = ReadyQueue(index, graph, workflow, scope=scope, created=created)
+
+    task_id = queue.peek()
+    if task_id is None:
+        output.success("No actionable tasks", data={"task": None, "ready": 0})
+        return
+
+    data = _task_context(task_id, index, graph, tickets_root)
+    data["ready"] = len(queue)
+    if limit > 1:
+        data["queue"] = list(queue)[:limit]
+    if not output.json_mode:
+        _print_context(output, data)
+    output.success(f"Next task: {task_id}", data=data if output.json_mode else None)
+
+
+def _next_in_roots(
+    output: OutputFormatter, roots: list[TicketRoot], scope: str | None, limit: int
+) -> None:
+    """List the next task of each root as one report."""
+    # Workers load the workflows again; check them here to report errors cleanly
+    if any(load_workflow_or_exit(output, root.workflow) is None for root in roots):
+        return
+    entries = [
+        entry
+        for entry in map_roots(partial(_root_next, scope=scope, limit=limit), roots)
+        if entry is not None
+    ]
+    if not entries:
+        output.error(f"Ticket not found: {scope}", exit_code=1)
+        return
+    ready = sum(entry["ready"] for entry in entries)
+    if not output.json_mode:
+        output.table(
+            ["Root", "Task", "Title", "Story", "Ready"],
+            [
+                [
+                    entry["root"],
+                    entry["task"]["id"] if entry["task"] else "-",
+                    entry["task"]["title"] if entry["task"] else "",
+                    (entry["story"]["id"] or "") if entry["task"] else "",
+                    str(entry["ready"]),
+                ]
+                for entry in entries
+            ],
+        )
+    with_task = sum(1 for entry in entries if entry["task"])
+    message = f"Next tasks in {with_task} of {len(entries)} root(s)"
+    if not ready:
+        message = "No actionable tasks"
+    output.success(message, data={"roots": entries, "ready": ready} if output.json_mode else None)
+
+
+def _root_next(root: TicketRoot, scope: str | None, limit: int) -> dict[str, Any] | None:
+    """Next task context of one root, or None if scope is not in it (runs in a worker)."""
+    index = load_root_index(root)
+    if scope is not None and scope not in index:
+        return None
+    graph = TicketGraph.from_index(index)
+    history = load_history(root.tickets, root.cache(DEFAULT_HISTORY_PATH))
+    created = creation_times(root.tickets, index, history)
+    queue = ReadyQueue(index, graph, load_workflow(root.workflow), scope=scope, created=created)
+    task_id = queue.peek()
+    if task_id is None:
+        return {"root": root.name, "task": None, "ready": 0}
+    data = {"root": root.name, **_task_context(task_id, index, graph, root.tickets)}
+    data["ready"] = len(queue)
+    if limit > 1:
+        data["queue"] = list(queue)[:limit]
+    return data
+
+
+def _task_context(
+    task_id: str, index: TicketIndex, graph: TicketGraph, tickets_root: Path
+) -> dict[str, Any]:
+    """Collect the task, its story, position, dependencies and branch status."""
+    task = index.by_id[task_id]
+    story_id = index.parent_id(task_id)
+    story = index.get(story_id) if story_id else None
+    siblings = index.children.get(story_id, []) if story_id else [task_id]
+    estimate = task.fields.get("Estimated Hours")
+    return {
+        "task": {
+            "id": task_id,
+            "title": task.title,
+            "status": task.status,
+            "path": (tickets_root / task.path).as_posix(),
+            "estimated_hours": estimate.value if estimate else None,
+        },
+        "story": {
+            "id": story_id,
+            "title": story.title if story else None,
+            "status": story.status if story else None,
+            "path": (tickets_root / story.path).as_posix() if story else None,
+        },
+        "position": siblings.index(task_id) + 1,
+        "total": len(siblings),
+        "blockers": graph.blockers(task_id),
+        "unblocks": graph.unblocks(task_id),
+        "branch": _branch_status(story_id),
+    }
+
+
+def _branch_status(branch: str | None) -> dict[str, Any] | None:
+    """Report whether the story branch exists and is checked out (None outside git)."""
+    if branch is None:
+        return None
+    try:
+        names, current = local_branches()
+    except GitError:
+        return None
+    return {
+        "name": branch,
+        "exists": branch in names,
+        "current": current,
+        "checked_out": current == branch,
+    }
+
+
+def _print_context(output: OutputFormatter, data: dict[str, Any]) -> None:
+    """Render the task context as a rich table."""
+    task, story, branch = data["task"], data["story"], data["branch"]
+    rows = [
+        ["Task", f"{task['id']}: {task['title']}"],
+        ["Position", f"{data['position']}/{data['total']}"],
+        ["Story", f"{story['id']}: {story['title'] or ''}"],
+        ["File", task["path"]],
+    ]
+    if task["estimated_hours"]:
+        rows.append(["Estimate", task["estimated_hours"]])
+    if branch is not None:
+        state = "checked out" if branch["checked_out"] else "exists" if branch["exists"] else "new"
+        rows.append(["Branch", f"{branch['name']} ({state})"])
+    if data["unblocks"]:
+        rows.append(["Unblocks", ", ".join(data["unblocks"])])
+    if "queue" in data:
+        rows.append(["Queue", ", ".join(data["queue"])])
+    output.table(["Field", "Value"], rows)
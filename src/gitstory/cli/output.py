@@ -7,15 +7,98 @@ Provides consistent output formatting across all CLI commands:
 
 import json
 import sys
+import time
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from io import StringIO
 from typing import Any
 
 from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeRemainingColumn,
+)
 from rich.table import Table
 
 from .symbols import get_symbols
 
+# Default throttles for progress reporting (see OutputFormatter.progress)
+PROGRESS_REFRESH_HZ = 10.0
+PROGRESS_EVENTS_PER_SECOND = 2.0
+
+
+class ProgressTracker:
+    """Counter for long-running loops that only renders at a bounded rate.
+
+    advance() does an integer add and one clock read; rendering is delegated to
+    the emit callback at most once per interval, so it can be called per item
+    from loops over hundreds of thousands of tickets.
+
+    Args:
+        description: Progress description
+        total: Total number of items to process
+        interval: Minimum seconds between emits
+        emit: Callback invoked with the tracker when an update is due
+
+    Example:
+        >>> with formatter.progress("Validating tickets", total=len(paths)) as progress:
+        ...     for path in paths:
+        ...         validate(path)
+        ...         progress.advance()
+    """
+
+    __slots__ = ("description", "total", "completed", "_interval", "_emit", "_start", "_next")
+
+    def __init__(
+        self,
+        description: str,
+        total: int,
+        interval: float,
+        emit: Callable[["ProgressTracker"], object],
+    ) -> None:
+        self.description = description
+        self.total = total
+        self.completed = 0
+        self._interval = interval
+        self._emit = emit
+        self._start = time.monotonic()
+        self._next = self._start + interval
+
+    def advance(self, amount: int = 1) -> None:
+        """Record completed items, emitting an update if the interval has elapsed.
+
+        Args:
+            amount: Number of items completed since the last call
+        """
+        self.completed += amount
+        now = time.monotonic()
+        if now >= self._next:
+            self._next = now + self._interval
+            self._emit(self)
+
+    def finish(self) -> None:
+        """Emit the final state unconditionally."""
+        self._emit(self)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return current counts, rate (items/s) and ETA (seconds) as a progress event."""
+        elapsed = time.monotonic() - self._start
+        rate = self.completed / elapsed if elapsed > 0 else 0.0
+        remaining = max(self.total - self.completed, 0)
+        eta = remaining / rate if rate > 0 else None
+        return {
+            "type": "progress",
+            "description": self.description,
+            "completed": self.completed,
+            "total": self.total,
+            "rate": round(rate, 1),
+            "elapsed": round(elapsed, 3),
+            "eta": round(eta, 1) if eta is not None else None,
+        }
+
 
 class OutputFormatter:
     """Dual-mode output formatter for GitStory CLI.
@@ -178,26 +261,72 @@ class OutputFormatter:
         elif self.console:
             self.console.print(f"[dim]{self.symbols.DEBUG} {message}[/dim]")
 
+    def event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Output a structured event for streaming consumers.
+
+        Emits one flushed JSON line ({"type": event_type, ...data}) in JSON mode.
+        Rich mode ignores events; callers print a human-readable summary instead.
+
+        Args:
+            event_type: Event type (e.g., "validation")
+            data: Event payload
+        """
+        if self.json_mode:
+            print(json.dumps({"type": event_type, **data}, ensure_ascii=False), flush=True)
+
     @contextmanager
-    def progress(self, description: str, total: int):  # type: ignore[no-untyped-def]
-        """Context manager for progress indication (placeholder implementation).
+    def progress(
+        self,
+        description: str,
+        total: int,
+        refresh_hz: float = PROGRESS_REFRESH_HZ,
+        events_per_second: float = PROGRESS_EVENTS_PER_SECOND,
+    ) -> Iterator["ProgressTracker"]:
+        """Context manager for rate-limited progress reporting.
 
         Args:
             description: Progress description
-            total: Total number of items (unused in placeholder)
+            total: Total number of items to process
+            refresh_hz: Maximum rich display refreshes per second
+            events_per_second: Maximum JSON progress events per second
 
         Yields:
-            self (no-op for placeholder)
+            ProgressTracker whose advance() is cheap enough for tight loops
 
         Note:
-            In rich mode, prints description on entry.
-            In JSON mode, silent (no output).
-            Actual rich.Progress implementation deferred to future task.
+            In rich mode, renders a rich.Progress bar refreshed at most refresh_hz times.
+            In JSON mode, emits {"type": "progress", ...} events coalesced to at most
+            events_per_second, plus one final event on exit.
         """
         if not self.json_mode and self.console:
             self.console.print(f"[blue]{self.symbols.INFO}[/blue] {description}")
-        yield self
-        # Exit: no-op for placeholder
+            bar = Progress(
+                TextColumn("{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeRemainingColumn(),
+                console=self.console,
+                auto_refresh=False,
+            )
+            task_id = bar.add_task(description, total=total)
+
+            def refresh(tracker: ProgressTracker) -> None:
+                bar.update(task_id, completed=tracker.completed)
+                bar.refresh()
+
+            tracker = ProgressTracker(description, total, interval=1.0 / refresh_hz, emit=refresh)
+            with bar:
+                yield tracker
+                tracker.finish()
+        else:
+            tracker = ProgressTracker(
+                description,
+                total,
+                interval=1.0 / events_per_second,
+                emit=lambda t: print(json.dumps(t.snapshot()), flush=True),
+            )
+            yield tracker
+            tracker.finish()
 
     def table(self, headers: list[str], rows: list[list[str]]) -> None:
         """Output table data.
@@ -219,4 +348,4 @@ class OutputFormatter:
 
 
 # Export for use in CLI commands
-__all__ = ["OutputFormatter"]
+__all__ = ["OutputFormatter", "ProgressTracker"]
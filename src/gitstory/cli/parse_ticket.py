@@ -0,0 +1,101 @@
+"""Parse-ticket command for GitStory CLI.
+
+Resolves ticket IDs to metadata (type, hierarchy components, file path,
+parent, children pattern) without touching the filesystem:
+- Single mode: one ID argument, formatted through OutputFormatter
+- Batch mode: many IDs on stdin, one NDJSON object per line on stdout
+"""
+
+import json
+import sys
+from collections.abc import Iterable
+from typing import TextIO
+
+import typer
+
+from gitstory.cli import app
+from gitstory.cli.output import OutputFormatter
+from gitstory.models import DEFAULT_TICKETS_ROOT, InvalidTicketIdError, TicketId
+
+# Number of NDJSON lines buffered per stdout write in batch mode
+BATCH_CHUNK_SIZE = 1024
+
+EXPECTED_FORMATS = "INIT-NNNN, EPIC-NNNN.E, STORY-NNNN.E.S, TASK-NNNN.E.S.T, BUG-NNNN"
+
+
+@app.command(name="parse-ticket")
+def parse_ticket(
+    ctx: typer.Context,
+    ticket_id: str = typer.Argument(None, help="Ticket ID to parse (e.g., STORY-0001.2.3)"),
+    batch: bool = typer.Option(
+        False, "--batch", help="Read ticket IDs from stdin (one per line), emit NDJSON"
+    ),
+    root: str = typer.Option(DEFAULT_TICKETS_ROOT, "--root", help="Tickets root directory"),
+) -> None:
+    """Parse ticket IDs into metadata: type, path, parent and children pattern.
+
+    Exit codes: 0 on success, 1 if any ID is invalid.
+
+    Example:
+        gitstory parse-ticket STORY-0001.2.3
+        git ls-files docs/tickets | grep -o 'TASK-[0-9.]*[0-9]' | gitstory parse-ticket --batch
+    """
+    json_mode = ctx.obj.get("json_mode", False)
+    output = OutputFormatter(json_mode=json_mode)
+
+    if batch:
+        invalid = _parse_batch(sys.stdin, sys.stdout, root)
+        if invalid:
+            raise typer.Exit(1)
+        return
+
+    if ticket_id is None:
+        output.error("Missing ticket ID (pass an ID or use --batch)", exit_code=1)
+        return
+
+    try:
+        metadata = TicketId.parse(ticket_id).to_dict(root)
+    except InvalidTicketIdError as e:
+        output.error(
+            str(e),
+            details={"expected": EXPECTED_FORMATS},
+            exit_code=1,
+        )
+        return
+    output.success(f"Parsed {ticket_id}", data=metadata)
+
+
+def _parse_batch(lines: Iterable[str], out: TextIO, root: str) -> int:
+    """Parse one ticket ID per input line and write NDJSON in bounded chunks.
+
+    Invalid IDs produce {"ticket_id": ..., "error": ...} lines so output stays
+    aligned with input.
+
+    Args:
+        lines: Iterable of input lines (blank lines are skipped)
+        out: Text stream to write NDJSON to
+        root: Tickets root prepended to paths
+
+    Returns:
+        Number of invalid IDs encountered
+    """
+    invalid = 0
+    chunk: list[str] = []
+    dumps = json.dumps
+    parse = TicketId.parse
+    write = out.write
+    for line in lines:
+        raw = line.strip()
+        if not raw:
+            continue
+        try:
+            chunk.append(dumps(parse(raw).to_dict(root)))
+        except InvalidTicketIdError as e:
+            invalid += 1
+            chunk.append(dumps({"ticket_id": raw, "error": str(e)}))
+        if len(chunk) >= BATCH_CHUNK_SIZE:
+            write("\n".join(chunk) + "\n")
+            chunk.clear()
+    if chunk:
+        write("\n".join(chunk) + "\n")
+    return invalid
@@ -5,18 +5,59 @@ This command will eventually handle:
 - Creating stories from epics
 - Creating tasks from stories
 - Interactive planning interviews
+
+The pre-create duplicate check is available now: given the title (and
+optionally a draft file) of a ticket about to be created, plan lists
+existing tickets that already cover it. So is batch creation: --spec
+renders a whole subtree (YAML or JSON) below the planned ticket in one call,
+after the same check for every spec.
 """
 
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
 import typer
 
-from gitstory.cli import app
+from gitstory.cli import app, load_workflow_or_exit
 from gitstory.cli.output import OutputFormatter
+from gitstory.core.importer import ImportRecordError, create_subtree, parse_subtree_spec
+from gitstory.core.similarity import (
+    DEFAULT_SIMILARITY_PATH,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    load_similarity_index,
+    ticket_text,
+)
+from gitstory.core.templates import TemplateError
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH
+from gitstory.models import DEFAULT_TICKETS_ROOT, InvalidTicketIdError
+
+if TYPE_CHECKING:
+    from gitstory.models import TicketSpec
 
 
 @app.command()
 def plan(
     ctx: typer.Context,
     ticket_id: str = typer.Argument(..., help="Ticket ID to plan (e.g., STORY-0001.2.4)"),
+    title: str = typer.Option(None, "--title", help="Title of the ticket about to be created"),
+    draft: Path = typer.Option(
+        None, "--draft", help="Markdown draft of the ticket about to be created"
+    ),
+    similarity: float = typer.Option(
+        DEFAULT_SIMILARITY_THRESHOLD,
+        "--similarity",
+        min=0.0,
+        max=1.0,
+        help="Minimum estimated similarity for the duplicate check (0-1)",
+    ),
+    spec: Path = typer.Option(
+        None, "--spec", help="YAML or JSON subtree of tickets to create below the ticket"
+    ),
+    allow_duplicates: bool = typer.Option(
+        False, "--allow-duplicates", help="Create --spec tickets that look like existing ones"
+    ),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
 ) -> None:
     """Plan tickets: create epics, stories, or tasks with interview process.
@@ -26,8 +67,26 @@ def plan(
     - EPIC → STORY: Define user-facing functionality
     - STORY → TASK: Define implementation steps
 
+    With --title and/or --draft, the new ticket is first checked against
+    existing tickets (MinHash signatures from .gitstory/cache/minhash.snap)
+    and likely duplicates are listed before anything is created.
+
+    With --spec, a list of tickets (title, and optionally type, status,
+    fields, body and nested children) is created below the ticket in a
+    single call: IDs are allocated in memory, files are rendered from the
+    compiled templates (override them in .gitstory/templates/<type>.md) and
+    written in atomic batches, and parent progress is rolled up once. Every
+    spec goes through the duplicate check first; if any looks like an
+    existing ticket, nothing is created unless --allow-duplicates is given.
+
+    Exit codes: 0 success, 1 invalid spec, likely duplicates or some specs skipped,
+    2 unreadable draft or spec file, missing tickets directory or invalid
+    workflow.
+
     Example:
         gitstory plan STORY-0001.2.4
+        gitstory plan STORY-0001.2.4 --title "Cache parsed headers" --draft task.md
+        gitstory plan EPIC-0001.3 --spec stories.yaml
     """
     # Get json_mode from context and create formatter
     json_mode = ctx.obj.get("json_mode", False)
@@ -36,4 +95,131 @@ def plan(
     output.info(f"Planning {ticket_id}...")
     if verbose:
         output.debug("Verbose mode enabled")
+    if title is not None or draft is not None:
+        try:
+            markdown = draft.read_text(encoding="utf-8") if draft is not None else ""
+        except OSError as e:
+            output.error(f"Cannot read draft: {e}", exit_code=2)
+            return
+        _check_duplicates(output, Path(path), f"{title or ''}\n{ticket_text(markdown)}", similarity)
+    if spec is not None:
+        _create_spec(output, Path(path), ticket_id, spec, similarity, allow_duplicates)
+        return
     output.warning("Coming in EPIC-0001.2: Workflow engine & planning logic")
+
+
+def _create_spec(
+    output: OutputFormatter,
+    tickets_root: Path,
+    ticket_id: str,
+    spec: Path,
+    threshold: float,
+    allow_duplicates: bool,
+) -> None:
+    """Create the subtree of a spec file below ticket_id and report the new tickets."""
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+    try:
+        text = spec.read_text(encoding="utf-8")
+    except OSError as e:
+        output.error(f"Cannot read spec: {e}", exit_code=2)
+        return
+    workflow = load_workflow_or_exit(output, DEFAULT_WORKFLOW_PATH)
+    if workflow is None:
+        return
+    try:
+        specs = parse_subtree_spec(text)
+    except ImportRecordError as e:
+        output.error(str(e), exit_code=1)
+        return
+    if not allow_duplicates:
+        duplicates = _spec_duplicates(tickets_root, specs, threshold)
+        if duplicates:
+            if not output.json_mode:
+                output.table(
+                    ["Spec", "Title", "Similarity", "Existing ticket"],
+                    [
+                        [d["spec"], d["title"], f"{d['similarity']:.0%}", d["ticket_id"] or ""]
+                        for d in duplicates
+                    ],
+                )
+            output.error(
+                f"{len(duplicates)} spec(s) look like existing tickets, nothing created; "
+                "rename them or pass --allow-duplicates",
+                details={"duplicates": duplicates} if output.json_mode else None,
+                exit_code=1,
+            )
+            return
+    try:
+        report = create_subtree(specs, ticket_id, tickets_root, workflow)
+    except (ImportRecordError, InvalidTicketIdError, TemplateError) as e:
+        output.error(str(e), exit_code=1)
+        return
+
+    if not output.json_mode and report.created:
+        output.table(
+            ["Ticket", "Path"], [[str(c["ticket_id"]), str(c["path"])] for c in report.created]
+        )
+    message = f"Created {len(report.created)} tickets below {ticket_id}"
+    if report.errors:
+        if not output.json_mode:
+            output.table(["Spec", "Error"], [[str(e["line"]), e["message"]] for e in report.errors])
+        output.error(
+            f"{message}; skipped {len(report.errors)} spec(s)",
+            details=report.to_dict() if output.json_mode else None,
+            exit_code=1,
+        )
+        return
+    output.success(message, data=report.to_dict() if output.json_mode else None)
+
+
+def _spec_duplicates(
+    tickets_root: Path, specs: "Sequence[TicketSpec]", threshold: float
+) -> list[dict[str, Any]]:
+    """Best existing match of every spec whose title and body look like a ticket."""
+    index = load_similarity_index(tickets_root, DEFAULT_SIMILARITY_PATH)
+    duplicates = []
+    for key, item in _walk_specs(specs, ""):
+        matches = index.query(f"{item.title}\n{ticket_text(item.body)}", threshold)
+        if matches:
+            best = matches[0]
+            duplicates.append(
+                {
+                    "spec": key,
+                    "title": item.title,
+                    "ticket_id": best.ticket_id,
+                    "path": best.path,
+                    "similarity": round(best.similarity, 3),
+                }
+            )
+    return duplicates
+
+
+def _walk_specs(specs: "Sequence[TicketSpec]", prefix: str) -> "Iterator[tuple[str, TicketSpec]]":
+    """Specs depth-first, keyed by position ("1", "1.2", ...) as in create_subtree."""
+    for number, item in enumerate(specs, start=1):
+        key = f"{prefix}{number}"
+        yield key, item
+        yield from _walk_specs(item.children, f"{key}.")
+
+
+def _check_duplicates(
+    output: OutputFormatter, tickets_root: Path, text: str, threshold: float
+) -> None:
+    """Warn about existing tickets that look like the draft."""
+    if not tickets_root.is_dir():
+        output.debug(f"Tickets directory not found: {tickets_root}")
+        return
+    matches = load_similarity_index(tickets_root, DEFAULT_SIMILARITY_PATH).query(text, threshold)
+    if not matches:
+        output.debug("No similar tickets found")
+        return
+    output.table(
+        ["Similarity", "Ticket", "Path"],
+        [[f"{m.similarity:.0%}", m.ticket_id or "", m.path] for m in matches],
+    )
+    output.warning(
+        f"{len(matches)} existing ticket(s) look like this draft: "
+        + ", ".join(m.ticket_id or m.path for m in matches)
+    )
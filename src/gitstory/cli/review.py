@@ -5,19 +5,71 @@ This command will eventually handle:
 - Gap analysis
 - Specification clarity checking
 - Design principle validation
+
+Dependency review (blockers, dependents, cycles) and the deterministic
+rule-based quality score are available now, for one tickets root or for
+every root of a monorepo (--root/--all-roots). `review --all` ranks every
+ticket by score so the LLM review only needs to look at the weakest ones;
+`review --duplicates` lists near-duplicate tickets found with MinHash/LSH.
 """
 
+from functools import partial
+from pathlib import Path
+from typing import Any
+
 import typer
 
-from gitstory.cli import app
+from gitstory.cli import app, load_workflow_or_exit
 from gitstory.cli.output import OutputFormatter
+from gitstory.core.graph import TicketGraph
+from gitstory.core.index import TicketIndex
+from gitstory.core.quality import (
+    DEFAULT_QUALITY_CACHE_PATH,
+    QualityReport,
+    QualityScore,
+    score_ticket,
+    score_tree,
+)
+from gitstory.core.roots import TicketRoot, load_root_index, map_roots, select_roots
+from gitstory.core.similarity import (
+    DEFAULT_SIMILARITY_PATH,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    SimilarMatch,
+    load_similarity_index,
+)
+from gitstory.core.snapshot import load_index
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH, Workflow
+from gitstory.models import DEFAULT_TICKETS_ROOT
 
 
 @app.command()
 def review(
     ctx: typer.Context,
-    ticket_id: str = typer.Argument(..., help="Ticket ID to review (e.g., EPIC-0001.3)"),
+    ticket_id: str = typer.Argument(None, help="Ticket ID to review (e.g., EPIC-0001.3)"),
+    all_tickets: bool = typer.Option(
+        False, "--all", help="Score every ticket and rank them from worst to best"
+    ),
+    threshold: int = typer.Option(
+        None, "--threshold", min=0, max=100, help="With --all: only list tickets scoring below this"
+    ),
+    duplicates: bool = typer.Option(
+        False, "--duplicates", help="List pairs of near-duplicate tickets"
+    ),
+    similarity: float = typer.Option(
+        DEFAULT_SIMILARITY_THRESHOLD,
+        "--similarity",
+        min=0.0,
+        max=1.0,
+        help="With --duplicates: minimum estimated similarity (0-1)",
+    ),
     focus: str = typer.Option(None, "--focus", help="Specific concern to focus on"),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+    roots: list[str] = typer.Option(
+        None, "--root", help="Project directory with its own docs/tickets (repeatable)"
+    ),
+    all_roots: bool = typer.Option(
+        False, "--all-roots", help="Look for the ticket in every docs/tickets below here"
+    ),
 ) -> None:
     """Review ticket quality, detect issues, propose fixes.
 
@@ -26,16 +78,238 @@ def review(
     - Clarity (vague specifications, unquantified requirements)
     - Coherence (conflicts with parent/sibling tickets)
     - Quality score (0-100%)
+    - Dependencies (open blockers, tickets it unblocks, dependency cycles)
+
+    The quality score is rule-based and deterministic: required sections per
+    ticket type plus vague-term detection. With --all, every ticket is scored
+    (in parallel for large trees, cached by content hash in
+    .gitstory/cache/quality.json) and results are ranked worst first;
+    --threshold keeps only tickets that need a closer (LLM) review.
+
+    With --duplicates, tickets whose title and intent sections (objective,
+    user story, acceptance criteria) overlap are listed in pairs. Candidates
+    come from MinHash signatures bucketed with LSH, so only likely pairs are
+    compared; signatures are cached in .gitstory/cache/minhash.snap. A
+    ticket and its own ancestors are never reported as duplicates.
+
+    With --root (repeatable) or --all-roots, the roots are processed
+    concurrently and the ticket is reviewed in every root that has it,
+    against that root's workflow.
+
+    Exit codes: 0 success, 2 invalid arguments, missing tickets directory or
+    invalid workflow.
 
     Example:
         gitstory review STORY-0001.2.4
+        gitstory --json review --all --threshold 70
+        gitstory review --duplicates --similarity 0.6
+        gitstory review STORY-0001.2.4 --root services/api --root services/web
         gitstory review EPIC-0001.3 --focus security
     """
     # Get json_mode from context and create formatter
     json_mode = ctx.obj.get("json_mode", False)
     output = OutputFormatter(json_mode=json_mode)
 
+    if (ticket_id is not None) + all_tickets + duplicates != 1:
+        output.error("Give either a ticket ID, --all or --duplicates", exit_code=2)
+        return
+    if threshold is not None and not all_tickets:
+        output.error("--threshold requires --all", exit_code=2)
+        return
+    try:
+        selected = select_roots(roots, all_roots)
+    except FileNotFoundError as e:
+        output.error(str(e), exit_code=2)
+        return
+    if duplicates:
+        _review_duplicates(output, Path(path), selected, similarity)
+        return
+    if ticket_id is None:
+        _review_all(output, Path(path), selected, threshold)
+        return
+
     output.info(f"Reviewing {ticket_id}...")
     if focus:
         output.debug(f"Focus area: {focus}")
-    output.warning("Coming in EPIC-0001.2: Quality checker & validation logic")
+    if selected is not None:
+        found = False
+        for root, index in zip(selected, map_roots(load_root_index, selected), strict=True):
+            if ticket_id in index:
+                found = True
+                output.info(f"{root.name}: {index.by_id[ticket_id].path}")
+                workflow = load_workflow_or_exit(output, root.workflow)
+                if workflow is None:
+                    return
+                _review_dependencies(output, ticket_id, index, workflow)
+                _review_quality(output, root.tickets / index.by_id[ticket_id].path)
+        if not found:
+            output.debug(f"{ticket_id} not found in {len(selected)} root(s)")
+        return
+
+    tickets_root = Path(path)
+    if tickets_root.is_dir():
+        index = load_index(tickets_root)
+        workflow = load_workflow_or_exit(output, DEFAULT_WORKFLOW_PATH)
+        if workflow is None:
+            return
+        if ticket_id in index:
+            _review_dependencies(output, ticket_id, index, workflow)
+            _review_quality(output, tickets_root / index.by_id[ticket_id].path)
+        else:
+            output.debug(f"{ticket_id} not found in {tickets_root}")
+
+
+def _review_dependencies(
+    output: OutputFormatter, ticket_id: str, index: TicketIndex, workflow: Workflow
+) -> None:
+    """Show what blocks ticket_id, what it unblocks, and cycles it is part of."""
+    graph = TicketGraph.from_index(index)
+    blockers = graph.blockers(ticket_id)
+    unblocks = graph.unblocks(ticket_id)
+    if blockers or unblocks:
+        output.table(
+            ["Relation", "Ticket", "Status"],
+            [["blocked by", b, index.by_id[b].status or ""] for b in blockers]
+            + [["unblocks", d, index.by_id[d].status or ""] for d in unblocks],
+        )
+    open_blockers = []
+    for blocker in blockers:
+        status = index.by_id[blocker].status
+        state = workflow.state_for_status(status) if status else None
+        if state is None or state.type != "end":
+            open_blockers.append(blocker)
+    if open_blockers:
+        output.warning(f"{ticket_id} is blocked by open tickets: {', '.join(open_blockers)}")
+    for cycle in graph.cycles():
+        if ticket_id in cycle:
+            output.warning(f"{ticket_id} is part of a dependency cycle: {', '.join(cycle)}")
+    if graph.missing.get(ticket_id):
+        output.warning(f"Unknown dependencies: {', '.join(graph.missing[ticket_id])}")
+
+
+def _review_quality(output: OutputFormatter, file_path: Path) -> None:
+    """Show the rule-based quality score of one ticket file."""
+    score = score_ticket(file_path.read_text(encoding="utf-8"))
+    output.info(f"Quality score: {score.score}% ({score.level})")
+    if score.issues:
+        output.table(
+            ["Severity", "Line", "Category", "Message"],
+            [[i.severity, str(i.line or ""), i.category, i.message] for i in score.issues],
+        )
+
+
+def _review_all(
+    output: OutputFormatter,
+    tickets_root: Path,
+    roots: list[TicketRoot] | None,
+    threshold: int | None,
+) -> None:
+    """Score every ticket of one or several roots and print them ranked worst first."""
+    if roots is None:
+        if not tickets_root.is_dir():
+            output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+            return
+        reports = [("", score_tree(tickets_root))]
+    else:
+        scored = map_roots(_score_root, roots)
+        reports = [(root.name, report) for root, report in zip(roots, scored, strict=True)]
+
+    ranked = sorted(
+        ((name, score) for name, report in reports for score in report.scores),
+        key=lambda item: item[1].score,
+    )
+    total = len(ranked)
+    if threshold is not None:
+        ranked = [(name, score) for name, score in ranked if score.score < threshold]
+    results = [_result(name, score, roots is not None) for name, score in ranked]
+
+    if not output.json_mode and results:
+        headers = ["Score", "Level", "Ticket", "Top issues"]
+        if roots is not None:
+            headers.insert(2, "Root")
+        rows = []
+        for result in results:
+            row = [
+                f"{result['score']}%",
+                result["level"],
+                result["ticket_id"] or result["path"],
+                "; ".join(issue["message"] for issue in result["issues"][:3]),
+            ]
+            if roots is not None:
+                row.insert(2, result["root"])
+            rows.append(row)
+        output.table(headers, rows)
+
+    cached = sum(report.cached for _, report in reports)
+    message = f"Scored {total} tickets ({cached} cached)"
+    if threshold is not None:
+        message += f", {len(results)} below {threshold}%"
+    data = {"tickets": total, "cached": cached, "threshold": threshold, "results": results}
+    output.success(message, data=data if output.json_mode else None)
+
+
+def _score_root(root: TicketRoot) -> QualityReport:
+    """Score one root with its own cache (runs in a worker process)."""
+    return score_tree(root.tickets, root.cache(DEFAULT_QUALITY_CACHE_PATH), max_workers=1)
+
+
+def _result(root: str, score: QualityScore, with_root: bool) -> dict[str, Any]:
+    """Ranked result entry, tagged with its root in multi-root mode."""
+    return {"root": root, **score.to_dict()} if with_root else score.to_dict()
+
+
+def _review_duplicates(
+    output: OutputFormatter,
+    tickets_root: Path,
+    roots: list[TicketRoot] | None,
+    threshold: float,
+) -> None:
+    """List near-duplicate ticket pairs of one or several roots, most similar first."""
+    if roots is None:
+        if not tickets_root.is_dir():
+            output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+            return
+        found = [("", _find_duplicates(tickets_root, DEFAULT_SIMILARITY_PATH, threshold))]
+    else:
+        per_root = map_roots(partial(_duplicates_root, threshold=threshold), roots)
+        found = [(root.name, matches) for root, matches in zip(roots, per_root, strict=True)]
+
+    pairs = [(name, match) for name, (_, matches) in found for match in matches]
+    total = sum(count for _, (count, _) in found)
+    results = [
+        {"root": name, **match.to_dict()} if roots is not None else match.to_dict()
+        for name, match in pairs
+    ]
+
+    if not output.json_mode and pairs:
+        headers = ["Similarity", "Ticket", "Duplicates"]
+        if roots is not None:
+            headers.insert(1, "Root")
+        rows = []
+        for name, match in pairs:
+            row = [
+                f"{match.similarity:.0%}",
+                match.ticket_id or match.path,
+                match.other_id or match.other_path or "",
+            ]
+            if roots is not None:
+                row.insert(1, name)
+            rows.append(row)
+        output.table(headers, rows)
+
+    message = f"Compared {total} tickets: {len(pairs)} near-duplicate pair(s) at {threshold:.0%}+"
+    data = {"tickets": total, "threshold": threshold, "results": results}
+    output.success(message, data=data if output.json_mode else None)
+
+
+def _find_duplicates(
+    tickets_root: Path, cache_path: Path | str, threshold: float
+) -> tuple[int, list[SimilarMatch]]:
+    """Number of tickets compared and their near-duplicate pairs."""
+    index = load_similarity_index(tickets_root, cache_path)
+    return len(index.entries), index.duplicates(threshold)
+
+
+def _duplicates_root(root: TicketRoot, threshold: float) -> tuple[int, list[SimilarMatch]]:
+    """Find one root's duplicates with its own signature cache (runs in a worker process)."""
+    return _find_duplicates(root.tickets, root.cache(DEFAULT_SIMILARITY_PATH), threshold)
@@ -0,0 +1,119 @@
+"""Stats command for GitStory CLI.
+
+Reports flow metrics per epic from the status history in git: lead time,
+cycle time, time in each workflow state, and estimated against actual hours.
+History is mined incrementally (see gitstory.core.history), so the command
+is cheap enough to run on every pull request.
+"""
+
+from pathlib import Path
+
+import typer
+
+from gitstory.cli import app, load_workflow_or_exit
+from gitstory.cli.output import OutputFormatter
+from gitstory.core.git import GitError
+from gitstory.core.history import DEFAULT_HISTORY_PATH, epic_stats, load_history
+from gitstory.core.snapshot import load_index
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH
+from gitstory.models import DEFAULT_TICKETS_ROOT, InvalidTicketIdError, TicketId
+
+
+@app.command()
+def stats(
+    ctx: typer.Context,
+    scope: str = typer.Argument(
+        None, help="Only report epics of this initiative or this epic (e.g., INIT-0001)"
+    ),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
+    states: bool = typer.Option(False, "--states", help="Also show time spent in each state"),
+) -> None:
+    """Show cycle time, lead time and estimate accuracy per epic.
+
+    Status changes are read from `git log -p` of the tickets root once and
+    cached per commit in .gitstory/cache/history.json; later runs only read
+    commits added since. Lead time runs from a ticket's first commit to its
+    completion, cycle time from its first active state to completion (medians
+    over completed tickets). Estimates compare `Estimated Hours` with
+    `Actual Hours` for tickets that record both.
+
+    Exit codes: 0 success, 1 invalid scope, 2 missing tickets directory, git
+    error or invalid workflow.
+
+    Example:
+        gitstory stats
+        gitstory stats INIT-0001 --states
+        gitstory --json stats EPIC-0001.2
+    """
+    json_mode = ctx.obj.get("json_mode", False)
+    output = OutputFormatter(json_mode=json_mode)
+
+    parsed = None
+    if scope is not None:
+        try:
+            parsed = TicketId.parse(scope)
+        except InvalidTicketIdError as e:
+            output.error(str(e), exit_code=1)
+            return
+    tickets_root = Path(path)
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+    try:
+        history = load_history(tickets_root, DEFAULT_HISTORY_PATH)
+    except GitError as e:
+        output.error(str(e), exit_code=2)
+        return
+
+    workflow = load_workflow_or_exit(output, DEFAULT_WORKFLOW_PATH)
+    if workflow is None:
+        return
+    epics = epic_stats(history, load_index(tickets_root), workflow)
+    if parsed is not None:
+        epics = [
+            e
+            for e in epics
+            if e.epic_id == scope or parsed.is_ancestor_of(TicketId.parse(e.epic_id))
+        ]
+    results = [e.to_dict() for e in epics]
+
+    if not output.json_mode and results:
+        output.table(
+            ["Epic", "Tickets", "Done", "Lead", "Cycle", "Est. h", "Actual h", "Ratio"],
+            [
+                [
+                    r["epic_id"],
+                    str(r["tickets"]),
+                    str(r["completed"]),
+                    _duration(r["lead_time_hours"]),
+                    _duration(r["cycle_time_hours"]),
+                    f"{r['estimated_hours']:g}",
+                    f"{r['actual_hours']:g}",
+                    f"{r['estimate_ratio']:.2f}" if r["estimate_ratio"] is not None else "-",
+                ]
+                for r in results
+            ],
+        )
+        if states:
+            output.table(
+                ["Epic", "State", "Time"],
+                [
+                    [r["epic_id"], state, _duration(hours)]
+                    for r in results
+                    for state, hours in r["time_in_state_hours"].items()
+                ],
+            )
+
+    message = (
+        f"{len(results)} epic(s) from {len(history.commits)} status commit(s) "
+        f"({history.mined} newly mined)"
+    )
+    data = {"head": history.head, "mined": history.mined, "epics": results}
+    output.success(message, data=data if output.json_mode else None)
+
+
+def _duration(hours: float | None) -> str:
+    """Render hours as hours below two days, days above."""
+    if hours is None:
+        return "-"
+    return f"{hours:.1f}h" if hours < 48 else f"{hours / 24:.1f}d"
@@ -3,22 +3,60 @@
 This command will eventually handle:
 - Testing workflow plugins in isolation
 - Plugin debugging and inspection
-- Plugin performance testing
-- Plugin contract validation
+- Plugin performance testing (--bench)
+- Plugin contract validation across the backlog (--matrix)
 """
 
+import tempfile
+from fnmatch import fnmatchcase
+from pathlib import Path
+
 import typer
 
-from gitstory.cli import app
+from gitstory.cli import app, load_workflow_or_exit
 from gitstory.cli.output import OutputFormatter
+from gitstory.core.bench import (
+    DEFAULT_BENCH_RUNS,
+    DEFAULT_BUDGET_SECONDS,
+    DEFAULT_WARMUP_RUNS,
+    BenchBudget,
+    BenchReport,
+    bench_plugin,
+    write_fixture,
+)
+from gitstory.core.matrix import MATRIX_WORKERS, MatrixSummary, run_matrix
+from gitstory.core.plugins import DEFAULT_PLUGIN_TIMEOUT, PLUGIN_TYPES, resolve_plugin
+from gitstory.core.snapshot import load_index
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH
+from gitstory.models import DEFAULT_TICKETS_ROOT
 
 
 @app.command(name="test-plugin")
 def test_plugin(
     ctx: typer.Context,
     plugin_name: str = typer.Argument(..., help="Plugin to test (e.g., all_children_done)"),
-    ticket_id: str = typer.Option(None, "--ticket", help="Ticket ID for plugin context"),
+    ticket_id: str = typer.Option(
+        None, "--ticket", help="Ticket ID for plugin context (a glob with --matrix)"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
+    bench: bool = typer.Option(False, "--bench", help="Benchmark the plugin against a budget"),
+    plugin_type: str = typer.Option("guard", "--type", help="Plugin type: guard, event, action"),
+    runs: int = typer.Option(DEFAULT_BENCH_RUNS, "--runs", min=1, help="Measured runs"),
+    warmup: int = typer.Option(DEFAULT_WARMUP_RUNS, "--warmup", min=0, help="Warmup runs"),
+    budget: float = typer.Option(
+        DEFAULT_BUDGET_SECONDS, "--budget", help="Max wall time per run, in seconds"
+    ),
+    max_rss: float = typer.Option(None, "--max-rss", help="Max peak RSS, in MiB"),
+    max_output: int = typer.Option(None, "--max-output", help="Max stdout size, in bytes"),
+    matrix: bool = typer.Option(False, "--matrix", help="Run the plugin for every ticket"),
+    status: str = typer.Option(
+        None, "--status", help="Only tickets in this workflow state, e.g. in_progress (--matrix)"
+    ),
+    jobs: int = typer.Option(MATRIX_WORKERS, "--jobs", "-j", min=1, help="Plugins run at once"),
+    timeout: float = typer.Option(
+        DEFAULT_PLUGIN_TIMEOUT, "--timeout", help="Seconds before a run is killed"
+    ),
+    path: str = typer.Option(DEFAULT_TICKETS_ROOT, "--path", help="Tickets root directory"),
 ) -> None:
     """Test individual workflow plugins in isolation.
 
@@ -28,17 +66,177 @@ def test_plugin(
     - Check plugin contract compliance
     - Performance profiling
 
+    --bench runs the plugin --warmup times, then --runs measured times, and
+    reports p50/p95/max wall time, CPU time, peak RSS and output size. The
+    plugin runs against --ticket in the current project, or against a
+    fixture story (with one done and one open task) in a temporary project.
+
+    --matrix runs the plugin for every ticket (or those matching the --ticket
+    glob and --status) with --jobs plugins at once. In --json mode each
+    result is streamed as an NDJSON {"type": "plugin_result", ...} line as
+    soon as it finishes; the summary counts pass/fail/error and lists the
+    tickets behind each contract violation (invalid_json, invalid_output,
+    exit_code, timeout, crash, cpu_limit, output_limit).
+
+    Exit codes (--bench): 0 within budget, 1 budget exceeded or runs that
+    errored, 2 plugin not found.
+    Exit codes (--matrix): 0 no contract violations, 1 violations found or
+    no ticket matched, 2 plugin or tickets directory not found, or invalid
+    workflow.
+
     Example:
         gitstory test-plugin all_children_done
         gitstory test-plugin validate_ticket --ticket STORY-0001.2.4 --verbose
+        gitstory test-plugin all_children_done --bench --runs 50 --budget 0.5
+        gitstory --json test-plugin all_children_done --matrix --ticket "STORY-*" -j 16
     """
     # Get json_mode from context and create formatter
     json_mode = ctx.obj.get("json_mode", False)
     output = OutputFormatter(json_mode=json_mode)
 
+    if bench or matrix:
+        if bench and matrix:
+            output.error("Give either --bench or --matrix", exit_code=1)
+            return
+        spec = _resolve(output, plugin_type, plugin_name)
+        if spec is None:
+            return
+        if bench:
+            limits = BenchBudget(budget, max_rss, max_output)
+            _bench(output, json_mode, plugin_type, spec, ticket_id, runs, warmup, limits, timeout)
+        else:
+            filters = (ticket_id or "*", status)
+            _matrix(output, json_mode, plugin_type, spec, filters, jobs, timeout, Path(path))
+        return
+
     output.info(f"Testing plugin {plugin_name}...")
     if ticket_id:
         output.debug(f"Using ticket context: {ticket_id}")
     if verbose:
         output.debug("Verbose mode enabled")
     output.warning("Coming in EPIC-0001.3: Plugin testing framework")
+
+
+def _resolve(output: OutputFormatter, plugin_type: str, name: str) -> dict[str, str] | None:
+    """File spec of a plugin of the current project (None after reporting an error)."""
+    if plugin_type not in PLUGIN_TYPES:
+        output.error(f"Unknown plugin type: {plugin_type}", exit_code=1)
+        return None
+    path = resolve_plugin(plugin_type, name)
+    if path is None:
+        output.error(f"Plugin {plugin_type}/{name} not found", exit_code=2)
+        return None
+    return {"name": name, "file": str(path)}
+
+
+def _bench(
+    output: OutputFormatter,
+    json_mode: bool,
+    plugin_type: str,
+    spec: dict[str, str],
+    ticket_id: str | None,
+    runs: int,
+    warmup: int,
+    budget: BenchBudget,
+    timeout: float,
+) -> None:
+    """Benchmark a plugin and report against budget."""
+    name = spec["name"]
+    if ticket_id:
+        report = bench_plugin(plugin_type, spec, ticket_id, runs, warmup, budget, timeout=timeout)
+    else:
+        with tempfile.TemporaryDirectory(prefix="gitstory-bench-") as fixture:
+            ticket_id = write_fixture(Path(fixture))
+            report = bench_plugin(
+                plugin_type, spec, ticket_id, runs, warmup, budget, Path(fixture), timeout
+            )
+
+    if not json_mode:
+        _show(output, report)
+    data = report.to_dict() if json_mode else None
+    summary = f"{plugin_type}/{name}: p95 {report.p95:.3f}s over {runs} run(s)"
+    if report.violations:
+        output.error(
+            f"{summary}; over budget: {'; '.join(report.violations)}", details=data, exit_code=1
+        )
+        return
+    output.success(f"{summary}, within budget", data=data)
+
+
+def _show(output: OutputFormatter, report: BenchReport) -> None:
+    """Render benchmark measurements as a table."""
+    measured = report.to_dict()
+    wall, cpu = measured["wall"], measured["cpu"]
+    output.table(
+        ["Metric", "Value"],
+        [
+            ["Wall p50", f"{wall['p50'] * 1000:.1f} ms"],
+            ["Wall p95", f"{wall['p95'] * 1000:.1f} ms"],
+            ["Wall max", f"{wall['max'] * 1000:.1f} ms"],
+            ["CPU max", f"{cpu['max'] * 1000:.1f} ms"],
+            ["Peak RSS", f"{report.peak_rss_bytes / 2**20:.1f} MiB"],
+            ["Output", f"{measured['output_bytes']} bytes"],
+            ["Exit codes", ", ".join(f"{c}: {n}" for c, n in measured["exit_codes"].items())],
+        ],
+    )
+
+
+def _matrix(
+    output: OutputFormatter,
+    json_mode: bool,
+    plugin_type: str,
+    spec: dict[str, str],
+    filters: tuple[str, str | None],
+    jobs: int,
+    timeout: float,
+    tickets_root: Path,
+) -> None:
+    """Run a plugin for every matching ticket, streaming results, then summarize."""
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+    pattern, status = filters
+    workflow = load_workflow_or_exit(output, DEFAULT_WORKFLOW_PATH)
+    if workflow is None:
+        return
+    if status is not None and status not in workflow.states:
+        output.error(f"Unknown workflow state: {status}", exit_code=1)
+        return
+    index = load_index(tickets_root)
+    ticket_ids = []
+    for ticket_id in sorted(index.by_id, key=index.sort_key):
+        if not fnmatchcase(ticket_id, pattern):
+            continue
+        state = workflow.state_for_status(index.by_id[ticket_id].status or "")
+        if status is None or (state is not None and state.id == status):
+            ticket_ids.append(ticket_id)
+    if not ticket_ids:
+        output.error(f"No tickets match {pattern}", exit_code=1)
+        return
+
+    summary = MatrixSummary(plugin_type, spec["name"])
+    with output.progress(f"Running {plugin_type}/{spec['name']}", len(ticket_ids)) as tracker:
+        for row in run_matrix(plugin_type, spec, ticket_ids, jobs, timeout):
+            summary.add(row)
+            output.event("plugin_result", row.to_dict())
+            tracker.advance()
+
+    counts = summary.counts
+    message = (
+        f"{len(ticket_ids)} ticket(s): {counts['pass']} pass, "
+        f"{counts['fail']} fail, {counts['error']} error"
+    )
+    data = summary.to_dict() if json_mode else None
+    if not summary.ok:
+        if not json_mode:
+            output.table(
+                ["Violation", "Tickets", "Examples"],
+                [
+                    [kind, str(len(ids)), ", ".join(ids[:5])]
+                    for kind, ids in sorted(summary.violations.items())
+                ],
+            )
+        total = sum(map(len, summary.violations.values()))
+        output.error(f"{message}; {total} contract violation(s)", details=data, exit_code=1)
+        return
+    output.success(f"{message}; no contract violations", data=data)
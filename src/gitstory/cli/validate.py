@@ -1,23 +1,70 @@
 """Validate command for GitStory CLI.
 
-This command will eventually handle:
-- Workflow.yaml schema validation
-- Ticket structure validation
+Handles:
+- Workflow.yaml schema and FSM validation
+- Ticket structure validation (with incremental --changed mode)
+- Several ticket roots at once (--root/--all-roots) with one merged report
 - Configuration file validation
-- Plugin validation
 """
 
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+
 import typer
 
 from gitstory.cli import app
 from gitstory.cli.output import OutputFormatter
+from gitstory.core.git import GitError, changed_files
+from gitstory.core.manifest import DEFAULT_MANIFEST_PATH, ValidationManifest
+from gitstory.core.roots import TicketRoot, map_roots, select_roots
+from gitstory.core.tickets import TICKET_DIR_PATTERN, is_ticket_path, iter_ticket_files
+from gitstory.core.validation import TreeValidation, validate_tree
+from gitstory.core.watch import PollingWatcher, open_watcher, watch_changes
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH
+from gitstory.models import DEFAULT_TICKETS_ROOT
+from gitstory.validators.result import ValidationIssue, ValidationResult
+from gitstory.validators.workflow_validator import validate_workflow
+from gitstory.validators.yaml_validator import validate_yaml_file
+
+DEFAULT_PATHS = {
+    "workflow": DEFAULT_WORKFLOW_PATH,
+    "ticket": DEFAULT_TICKETS_ROOT,
+    "config": ".gitstory/",
+}
+
+# Only show scan progress for trees with at least this many ticket files
+PROGRESS_MIN_FILES = 200
 
 
 @app.command()
 def validate(
     ctx: typer.Context,
     target: str = typer.Argument("workflow", help="What to validate: workflow, ticket, or config"),
-    path: str = typer.Option(".gitstory/workflow.yaml", "--path", help="Path to file"),
+    path: str = typer.Option(
+        None, "--path", help="Path to file (default depends on target, e.g. docs/tickets)"
+    ),
+    changed: bool = typer.Option(
+        False, "--changed", help="Only revalidate tickets changed since the last run"
+    ),
+    base: str = typer.Option(
+        None, "--base", help="With --changed: also revalidate files in `git diff <base>`"
+    ),
+    workflow_path: str = typer.Option(
+        DEFAULT_WORKFLOW_PATH, "--workflow", help="workflow.yaml used for ticket statuses"
+    ),
+    watch: bool = typer.Option(
+        False, "--watch", help="Keep running and revalidate tickets as files change"
+    ),
+    poll: bool = typer.Option(
+        False, "--poll", help="With --watch: use stat polling instead of inotify"
+    ),
+    roots: list[str] = typer.Option(
+        None, "--root", help="Project directory with its own docs/tickets (repeatable)"
+    ),
+    all_roots: bool = typer.Option(
+        False, "--all-roots", help="Validate every docs/tickets directory below the current one"
+    ),
 ) -> None:
     """Validate workflow.yaml, ticket structure, or config files.
 
@@ -26,14 +73,369 @@ def validate(
     - ticket: file structure, required fields, hierarchy consistency
     - config: .gitstory/ directory structure and settings
 
+    Ticket validation records per-file results in .gitstory/cache/validation.json.
+    With --changed, only tickets whose content hash changed (plus their parents,
+    children and the whole tree if workflow.yaml changed) are revalidated.
+    With --watch, the same incremental pass runs after every burst of file
+    changes and results are streamed until interrupted (Ctrl+C).
+
+    With --root (repeatable) or --all-roots, each project's docs/tickets is
+    validated against its own .gitstory/workflow.yaml and cache, the roots run
+    concurrently, and one report lists every root.
+
+    Exit codes: 0 valid, 1 validation failed, 2 unexpected error.
+
     Example:
         gitstory validate workflow
         gitstory validate ticket --path docs/tickets/INIT-0001
+        gitstory validate ticket --changed --base origin/main
+        gitstory validate ticket --watch
+        gitstory validate ticket --all-roots --changed
         gitstory validate config --path .gitstory/
     """
     # Get json_mode from context and create formatter
     json_mode = ctx.obj.get("json_mode", False)
     output = OutputFormatter(json_mode=json_mode)
 
-    output.info(f"Validating {target} at {path}...")
-    output.warning("Coming in EPIC-0001.2: Validation engine")
+    if target not in DEFAULT_PATHS:
+        output.error(
+            f"Unknown validation target: {target}",
+            details={"expected": ", ".join(DEFAULT_PATHS)},
+            exit_code=2,
+        )
+        return
+    if base and not changed:
+        output.error("--base requires --changed", exit_code=2)
+        return
+    if watch and target != "ticket":
+        output.error("--watch is only supported for ticket validation", exit_code=2)
+        return
+    if poll and not watch:
+        output.error("--poll requires --watch", exit_code=2)
+        return
+
+    if roots or all_roots:
+        if target != "ticket" or watch or path:
+            output.error(
+                "--root/--all-roots support ticket validation without --path or --watch",
+                exit_code=2,
+            )
+            return
+        try:
+            selected = select_roots(roots, all_roots) or []
+        except FileNotFoundError as e:
+            output.error(str(e), exit_code=2)
+            return
+        _validate_roots(output, selected, changed, base)
+        return
+
+    path = path or DEFAULT_PATHS[target]
+    if target == "workflow":
+        _validate_workflow_file(output, Path(path))
+    elif target == "ticket":
+        _validate_tickets(output, Path(path), Path(workflow_path), changed, base, watch, poll)
+    else:
+        _validate_config(output, Path(path))
+
+
+def _validate_workflow_file(output: OutputFormatter, path: Path) -> None:
+    """Validate a single workflow.yaml file."""
+    output.info(f"Validating workflow at {path}...")
+    try:
+        content = path.read_text(encoding="utf-8")
+    except OSError as e:
+        output.error(f"Cannot read {path}: {e.strerror or e}", exit_code=2)
+        return
+    _report(output, validate_workflow(content, path=str(path)), f"Workflow {path} is valid", {})
+
+
+def _validate_tickets(
+    output: OutputFormatter,
+    tickets_root: Path,
+    workflow_path: Path,
+    changed: bool,
+    base: str | None,
+    watch: bool = False,
+    poll: bool = False,
+) -> None:
+    """Validate the ticket tree, incrementally if requested.
+
+    A path inside the tree (e.g., docs/tickets/INIT-0001) validates the whole
+    tree, so cross-file rules see parents, but only reports issues under it.
+    """
+    output.info(f"Validating ticket at {tickets_root}...")
+    if not tickets_root.is_dir():
+        output.error(f"Tickets directory not found: {tickets_root}", exit_code=2)
+        return
+    scope = ""
+    while TICKET_DIR_PATTERN.match(tickets_root.resolve().name):
+        scope = f"{tickets_root.resolve().name}/{scope}"
+        tickets_root = tickets_root.resolve().parent
+
+    changed_paths: set[str] = set()
+    if base:
+        try:
+            changed_paths = _paths_under(changed_files(base), tickets_root, workflow_path)
+        except GitError as e:
+            output.error(str(e), exit_code=2)
+            return
+
+    manifest = ValidationManifest(root=str(tickets_root.resolve()))
+    if changed:
+        cached = ValidationManifest.load(DEFAULT_MANIFEST_PATH)
+        if cached.root == manifest.root:
+            manifest = cached
+    paths = list(iter_ticket_files(tickets_root))
+    with ExitStack() as stack:
+        advance = None
+        if len(paths) >= PROGRESS_MIN_FILES:
+            advance = stack.enter_context(output.progress("Scanning tickets", len(paths))).advance
+        report = validate_tree(
+            tickets_root,
+            workflow_path,
+            manifest,
+            changed_only=changed,
+            changed_paths=changed_paths,
+            paths=paths,
+            advance=advance,
+        )
+    manifest.save(DEFAULT_MANIFEST_PATH)
+
+    if watch:
+        _stream(output, report, _scoped(report.result, scope, workflow_path))
+        _watch_tickets(output, tickets_root, workflow_path, manifest, scope, poll)
+        return
+
+    result = _scoped(report.result, scope, workflow_path)
+    summary = {"tickets": report.total, "revalidated": len(report.revalidated)}
+    if changed:
+        output.debug(
+            f"Revalidated {len(report.revalidated)} of {report.total} tickets "
+            f"({report.total - len(report.revalidated)} unchanged)"
+        )
+    _report(output, result, f"{report.total} tickets are valid", summary)
+
+
+def _validate_roots(
+    output: OutputFormatter, roots: list[TicketRoot], changed: bool, base: str | None
+) -> None:
+    """Validate several roots concurrently and print one report covering all of them."""
+    output.info(f"Validating {len(roots)} ticket root(s)...")
+    files: set[str] = set()
+    if base:
+        try:
+            files = changed_files(base)
+        except GitError as e:
+            output.error(str(e), exit_code=2)
+            return
+    reports = map_roots(partial(_validate_root, changed=changed, files=files), roots)
+
+    entries = []
+    issue_rows = []
+    summary_rows = []
+    for root, report in zip(roots, reports, strict=True):
+        result = report.result
+        entries.append(
+            {
+                **root.to_dict(),
+                **result.to_dict(),
+                "tickets": report.total,
+                "revalidated": len(report.revalidated),
+            }
+        )
+        issue_rows += [
+            [root.name, i.severity, i.path or "", str(i.line or ""), i.type, i.message]
+            for i in result.errors + result.warnings
+        ]
+        summary_rows.append(
+            [root.name, str(report.total), str(len(result.errors)), str(len(result.warnings))]
+        )
+
+    total = sum(report.total for report in reports)
+    errors = sum(len(report.result.errors) for report in reports)
+    if not output.json_mode:
+        if issue_rows:
+            output.table(["Root", "Severity", "Path", "Line", "Type", "Message"], issue_rows)
+        output.table(["Root", "Tickets", "Errors", "Warnings"], summary_rows)
+    data = {"valid": not errors, "tickets": total, "roots": entries}
+    if not errors:
+        output.success(
+            f"{total} tickets in {len(roots)} root(s) are valid",
+            data=data if output.json_mode else None,
+        )
+    else:
+        failed = sum(1 for report in reports if not report.result.valid)
+        output.error(
+            f"Validation failed with {errors} error(s) in {failed} root(s)",
+            details=data if output.json_mode else None,
+        )
+
+
+def _validate_root(root: TicketRoot, changed: bool, files: set[str]) -> TreeValidation:
+    """Validate one root with its own workflow and manifest (runs in a worker process)."""
+    manifest_path = root.cache(DEFAULT_MANIFEST_PATH)
+    manifest = ValidationManifest(root=str(root.tickets.resolve()))
+    if changed:
+        cached = ValidationManifest.load(manifest_path)
+        if cached.root == manifest.root:
+            manifest = cached
+    report = validate_tree(
+        root.tickets,
+        root.workflow,
+        manifest,
+        changed_only=changed,
+        changed_paths=_paths_under(files, root.tickets, root.workflow),
+    )
+    manifest.save(manifest_path)
+    return report
+
+
+def _watch_tickets(
+    output: OutputFormatter,
+    tickets_root: Path,
+    workflow_path: Path,
+    manifest: ValidationManifest,
+    scope: str,
+    poll: bool,
+) -> None:
+    """Revalidate incrementally after each burst of changes until interrupted."""
+    with open_watcher(tickets_root, [workflow_path], polling=poll) as watcher:
+        mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+        output.info(f"Watching {tickets_root} for changes ({mode}, Ctrl+C to stop)...")
+        try:
+            for changed in watch_changes(watcher):
+                output.debug(f"{len(changed)} path(s) changed")
+                batch = _watched_paths(
+                    manifest, _paths_under(changed, tickets_root, workflow_path), tickets_root
+                )
+                if batch is None:
+                    report = validate_tree(tickets_root, workflow_path, manifest, changed_only=True)
+                else:
+                    paths, changed_paths = batch
+                    report = validate_tree(
+                        tickets_root,
+                        workflow_path,
+                        manifest,
+                        changed_only=True,
+                        changed_paths=changed_paths,
+                        paths=paths,
+                        trust_manifest=True,
+                    )
+                manifest.save(DEFAULT_MANIFEST_PATH)
+                if report.revalidated or report.workflow_revalidated:
+                    _stream(output, report, _scoped(report.result, scope, workflow_path))
+        except KeyboardInterrupt:
+            output.info("Stopped watching")
+
+
+def _stream(output: OutputFormatter, report: TreeValidation, result: ValidationResult) -> None:
+    """Print one watch-mode result without exiting."""
+    if output.json_mode:
+        output.event(
+            "validation",
+            {**result.to_dict(), "tickets": report.total, "revalidated": report.revalidated},
+        )
+        return
+    issues = result.errors + result.warnings
+    if issues:
+        output.table(
+            ["Severity", "Path", "Line", "Type", "Message"],
+            [[i.severity, i.path or "", str(i.line or ""), i.type, i.message] for i in issues],
+        )
+    checked = f"revalidated {len(report.revalidated)} of {report.total}"
+    if result.valid:
+        output.success(f"{report.total} tickets are valid ({checked})")
+    else:
+        output.warning(f"Validation failed with {len(result.errors)} error(s) ({checked})")
+
+
+def _scoped(result: ValidationResult, scope: str, workflow_path: Path) -> ValidationResult:
+    """Keep only issues under scope (a path prefix) and workflow issues."""
+    if not scope:
+        return result
+    scoped = ValidationResult()
+    scoped.extend(
+        [
+            issue
+            for issue in result.errors + result.warnings
+            if issue.path == str(workflow_path) or (issue.path or "").startswith(scope)
+        ]
+    )
+    return scoped
+
+
+def _validate_config(output: OutputFormatter, config_dir: Path) -> None:
+    """Validate YAML syntax of every file in the .gitstory/ directory."""
+    output.info(f"Validating config at {config_dir}...")
+    if not config_dir.is_dir():
+        output.error(f"Config directory not found: {config_dir}", exit_code=2)
+        return
+    result = ValidationResult()
+    for yaml_file in sorted([*config_dir.rglob("*.yaml"), *config_dir.rglob("*.yml")]):
+        outcome = validate_yaml_file(str(yaml_file))
+        if outcome is not True:
+            result.add(
+                ValidationIssue(type="yaml_syntax", message=str(outcome), path=str(yaml_file))
+            )
+    _report(output, result, f"Config {config_dir} is valid", {})
+
+
+def _watched_paths(
+    manifest: ValidationManifest, changed: set[str], tickets_root: Path
+) -> tuple[list[str], set[str]] | None:
+    """Ticket files and forced paths for validate_tree after one watch batch.
+
+    Manifest entries the watcher did not report are trusted as-is, so a
+    batch only touches the changed files on disk. A changed ticket directory
+    was created, moved or removed: manifest entries below it are re-checked
+    too (the watcher already reports the files inside trees moved in).
+
+    Returns:
+        (paths, changed_paths) for validate_tree, or None when the whole tree
+        must be rescanned (the watcher reports the root after dropping events)
+    """
+    if "." in changed:
+        return None
+    directories = tuple(f"{p}/" for p in changed if TICKET_DIR_PATTERN.match(p.rpartition("/")[2]))
+    stale = {
+        p for p in manifest.files if p in changed or (directories and p.startswith(directories))
+    }
+    gone = {p for p in stale if not (tickets_root / p).is_file()}
+    paths = [p for p in manifest.files if p not in gone]
+    paths += sorted(
+        p
+        for p in changed
+        if p not in manifest.files and is_ticket_path(p) and (tickets_root / p).is_file()
+    )
+    return paths, changed | stale
+
+
+def _paths_under(paths: set[str], tickets_root: Path, workflow_path: Path) -> set[str]:
+    """Convert cwd-relative paths to tickets-root-relative ones (workflow path kept as-is)."""
+    root = tickets_root.resolve()
+    workflow = workflow_path.resolve()
+    converted: set[str] = set()
+    for raw in paths:
+        resolved = Path(raw).resolve()
+        if resolved == workflow:
+            converted.add(str(workflow_path))
+        elif resolved.is_relative_to(root):
+            converted.add(resolved.relative_to(root).as_posix())
+    return converted
+
+
+def _report(
+    output: OutputFormatter, result: ValidationResult, message: str, summary: dict[str, int]
+) -> None:
+    """Print validation issues and exit non-zero on errors."""
+    issues = result.errors + result.warnings
+    if issues and not output.json_mode:
+        output.table(
+            ["Severity", "Path", "Line", "Type", "Message"],
+            [[i.severity, i.path or "", str(i.line or ""), i.type, i.message] for i in issues],
+        )
+    data = {**result.to_dict(), **summary} if output.json_mode else summary
+    if result.valid:
+        output.success(message, data=data or None)
+    else:
+        output.error(f"Validation failed with {len(result.errors)} error(s)", details=data or None)
@@ -0,0 +1,234 @@
+"""Plugin benchmarking against a latency and resource budget.
+
+bench_plugin runs a plugin a few times to warm caches (interpreter startup,
+page cache, .pyc files), then N measured times against the same ticket, and
+reports wall time percentiles, CPU time, peak memory and output size.
+EPIC-0001.4 requires every plugin to finish within 3 seconds; BenchBudget
+holds that limit by default and can add memory and output limits.
+
+CPU time and memory are the per-run resources run_plugin records from
+wait4: user + system CPU time of the plugin, and its peak resident set.
+Peak RSS is the largest of the measured runs.
+
+Plugins usually read the tickets around the one they run for, so
+write_fixture creates a small tree (initiative, epic, story with two tasks)
+for benchmarking outside a project.
+
+Example:
+    >>> report = bench_plugin("guard", {"file": path}, "STORY-0001.1.1", runs=20)
+    >>> report.violations
+    []
+"""
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.execute import progress_bar
+from gitstory.core.plugins import (
+    DEFAULT_PLUGIN_TIMEOUT,
+    PluginResult,
+    PluginSpec,
+    plugin_name,
+    run_plugin,
+)
+from gitstory.core.templates import TemplateSet
+from gitstory.models import DEFAULT_TICKETS_ROOT, TicketId
+
+DEFAULT_BENCH_RUNS = 20
+DEFAULT_WARMUP_RUNS = 2
+# EPIC-0001.4: no plugin may take longer than this (max wall time, seconds)
+DEFAULT_BUDGET_SECONDS = 3.0
+
+# Ticket the fixture tree is built around
+FIXTURE_TICKET = "STORY-0001.1.1"
+
+
+@dataclass(frozen=True)
+class BenchBudget:
+    """Limits a benchmark must stay within (None disables a limit).
+
+    Attributes:
+        max_seconds: Slowest run's wall time
+        max_rss_mb: Peak resident set size, in MiB
+        max_output_bytes: Largest stdout of a run
+    """
+
+    max_seconds: float | None = DEFAULT_BUDGET_SECONDS
+    max_rss_mb: float | None = None
+    max_output_bytes: int | None = None
+
+
+@dataclass
+class BenchReport:
+    """Measurements of a plugin benchmark.
+
+    Attributes:
+        type: Plugin type (guard, event, action)
+        name: Plugin name
+        ticket_id: Ticket the plugin ran for
+        warmup: Unmeasured runs before the measured ones
+        wall: Wall time of each measured run, in seconds
+        cpu: User + system CPU time of each measured run, in seconds
+        output_bytes: Stdout size of each measured run
+        peak_rss_bytes: Largest resident set of a measured run (0 where unavailable)
+        exit_codes: Number of measured runs by exit code
+        budget: Budget the runs are checked against
+    """
+
+    type: str
+    name: str
+    ticket_id: str
+    warmup: int
+    wall: list[float] = field(default_factory=list)
+    cpu: list[float] = field(default_factory=list)
+    output_bytes: list[int] = field(default_factory=list)
+    peak_rss_bytes: int = 0
+    exit_codes: dict[int, int] = field(default_factory=dict)
+    budget: BenchBudget = field(default_factory=BenchBudget)
+
+    @property
+    def p50(self) -> float:
+        """Median wall time."""
+        return percentile(self.wall, 50)
+
+    @property
+    def p95(self) -> float:
+        """95th percentile wall time."""
+        return percentile(self.wall, 95)
+
+    @property
+    def max(self) -> float:
+        """Slowest wall time."""
+        return max(self.wall, default=0.0)
+
+    @property
+    def violations(self) -> list[str]:
+        """Budget limits exceeded, and runs that errored (exit code 2)."""
+        budget = self.budget
+        problems = []
+        if budget.max_seconds is not None and self.max > budget.max_seconds:
+            problems.append(f"max wall time {self.max:.3f}s > {budget.max_seconds:g}s")
+        peak_mb = self.peak_rss_bytes / 2**20
+        if budget.max_rss_mb is not None and peak_mb > budget.max_rss_mb:
+            problems.append(f"peak RSS {peak_mb:.1f} MiB > {budget.max_rss_mb:g} MiB")
+        largest = max(self.output_bytes, default=0)
+        if budget.max_output_bytes is not None and largest > budget.max_output_bytes:
+            problems.append(f"output {largest} bytes > {budget.max_output_bytes} bytes")
+        if self.exit_codes.get(2):
+            problems.append(f"{self.exit_codes[2]} run(s) errored (exit code 2)")
+        return problems
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "type": self.type,
+            "name": self.name,
+            "ticket_id": self.ticket_id,
+            "runs": len(self.wall),
+            "warmup": self.warmup,
+            "wall": {
+                "p50": round(self.p50, 4),
+                "p95": round(self.p95, 4),
+                "max": round(self.max, 4),
+            },
+            "cpu": {"total": round(sum(self.cpu), 4), "max": round(max(self.cpu, default=0), 4)},
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "output_bytes": max(self.output_bytes, default=0),
+            "exit_codes": {str(code): n for code, n in sorted(self.exit_codes.items())},
+            "budget": {
+                "max_seconds": self.budget.max_seconds,
+                "max_rss_mb": self.budget.max_rss_mb,
+                "max_output_bytes": self.budget.max_output_bytes,
+            },
+            "violations": self.violations,
+        }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of values (0.0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+def bench_plugin(
+    plugin_type: str,
+    spec: PluginSpec,
+    ticket_id: str,
+    runs: int = DEFAULT_BENCH_RUNS,
+    warmup: int = DEFAULT_WARMUP_RUNS,
+    budget: BenchBudget | None = None,
+    cwd: Path | None = None,
+    timeout: float = DEFAULT_PLUGIN_TIMEOUT,
+) -> BenchReport:
+    """Run a plugin warmup + runs times and measure the last runs.
+
+    Args:
+        plugin_type: guard, event or action
+        spec: Plugin spec, as accepted by run_plugin
+        ticket_id: Ticket the plugin runs for
+        runs: Measured runs
+        warmup: Unmeasured runs first
+        budget: Limits to check (default: BenchBudget())
+        cwd: Working directory of the plugin (e.g., a fixture project)
+        timeout: Seconds before a run is killed (counted as an error)
+
+    Returns:
+        BenchReport
+
+    Raises:
+        PluginNotFoundError: If a string-form plugin is not found
+    """
+    report = BenchReport(
+        plugin_type, plugin_name(spec), ticket_id, warmup, budget=budget or BenchBudget()
+    )
+    for _ in range(warmup):
+        run_plugin(plugin_type, spec, ticket_id, timeout=timeout, cwd=cwd)
+    for _ in range(runs):
+        result = run_plugin(plugin_type, spec, ticket_id, timeout=timeout, cwd=cwd)
+        _record(report, result)
+    return report
+
+
+def write_fixture(root: Path) -> str:
+    """Write a small ticket tree below root (a project directory).
+
+    Returns:
+        ID of the fixture story, which has one done and one in-progress task
+    """
+    templates = TemplateSet.load(None)
+    story = TicketId.parse(FIXTURE_TICKET)
+    initiative, epic = TicketId(story.parts[:1]), TicketId(story.parts[:2])
+    tickets = [
+        (initiative, "initiative", "Fixture initiative", "🟡 In Progress", None),
+        (epic, "epic", "Fixture epic", "🟡 In Progress", initiative),
+        (story, "story", "Fixture story", "🟡 In Progress", epic),
+        (story.child(1), "task", "Done task", "✅ Complete", story),
+        (story.child(2), "task", "Open task", "🟡 In Progress", story),
+    ]
+    for ticket_id, ticket_type, title, status, parent in tickets:
+        path = root / DEFAULT_TICKETS_ROOT / ticket_id.relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        values = {
+            "id": str(ticket_id),
+            "title": title,
+            "status": status,
+            "parent": str(parent) if parent else "",
+            "fields": "",
+            "progress": progress_bar(1, 2),
+            "body": "\n## Description\n\nBenchmark fixture.\n",
+        }
+        path.write_text(templates[ticket_type].render(values), encoding="utf-8")
+    return str(story)
+
+
+def _record(report: BenchReport, result: PluginResult) -> None:
+    """Add one measured run to report."""
+    report.wall.append(result.duration)
+    report.cpu.append(result.cpu_seconds)
+    report.output_bytes.append(result.output_bytes)
+    report.peak_rss_bytes = max(report.peak_rss_bytes, result.max_rss_bytes)
+    report.exit_codes[result.exit_code] = report.exit_codes.get(result.exit_code, 0) + 1
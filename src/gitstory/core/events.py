@@ -0,0 +1,307 @@
+"""Incremental detection of git ref events (branches created, deleted, merged).
+
+Event plugins like branch_merged ask git on every run whether something
+happened (`git log --merges --grep=STORY-... --since=...`), walking history
+each time. detect_ref_events keeps a cursor in `.gitstory/cache/events.json`
+instead: the tip of every local branch at the last run, the tip of the
+target branch (e.g., main), and the branches already seen merged into it.
+A run lists the branches with one `git for-each-ref` and only looks further
+at what changed since the cursor:
+
+- branch_created / branch_deleted: branches added / removed
+- branch_merged: branches whose tip became reachable from the target. When
+  the target moved forward, reachability only grew by `<old tip>..<new tip>`,
+  so that range is listed once (O(new commits)) and every unmoved branch is
+  a set lookup; branches that moved themselves get one
+  `merge-base --is-ancestor` each. Only a rewritten target falls back to a
+  full `for-each-ref --merged` scan.
+
+The first run (or a new target) records a baseline and reports nothing,
+otherwise every branch ever merged would fire. A branch created since the
+last run counts as merged only if its tip arrived in the target since then
+and is not the target tip itself; one created at a commit the target already
+had (no commits of its own yet) joins the baseline. A branch created and
+deleted between two runs is never seen.
+
+Events name the ticket whose ID appears in the branch name (e.g.,
+gitstory/STORY-0001.2.3). deliver_events takes, for each, the workflow
+transition declared `on:` that event type from the ticket's current state.
+
+Example:
+    >>> cursor = EventCursor.read(DEFAULT_CURSOR_PATH)
+    >>> events, cursor = detect_ref_events(Path("."), cursor, "main")
+    >>> outcomes, written = deliver_events(events, tickets_root, workflow, load)
+    >>> cursor.write(DEFAULT_CURSOR_PATH)
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.execute import (
+    ExecutionRequest,
+    apply_with_retry,
+    plan_execution,
+)
+from gitstory.core.git import GitError, run_git
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import TICKET_REF_PATTERN
+from gitstory.core.workflow import Transition, Workflow
+from gitstory.core.writer import atomic_write
+
+DEFAULT_CURSOR_PATH = ".gitstory/cache/events.json"
+# Bump when the cursor format changes so old cursors start a new baseline
+CURSOR_VERSION = 1
+DEFAULT_EVENT_TARGET = "main"
+# In the order they are reported for one branch
+REF_EVENTS = ("branch_created", "branch_merged", "branch_deleted")
+
+
+@dataclass(frozen=True)
+class RefEvent:
+    """A change of a branch since the cursor.
+
+    Attributes:
+        type: One of REF_EVENTS
+        branch: Branch name
+        commit: Branch tip (the last one seen, for deleted branches)
+        ticket_id: Ticket ID found in the branch name, if any
+    """
+
+    type: str
+    branch: str
+    commit: str
+    ticket_id: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "type": self.type,
+            "branch": self.branch,
+            "commit": self.commit,
+            "ticket_id": self.ticket_id,
+        }
+
+
+@dataclass
+class EventCursor:
+    """Ref state at the end of the last run.
+
+    Attributes:
+        target: Branch merges are detected into
+        target_tip: Commit of target (None if it did not exist)
+        refs: Tip of every local branch
+        merged: Branches reachable from target_tip, with the tip that was reachable
+        scanned: Commits listed on the run that produced this cursor (not persisted)
+    """
+
+    target: str
+    target_tip: str | None = None
+    refs: dict[str, str] = field(default_factory=dict)
+    merged: dict[str, str] = field(default_factory=dict)
+    scanned: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the JSON cache."""
+        return {
+            "version": CURSOR_VERSION,
+            "target": self.target,
+            "target_tip": self.target_tip,
+            "refs": self.refs,
+            "merged": self.merged,
+        }
+
+    @classmethod
+    def read(cls, path: Path | str) -> "EventCursor | None":
+        """Load a cursor, returning None if missing, corrupt or outdated."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CURSOR_VERSION:
+                return None
+            return cls(
+                target=str(data["target"]),
+                target_tip=data["target_tip"],
+                refs={str(k): str(v) for k, v in data["refs"].items()},
+                merged={str(k): str(v) for k, v in data["merged"].items()},
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def write(self, path: Path | str) -> None:
+        """Write the cursor atomically (see gitstory.core.writer.atomic_write)."""
+        data = json.dumps(self.to_dict(), separators=(",", ":"), sort_keys=True)
+        atomic_write(path, data.encode())
+
+
+def detect_ref_events(
+    repo: Path, cursor: EventCursor | None, target: str = DEFAULT_EVENT_TARGET
+) -> tuple[list[RefEvent], EventCursor]:
+    """Compare the branches of repo with cursor.
+
+    Args:
+        repo: Directory inside the repository
+        cursor: Cursor of the last run (None for a first run)
+        target: Branch merges are detected into
+
+    Returns:
+        (events in branch order, cursor to save once the events are handled)
+
+    Raises:
+        GitError: If git fails (e.g., repo is not a repository)
+    """
+    refs = list_branches(repo)
+    tip = refs.get(target)
+    if cursor is None or cursor.target != target:
+        merged = list_branches(repo, tip) if tip else {}
+        return [], EventCursor(target, tip, refs, merged)
+
+    old = cursor.refs
+    created = {b for b in refs if b not in old}
+    moved = {b for b in refs if b in old and old[b] != refs[b]}
+    deleted = {b: old[b] for b in old if b not in refs}
+    # Branches that moved since they were merged are no longer known merged
+    merged = {b: t for b, t in cursor.merged.items() if refs.get(b) == t}
+    newly: set[str] = set()
+    scanned = 0
+    if tip is not None:
+        if cursor.target_tip is not None and tip != cursor.target_tip:
+            if _is_ancestor(repo, cursor.target_tip, tip):
+                added = run_git(["rev-list", f"{cursor.target_tip}..{tip}"], repo).split()
+                scanned = len(added)
+                reachable = set(added)
+                newly |= {b for b, t in refs.items() if b not in merged and t in reachable}
+                newly |= {b for b, t in deleted.items() if t in reachable}
+            else:
+                rescanned = list_branches(repo, tip)
+                newly |= {b for b, t in rescanned.items() if b not in merged and t == refs[b]}
+                newly |= {
+                    b
+                    for b, t in deleted.items()
+                    if b not in cursor.merged and _is_ancestor(repo, t, tip)
+                }
+        elif cursor.target_tip is None:
+            # A new target starts a new baseline
+            merged = list_branches(repo, tip)
+        for branch in moved - newly:
+            if branch not in merged and _is_ancestor(repo, refs[branch], tip):
+                newly.add(branch)
+        # A new branch with no commits of its own is reachable without being merged
+        baseline = {
+            b
+            for b in created
+            if (b not in newly or refs[b] == tip) and _is_ancestor(repo, refs[b], tip)
+        }
+        newly -= baseline
+        merged.update((b, refs[b]) for b in baseline)
+    newly.discard(target)
+    merged.update((b, refs[b]) for b in newly if b in refs)
+
+    events = [RefEvent("branch_created", b, refs[b], _ticket_id(b)) for b in created]
+    events += [
+        RefEvent("branch_merged", b, refs.get(b) or deleted[b], _ticket_id(b)) for b in newly
+    ]
+    events += [RefEvent("branch_deleted", b, t, _ticket_id(b)) for b, t in deleted.items()]
+    events.sort(key=lambda e: (e.branch, REF_EVENTS.index(e.type)))
+    return events, EventCursor(target, tip, refs, merged, scanned)
+
+
+def list_branches(repo: Path, merged_into: str | None = None) -> dict[str, str]:
+    """Tip of every local branch (only those reachable from merged_into, if given)."""
+    args = ["for-each-ref", "--format=%(objectname) %(refname:short)"]
+    if merged_into is not None:
+        args.append(f"--merged={merged_into}")
+    output = run_git([*args, "refs/heads/"], repo)
+    return {name: sha for sha, name in (line.split(" ", 1) for line in output.splitlines() if line)}
+
+
+def deliver_events(
+    events: Iterable[RefEvent],
+    tickets_root: Path,
+    workflow: Workflow,
+    load: Callable[[], TicketIndex],
+) -> tuple[list[dict[str, Any]], list[Path]]:
+    """Take the transition declared for each event on the ticket it names.
+
+    Each event is planned and applied on its own, so a failed guard only
+    skips that ticket.
+
+    Args:
+        events: Events from detect_ref_events
+        tickets_root: Tickets root directory
+        workflow: Workflow whose transitions declare `on:` event types
+        load: Returns a fresh index of tickets_root (e.g., load_index)
+
+    Returns:
+        (one outcome per event: the event, the transition taken or None, a
+        status (applied, unchanged, skipped, ignored) and a message; the
+        files written)
+
+    Raises:
+        ExecutionError, OSError: If writing a ticket fails (no file of that ticket changed)
+    """
+    outcomes = []
+    files: list[Path] = []
+    for event in events:
+        outcome: dict[str, Any] = {
+            **event.to_dict(),
+            "transition": None,
+            "status": "ignored",
+            "message": "",
+        }
+        outcomes.append(outcome)
+        index = load()
+        header = index.by_id.get(event.ticket_id) if event.ticket_id else None
+        if header is None:
+            outcome["message"] = (
+                "No ticket in branch name" if not event.ticket_id else "Unknown ticket"
+            )
+            continue
+        state = workflow.state_for_status(header.status or "")
+        transition = _transition_on(workflow, event.type, state.id if state else None)
+        if transition is None:
+            outcome["message"] = f"No transition on {event.type} from this state"
+            continue
+        outcome["transition"] = transition.id
+        requests = [ExecutionRequest(header.ticket_id or "", transition=transition.id)]
+        plan = plan_execution(requests, index, tickets_root, workflow)
+        if plan.ok:
+            plan, written = apply_with_retry(requests, plan, tickets_root, workflow, load)
+            if plan.ok:
+                outcome["status"] = "applied" if written else "unchanged"
+                files += written
+                continue
+        outcome["status"] = "skipped"
+        outcome["message"] = "; ".join(
+            [e["message"] for e in plan.errors]
+            + [f"Guard {g.guard} failed" for g in plan.failed_guards]
+        )
+    return outcomes, files
+
+
+def _transition_on(workflow: Workflow, event_type: str, state: str | None) -> Transition | None:
+    """Transition taken on event_type from state (declared ones before wildcards)."""
+    if state is None:
+        return None
+    candidates = [
+        t for t in workflow.transitions if t.on == event_type and t.from_state in (state, "*")
+    ]
+    candidates.sort(key=lambda t: t.from_state == "*")
+    return candidates[0] if candidates else None
+
+
+def _is_ancestor(repo: Path, commit: str, tip: str) -> bool:
+    """True if commit is reachable from tip."""
+    try:
+        run_git(["merge-base", "--is-ancestor", commit, tip], repo)
+    except GitError:
+        return False
+    return True
+
+
+def _ticket_id(branch: str) -> str | None:
+    """Ticket ID named in a branch, if any."""
+    match = TICKET_REF_PATTERN.search(branch)
+    return match.group() if match else None
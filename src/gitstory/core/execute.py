@@ -0,0 +1,449 @@
+"""Bulk ticket state transitions.
+
+plan_execution() resolves a transition for every requested ticket, applies
+all state changes to an in-memory view and only then evaluates guards, so
+guards see the whole batch (completing a story together with its last tasks
+passes all_children_done). If any request is invalid or any guard fails,
+the plan is not applicable and nothing is written.
+
+An applicable plan touches each file at most once: the new `**Status**` of
+every transitioned ticket (plus `**Actual Hours**` if given) and the
+`**Progress**` rollup of every affected parent are patched into the file's
+header bytes, then all files are written as one batch (see
+gitstory.core.writer). Values that do not change meaning (a status mapping
+to the same state, an unchanged percentage) are left as they are, and files
+without changes are not rewritten.
+
+Concurrent runs (several agents, several worktrees sharing a checkout)
+use optimistic concurrency rather than a global lock. Planning re-reads
+every file its written values depend on (the tickets, their children,
+their parents and siblings) and records their content hashes. apply_plan
+hands those hashes to write_files, which checks them under per-file locks
+just before replacing. If another run got there first, apply_with_retry
+plans again against fresh data, so a parent's `**Progress**` is never
+computed from stale sibling states.
+
+Example:
+    >>> plan = plan_execution([ExecutionRequest("TASK-0001.2.4.3")], index, root, workflow)
+    >>> if plan.ok:
+    ...     apply_plan(plan, root)
+"""
+
+import io
+import random
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.guards import GuardContext, GuardOutcome, evaluate_guard
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import parse_header
+from gitstory.core.workflow import Transition, Workflow
+from gitstory.core.writer import WriteConflictError, content_hash, patch_header, write_files
+
+PROGRESS_BAR_WIDTH = 10
+# Plans tried before a write conflict is reported
+CONFLICT_RETRIES = 5
+# Upper bound of the first random wait before re-planning (seconds, doubled per retry)
+CONFLICT_BACKOFF = 0.01
+_PLURALS = {"epic": "epics", "story": "stories", "task": "tasks"}
+
+GuardEvaluator = Callable[[Any, GuardContext], GuardOutcome]
+
+
+class ExecutionError(ValueError):
+    """Raised for requests that cannot be planned (unknown ticket, no transition)."""
+
+
+@dataclass(frozen=True)
+class ExecutionRequest:
+    """One ticket to transition.
+
+    Attributes:
+        ticket_id: Ticket ID or glob (e.g., "TASK-0001.2.4.*")
+        transition: Transition ID to take (e.g., "complete_work")
+        to_state: Target state ID (e.g., "done"); used if transition is not given
+        actual_hours: New `**Actual Hours**` value, if any
+    """
+
+    ticket_id: str
+    transition: str | None = None
+    to_state: str | None = None
+    actual_hours: str | None = None
+
+
+@dataclass
+class Change:
+    """A planned state change for one ticket."""
+
+    ticket_id: str
+    path: str
+    transition: Transition
+    from_state: str
+    to_state: str
+    actual_hours: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "ticket_id": self.ticket_id,
+            "path": self.path,
+            "transition": self.transition.id,
+            "from": self.from_state,
+            "to": self.to_state,
+        }
+
+
+@dataclass
+class ExecutionPlan:
+    """Changes, guard outcomes and new file contents for a batch.
+
+    Attributes:
+        changes: One change per transitioned ticket, in request order
+        guards: Outcome of every guard evaluated
+        errors: Requests that could not be planned, as {"ticket_id", "message"}
+        files: New contents of changed files by path relative to the tickets root
+        versions: Content hash of every file the plan was computed from, as read
+    """
+
+    changes: list[Change] = field(default_factory=list)
+    guards: list[GuardOutcome] = field(default_factory=list)
+    errors: list[dict[str, str]] = field(default_factory=list)
+    files: dict[str, bytes] = field(default_factory=dict)
+    versions: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if every request was planned and every guard passed."""
+        return not self.errors and all(g.passed for g in self.guards)
+
+    @property
+    def failed_guards(self) -> list[GuardOutcome]:
+        """Guards that did not pass."""
+        return [g for g in self.guards if not g.passed]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "changes": [c.to_dict() for c in self.changes],
+            "guards": [g.to_dict() for g in self.guards],
+            "errors": self.errors,
+            "files": sorted(self.files),
+        }
+
+
+def expand_requests(
+    requests: Iterable[ExecutionRequest], index: TicketIndex
+) -> list[ExecutionRequest]:
+    """Expand glob requests against the index (in tree order), dropping duplicates.
+
+    Args:
+        requests: Requests whose ticket_id may contain *, ? or [...]
+        index: Ticket index
+
+    Returns:
+        One request per ticket ID (first request wins)
+
+    Raises:
+        ExecutionError: If a glob matches no ticket
+    """
+    expanded: dict[str, ExecutionRequest] = {}
+    for request in requests:
+        if not any(c in request.ticket_id for c in "*?["):
+            expanded.setdefault(request.ticket_id, request)
+            continue
+        matches = [t for t in index.by_id if fnmatchcase(t, request.ticket_id)]
+        if not matches:
+            raise ExecutionError(f"No tickets match {request.ticket_id}")
+        for ticket_id in sorted(matches, key=index.sort_key):
+            expanded.setdefault(ticket_id, replace(request, ticket_id=ticket_id))
+    return list(expanded.values())
+
+
+def choose_transition(
+    workflow: Workflow,
+    from_state: str,
+    transition: str | None = None,
+    to_state: str | None = None,
+) -> Transition:
+    """Pick the transition to take from from_state.
+
+    Args:
+        workflow: Workflow to search
+        from_state: Current state ID
+        transition: Transition ID, if requested explicitly
+        to_state: Target state ID, if requested
+
+    Returns:
+        The named transition, else the transition to to_state, else the first
+        transition leaving from_state (wildcard "*" transitions only match
+        explicit requests)
+
+    Raises:
+        ExecutionError: If no such transition leaves from_state
+    """
+    candidates = [t for t in workflow.transitions if t.from_state in (from_state, "*")]
+    # Transitions declared for this state win over wildcard ones
+    candidates.sort(key=lambda t: t.from_state == "*")
+    if transition is not None:
+        match = next((t for t in candidates if t.id == transition), None)
+    elif to_state is not None:
+        match = next((t for t in candidates if t.to_state == to_state), None)
+    else:
+        match = next((t for t in candidates if t.from_state == from_state), None)
+    if match is None:
+        wanted = transition or (f"to {to_state}" if to_state else "transition")
+        raise ExecutionError(f"No {wanted} allowed from state {from_state}")
+    return match
+
+
+def plan_execution(
+    requests: Iterable[ExecutionRequest],
+    index: TicketIndex,
+    tickets_root: Path,
+    workflow: Workflow,
+    guard: GuardEvaluator = evaluate_guard,
+) -> ExecutionPlan:
+    """Plan a batch of transitions and evaluate their guards.
+
+    Args:
+        requests: Tickets to transition (globs are expanded)
+        index: Ticket index of tickets_root
+        tickets_root: Tickets root directory
+        workflow: Workflow defining states and transitions
+        guard: Guard evaluator (spec, context) -> outcome
+
+    Returns:
+        ExecutionPlan; files is only filled in when the plan is ok
+    """
+    plan = ExecutionPlan()
+    try:
+        requests = expand_requests(requests, index)
+    except ExecutionError as e:
+        plan.errors.append({"ticket_id": "", "message": str(e)})
+        return plan
+
+    contents = _read_inputs([r.ticket_id for r in requests], index, tickets_root)
+    for request in requests:
+        try:
+            plan.changes.append(_plan_change(request, index, workflow))
+        except ExecutionError as e:
+            plan.errors.append({"ticket_id": request.ticket_id, "message": str(e)})
+    if plan.errors:
+        return plan
+
+    planned = {c.ticket_id: c.to_state for c in plan.changes}
+    for change in plan.changes:
+        text = contents[change.path].decode("utf-8", "replace")
+        ctx = GuardContext(change.ticket_id, text, index, workflow, planned)
+        plan.guards.extend(guard(spec, ctx) for spec in change.transition.guards)
+    if not plan.ok:
+        return plan
+
+    updates: dict[str, dict[str, str]] = {}
+    for change in plan.changes:
+        fields = updates.setdefault(change.path, {})
+        if change.to_state != change.from_state:
+            fields["Status"] = workflow.status_text(change.to_state)
+        if change.actual_hours is not None:
+            fields["Actual Hours"] = change.actual_hours
+    parents = dict.fromkeys(p for c in plan.changes if (p := index.parent_id(c.ticket_id)))
+    for path, progress in rollup_updates(parents, index, workflow, planned).items():
+        updates.setdefault(path, {})["Progress"] = progress
+    for path, fields in updates.items():
+        if not fields:
+            continue
+        if path not in contents:
+            contents[path] = (tickets_root / path).read_bytes()
+        patched = patch_header(contents[path], fields)
+        if patched is not contents[path]:
+            plan.files[path] = patched
+    plan.versions = {path: content_hash(data) for path, data in contents.items()}
+    return plan
+
+
+def apply_plan(plan: ExecutionPlan, tickets_root: Path) -> list[Path]:
+    """Write every file of an applicable plan in one batch.
+
+    Args:
+        plan: Plan returned by plan_execution()
+        tickets_root: Tickets root the plan was made for
+
+    Returns:
+        Written paths (empty if no file needed a change)
+
+    Raises:
+        ExecutionError: If the plan has errors or failed guards
+        WriteConflictError: If a file the plan read has changed since (no file is changed)
+        OSError: If writing fails (no file is changed)
+    """
+    if not plan.ok:
+        raise ExecutionError("Plan has errors or failed guards; nothing was written")
+    contents = {tickets_root / path: data for path, data in sorted(plan.files.items())}
+    expected = {tickets_root / path: version for path, version in plan.versions.items()}
+    write_files(contents, expected=expected)
+    return list(contents)
+
+
+def apply_with_retry(
+    requests: Iterable[ExecutionRequest],
+    plan: ExecutionPlan,
+    tickets_root: Path,
+    workflow: Workflow,
+    load: Callable[[], TicketIndex],
+    attempts: int = CONFLICT_RETRIES,
+) -> tuple[ExecutionPlan, list[Path]]:
+    """Apply plan, planning the requests again from fresh data after each write conflict.
+
+    Args:
+        requests: Requests the plan was made from
+        plan: Plan returned by plan_execution()
+        tickets_root: Tickets root the plan was made for
+        workflow: Workflow the plan was made with
+        load: Returns a fresh index of tickets_root (e.g., load_index)
+        attempts: Plans tried before giving up
+
+    Returns:
+        The plan that was applied and the written paths, or a re-plan that is
+        no longer ok (e.g., another run already took the transition) and no paths
+
+    Raises:
+        WriteConflictError: If every attempt conflicted (no file is changed)
+        ExecutionError: If plan has errors or failed guards
+        OSError: If writing fails (no file is changed)
+    """
+    requests = list(requests)
+    attempt = 1
+    while True:
+        try:
+            return plan, apply_plan(plan, tickets_root)
+        except WriteConflictError:
+            if attempt >= attempts:
+                raise
+        # Random backoff keeps runs that conflicted together from colliding again
+        time.sleep(random.uniform(0, CONFLICT_BACKOFF * 2 ** (attempt - 1)))
+        attempt += 1
+        plan = plan_execution(requests, load(), tickets_root, workflow)
+        if not plan.ok:
+            return plan, []
+
+
+def progress_bar(done: int, total: int) -> str:
+    """Render a progress bar (e.g., "████░░░░░░ 40%")."""
+    percent = round(100 * done / total) if total else 0
+    filled = percent * PROGRESS_BAR_WIDTH // 100
+    return f"{'█' * filled}{'░' * (PROGRESS_BAR_WIDTH - filled)} {percent}%"
+
+
+def progress_rollup(
+    parent_id: str,
+    index: TicketIndex,
+    workflow: Workflow,
+    planned: Mapping[str, str] | None = None,
+) -> str:
+    """Progress rollup of parent_id over its children's (planned) states.
+
+    Example:
+        >>> progress_rollup("STORY-0001.2.4", index, workflow)
+        '████░░░░░░ 40% (2/5 tasks complete)'
+    """
+    children = index.children.get(parent_id, [])
+    ctx = GuardContext(parent_id, "", index, workflow, planned or {})
+    done = 0
+    for child in children:
+        state = ctx.state_of(child)
+        done += state is not None and state.type == "end"
+    bar = progress_bar(done, len(children))
+    parsed = index.parse_id(children[0]) if children else None
+    noun = _PLURALS.get(parsed.type, "tickets") if parsed else "tickets"
+    return f"{bar} ({done}/{len(children)} {noun} complete)"
+
+
+def rollup_updates(
+    parent_ids: Iterable[str],
+    index: TicketIndex,
+    workflow: Workflow,
+    planned: Mapping[str, str] | None = None,
+) -> dict[str, str]:
+    """New `**Progress**` values of parents whose percentage changes.
+
+    Parents without a `**Progress**` field are left alone.
+
+    Returns:
+        Progress values by parent file path (relative to the tickets root)
+    """
+    updates = {}
+    for parent_id in parent_ids:
+        header = index.get(parent_id)
+        current = header.fields.get("Progress") if header else None
+        if header is None or current is None:
+            continue
+        progress = progress_rollup(parent_id, index, workflow, planned)
+        if _percent(progress) != _percent(current.value):
+            updates[header.path] = progress
+    return updates
+
+
+def _read_inputs(ticket_ids: list[str], index: TicketIndex, tickets_root: Path) -> dict[str, bytes]:
+    """Read the files a plan depends on and refresh their headers in the index.
+
+    These are the requested tickets, their children, their parents and their
+    siblings: everything transitions, guards on children and `**Progress**`
+    rollups are computed from. Planning then works on exactly the bytes whose
+    hashes are recorded in ExecutionPlan.versions.
+
+    Returns:
+        File contents by path relative to the tickets root (deleted files are
+        dropped from the index)
+    """
+    ids: dict[str, None] = {}
+    for ticket_id in ticket_ids:
+        if ticket_id not in index:
+            continue
+        ids[ticket_id] = None
+        ids.update(dict.fromkeys(index.children.get(ticket_id, ())))
+        parent = index.parent_id(ticket_id)
+        if parent is not None and parent in index:
+            ids[parent] = None
+            ids.update(dict.fromkeys(index.children.get(parent, ())))
+    contents = {}
+    for path in [index.by_id[t].path for t in ids if t in index]:
+        try:
+            data = (tickets_root / path).read_bytes()
+        except FileNotFoundError:
+            index.remove(path)
+            continue
+        contents[path] = data
+        text = io.StringIO(data.decode("utf-8", "replace"), newline=None)
+        index.add(parse_header(text, path))
+    return contents
+
+
+def _plan_change(request: ExecutionRequest, index: TicketIndex, workflow: Workflow) -> Change:
+    header = index.get(request.ticket_id)
+    if header is None:
+        raise ExecutionError(f"Ticket not found: {request.ticket_id}")
+    state = workflow.state_for_status(header.status) if header.status else None
+    if state is None:
+        raise ExecutionError(f"Unknown status: {header.status!r}")
+    if request.to_state is not None and request.to_state not in workflow.states:
+        raise ExecutionError(f"Unknown state: {request.to_state}")
+    if request.to_state == state.id:
+        raise ExecutionError(f"Already in state {state.id}")
+    transition = choose_transition(workflow, state.id, request.transition, request.to_state)
+    return Change(
+        request.ticket_id,
+        header.path,
+        transition,
+        state.id,
+        transition.to_state,
+        request.actual_hours,
+    )
+
+
+def _percent(progress: str) -> str | None:
+    """Percentage part of a Progress value ("███░░░░░░░ 30% (...)" -> "30%")."""
+    return next((word for word in progress.split() if word.endswith("%")), None)
@@ -0,0 +1,170 @@
+"""Streaming export of ticket headers as JSON Lines or CSV.
+
+Rows are produced one at a time straight from the snapshot records (see
+gitstory.core.snapshot), without building TicketHeader objects or the
+ticket index, and written in chunks of EXPORT_CHUNK_ROWS rows. Memory use
+is the snapshot plus one chunk, whatever the size of the tree.
+
+Fields are either built-in columns (RECORD_FIELDS) or the name of any
+header field (e.g., "Story Points").
+
+Example:
+    >>> snapshot = load_snapshot(Path("docs/tickets"))
+    >>> rows = iter_rows(snapshot.records.values(), DEFAULT_EXPORT_FIELDS)
+    >>> export_rows(rows, DEFAULT_EXPORT_FIELDS, "csv", sys.stdout)
+"""
+
+import csv
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, TextIO
+
+from gitstory.core.snapshot import HeaderRecord
+from gitstory.models import InvalidTicketIdError, TicketId
+
+EXPORT_FORMATS = ("jsonl", "csv")
+DEFAULT_EXPORT_FIELDS = ("ticket_id", "type", "title", "status", "parent", "path")
+# Built-in columns; any other field name is looked up in the ticket header
+RECORD_FIELDS = (*DEFAULT_EXPORT_FIELDS, "requires", "blocks")
+# Rows buffered before each write
+EXPORT_CHUNK_ROWS = 1000
+
+# Built-in names that are header fields
+_HEADER_ALIASES = {"status": "Status"}
+
+
+def iter_rows(records: Iterable[HeaderRecord], fields: Sequence[str]) -> Iterator[tuple[Any, ...]]:
+    """Yield one tuple of field values per snapshot record.
+
+    Only the requested columns are computed; header fields are looked up
+    only if one was requested.
+
+    Args:
+        records: Snapshot records, in the order to export
+        fields: Built-in column or header field names
+
+    Yields:
+        Values in field order (None for a missing header field, lists for
+        requires/blocks)
+    """
+    keys = [_HEADER_ALIASES.get(f, f) for f in fields]
+    getters = [_COLUMNS.get(k) for k in keys]
+    columns = [getter for getter in getters if getter is not None]
+    if len(columns) == len(getters):
+        for record in records:
+            yield tuple(column(record) for column in columns)
+        return
+    for record in records:
+        flat = record[3]
+        header = {flat[i]: flat[i + 1] for i in range(0, len(flat), 3)}
+        yield tuple(
+            getter(record) if getter is not None else header.get(key)
+            for getter, key in zip(getters, keys, strict=True)
+        )
+
+
+def export_rows(
+    rows: Iterable[Sequence[Any]],
+    fields: Sequence[str],
+    fmt: str,
+    out: TextIO,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> int:
+    """Write rows as JSON Lines or CSV (with a header row), chunk_rows at a time.
+
+    Args:
+        rows: Field values per ticket (e.g., from iter_rows)
+        fields: Field names (JSON keys or CSV header)
+        fmt: "jsonl" or "csv"
+        out: Text stream to write to
+        chunk_rows: Rows buffered before each write
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If fmt is not one of EXPORT_FORMATS
+    """
+    if fmt == "jsonl":
+        return _write_jsonl(rows, fields, out, chunk_rows)
+    if fmt == "csv":
+        return _write_csv(rows, fields, out, chunk_rows)
+    raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(EXPORT_FORMATS)})")
+
+
+def _write_jsonl(
+    rows: Iterable[Sequence[Any]], fields: Sequence[str], out: TextIO, chunk_rows: int
+) -> int:
+    """Write one JSON object per line."""
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    count = 0
+    chunk: list[str] = []
+    for row in rows:
+        chunk.append(encode(dict(zip(fields, row, strict=True))))
+        count += 1
+        if len(chunk) >= chunk_rows:
+            out.write("\n".join(chunk) + "\n")
+            chunk.clear()
+    if chunk:
+        out.write("\n".join(chunk) + "\n")
+    return count
+
+
+def _write_csv(
+    rows: Iterable[Sequence[Any]], fields: Sequence[str], out: TextIO, chunk_rows: int
+) -> int:
+    """Write a header row, then one row per ticket (lists joined with spaces)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    count = 0
+    for row in rows:
+        writer.writerow(
+            [" ".join(v) if isinstance(v, list) else "" if v is None else v for v in row]
+        )
+        count += 1
+        if count % chunk_rows == 0:
+            out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    out.write(buffer.getvalue())
+    return count
+
+
+@lru_cache(maxsize=4096)
+def _parse_id(ticket_id: str | None) -> TicketId | None:
+    """Parsed ticket ID, or None if missing or malformed (memoized across columns)."""
+    if ticket_id is None:
+        return None
+    try:
+        return TicketId.parse(ticket_id)
+    except InvalidTicketIdError:
+        return None
+
+
+def _type(record: HeaderRecord) -> str | None:
+    """Ticket type column."""
+    parsed = _parse_id(record[1])
+    return parsed.type if parsed else None
+
+
+def _parent(record: HeaderRecord) -> str | None:
+    """Parent ticket ID column."""
+    parsed = _parse_id(record[1])
+    parent = parsed.parent if parsed else None
+    return str(parent) if parent else None
+
+
+# Built-in columns computed from a record (path, ticket_id, title, flat fields, requires, blocks)
+_COLUMNS: dict[str, Callable[[HeaderRecord], Any]] = {
+    "ticket_id": itemgetter(1),
+    "type": _type,
+    "title": itemgetter(2),
+    "parent": _parent,
+    "path": itemgetter(0),
+    "requires": lambda record: list(record[4]),
+    "blocks": lambda record: list(record[5]),
+}
@@ -0,0 +1,87 @@
+"""Thin wrappers around the git CLI."""
+
+import subprocess
+from pathlib import Path
+
+
+class GitError(RuntimeError):
+    """Raised when a git command fails."""
+
+
+def run_git(args: list[str], cwd: Path | str = ".") -> str:
+    """Run a git command and return its stdout.
+
+    Args:
+        args: Arguments after `git` (e.g., ["diff", "--name-only", "main"])
+        cwd: Working directory for the command
+
+    Returns:
+        Command stdout
+
+    Raises:
+        GitError: If git is missing or exits non-zero
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+        )
+    except FileNotFoundError as e:
+        raise GitError("git executable not found") from e
+    if result.returncode != 0:
+        raise GitError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def changed_files(base: str, cwd: Path | str = ".") -> set[str]:
+    """Return files that differ between base and the working tree, plus untracked files.
+
+    Args:
+        base: Commit-ish to diff against (e.g., "origin/main")
+        cwd: Directory inside the repository; returned paths are relative to it
+
+    Returns:
+        POSIX paths relative to cwd
+    """
+    diff = run_git(["diff", "--name-only", "--relative", base, "--"], cwd)
+    untracked = run_git(["ls-files", "--others", "--exclude-standard"], cwd)
+    return {line for line in (diff + untracked).splitlines() if line}
+
+
+def local_branches(cwd: Path | str = ".") -> tuple[set[str], str | None]:
+    """Return local branch names and the checked-out branch in one git call.
+
+    Args:
+        cwd: Directory inside the repository
+
+    Returns:
+        (branch names, current branch or None if HEAD is detached)
+    """
+    output = run_git(["for-each-ref", "--format=%(HEAD)%(refname:short)", "refs/heads/"], cwd)
+    names: set[str] = set()
+    current = None
+    for line in output.splitlines():
+        marker, name = line[:1], line[1:]
+        names.add(name)
+        if marker == "*":
+            current = name
+    return names, current
+
+
+def commit_paths(paths: list[Path], message: str, cwd: Path | str = ".") -> str:
+    """Stage exactly paths and commit them, leaving other staged changes alone.
+
+    Args:
+        paths: Files to commit
+        message: Commit message
+        cwd: Directory inside the repository (paths are relative to it)
+
+    Returns:
+        Hash of the new commit
+
+    Raises:
+        GitError: If staging or committing fails
+    """
+    names = [str(p) for p in paths]
+    run_git(["add", "--", *names], cwd)
+    run_git(["commit", "--quiet", "-m", message, "--only", "--", *names], cwd)
+    return run_git(["rev-parse", "HEAD"], cwd).strip()
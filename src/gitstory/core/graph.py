@@ -0,0 +1,222 @@
+"""Dependency and blocker graph over the ticket index.
+
+Edges come from two sources:
+- Dependencies: `**Requires:**` / `**Blocks:**` lists (see gitstory.core.tickets)
+- Hierarchy: a child must be completed before its parent
+
+Dependency adjacency is precomputed in both directions, so "what blocks X"
+and "what does X unblock" are dict lookups. Cycles (tickets that can never
+be completed) are found with an iterative Tarjan SCC pass, linear in the
+number of edges. Since the hierarchy alone is a forest, every cycle passes
+through a dependency edge: the SCC pass only visits tickets with
+dependencies and their ancestors, so cost scales with the number of
+dependencies rather than the size of the tree.
+
+Example:
+    >>> graph = TicketGraph.from_index(TicketIndex.scan(Path("docs/tickets")))
+    >>> graph.blockers("STORY-0001.2.3")
+    ['STORY-0001.2.2']
+    >>> graph.cycles()
+    []
+"""
+
+from collections.abc import Collection, Iterable
+
+from gitstory.core.index import TicketIndex
+from gitstory.models.ticket_id import PREFIXES
+
+
+class TicketGraph:
+    """Blocker graph with precomputed forward and reverse adjacency.
+
+    Args:
+        ids: Known ticket IDs (dependencies on other IDs are reported as missing)
+        requires: Blocker IDs for each ticket (tickets that must be completed first)
+
+    Attributes:
+        blocked_by: Direct blockers of each ticket that has any
+        blocking: Tickets directly waiting on each ticket that blocks any
+        missing: Referenced but unknown ticket IDs, by referencing ticket
+    """
+
+    __slots__ = ("_ids", "blocked_by", "blocking", "missing")
+
+    def __init__(self, ids: Collection[str], requires: dict[str, Iterable[str]]) -> None:
+        self._ids = ids
+        self.blocked_by: dict[str, list[str]] = {}
+        self.blocking: dict[str, list[str]] = {}
+        self.missing: dict[str, list[str]] = {}
+        for ticket_id, blockers in requires.items():
+            for blocker in blockers:
+                self._add_edge(blocker, ticket_id, ticket_id)
+
+    @classmethod
+    def from_index(cls, index: TicketIndex) -> "TicketGraph":
+        """Build the graph from ticket headers.
+
+        `**Blocks:** Y` on X is recorded as Y requiring X, so both lists yield
+        the same edge. Unknown IDs are reported on the ticket that lists them.
+
+        Args:
+            index: Ticket index to read IDs and dependencies from
+
+        Returns:
+            TicketGraph over every indexed ticket ID
+        """
+        graph = cls(index.by_id, {})
+        for ticket_id, header in index.by_id.items():
+            for blocker in header.requires:
+                graph._add_edge(blocker, ticket_id, ticket_id)
+            for blocked in header.blocks:
+                graph._add_edge(ticket_id, blocked, ticket_id)
+        return graph
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._ids
+
+    def blockers(self, ticket_id: str, transitive: bool = False) -> list[str]:
+        """Return tickets that must be completed before ticket_id.
+
+        Args:
+            ticket_id: Ticket to look up
+            transitive: Include blockers of blockers
+
+        Returns:
+            Blocker IDs (direct ones first)
+        """
+        return _walk(ticket_id, self.blocked_by, transitive)
+
+    def unblocks(self, ticket_id: str, transitive: bool = False) -> list[str]:
+        """Return tickets waiting on ticket_id.
+
+        Args:
+            ticket_id: Ticket to look up
+            transitive: Include tickets waiting on those tickets
+
+        Returns:
+            Dependent IDs (direct ones first)
+        """
+        return _walk(ticket_id, self.blocking, transitive)
+
+    def cycles(self) -> list[list[str]]:
+        """Return groups of tickets that (transitively) wait on each other.
+
+        Both dependency edges and child-before-parent edges are followed, so a
+        ticket requiring its own ancestor is reported as a cycle too.
+
+        Returns:
+            Strongly connected components with more than one ticket (or a
+            ticket requiring itself), each in ID order, sorted by first ID
+        """
+        # Tickets with dependencies, closed upwards under the parent relation
+        nodes: dict[str, int] = {}
+        ids: list[str] = []
+        parent: list[int] = []
+        for ticket_id in (*self.blocked_by, *self.blocking):
+            chain = []
+            current: str | None = ticket_id
+            while current is not None and current not in nodes and current in self._ids:
+                nodes[current] = len(ids)
+                ids.append(current)
+                parent.append(-1)
+                chain.append(current)
+                current = _parent_id(current)
+            for child in chain:
+                parent[nodes[child]] = nodes.get(_parent_id(child) or "", -1)
+
+        successors = [
+            [nodes[d] for d in self.blocking.get(ticket_id, ())]
+            + ([parent[n]] if parent[n] != -1 else [])
+            for n, ticket_id in enumerate(ids)
+        ]
+        cyclic = []
+        for component in _strongly_connected(successors):
+            if len(component) > 1 or component[0] in successors[component[0]]:
+                cyclic.append(sorted(ids[n] for n in component))
+        return sorted(cyclic)
+
+    def _add_edge(self, blocker: str, blocked: str, source: str) -> None:
+        """Record that blocked waits on blocker; unknown IDs are reported on source."""
+        for ticket_id in (blocker, blocked):
+            if ticket_id not in self._ids:
+                if ticket_id != source:
+                    self.missing.setdefault(source, []).append(ticket_id)
+                return
+        waiting = self.blocking.setdefault(blocker, [])
+        if blocked not in waiting:
+            waiting.append(blocked)
+            self.blocked_by.setdefault(blocked, []).append(blocker)
+
+
+def _parent_id(ticket_id: str) -> str | None:
+    """Parent ID derived from a hierarchical ID by string slicing (None for roots/bugs)."""
+    prefix, _, number = ticket_id.partition("-")
+    head, dot, _ = number.rpartition(".")
+    if not dot or prefix == "BUG":
+        return None
+    depth = head.count(".")
+    return f"{PREFIXES[depth]}-{head}" if depth < len(PREFIXES) else None
+
+
+def _walk(ticket_id: str, adjacency: dict[str, list[str]], transitive: bool) -> list[str]:
+    """Direct neighbours, or all reachable tickets in breadth-first order."""
+    direct = adjacency.get(ticket_id, [])
+    if not transitive:
+        return list(direct)
+    seen = {ticket_id}
+    order: list[str] = []
+    queue = [ticket_id]
+    for current in queue:
+        for neighbour in adjacency.get(current, ()):
+            if neighbour not in seen:
+                seen.add(neighbour)
+                order.append(neighbour)
+                queue.append(neighbour)
+    return order
+
+
+def _strongly_connected(successors: list[list[int]]) -> list[list[int]]:
+    """Iterative Tarjan SCC over an adjacency list of node numbers."""
+    count = len(successors)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(successors[root]))]
+        while work:
+            v, edges = work[-1]
+            for w in edges:
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, iter(successors[w])))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+    return components
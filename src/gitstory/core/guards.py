@@ -0,0 +1,133 @@
+"""Guard evaluation for workflow transitions.
+
+Guards named in workflow.yaml are resolved like any other plugin (see
+gitstory.core.plugins): a project or user plugin with the same name always
+wins. The default workflow's guards also have built-in implementations,
+evaluated in-process against the planned ticket states, so a bulk
+`execute` that completes a story together with its last tasks sees those
+tasks as done.
+"""
+
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.index import TicketIndex
+from gitstory.core.plugins import (
+    PluginNotFoundError,
+    PluginSpec,
+    plugin_name,
+    run_plugin,
+)
+from gitstory.core.workflow import State, Workflow
+
+ACCEPTANCE_SECTION = "## Acceptance Criteria"
+_UNCHECKED_PATTERN = re.compile(r"^\s*[-*+]\s+\[ \]\s*(?P<text>.*)$")
+
+
+@dataclass(frozen=True)
+class GuardContext:
+    """What a built-in guard may look at.
+
+    Attributes:
+        ticket_id: Ticket being transitioned
+        text: Current contents of the ticket file
+        index: Ticket index (statuses as on disk)
+        workflow: Workflow used to classify statuses
+        planned: Target state IDs of every ticket in the batch, overriding the index
+    """
+
+    ticket_id: str
+    text: str
+    index: TicketIndex
+    workflow: Workflow
+    planned: Mapping[str, str] = field(default_factory=dict)
+
+    def state_of(self, ticket_id: str) -> State | None:
+        """Return the state ticket_id will be in once the batch is applied."""
+        if ticket_id in self.planned:
+            return self.workflow.states[self.planned[ticket_id]]
+        header = self.index.get(ticket_id)
+        status = header.status if header else None
+        return self.workflow.state_for_status(status) if status else None
+
+
+@dataclass
+class GuardOutcome:
+    """Result of one guard for one ticket."""
+
+    ticket_id: str
+    guard: str
+    passed: bool
+    source: str
+    details: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "ticket_id": self.ticket_id,
+            "guard": self.guard,
+            "passed": self.passed,
+            "source": self.source,
+            "details": self.details,
+            "error": self.error,
+        }
+
+
+def all_children_done(ctx: GuardContext) -> tuple[bool, dict[str, Any]]:
+    """Pass when every child ticket is (or will be) in an end state."""
+    pending = []
+    for child in ctx.index.children.get(ctx.ticket_id, ()):
+        state = ctx.state_of(child)
+        if state is None or state.type != "end":
+            pending.append(child)
+    return not pending, {"pending": pending}
+
+
+def acceptance_criteria_met(ctx: GuardContext) -> tuple[bool, dict[str, Any]]:
+    """Pass when no `- [ ]` item is left under `## Acceptance Criteria`."""
+    unchecked = []
+    in_section = False
+    for line in ctx.text.splitlines():
+        if line.startswith("## "):
+            in_section = line.rstrip() == ACCEPTANCE_SECTION
+            continue
+        match = _UNCHECKED_PATTERN.match(line) if in_section else None
+        if match:
+            unchecked.append(match.group("text"))
+    return not unchecked, {"unchecked": unchecked}
+
+
+BUILTIN_GUARDS: dict[str, Callable[[GuardContext], tuple[bool, dict[str, Any]]]] = {
+    "all_children_done": all_children_done,
+    "acceptance_criteria_met": acceptance_criteria_met,
+}
+
+
+def evaluate_guard(
+    spec: PluginSpec, ctx: GuardContext, project_root: Path | None = None
+) -> GuardOutcome:
+    """Evaluate one guard for ctx.ticket_id.
+
+    Args:
+        spec: Guard spec from workflow.yaml (name, inline or file form)
+        ctx: Guard context with planned batch states
+        project_root: Project directory for plugin lookup (default: current directory)
+
+    Returns:
+        GuardOutcome (failed with an error for unknown guards and plugin errors)
+    """
+    name = plugin_name(spec)
+    try:
+        result = run_plugin("guard", spec, ctx.ticket_id, cwd=project_root)
+    except PluginNotFoundError as e:
+        builtin = BUILTIN_GUARDS.get(name) if isinstance(spec, str) else None
+        if builtin is None:
+            return GuardOutcome(ctx.ticket_id, name, False, "missing", error=str(e))
+        passed, details = builtin(ctx)
+        return GuardOutcome(ctx.ticket_id, name, passed, "builtin", details)
+    error = (result.stderr.strip() or None) if result.exit_code == 2 else None
+    return GuardOutcome(ctx.ticket_id, name, result.ok, "plugin", result.output, error)
@@ -0,0 +1,388 @@
+"""Status-transition history and flow metrics mined from git.
+
+Tickets only store their current `**Status**`; every earlier status lives in
+git. `git log -p -G'**Status**'` over the tickets root yields, per commit, the
+status each touched ticket was given. Those observations are cached per
+commit in `.gitstory/cache/history.json` together with the HEAD they were
+mined up to, so later runs only read `<cached head>..HEAD` (a rewritten
+history, where the cached head is no longer an ancestor, is mined again).
+
+Observations are keyed by the ticket ID implied by the file path, so moving
+a ticket file keeps its history. From them, per ticket:
+
+- lead time: first commit of the ticket to its final entry into an end state
+- cycle time: first entry into an active state to that same end
+- time in state: hours spent in each workflow state (the current open state
+  counts up to now)
+
+and per epic, the median lead/cycle times, total time in state, and
+`Estimated Hours` against `Actual Hours` of the tickets that record both.
+
+Example:
+    >>> history = load_history(Path("docs/tickets"))
+    >>> stats = epic_stats(history, load_index(Path("docs/tickets")), load_workflow())
+"""
+
+import json
+import re
+import statistics
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.git import GitError, run_git
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import FIELD_PATTERN, HeaderField, file_ticket_id, is_ticket_path
+from gitstory.core.workflow import Workflow
+from gitstory.core.writer import atomic_write, ignore_cache_errors
+from gitstory.models import TicketId
+
+DEFAULT_HISTORY_PATH = ".gitstory/cache/history.json"
+# Bump when the mined data changes so cached histories are rebuilt
+HISTORY_VERSION = 1
+
+# Commit header line in the mined log: NUL, hash, committer timestamp
+_COMMIT_FORMAT = "%x00%H %ct"
+_STATUS_REGEX = r"^\*\*Status\*\*"
+_HOURS_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
+# (ticket_id, status) pairs set by one commit
+Observations = list[tuple[str, str]]
+
+
+@dataclass
+class History:
+    """Status observations mined from git, oldest commit first.
+
+    Attributes:
+        root: Tickets root the history was mined for
+        head: Commit the history is complete up to (None if nothing was mined)
+        commits: (hash, committer timestamp, observations) of commits that set a status
+        mined: Status-changing commits read from git on this run (0 when fully cached)
+    """
+
+    root: str
+    head: str | None = None
+    commits: list[tuple[str, int, Observations]] = field(default_factory=list)
+    mined: int = 0
+
+    def transitions(self) -> dict[str, list[tuple[int, str]]]:
+        """Status changes by ticket ID: (timestamp, new status), oldest first.
+
+        Repeated observations of the same status (e.g., a file move) are not changes.
+        """
+        result: dict[str, list[tuple[int, str]]] = {}
+        for _, timestamp, observations in self.commits:
+            for ticket_id, status in observations:
+                changes = result.setdefault(ticket_id, [])
+                if not changes or changes[-1][1] != status:
+                    changes.append((timestamp, status))
+        return result
+
+    def created(self) -> dict[str, int]:
+        """Timestamp of the first commit that set a status, by ticket ID."""
+        result: dict[str, int] = {}
+        for _, timestamp, observations in self.commits:
+            for ticket_id, _ in observations:
+                result.setdefault(ticket_id, timestamp)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the JSON cache."""
+        return {
+            "version": HISTORY_VERSION,
+            "root": self.root,
+            "head": self.head,
+            "commits": [[c, t, [list(o) for o in obs]] for c, t, obs in self.commits],
+        }
+
+    @classmethod
+    def read(cls, path: Path | str) -> "History | None":
+        """Load a cached history, returning None if missing, corrupt or outdated."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != HISTORY_VERSION:
+                return None
+            commits = [(c, int(t), [(i, s) for i, s in obs]) for c, t, obs in data["commits"]]
+            return cls(root=data["root"], head=data["head"], commits=commits)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def write(self, path: Path | str) -> None:
+        """Write the history atomically (see gitstory.core.writer.atomic_write)."""
+        data = json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        atomic_write(path, data.encode())
+
+
+@dataclass(frozen=True)
+class TicketFlow:
+    """Flow metrics of one ticket (durations in hours).
+
+    Attributes:
+        ticket_id: Ticket ID
+        lead_time: First commit to completion (None while not done)
+        cycle_time: First active state to completion (None if never active or not done)
+        time_in_state: Hours per workflow state ID (raw status text if unmapped)
+    """
+
+    ticket_id: str
+    lead_time: float | None
+    cycle_time: float | None
+    time_in_state: dict[str, float]
+
+
+@dataclass
+class EpicStats:
+    """Flow and estimate metrics of an epic and the tickets below it.
+
+    Attributes:
+        epic_id: Epic ID
+        tickets: Tickets below (and including) the epic
+        completed: Tickets currently in an end state
+        lead_time: Median lead time in hours of completed tickets
+        cycle_time: Median cycle time in hours of completed tickets
+        time_in_state: Total hours per state
+        estimated_hours: Sum of `Estimated Hours` of tickets that also record actuals
+        actual_hours: Sum of `Actual Hours` of the same tickets
+    """
+
+    epic_id: str
+    tickets: int = 0
+    completed: int = 0
+    lead_time: float | None = None
+    cycle_time: float | None = None
+    time_in_state: dict[str, float] = field(default_factory=dict)
+    estimated_hours: float = 0.0
+    actual_hours: float = 0.0
+
+    @property
+    def estimate_ratio(self) -> float | None:
+        """Actual over estimated hours (above 1 means underestimated)."""
+        return self.actual_hours / self.estimated_hours if self.estimated_hours else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stats as a JSON-serializable dict (hours rounded to 0.1)."""
+        ratio = self.estimate_ratio
+        return {
+            "epic_id": self.epic_id,
+            "tickets": self.tickets,
+            "completed": self.completed,
+            "lead_time_hours": _round(self.lead_time),
+            "cycle_time_hours": _round(self.cycle_time),
+            "time_in_state_hours": {k: round(v, 1) for k, v in self.time_in_state.items()},
+            "estimated_hours": round(self.estimated_hours, 1),
+            "actual_hours": round(self.actual_hours, 1),
+            "estimate_ratio": round(ratio, 2) if ratio is not None else None,
+        }
+
+
+def load_history(
+    tickets_root: Path,
+    cache_path: Path | str | None = DEFAULT_HISTORY_PATH,
+    save: bool = True,
+) -> History:
+    """Mine status observations from git, reading only commits not yet cached.
+
+    Args:
+        tickets_root: Tickets root directory (inside a git work tree)
+        cache_path: History cache (None disables it)
+        save: Write the cache back if new commits were mined
+
+    Returns:
+        History up to HEAD (empty outside git or before the first commit)
+    """
+    root = str(tickets_root)
+    cached = History.read(cache_path) if cache_path is not None else None
+    history = cached if cached is not None and cached.root == root else History(root)
+    try:
+        head = run_git(["rev-parse", "--verify", "--quiet", "HEAD"], tickets_root).strip()
+    except GitError:
+        return History(root)
+    if head == history.head:
+        return history
+
+    revisions = head
+    if history.head is not None:
+        try:
+            run_git(["merge-base", "--is-ancestor", history.head, head], tickets_root)
+            revisions = f"{history.head}..{head}"
+        except GitError:
+            history = History(root)
+    log = run_git(
+        [
+            "log",
+            "--reverse",
+            "--no-renames",
+            "--no-color",
+            "--no-ext-diff",
+            "--relative",
+            "--unified=0",
+            f"--format={_COMMIT_FORMAT}",
+            f"-G{_STATUS_REGEX}",
+            "-p",
+            revisions,
+            "--",
+            ".",
+        ],
+        tickets_root,
+    )
+    mined = parse_log(log)
+    history.commits.extend(c for c in mined if c[2])
+    history.head = head
+    history.mined = len(mined)
+    if save and cache_path is not None:
+        with ignore_cache_errors():
+            history.write(cache_path)
+    return history
+
+
+def parse_log(log: str) -> list[tuple[str, int, Observations]]:
+    """Parse `git log -p --format=%x00%H %ct` output into per-commit status observations.
+
+    Only added `**Status**` lines of ticket files count; the first one of a
+    file wins, as in header parsing.
+    """
+    commits: list[tuple[str, int, Observations]] = []
+    for chunk in log.split("\0")[1:]:
+        header, _, diff = chunk.partition("\n")
+        commit, timestamp = header.split()
+        observations: dict[str, str] = {}
+        path: str | None = None
+        for line in diff.splitlines():
+            if line.startswith("+++ "):
+                name = line[4:]
+                path = name[2:] if name.startswith("b/") and is_ticket_path(name[2:]) else None
+            elif path is not None and line.startswith("+**Status**"):
+                match = FIELD_PATTERN.search(line[1:])
+                if match is not None:
+                    observations.setdefault(file_ticket_id(path), match.group("value"))
+        commits.append((commit, int(timestamp), list(observations.items())))
+    return commits
+
+
+def ticket_flow(
+    ticket_id: str,
+    changes: list[tuple[int, str]],
+    workflow: Workflow,
+    now: float | None = None,
+) -> TicketFlow:
+    """Compute lead time, cycle time and time in state from a ticket's status changes.
+
+    Args:
+        ticket_id: Ticket ID
+        changes: (timestamp, status) changes, oldest first
+        workflow: Workflow mapping status text to states
+        now: Current timestamp for the open state (default: time.time())
+
+    Returns:
+        TicketFlow with durations in hours
+    """
+    now = time.time() if now is None else now
+    states = [workflow.state_for_status(status) for _, status in changes]
+    time_in_state: dict[str, float] = {}
+    started: int | None = None
+    finished: int | None = None
+    for i, ((timestamp, status), state) in enumerate(zip(changes, states, strict=True)):
+        state_type = state.type if state is not None else None
+        if state_type == "active" and started is None:
+            started = timestamp
+        if state_type == "end":
+            finished = timestamp
+            if i == len(changes) - 1:
+                break
+        end = changes[i + 1][0] if i + 1 < len(changes) else now
+        key = state.id if state is not None else status
+        time_in_state[key] = time_in_state.get(key, 0.0) + (end - timestamp) / 3600
+    last = states[-1] if states else None
+    if last is None or last.type != "end":
+        finished = None
+    created = changes[0][0] if changes else None
+    return TicketFlow(
+        ticket_id=ticket_id,
+        lead_time=_hours(created, finished),
+        cycle_time=_hours(started, finished),
+        time_in_state=time_in_state,
+    )
+
+
+def epic_stats(
+    history: History,
+    index: TicketIndex,
+    workflow: Workflow,
+    now: float | None = None,
+) -> list[EpicStats]:
+    """Aggregate flow and estimate metrics per epic, in ticket order.
+
+    Tickets below an epic (its stories and their tasks) count towards it;
+    initiatives and bugs belong to no epic and are left out, as are tickets
+    that no longer exist.
+
+    Args:
+        history: Mined status history
+        index: Current ticket index (for existing tickets and hours fields)
+        workflow: Workflow mapping status text to states
+        now: Current timestamp for open states (default: time.time())
+
+    Returns:
+        Stats of every epic with at least one ticket
+    """
+    changes = history.transitions()
+    stats: dict[str, EpicStats] = {}
+    lead: dict[str, list[float]] = {}
+    cycle: dict[str, list[float]] = {}
+    for ticket_id in sorted(index.by_id, key=index.sort_key):
+        parsed = index.parse_id(ticket_id)
+        if parsed is None or parsed.bug or parsed.depth < 2:
+            continue
+        epic_id = str(TicketId(parsed.parts[:2]))
+        epic = stats.setdefault(epic_id, EpicStats(epic_id))
+        epic.tickets += 1
+        flow = ticket_flow(ticket_id, changes.get(ticket_id, []), workflow, now)
+        for state_id, hours in flow.time_in_state.items():
+            epic.time_in_state[state_id] = epic.time_in_state.get(state_id, 0.0) + hours
+        header = index.by_id[ticket_id]
+        state = workflow.state_for_status(header.status) if header.status else None
+        if state is not None and state.type == "end":
+            epic.completed += 1
+        if flow.lead_time is not None:
+            lead.setdefault(epic_id, []).append(flow.lead_time)
+        if flow.cycle_time is not None:
+            cycle.setdefault(epic_id, []).append(flow.cycle_time)
+        estimated = _hours_field(header.fields.get("Estimated Hours"))
+        actual = _hours_field(header.fields.get("Actual Hours"))
+        if estimated is not None and actual is not None:
+            epic.estimated_hours += estimated
+            epic.actual_hours += actual
+    for epic_id, epic in stats.items():
+        epic.lead_time = _median(lead.get(epic_id, ()))
+        epic.cycle_time = _median(cycle.get(epic_id, ()))
+    return list(stats.values())
+
+
+def _hours(start: float | None, end: float | None) -> float | None:
+    """Hours between two timestamps (None if either is missing)."""
+    if start is None or end is None or end < start:
+        return None
+    return (end - start) / 3600
+
+
+def _hours_field(value: HeaderField | None) -> float | None:
+    """Leading number of an hours field (None for "-" or missing)."""
+    if value is None:
+        return None
+    match = _HOURS_PATTERN.search(value.value)
+    return float(match.group()) if match else None
+
+
+def _median(values: Iterable[float]) -> float | None:
+    """Median of values, None if empty."""
+    values = list(values)
+    return statistics.median(values) if values else None
+
+
+def _round(value: float | None) -> float | None:
+    """Round hours to 0.1, keeping None."""
+    return round(value, 1) if value is not None else None
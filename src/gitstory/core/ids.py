@@ -0,0 +1,303 @@
+"""Collision-free ticket ID allocation across processes and worktrees.
+
+Parallel planners (agents in several worktrees, concurrent imports) must
+not pick the same "next story number". IdAllocator keeps the last number
+handed out below every parent in a counters file shared by all worktrees of
+the repository (`<git common dir>/gitstory/ids.json`), and holds an
+exclusive lock on it for the length of an allocation session. Inside a
+session, allocation is O(1): the next number is one past the larger of the
+shared counter and the last child in the index (index.children is kept in
+ID order), skipping any number whose file already exists. Counters are
+written back atomically when the session ends.
+
+Manual edits can still leave the tree inconsistent. check_ids reports
+duplicate IDs, holes in sibling numbering and counters that lag behind the
+tree; repair_ids fixes what can be fixed without changing the ID of a
+ticket others may already reference (see its docstring).
+
+Example:
+    >>> with IdAllocator(index, Path("docs/tickets")) as ids:
+    ...     story = ids.allocate(TicketId.parse("EPIC-0001.2"))
+"""
+
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from gitstory.core.git import GitError, run_git
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import file_ticket_id
+from gitstory.core.writer import atomic_write, write_files
+from gitstory.models import TicketId
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# Counters file below the git common directory (shared by all worktrees)
+COUNTERS_FILE = "gitstory/ids.json"
+# Used outside a git repository
+DEFAULT_COUNTERS_PATH = ".gitstory/cache/ids.json"
+COUNTERS_VERSION = 1
+
+# Counter keys of tickets without a parent
+_INITIATIVES = "INIT"
+_BUGS = "BUG"
+
+
+def default_counters_path(tickets_root: Path) -> Path:
+    """Counters file shared by every worktree of the repository holding tickets_root."""
+    try:
+        common = run_git(["rev-parse", "--git-common-dir"], tickets_root).strip()
+    except GitError:
+        return Path(DEFAULT_COUNTERS_PATH)
+    return (tickets_root / common).resolve() / COUNTERS_FILE
+
+
+class IdAllocator:
+    """Allocation session over the shared per-parent counters.
+
+    Use as a context manager: entering takes the lock and reads the
+    counters, leaving writes them back and releases the lock. Other
+    processes entering a session meanwhile wait for the lock.
+
+    Args:
+        index: Index of the tickets root (fresh, e.g., from load_index)
+        tickets_root: Tickets root directory
+        counters_path: Counters file (default: default_counters_path(tickets_root))
+    """
+
+    def __init__(
+        self, index: TicketIndex, tickets_root: Path, counters_path: Path | None = None
+    ) -> None:
+        self.index = index
+        self.tickets_root = tickets_root
+        self.path = counters_path or default_counters_path(tickets_root)
+        self.counters: dict[str, int] = {}
+        self._indexed: dict[str, int] = {}
+        self._lock: TextIO | None = None
+
+    def __enter__(self) -> "IdAllocator":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock = open(self.path.with_name(self.path.name + ".lock"), "a+", encoding="utf-8")
+        try:
+            _lock_file(lock)
+        except BaseException:
+            lock.close()
+            raise
+        self._lock = lock
+        self.counters = _read_counters(self.path)
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        # Saved even after an error: a counter ahead of the tree only leaves a
+        # hole, while one behind it could hand out an ID that is already used
+        try:
+            _write_counters(self.path, self.counters)
+        finally:
+            if self._lock is not None:
+                _unlock_file(self._lock)
+                self._lock.close()
+                self._lock = None
+
+    def reserve(self, ticket_id: TicketId) -> None:
+        """Mark ticket_id as taken (e.g., an ID allocated by an interrupted run)."""
+        key = _key(ticket_id.parent, ticket_id.bug)
+        self.counters[key] = max(self.counters.get(key, 0), ticket_id.parts[-1])
+
+    def allocate(self, parent: TicketId | None, bug: bool = False) -> TicketId:
+        """Allocate the next ID below parent (a new initiative, or bug, when None).
+
+        Raises:
+            RuntimeError: If called outside the session (`with` block)
+        """
+        if self._lock is None:
+            raise RuntimeError("IdAllocator.allocate() needs an open session")
+        key = _key(parent, bug)
+        number = max(self.counters.get(key, 0), self._last_indexed(key))
+        while True:
+            number += 1
+            if bug:
+                candidate = TicketId((number,), bug=True)
+            elif parent is None:
+                candidate = TicketId((number,))
+            else:
+                candidate = parent.child(number)
+            if not (self.tickets_root / candidate.relative_path).exists():
+                break
+        self.counters[key] = number
+        return candidate
+
+    def _last_indexed(self, key: str) -> int:
+        """Highest child number below a counter key in the index."""
+        last = self._indexed.get(key)
+        if last is not None:
+            return last
+        if key in (_INITIATIVES, _BUGS):
+            self._indexed[_INITIATIVES] = self._indexed[_BUGS] = 0
+            for ticket_id in self.index.by_id:
+                parsed = self.index.parse_id(ticket_id)
+                if parsed is not None and parsed.depth == 1:
+                    root = _BUGS if parsed.bug else _INITIATIVES
+                    self._indexed[root] = max(self._indexed[root], parsed.parts[0])
+            return self._indexed[key]
+        children = self.index.children.get(key)
+        parsed = self.index.parse_id(children[-1]) if children else None
+        last = self._indexed[key] = parsed.parts[-1] if parsed else 0
+        return last
+
+
+@dataclass
+class IdReport:
+    """Inconsistencies in the ticket IDs of a tree.
+
+    Attributes:
+        duplicates: Ticket IDs declared by more than one file, with all their paths
+        gaps: Missing child numbers by parent ("INIT" and "BUG" for top-level tickets)
+        stale_counters: Counters behind the tree, as (counter, highest number in the tree)
+        renumbered: (path, old ID, new ID) of tickets repair_ids gave a new ID
+        unrepaired: Duplicate paths repair_ids could not renumber
+    """
+
+    duplicates: dict[str, list[str]] = field(default_factory=dict)
+    gaps: dict[str, list[int]] = field(default_factory=dict)
+    stale_counters: dict[str, tuple[int, int]] = field(default_factory=dict)
+    renumbered: list[tuple[str, str, str]] = field(default_factory=list)
+    unrepaired: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True when there are no duplicates and no stale counters."""
+        return not self.duplicates and not self.stale_counters
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "duplicates": self.duplicates,
+            "gaps": self.gaps,
+            "stale_counters": {k: list(v) for k, v in self.stale_counters.items()},
+            "renumbered": [
+                {"path": path, "old_id": old, "new_id": new} for path, old, new in self.renumbered
+            ],
+            "unrepaired": self.unrepaired,
+        }
+
+
+def check_ids(ids: IdAllocator) -> IdReport:
+    """Report duplicate IDs, numbering holes and stale counters (in an open session)."""
+    index = ids.index
+    numbers: dict[str, set[int]] = {}
+    for ticket_id in index.by_id:
+        parsed = index.parse_id(ticket_id)
+        if parsed is not None:
+            numbers.setdefault(_key(parsed.parent, parsed.bug), set()).add(parsed.parts[-1])
+    report = IdReport(duplicates={k: list(v) for k, v in sorted(index.duplicates.items())})
+    for key in sorted(numbers):
+        taken = numbers[key]
+        last = max(taken)
+        missing = [n for n in range(1, last + 1) if n not in taken]
+        if missing:
+            report.gaps[key] = missing
+        counter = ids.counters.get(key)
+        if counter is not None and counter < last:
+            report.stale_counters[key] = (counter, last)
+    return report
+
+
+def repair_ids(ids: IdAllocator) -> IdReport:
+    """Repair the inconsistencies check_ids finds (in an open session).
+
+    - Stale counters are raised to the highest number in the tree.
+    - Of the files declaring a duplicate ID, the one whose location matches
+      the ID keeps it. Each other file takes the ID its own location implies
+      when that is free (only its title line changes); otherwise a task or
+      bug file is moved to a newly allocated ID below the same parent.
+      Directory tickets that cannot take their directory's ID are left in
+      `unrepaired`.
+    - Holes are only reported: renumbering existing tickets would break
+      links, dependencies and commit references to them.
+
+    Returns:
+        IdReport of what was found, with renumbered and unrepaired filled in
+    """
+    report = check_ids(ids)
+    for key, (_, last) in report.stale_counters.items():
+        ids.counters[key] = last
+    taken = set(ids.index.by_id)
+    for ticket_id, paths in report.duplicates.items():
+        keeper = next((p for p in paths if file_ticket_id(p) == ticket_id), paths[0])
+        for path in paths:
+            if path == keeper:
+                continue
+            new_id = file_ticket_id(path)
+            new_path = path
+            if new_id in taken or ids.index.parse_id(new_id) is None:
+                parsed = ids.index.parse_id(ticket_id)
+                if path.endswith("/README.md") or parsed is None:
+                    report.unrepaired.append(path)
+                    continue
+                allocated = ids.allocate(parsed.parent, bug=parsed.bug)
+                new_id, new_path = str(allocated), allocated.relative_path
+            _renumber(ids.tickets_root, path, new_path, ticket_id, new_id)
+            taken.add(new_id)
+            report.renumbered.append((path, ticket_id, new_id))
+    return report
+
+
+def _renumber(tickets_root: Path, path: str, new_path: str, old_id: str, new_id: str) -> None:
+    """Rewrite the title line of a ticket with its new ID, moving the file if needed."""
+    source = tickets_root / path
+    text = source.read_text(encoding="utf-8")
+    text = text.replace(f"# {old_id}:", f"# {new_id}:", 1)
+    write_files({tickets_root / new_path: text.encode("utf-8")})
+    if new_path != path:
+        source.unlink()
+
+
+def _key(parent: TicketId | None, bug: bool) -> str:
+    """Counter key of the children of parent."""
+    if bug:
+        return _BUGS
+    return _INITIATIVES if parent is None else str(parent)
+
+
+def _read_counters(path: Path) -> dict[str, int]:
+    """Counters from path (empty if missing, unreadable or from another version)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != COUNTERS_VERSION:
+        return {}
+    counters = data.get("counters")
+    if not isinstance(counters, dict):
+        return {}
+    return {k: v for k, v in counters.items() if isinstance(v, int)}
+
+
+def _write_counters(path: Path, counters: dict[str, int]) -> None:
+    """Write the counters atomically and durably (readers never see a partial file)."""
+    data = json.dumps({"version": COUNTERS_VERSION, "counters": counters}, sort_keys=True)
+    atomic_write(path, data.encode(), durable=True)
+
+
+def _lock_file(f: TextIO) -> None:
+    """Block until this process holds the exclusive lock on f."""
+    if sys.platform == "win32":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(f: TextIO) -> None:
+    """Release the lock taken by _lock_file."""
+    if sys.platform == "win32":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,487 @@
+"""Bulk ticket creation: JSON Lines imports and subtree specs.
+
+Each line is one TicketImport (see gitstory.models.ticket), validated
+straight from the raw line by the compiled TICKET_IMPORT_ADAPTER. The
+stream is consumed in one pass: every record gets the next free ID below
+its parent (O(1) from the shared counters of gitstory.core.ids, which stay
+locked for the whole import so parallel planners never collide), is
+rendered with the compiled templates of gitstory.core.templates, and joins
+a chunk of IMPORT_CHUNK_FILES files. Full chunks are written as atomic
+batches (see gitstory.core.writer.write_files) on a thread pool while the
+stream is still being read.
+
+create_subtree feeds a nested spec (e.g., the YAML given to `gitstory plan
+--spec`) through the same pipeline, creating a whole subtree in one call.
+
+The index and the `**Progress**` rollups of affected parents are updated
+once, after the last chunk, instead of per ticket (computed again from a
+fresh index if a concurrent run changes a parent in between).
+
+Imports are resumable. Before a chunk is written, the IDs allocated for it
+are appended to a journal (`.gitstory/cache/import/<source hash>.jsonl`),
+each with the content hash of its record. Re-running an interrupted import
+reuses the journaled ID of every record whose hash matches, skips files that
+exist and writes the ones that do not, so no ticket is created twice; a
+record that differs (e.g., another import read from stdin) gets a new ID.
+The journal is removed once every batch is written.
+
+The models (and pydantic) are imported by the functions that validate, so
+importing this module (e.g., to register `gitstory import`) stays cheap.
+
+Example:
+    >>> with open("tickets.jsonl") as f:
+    ...     report = import_tickets(f, Path("docs/tickets"), load_workflow())
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+import yaml
+
+from gitstory.core.execute import CONFLICT_RETRIES, progress_bar, rollup_updates
+from gitstory.core.ids import IdAllocator
+from gitstory.core.index import TicketIndex
+from gitstory.core.snapshot import DEFAULT_SNAPSHOT_PATH, load_index
+from gitstory.core.templates import TemplateSet
+from gitstory.core.workflow import Workflow
+from gitstory.core.writer import WriteConflictError, content_hash, patch_files, write_files
+from gitstory.models import InvalidTicketIdError, TicketId
+
+if TYPE_CHECKING:
+    from pydantic import ValidationError
+
+    from gitstory.models import TicketImport, TicketSpec
+
+DEFAULT_IMPORT_JOURNAL_DIR = ".gitstory/cache/import"
+# Files written per atomic batch
+IMPORT_CHUNK_FILES = 256
+# Writer threads (batches are I/O bound: mkdir, write, fsync, rename)
+IMPORT_WORKERS = 8
+
+# Fields the importer writes itself
+_RESERVED_FIELDS = frozenset({"Status", "Progress"})
+_CHILD_TYPES = {"initiative": "epic", "epic": "story", "story": "task"}
+
+
+class ImportRecordError(ValueError):
+    """Raised for a record that cannot be imported (bad parent, type mismatch)."""
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import.
+
+    Attributes:
+        created: {"key", "ticket_id", "path"} of every ticket written, in stream order
+        resumed: Tickets already written by an interrupted run of the same import
+        errors: {"line", "message"} of records that were skipped
+        rollups: Parent files whose `**Progress**` was updated
+    """
+
+    created: list[dict[str, str | None]] = field(default_factory=list)
+    resumed: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    rollups: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "created": self.created,
+            "resumed": self.resumed,
+            "errors": self.errors,
+            "rollups": self.rollups,
+        }
+
+
+def journal_path(source: str, directory: Path | str = DEFAULT_IMPORT_JOURNAL_DIR) -> Path:
+    """Journal file of an import source ("-" for stdin, otherwise a file path)."""
+    identity = source if source == "-" else str(Path(source).resolve())
+    name = hashlib.blake2b(identity.encode(), digest_size=8).hexdigest()
+    return Path(directory) / f"{name}.jsonl"
+
+
+def render_ticket(
+    ticket_id: TicketId, record: "TicketImport", status: str, templates: TemplateSet
+) -> str:
+    """Render the markdown of an imported ticket with the compiled template of its type."""
+    parent = ticket_id.parent
+    body = record.body.strip()
+    return templates[ticket_id.type].render(
+        {
+            "id": str(ticket_id),
+            "title": _one_line(record.title),
+            "status": status,
+            "parent": str(parent) if parent is not None else "",
+            "fields": "".join(
+                f"**{key}**: {_one_line(value)}\n"
+                for key, value in record.fields.items()
+                if key not in _RESERVED_FIELDS
+            ),
+            "progress": progress_bar(0, 0),
+            "body": f"\n{body}\n" if body else "",
+        }
+    )
+
+
+def import_tickets(
+    lines: Iterable[str],
+    tickets_root: Path,
+    workflow: Workflow,
+    journal: Path | None = None,
+    snapshot_path: Path | str = DEFAULT_SNAPSHOT_PATH,
+    max_workers: int = IMPORT_WORKERS,
+    templates: TemplateSet | None = None,
+    counters_path: Path | None = None,
+) -> ImportReport:
+    """Create tickets from a JSON Lines stream in one pass.
+
+    Args:
+        lines: JSON Lines (one TicketImport per line; blank lines are skipped)
+        tickets_root: Tickets root directory
+        workflow: Workflow providing the default status and rollups
+        journal: Journal of allocated IDs for resuming (None disables resuming)
+        snapshot_path: Tree snapshot used to load and refresh the index
+        max_workers: Writer threads
+        templates: Ticket templates (default: TemplateSet.load())
+        counters_path: Shared ID counters (default: see gitstory.core.ids)
+
+    Returns:
+        ImportReport; records with errors are skipped, the rest are written
+
+    Raises:
+        OSError: If a batch cannot be written (the journal is kept for resuming)
+        TemplateError: If a template file uses an unknown placeholder
+    """
+    return _create(
+        _parse_lines(lines),
+        tickets_root,
+        workflow,
+        journal,
+        snapshot_path,
+        max_workers,
+        templates,
+        counters_path,
+    )
+
+
+def create_subtree(
+    specs: "Sequence[TicketSpec]",
+    parent: str | None,
+    tickets_root: Path,
+    workflow: Workflow,
+    snapshot_path: Path | str = DEFAULT_SNAPSHOT_PATH,
+    templates: TemplateSet | None = None,
+    counters_path: Path | None = None,
+) -> ImportReport:
+    """Create a whole subtree of tickets in a single call.
+
+    The specs are flattened depth-first into import records (children link
+    to their spec by parent_key) and go through the same pipeline as
+    import_tickets: in-memory ID allocation, batched atomic writes and one
+    rollup pass at the end. Keys in the report are spec positions ("1",
+    "1.2", ...), and error "line" numbers count specs in depth-first order.
+
+    Args:
+        specs: Top-level tickets, with their children
+        parent: Existing ticket the top-level tickets go below (None for new
+            initiatives or bugs)
+        tickets_root: Tickets root directory
+        workflow: Workflow providing the default status and rollups
+        snapshot_path: Tree snapshot used to load and refresh the index
+        templates: Ticket templates (default: TemplateSet.load())
+        counters_path: Shared ID counters (default: see gitstory.core.ids)
+
+    Returns:
+        ImportReport; specs with errors are skipped (their children are
+        reported as errors too), the rest are written
+
+    Raises:
+        InvalidTicketIdError: If parent is not a well-formed ticket ID
+        OSError: If a batch cannot be written
+        TemplateError: If a template file uses an unknown placeholder
+    """
+    if parent is not None:
+        TicketId.parse(parent)
+    records = enumerate(_flatten(specs, parent, None, ""), start=1)
+    return _create(
+        records,
+        tickets_root,
+        workflow,
+        None,
+        snapshot_path,
+        IMPORT_WORKERS,
+        templates,
+        counters_path,
+    )
+
+
+def parse_subtree_spec(text: str) -> "list[TicketSpec]":
+    """Parse a subtree spec: a YAML (or JSON) list of TicketSpec, or {"tickets": [...]}.
+
+    Raises:
+        ImportRecordError: If the text is not valid YAML or not a valid spec
+    """
+    from pydantic import ValidationError
+
+    from gitstory.models import SUBTREE_ADAPTER
+
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise ImportRecordError(f"Invalid spec: {e}") from e
+    if isinstance(data, dict) and set(data) == {"tickets"}:
+        data = data["tickets"]
+    try:
+        return SUBTREE_ADAPTER.validate_python(data)
+    except ValidationError as e:
+        raise ImportRecordError(f"Invalid spec: {_message(e)}") from e
+
+
+def _create(
+    records: "Iterable[tuple[int, TicketImport | ValidationError]]",
+    tickets_root: Path,
+    workflow: Workflow,
+    journal: Path | None,
+    snapshot_path: Path | str,
+    max_workers: int,
+    templates: TemplateSet | None,
+    counters_path: Path | None,
+) -> ImportReport:
+    """Allocate, render and write numbered records, then update parent rollups once."""
+    from pydantic import ValidationError
+
+    if templates is None:
+        templates = TemplateSet.load()
+    index = load_index(tickets_root, snapshot_path)
+    journaled = _read_journal(journal) if journal is not None else {}
+    start = next((s for s in workflow.states.values() if s.type == "start"), None)
+    default_status = workflow.status_text(start.id) if start else ""
+
+    report = ImportReport()
+    keys: dict[str, str] = {}
+    imported: set[str] = set()
+    parents: dict[str, None] = {}
+    with (
+        IdAllocator(index, tickets_root, counters_path) as allocator,
+        _ChunkWriter(journal, journaled, max_workers) as writer,
+    ):
+        for _, allocated in journaled.values():
+            allocator.reserve(TicketId.parse(allocated))
+        for lineno, record in records:
+            try:
+                if isinstance(record, ValidationError):
+                    raise record
+                source = f"key:{record.key}" if record.key is not None else f"line:{lineno}"
+                if record.key is not None and record.key in keys:
+                    raise ImportRecordError(f"Duplicate key: {record.key}")
+                digest = content_hash(record.model_dump_json().encode())
+                resumed = journaled.get(source, ("", ""))[0] == digest
+                if resumed:
+                    ticket_id = TicketId.parse(journaled[source][1])
+                else:
+                    parent = _parent(record, index, keys, imported)
+                    ticket_id = allocator.allocate(parent, bug=record.type == "bug")
+            except (ValidationError, ImportRecordError) as e:
+                report.errors.append({"line": lineno, "message": _message(e)})
+                continue
+            if record.key is not None:
+                keys[record.key] = str(ticket_id)
+            imported.add(str(ticket_id))
+            if ticket_id.parent is not None:
+                parents[str(ticket_id.parent)] = None
+            rel_path = ticket_id.relative_path
+            if resumed and (tickets_root / rel_path).exists():
+                report.resumed += 1
+                continue
+            text = render_ticket(ticket_id, record, record.status or default_status, templates)
+            writer.add((source, digest, str(ticket_id)), tickets_root / rel_path, text)
+            report.created.append(
+                {"key": record.key, "ticket_id": str(ticket_id), "path": rel_path}
+            )
+
+    for attempt in range(1, CONFLICT_RETRIES + 1):
+        index = load_index(tickets_root, snapshot_path)
+        updates = rollup_updates(parents, index, workflow)
+        try:
+            patch_files(
+                {tickets_root / path: {"Progress": value} for path, value in updates.items()}
+            )
+            break
+        except WriteConflictError:
+            if attempt == CONFLICT_RETRIES:
+                raise  # a concurrent run keeps changing the parents
+    report.rollups = sorted(updates)
+    if journal is not None:
+        journal.unlink(missing_ok=True)
+    return report
+
+
+class _ChunkWriter:
+    """Journal allocated IDs, then write files in atomic batches on a thread pool."""
+
+    def __init__(
+        self, journal: Path | None, journaled: dict[str, tuple[str, str]], max_workers: int
+    ) -> None:
+        self._journaled = journaled
+        self._max_pending = 2 * max_workers
+        self._chunk: list[tuple[tuple[str, str, str], Path, str]] = []
+        self._futures: set[Future[None]] = set()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._journal: TextIO | None = None
+        if journal is not None:
+            journal.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(journal, "a", encoding="utf-8")
+
+    def __enter__(self) -> "_ChunkWriter":
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+                for future in self._futures:
+                    future.result()
+        finally:
+            self._executor.shutdown(wait=True)
+            if self._journal is not None:
+                self._journal.close()
+
+    def add(self, entry: tuple[str, str, str], path: Path, text: str) -> None:
+        """Queue one file ((source, record hash, ticket ID) journal entry), writing full chunks."""
+        self._chunk.append((entry, path, text))
+        if len(self._chunk) >= IMPORT_CHUNK_FILES:
+            self.flush()
+
+    def flush(self) -> None:
+        """Journal the queued IDs (fsynced), then hand the chunk to a writer thread."""
+        if not self._chunk:
+            return
+        if self._journal is not None:
+            for (source, digest, ticket_id), _, _ in self._chunk:
+                if self._journaled.get(source) != (digest, ticket_id):
+                    entry = {"source": source, "record": digest, "ticket_id": ticket_id}
+                    self._journal.write(json.dumps(entry) + "\n")
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        if len(self._futures) >= self._max_pending:
+            done, self._futures = wait(self._futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        contents = {path: text.encode("utf-8") for _, path, text in self._chunk}
+        self._futures.add(self._executor.submit(_write_batch, contents))
+        self._chunk = []
+
+
+def _parent(
+    record: "TicketImport", index: TicketIndex, keys: dict[str, str], imported: set[str]
+) -> TicketId | None:
+    """Resolve and check the parent of a record (None for initiatives)."""
+    if record.parent is not None and record.parent_key is not None:
+        raise ImportRecordError("Give either parent or parent_key, not both")
+    if record.parent_key is not None:
+        if record.parent_key not in keys:
+            raise ImportRecordError(
+                f"Unknown parent_key {record.parent_key!r} (parents must come first)"
+            )
+        parent_id = keys[record.parent_key]
+    elif record.parent is not None:
+        if record.parent not in index and record.parent not in imported:
+            raise ImportRecordError(f"Parent not found: {record.parent}")
+        parent_id = record.parent
+    else:
+        if record.type not in (None, "initiative", "bug"):
+            raise ImportRecordError(f"A {record.type} needs a parent or parent_key")
+        return None
+    try:
+        parent = TicketId.parse(parent_id)
+    except InvalidTicketIdError as e:
+        raise ImportRecordError(str(e)) from e
+    child_type = _CHILD_TYPES.get(parent.type)
+    if child_type is None:
+        raise ImportRecordError(f"{parent} cannot have children")
+    if record.type is not None and record.type != child_type:
+        raise ImportRecordError(f"A {record.type} cannot be a child of {parent}")
+    return parent
+
+
+def _parse_lines(
+    lines: Iterable[str],
+) -> "Iterator[tuple[int, TicketImport | ValidationError]]":
+    """Validate JSON Lines into numbered records (or the error of each bad line)."""
+    from pydantic import ValidationError
+
+    from gitstory.models import TICKET_IMPORT_ADAPTER
+
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield lineno, TICKET_IMPORT_ADAPTER.validate_json(line)
+        except ValidationError as e:
+            yield lineno, e
+
+
+def _flatten(
+    specs: "Sequence[TicketSpec]", parent: str | None, parent_key: str | None, prefix: str
+) -> "Iterator[TicketImport]":
+    """Import records of specs and their children, depth-first, keyed by position."""
+    from gitstory.models import TicketImport
+
+    for number, spec in enumerate(specs, start=1):
+        key = f"{prefix}{number}"
+        yield TicketImport(
+            key=key,
+            type=spec.type,
+            title=spec.title,
+            parent=parent,
+            parent_key=parent_key,
+            status=spec.status,
+            fields=spec.fields,
+            body=spec.body,
+        )
+        yield from _flatten(spec.children, None, key, f"{key}.")
+
+
+def _write_batch(contents: dict[Path, bytes]) -> None:
+    """Create the directories of a batch and write it atomically (runs on a writer thread)."""
+    for directory in dict.fromkeys(path.parent for path in contents):
+        directory.mkdir(parents=True, exist_ok=True)
+    write_files(contents)
+
+
+def _read_journal(path: Path) -> dict[str, tuple[str, str]]:
+    """(record hash, allocated ticket ID) by record source from an earlier run."""
+    journaled = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    journaled[entry["source"]] = (entry["record"], entry["ticket_id"])
+                except (ValueError, KeyError, TypeError):
+                    continue  # a line cut short by the interruption
+    except FileNotFoundError:
+        pass
+    return journaled
+
+
+def _message(error: Exception) -> str:
+    """One-line error message (first pydantic error, with its location)."""
+    from pydantic import ValidationError
+
+    if isinstance(error, ValidationError):
+        first = error.errors()[0]
+        location = ".".join(str(part) for part in first["loc"])
+        return f"{location}: {first['msg']}" if location else first["msg"]
+    return str(error)
+
+
+def _one_line(text: str) -> str:
+    """Collapse whitespace so a value fits on its header line."""
+    return " ".join(text.split())
@@ -0,0 +1,114 @@
+"""In-memory index of ticket headers.
+
+The index maps ticket IDs and paths to parsed headers and precomputes the
+parent → children relation derived from hierarchical IDs, so cross-ticket
+rules are answered with dict lookups instead of filesystem searches.
+"""
+
+from bisect import insort
+from collections.abc import Iterable
+from pathlib import Path
+
+from gitstory.core.tickets import TicketHeader, iter_ticket_files, read_header
+from gitstory.models import InvalidTicketIdError, TicketId
+
+
+class TicketIndex:
+    """Ticket headers keyed by ID and by path.
+
+    Args:
+        headers: Parsed ticket headers (paths relative to the tickets root)
+
+    Attributes:
+        by_path: Header for every ticket file
+        by_id: Header for every ticket ID (first file wins on duplicates)
+        duplicates: Ticket IDs declared by more than one file, with all their paths
+        children: Child ticket IDs by parent ID, in ID order
+    """
+
+    def __init__(self, headers: Iterable[TicketHeader]) -> None:
+        self.by_path: dict[str, TicketHeader] = {}
+        self.by_id: dict[str, TicketHeader] = {}
+        self.duplicates: dict[str, list[str]] = {}
+        self.children: dict[str, list[str]] = {}
+        self._ids: dict[str, TicketId] = {}
+        for header in headers:
+            self.add(header)
+
+    @classmethod
+    def scan(cls, root: Path) -> "TicketIndex":
+        """Build an index by reading the header of every ticket file under root."""
+        return cls(read_header(root / rel_path, rel_path) for rel_path in iter_ticket_files(root))
+
+    def add(self, header: TicketHeader) -> None:
+        """Add or replace the header stored for header.path."""
+        if header.path in self.by_path:
+            self.remove(header.path)
+        self.by_path[header.path] = header
+        ticket_id = header.ticket_id
+        if ticket_id is None:
+            return
+        if ticket_id in self.by_id:
+            paths = self.duplicates.setdefault(ticket_id, [self.by_id[ticket_id].path])
+            paths.append(header.path)
+            return
+        self.by_id[ticket_id] = header
+        parent = self.parent_id(ticket_id)
+        if parent is not None:
+            insort(self.children.setdefault(parent, []), ticket_id, key=self.sort_key)
+
+    def remove(self, path: str) -> TicketHeader | None:
+        """Remove the header stored for path, returning it if present."""
+        header = self.by_path.pop(path, None)
+        if header is None or header.ticket_id is None:
+            return header
+        ticket_id = header.ticket_id
+        paths = self.duplicates.get(ticket_id)
+        if paths is not None:
+            paths.remove(path)
+            if self.by_id[ticket_id].path == path:
+                self.by_id[ticket_id] = self.by_path[paths[0]]
+            if len(paths) == 1:
+                del self.duplicates[ticket_id]
+            return header
+        del self.by_id[ticket_id]
+        parent = self.parent_id(ticket_id)
+        if parent is not None and ticket_id in self.children.get(parent, ()):
+            self.children[parent].remove(ticket_id)
+        return header
+
+    def get(self, ticket_id: str) -> TicketHeader | None:
+        """Return the header for ticket_id, if indexed."""
+        return self.by_id.get(ticket_id)
+
+    def parse_id(self, ticket_id: str) -> TicketId | None:
+        """Return the parsed TicketId (memoized), or None if malformed."""
+        parsed = self._ids.get(ticket_id)
+        if parsed is None:
+            try:
+                parsed = self._ids[ticket_id] = TicketId.parse(ticket_id)
+            except InvalidTicketIdError:
+                return None
+        return parsed
+
+    def parent_id(self, ticket_id: str) -> str | None:
+        """Return the parent ID derived from ticket_id, if any."""
+        parsed = self.parse_id(ticket_id)
+        parent = parsed.parent if parsed else None
+        return str(parent) if parent else None
+
+    def ancestor_ids(self, ticket_id: str) -> list[str]:
+        """Return ancestor IDs from the initiative down to the parent."""
+        parsed = self.parse_id(ticket_id)
+        return [str(a) for a in parsed.ancestors] if parsed else []
+
+    def sort_key(self, ticket_id: str) -> tuple[bool, tuple[int, ...]]:
+        """Tree-order sort key for ticket IDs (bugs last, malformed IDs at the end)."""
+        parsed = self.parse_id(ticket_id)
+        return (parsed.bug, parsed.parts) if parsed else (True, ())
+
+    def __len__(self) -> int:
+        return len(self.by_path)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self.by_id
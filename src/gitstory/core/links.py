@@ -0,0 +1,158 @@
+"""Link and ticket-ID reference index.
+
+Ticket markdown links to its parent and children with relative links
+(`[STORY-0001.1.3](README.md)`) and mentions other tickets by ID. One regex
+pass per line extracts both (outside code blocks and inline code); the
+extracted references are cached per file in the validation manifest, so a
+tree-wide check resolves every reference with set lookups against the
+ticket index and never re-reads unchanged files.
+
+Example:
+    >>> refs = extract_references(text.splitlines())
+    >>> issues = check_references({"INIT-0001/README.md": refs}, index, Path("docs/tickets"))
+"""
+
+import posixpath
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import unquote
+
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import FENCE_PATTERN, TICKET_REF_PATTERN
+from gitstory.validators.result import ValidationIssue
+
+# A markdown link (target in <> or up to whitespace/")", optional title) or a bare ticket ID
+REFERENCE_PATTERN = re.compile(
+    r"\[(?P<text>[^\]\n]*)\]\((?P<target><[^>\n]*>|[^)\s]*)(?:\s+[^)\n]*)?\)"
+    rf"|(?P<id>{TICKET_REF_PATTERN.pattern})"
+)
+_INLINE_CODE_PATTERN = re.compile(r"`[^`\n]*`")
+_EXTERNAL_PATTERN = re.compile(r"^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//|/)")
+
+
+class Reference(NamedTuple):
+    """A link or ticket-ID mention in a ticket file.
+
+    Attributes:
+        line: 1-based line number
+        target: Link target as written (None for a bare ticket ID)
+        ticket_id: Ticket ID in the link text, or the bare ID mentioned
+    """
+
+    line: int
+    target: str | None
+    ticket_id: str | None
+
+
+def extract_references(lines: Iterable[str]) -> tuple[Reference, ...]:
+    """Extract every link and bare ticket ID outside code.
+
+    Args:
+        lines: Lines of the ticket file
+
+    Returns:
+        References in file order
+    """
+    refs = []
+    in_code = False
+    for lineno, line in enumerate(lines, start=1):
+        if FENCE_PATTERN.match(line):
+            in_code = not in_code
+            continue
+        if in_code or ("[" not in line and "-" not in line):
+            continue
+        if "`" in line:
+            line = _INLINE_CODE_PATTERN.sub("", line)
+        for match in REFERENCE_PATTERN.finditer(line):
+            if match.group("id"):
+                refs.append(Reference(lineno, None, match.group("id")))
+                continue
+            ids = TICKET_REF_PATTERN.findall(match.group("text"))
+            target = match.group("target").removeprefix("<").removesuffix(">")
+            refs.append(Reference(lineno, target, ids[0] if len(ids) == 1 else None))
+    return tuple(refs)
+
+
+def check_references(
+    references: Mapping[str, Sequence[Reference]], index: TicketIndex, tickets_root: Path
+) -> list[ValidationIssue]:
+    """Resolve every reference of the tree and report broken or mismatched ones.
+
+    Links inside the tree are resolved with set lookups against the index
+    (ticket files and their directories); other targets (assets, files
+    outside the tree) are checked on disk once per distinct path.
+
+    Reports:
+    - broken_link (error): the link target does not exist
+    - link_id_mismatch (warning): link text names a ticket other than the target's
+    - unknown_reference (warning): a bare ticket ID that no file declares
+
+    Args:
+        references: References by ticket path relative to tickets_root
+        index: Index of the whole ticket tree
+        tickets_root: Tickets root directory
+
+    Returns:
+        Issues found, by path
+    """
+    dirs = {posixpath.dirname(p) for p in index.by_path}
+    for directory in list(dirs):
+        while directory:
+            directory = posixpath.dirname(directory)
+            dirs.add(directory)
+    on_disk: dict[str, bool] = {}
+    issues: list[ValidationIssue] = []
+
+    for path in sorted(references):
+        base = posixpath.dirname(path)
+        unknown: dict[str, int] = {}
+        for ref in references[path]:
+            if ref.target is None:
+                if ref.ticket_id and ref.ticket_id not in index:
+                    unknown.setdefault(ref.ticket_id, ref.line)
+                continue
+            target = unquote(ref.target.split("#", 1)[0])
+            if not target or _EXTERNAL_PATTERN.match(target):
+                continue
+            resolved = posixpath.normpath(posixpath.join(base, target))
+            if resolved in index.by_path or resolved in dirs or resolved == ".":
+                linked = index.by_path.get(resolved) or index.by_path.get(
+                    posixpath.join(resolved, "README.md")
+                )
+            else:
+                if resolved not in on_disk:
+                    on_disk[resolved] = (tickets_root / resolved).exists()
+                if not on_disk[resolved]:
+                    issues.append(
+                        ValidationIssue(
+                            type="broken_link",
+                            message=f"Link target does not exist: {ref.target}",
+                            line=ref.line,
+                            path=path,
+                        )
+                    )
+                continue
+            if ref.ticket_id and linked is not None and linked.ticket_id != ref.ticket_id:
+                issues.append(
+                    ValidationIssue(
+                        type="link_id_mismatch",
+                        message=f"Link text names {ref.ticket_id} but {ref.target} "
+                        f"is {linked.ticket_id}",
+                        line=ref.line,
+                        path=path,
+                        severity="warning",
+                    )
+                )
+        if unknown:
+            issues.append(
+                ValidationIssue(
+                    type="unknown_reference",
+                    message="Mentions tickets that do not exist: " + ", ".join(unknown),
+                    line=min(unknown.values()),
+                    path=path,
+                    severity="warning",
+                )
+            )
+    return issues
@@ -0,0 +1,118 @@
+"""Validation manifest: per-file validation results keyed on content hash.
+
+The manifest (`.gitstory/cache/validation.json`) records, for every ticket
+file, its content hash, stat signature, parsed header, extracted links and
+ticket mentions, and validation issues.
+Incremental validation uses it to skip unchanged files: a matching
+(mtime_ns, size) pair skips hashing, a matching hash skips re-validation,
+and stored headers rebuild the ticket index without reading unchanged files.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.links import Reference
+from gitstory.core.tickets import HeaderField, TicketHeader
+from gitstory.core.writer import atomic_write
+from gitstory.validators.result import ValidationIssue
+
+DEFAULT_MANIFEST_PATH = ".gitstory/cache/validation.json"
+MANIFEST_VERSION = 3
+
+
+@dataclass
+class ManifestEntry:
+    """Cached validation state of one file."""
+
+    hash: str
+    mtime_ns: int
+    size: int
+    header: TicketHeader | None = None
+    issues: list[ValidationIssue] = field(default_factory=list)
+    references: tuple[Reference, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the JSON manifest."""
+        data: dict[str, Any] = {
+            "hash": self.hash,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "issues": [{**i.to_dict(), "severity": i.severity} for i in self.issues],
+            "references": [list(ref) for ref in self.references],
+        }
+        if self.header is not None:
+            data["header"] = {
+                "ticket_id": self.header.ticket_id,
+                "title": self.header.title,
+                "fields": {k: [f.value, f.line] for k, f in self.header.fields.items()},
+                "requires": list(self.header.requires),
+                "blocks": list(self.header.blocks),
+            }
+        return data
+
+    @classmethod
+    def from_dict(cls, path: str, data: dict[str, Any]) -> "ManifestEntry":
+        """Deserialize a manifest entry stored for path."""
+        header_data = data.get("header")
+        header = None
+        if header_data is not None:
+            header = TicketHeader(
+                path=path,
+                ticket_id=header_data["ticket_id"],
+                title=header_data["title"],
+                fields={k: HeaderField(v, line) for k, (v, line) in header_data["fields"].items()},
+                requires=tuple(header_data["requires"]),
+                blocks=tuple(header_data["blocks"]),
+            )
+        return cls(
+            hash=data["hash"],
+            mtime_ns=data["mtime_ns"],
+            size=data["size"],
+            header=header,
+            issues=[ValidationIssue.from_dict(i, i["severity"]) for i in data["issues"]],
+            references=tuple(Reference(*ref) for ref in data.get("references", ())),
+        )
+
+
+@dataclass
+class ValidationManifest:
+    """Per-file validation results for a tickets root and its workflow file.
+
+    Attributes:
+        root: Tickets root the file paths are relative to
+        files: Entries keyed by ticket path relative to root
+        workflow: Entry for the workflow file, if it exists
+    """
+
+    root: str | None = None
+    files: dict[str, ManifestEntry] = field(default_factory=dict)
+    workflow: ManifestEntry | None = None
+
+    @classmethod
+    def load(cls, path: Path | str = DEFAULT_MANIFEST_PATH) -> "ValidationManifest":
+        """Load a manifest, returning an empty one if missing, corrupt or outdated."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return cls()
+            workflow = data.get("workflow")
+            return cls(
+                root=data["root"],
+                files={p: ManifestEntry.from_dict(p, e) for p, e in data["files"].items()},
+                workflow=ManifestEntry.from_dict("", workflow) if workflow else None,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls()
+
+    def save(self, path: Path | str = DEFAULT_MANIFEST_PATH) -> None:
+        """Write the manifest atomically (see gitstory.core.writer.atomic_write)."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "root": self.root,
+            "workflow": self.workflow.to_dict() if self.workflow else None,
+            "files": {p: e.to_dict() for p, e in sorted(self.files.items())},
+        }
+        atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode())
@@ -0,0 +1,176 @@
+"""Run one plugin against many tickets in parallel.
+
+Before a new guard is rolled out, run_matrix runs it for every ticket of the
+backlog (or a filtered set) on a process pool and yields one MatrixRow per
+ticket as soon as it finishes, so callers can stream results. At most
+2 x workers runs are queued at once, so memory stays bounded however many
+tickets there are. MatrixSummary aggregates the rows: pass/fail/error
+counts, latency percentiles, and the tickets behind every kind of contract
+violation (PLUGIN_VIOLATIONS: non-JSON or invalid output, exit codes outside
+0-2, timeouts, crashes, exceeded CPU or output limits).
+
+Example:
+    >>> summary = MatrixSummary("guard", "all_children_done")
+    >>> for row in run_matrix("guard", spec, ticket_ids, workers=8):
+    ...     summary.add(row)
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.bench import percentile
+from gitstory.core.plugins import DEFAULT_PLUGIN_TIMEOUT, PluginResult, PluginSpec, run_plugin
+
+MATRIX_WORKERS = min(8, os.cpu_count() or 1)
+# Status of a row by plugin exit code (anything else is an error)
+_STATUS = {0: "pass", 1: "fail"}
+
+
+@dataclass
+class MatrixRow:
+    """Outcome of the plugin for one ticket.
+
+    Attributes:
+        ticket_id: Ticket the plugin ran for
+        status: pass, fail or error
+        exit_code: Plugin exit code (2 for timeouts and invalid output)
+        seconds: Wall time
+        violation: Contract violation (one of PLUGIN_VIOLATIONS), if any
+        message: Plugin message, or the first stderr line of an error
+    """
+
+    ticket_id: str
+    status: str
+    exit_code: int
+    seconds: float
+    violation: str | None = None
+    message: str = ""
+
+    @classmethod
+    def from_result(cls, ticket_id: str, result: PluginResult) -> "MatrixRow":
+        """Summarize a plugin result."""
+        status = _STATUS.get(result.exit_code, "error")
+        message = str(result.output.get("message") or "")
+        if status == "error" and not message:
+            message = next(iter(result.stderr.strip().splitlines()), "")
+        return cls(ticket_id, status, result.exit_code, result.duration, result.violation, message)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "ticket_id": self.ticket_id,
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "seconds": round(self.seconds, 4),
+            "violation": self.violation,
+            "message": self.message,
+        }
+
+
+@dataclass
+class MatrixSummary:
+    """Aggregate of the rows of a matrix run.
+
+    Attributes:
+        type: Plugin type (guard, event, action)
+        name: Plugin name
+        counts: Number of rows by status
+        violations: Ticket IDs by contract violation kind
+        seconds: Wall time of every row
+    """
+
+    type: str
+    name: str
+    counts: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(("pass", "fail", "error"), 0)
+    )
+    violations: dict[str, list[str]] = field(default_factory=dict)
+    seconds: list[float] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True when no ticket made the plugin break its contract."""
+        return not self.violations
+
+    def add(self, row: MatrixRow) -> None:
+        """Count one row."""
+        self.counts[row.status] += 1
+        self.seconds.append(row.seconds)
+        if row.violation is not None:
+            self.violations.setdefault(row.violation, []).append(row.ticket_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "type": self.type,
+            "name": self.name,
+            "tickets": len(self.seconds),
+            "counts": self.counts,
+            "violations": self.violations,
+            "seconds": {
+                "p50": round(percentile(self.seconds, 50), 4),
+                "p95": round(percentile(self.seconds, 95), 4),
+                "max": round(max(self.seconds, default=0.0), 4),
+            },
+        }
+
+
+def run_matrix(
+    plugin_type: str,
+    spec: PluginSpec,
+    ticket_ids: Iterable[str],
+    workers: int = MATRIX_WORKERS,
+    timeout: float = DEFAULT_PLUGIN_TIMEOUT,
+    cwd: Path | None = None,
+) -> Iterator[MatrixRow]:
+    """Run a plugin for every ticket, yielding rows in completion order.
+
+    Args:
+        plugin_type: guard, event or action
+        spec: Plugin spec, as accepted by run_plugin (a file spec for process pools)
+        ticket_ids: Tickets to run the plugin for
+        workers: Plugins running at once
+        timeout: Seconds before a run is killed (a "timeout" violation)
+        cwd: Working directory of the plugin
+
+    Yields:
+        MatrixRow for each ticket
+
+    Raises:
+        PluginNotFoundError: If a string-form plugin is not found
+    """
+    executor: Executor
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError):
+        executor = ThreadPoolExecutor(max_workers=workers)
+    pending: set[Future[MatrixRow]] = set()
+    with executor:
+        for ticket_id in ticket_ids:
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            pending.add(executor.submit(_run, plugin_type, spec, ticket_id, timeout, cwd))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+
+def _run(
+    plugin_type: str, spec: PluginSpec, ticket_id: str, timeout: float, cwd: Path | None
+) -> MatrixRow:
+    """Run the plugin for one ticket (in a worker process)."""
+    return MatrixRow.from_result(
+        ticket_id, run_plugin(plugin_type, spec, ticket_id, timeout=timeout, cwd=cwd)
+    )
@@ -0,0 +1,447 @@
+"""Workflow plugin resolution and execution.
+
+Plugins are executables following the STORY-0001.2.4 contract:
+- Invoked as `<plugin> TICKET-ID [args...]`, with `GITSTORY_PLUGIN_CONFIG`
+  holding the plugin's JSON config
+- Exit code 0 = pass/success, 1 = fail, 2 = error
+- Stdout is a JSON object with a boolean result key: guards return
+  "passed", events "occurred", actions "success" (validated by
+  gitstory.models.plugin)
+
+Workflow.yaml refers to plugins in one of three forms:
+- String: "all_children_done", resolved by convention path in priority order
+  (project `.gitstory/plugins/{type}s/`, then user
+  `~/.claude/skills/gitstory/plugins/{type}s/`)
+- Inline: {"inline": "[ -f README.md ]", "interpreter": "/bin/bash"}
+- File: {"file": "scripts/check.py", "config": {...}}
+
+Every plugin runs in its own process group under resource limits
+(PluginLimits, overridable per plugin with a "limits" mapping in the inline
+and file forms): rlimits on CPU seconds, address space and open files are
+set in the child before it starts, captured stdout and stderr are kept in
+bounded ring buffers, and on timeout the whole process group is killed. The
+CPU time and peak RSS of each run (from wait4) are recorded in the result,
+so one runaway plugin can neither stall nor starve a batch of others.
+
+The rlimits are set by a preexec_fn, which is only safe while no other
+thread of this process is forking or allocating: launches are serialized
+by a module lock, and run_plugin must not be called from threads that fork
+by other means. (An exec wrapper would avoid this, but would add an
+interpreter start and its memory to the timings of every run.)
+"""
+
+import json
+import math
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import IO, Any
+
+if sys.platform != "win32":
+    import resource
+
+# Plugin type -> required boolean key in the JSON output
+PLUGIN_TYPES = {"guard": "passed", "event": "occurred", "action": "success"}
+DEFAULT_PLUGIN_TIMEOUT = 30.0
+DEFAULT_INTERPRETER = "/bin/bash"
+PLUGIN_CONFIG_ENV = "GITSTORY_PLUGIN_CONFIG"
+# Ways a plugin can break the contract (PluginResult.violation)
+PLUGIN_VIOLATIONS = (
+    "timeout",
+    "invalid_json",
+    "invalid_output",
+    "exit_code",
+    "crash",
+    "cpu_limit",
+    "output_limit",
+)
+# Bytes read from a plugin pipe at a time
+_READ_CHUNK = 64 * 1024
+# Seconds to wait for pipes to drain after the process group is killed
+_DRAIN_TIMEOUT = 1.0
+# Held while forking a plugin: preexec_fn must not run alongside another fork
+_LAUNCH_LOCK = threading.Lock()
+
+PluginSpec = str | dict[str, Any]
+
+
+class PluginNotFoundError(LookupError):
+    """Raised when a string-form plugin is not found in any search path."""
+
+
+@dataclass(frozen=True)
+class PluginLimits:
+    """Resource caps applied to every plugin run (None disables a cap).
+
+    Attributes:
+        cpu_seconds: RLIMIT_CPU (SIGXCPU, then SIGKILL one second later)
+        memory_mb: RLIMIT_AS, in MiB (allocations beyond it fail)
+        open_files: RLIMIT_NOFILE
+        output_bytes: Bytes of stdout and of stderr kept (the tail is kept;
+            a plugin writing more stdout breaks the contract)
+    """
+
+    cpu_seconds: float | None = DEFAULT_PLUGIN_TIMEOUT
+    memory_mb: int | None = 4096
+    open_files: int | None = 256
+    output_bytes: int | None = 1024 * 1024
+
+    def merge(self, overrides: Mapping[str, Any] | None) -> "PluginLimits":
+        """Copy with the caps given in a spec's "limits" mapping (unknown keys ignored)."""
+        if not overrides:
+            return self
+        names = {f.name for f in fields(self)}
+        return replace(self, **{k: v for k, v in overrides.items() if k in names})
+
+
+DEFAULT_PLUGIN_LIMITS = PluginLimits()
+
+
+@dataclass
+class PluginResult:
+    """Outcome of one plugin execution.
+
+    Attributes:
+        type: Plugin type (guard, event, action)
+        name: Plugin name (or "inline"/file path for other forms)
+        exit_code: 0 pass, 1 fail, 2 error (also used for timeouts and bad output)
+        output: Parsed JSON output ({} if missing or invalid)
+        stderr: Captured stderr (or the reason for an error)
+        duration: Wall time in seconds
+        path: Resolved executable, if any
+        output_bytes: Size of the raw stdout (including any bytes beyond the cap)
+        violation: How the plugin broke the contract (one of PLUGIN_VIOLATIONS), if it did
+        cpu_seconds: User + system CPU time the plugin process tree used
+        max_rss_bytes: Peak resident set size of the plugin (0 where unavailable)
+    """
+
+    type: str
+    name: str
+    exit_code: int
+    output: dict[str, Any] = field(default_factory=dict)
+    stderr: str = ""
+    duration: float = 0.0
+    path: str | None = None
+    output_bytes: int = 0
+    violation: str | None = None
+    cpu_seconds: float = 0.0
+    max_rss_bytes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """True if the plugin exited 0 and reported a true result key."""
+        return self.exit_code == 0 and self.output.get(PLUGIN_TYPES[self.type]) is True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "type": self.type,
+            "name": self.name,
+            "exit_code": self.exit_code,
+            "ok": self.ok,
+            "output": self.output,
+            "stderr": self.stderr,
+            "duration": round(self.duration, 3),
+            "path": self.path,
+            "output_bytes": self.output_bytes,
+            "violation": self.violation,
+            "resources": {
+                "cpu_seconds": round(self.cpu_seconds, 4),
+                "max_rss_bytes": self.max_rss_bytes,
+            },
+        }
+
+
+def plugin_name(spec: PluginSpec) -> str:
+    """Return a display name for a plugin spec."""
+    if isinstance(spec, str):
+        return spec
+    return str(spec.get("name") or spec.get("file") or "inline")
+
+
+def search_paths(plugin_type: str, name: str, project_root: Path | None = None) -> list[Path]:
+    """Return convention paths for a string-form plugin, highest priority first.
+
+    Args:
+        plugin_type: guard, event or action
+        name: Plugin name
+        project_root: Project directory (default: current directory)
+
+    Returns:
+        Candidate paths (project, then user)
+    """
+    subdir = Path("plugins") / f"{plugin_type}s" / name
+    return [
+        (project_root or Path.cwd()) / ".gitstory" / subdir,
+        Path.home() / ".claude" / "skills" / "gitstory" / subdir,
+    ]
+
+
+def resolve_plugin(plugin_type: str, name: str, project_root: Path | None = None) -> Path | None:
+    """Return the first existing convention path for a plugin, or None."""
+    return next((p for p in search_paths(plugin_type, name, project_root) if p.is_file()), None)
+
+
+def run_plugin(
+    plugin_type: str,
+    spec: PluginSpec,
+    ticket_id: str,
+    args: list[str] | None = None,
+    timeout: float = DEFAULT_PLUGIN_TIMEOUT,
+    cwd: Path | None = None,
+    limits: PluginLimits | None = None,
+) -> PluginResult:
+    """Execute a plugin under resource limits and validate its output against the contract.
+
+    Args:
+        plugin_type: guard, event or action
+        spec: String, inline or file plugin spec from workflow.yaml
+        ticket_id: Ticket the plugin runs for (passed as the first argument)
+        args: Additional arguments
+        timeout: Seconds before the plugin's process group is killed (exit code 2)
+        cwd: Working directory (default: current directory)
+        limits: Resource caps (default: DEFAULT_PLUGIN_LIMITS), overridden by a
+            "limits" mapping in the spec
+
+    Returns:
+        PluginResult (exit code 2 for timeouts, crashes, exceeded limits and invalid output)
+
+    Raises:
+        PluginNotFoundError: If a string-form plugin is not found
+    """
+    name = plugin_name(spec)
+    config: dict[str, Any] = {}
+    limits = limits or DEFAULT_PLUGIN_LIMITS
+    temp_path = None
+    if isinstance(spec, str):
+        path = resolve_plugin(plugin_type, spec, cwd)
+        if path is None:
+            raise PluginNotFoundError(f"Plugin {plugin_type}/{spec} not found")
+        command = [str(path)]
+    elif "inline" in spec:
+        fd, temp_path = tempfile.mkstemp(prefix="gitstory-plugin-", suffix=".sh")
+        with os.fdopen(fd, "w") as f:
+            f.write(f"#!{spec.get('interpreter', DEFAULT_INTERPRETER)}\n{spec['inline']}\n")
+        os.chmod(temp_path, 0o700)
+        command = [temp_path]
+        config = dict(spec.get("config") or {})
+        limits = limits.merge(spec.get("limits"))
+    else:
+        command = [str(spec["file"])]
+        config = dict(spec.get("config") or {})
+        limits = limits.merge(spec.get("limits"))
+
+    env = {**os.environ, PLUGIN_CONFIG_ENV: json.dumps(config)}
+    start = time.monotonic()
+    try:
+        run = _launch([*command, ticket_id, *(args or [])], env, cwd, timeout, limits)
+    except OSError as e:
+        return PluginResult(plugin_type, name, 2, stderr=str(e), path=command[0], violation="crash")
+    finally:
+        if temp_path is not None:
+            os.unlink(temp_path)
+
+    result = PluginResult(
+        plugin_type,
+        name,
+        run.returncode,
+        stderr=run.stderr.text(),
+        duration=time.monotonic() - start,
+        path=None if temp_path else command[0],
+        output_bytes=run.stdout.total,
+        cpu_seconds=run.cpu_seconds,
+        max_rss_bytes=run.max_rss_bytes,
+    )
+    error = None
+    if run.timed_out:
+        result.violation, error = "timeout", f"Plugin timed out after {timeout:g}s"
+    elif run.stdout.truncated:
+        result.violation = "output_limit"
+        error = f"Plugin wrote {run.stdout.total} bytes to stdout (limit {limits.output_bytes})"
+    elif run.returncode in (0, 1):
+        result.output, result.violation, error = _parse_output(plugin_type, run.stdout.text())
+    elif _hit_cpu_limit(run, limits):
+        result.violation = "cpu_limit"
+        error = f"Plugin exceeded its CPU limit of {limits.cpu_seconds:g}s"
+    elif run.returncode != 2:
+        # Killed by a signal (negative) or an exit code outside the contract
+        result.violation = "exit_code"
+    if error:
+        result.exit_code = 2
+        result.stderr = f"{result.stderr}{error}"
+    return result
+
+
+class _RingBuffer:
+    """The last `capacity` bytes written (everything when capacity is None)."""
+
+    def __init__(self, capacity: int | None) -> None:
+        self.capacity = capacity
+        self.data = bytearray()
+        self.total = 0
+
+    def write(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        self.data += chunk
+        if self.capacity is not None and len(self.data) > self.capacity:
+            del self.data[: len(self.data) - self.capacity]
+
+    @property
+    def truncated(self) -> bool:
+        """True if bytes were dropped."""
+        return len(self.data) < self.total
+
+    def text(self) -> str:
+        return self.data.decode("utf-8", errors="replace")
+
+
+@dataclass
+class _Run:
+    """Raw outcome of a launched plugin process."""
+
+    returncode: int
+    stdout: _RingBuffer
+    stderr: _RingBuffer
+    timed_out: bool
+    cpu_seconds: float = 0.0
+    max_rss_bytes: int = 0
+
+
+def _launch(
+    argv: list[str], env: dict[str, str], cwd: Path | None, timeout: float, limits: PluginLimits
+) -> _Run:
+    """Run argv in a new process group under limits, killing the group on timeout.
+
+    Raises:
+        OSError: If the process cannot be started
+    """
+    posix = sys.platform != "win32"
+    # preexec_fn runs between fork and exec and only calls setrlimit; the lock
+    # keeps threads of this process (matrix runs, drains) from forking meanwhile
+    with _LAUNCH_LOCK:
+        proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            start_new_session=posix,
+            preexec_fn=_rlimits(limits) if posix else None,
+        )
+    assert proc.stdout is not None and proc.stderr is not None
+    run = _Run(0, _RingBuffer(limits.output_bytes), _RingBuffer(limits.output_bytes), False)
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, run.stdout), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, run.stderr), daemon=True),
+    ]
+    waiter = threading.Thread(target=_reap, args=(proc, run), daemon=True)
+    try:
+        for thread in (*readers, waiter):
+            thread.start()
+        waiter.join(timeout)
+        run.timed_out = waiter.is_alive()
+    finally:
+        # Also kills children left behind by a plugin that exited, which would
+        # otherwise keep the pipes open
+        _kill_group(proc)
+        waiter.join()
+        for reader in readers:
+            reader.join(_DRAIN_TIMEOUT)
+        proc.stdout.close()
+        proc.stderr.close()
+    run.returncode = proc.returncode
+    return run
+
+
+def _hit_cpu_limit(run: _Run, limits: PluginLimits) -> bool:
+    """True if the process was killed for exceeding RLIMIT_CPU."""
+    if sys.platform == "win32" or limits.cpu_seconds is None:
+        return False
+    # SIGXCPU at the soft limit; SIGKILL at the hard one if SIGXCPU was ignored
+    return run.returncode == -signal.SIGXCPU or (
+        run.returncode == -signal.SIGKILL and run.cpu_seconds >= math.ceil(limits.cpu_seconds)
+    )
+
+
+def _rlimits(limits: PluginLimits) -> Callable[[], None]:
+    """Function setting the rlimits of limits in the child (precomputed before fork)."""
+    caps = []
+    if limits.cpu_seconds is not None:
+        seconds = max(1, math.ceil(limits.cpu_seconds))
+        # SIGXCPU at the soft limit, SIGKILL at the hard one
+        caps.append((resource.RLIMIT_CPU, seconds, seconds + 1))
+    if limits.memory_mb is not None:
+        caps.append((resource.RLIMIT_AS, limits.memory_mb * 2**20, limits.memory_mb * 2**20))
+    if limits.open_files is not None:
+        caps.append((resource.RLIMIT_NOFILE, limits.open_files, limits.open_files))
+
+    def apply() -> None:
+        for which, soft, hard in caps:
+            current = resource.getrlimit(which)[1]
+            if current != resource.RLIM_INFINITY:
+                soft, hard = min(soft, current), min(hard, current)
+            try:
+                resource.setrlimit(which, (soft, hard))
+            except (ValueError, OSError):
+                pass  # Not supported here (e.g., RLIMIT_AS on macOS)
+
+    return apply
+
+
+def _drain(stream: IO[bytes], buffer: _RingBuffer) -> None:
+    """Read a pipe into buffer until EOF."""
+    fd = stream.fileno()
+    while chunk := os.read(fd, _READ_CHUNK):
+        buffer.write(chunk)
+
+
+def _reap(proc: "subprocess.Popen[bytes]", run: _Run) -> None:
+    """Wait for the process and record the resources it used."""
+    if sys.platform == "win32":
+        proc.wait()
+        return
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    run.cpu_seconds = usage.ru_utime + usage.ru_stime
+    # Kilobytes on Linux, bytes on macOS
+    run.max_rss_bytes = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+def _kill_group(proc: "subprocess.Popen[bytes]") -> None:
+    """Kill the plugin and everything it started."""
+    if sys.platform == "win32":
+        if proc.returncode is None:
+            proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass  # The whole group has exited
+
+
+def _parse_output(plugin_type: str, stdout: str) -> tuple[dict[str, Any], str | None, str | None]:
+    """Parse and validate plugin stdout, returning (output, violation, error message)."""
+    from pydantic import ValidationError
+
+    from gitstory.models.plugin import plugin_output_adapter
+
+    try:
+        output = plugin_output_adapter(plugin_type).validate_json(stdout)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            return {}, "invalid_json", "Plugin did not return valid JSON"
+        key = PLUGIN_TYPES[plugin_type]
+        return (
+            {},
+            "invalid_output",
+            f'{plugin_type.capitalize()} must return {{"{key}": bool, ...}}',
+        )
+    return output.model_dump(), None, None
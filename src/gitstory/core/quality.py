@@ -0,0 +1,500 @@
+"""Deterministic, rule-based ticket quality scoring.
+
+A cheap first pass before the LLM specification review: every ticket is
+checked against the structural criteria of its type (required sections,
+list items, header fields) and scanned for vague language with precompiled
+pattern sets (placeholders, weasel words, implicit assumptions,
+unquantified adjectives). Code blocks and inline code are not scanned.
+
+Scoring follows the specification-quality-checker rubric: penalties (high 3,
+medium 2, low 1) are weighed against the ticket's checkpoints (criteria plus
+list items), score = 100 - penalty / checkpoints * 100, clamped to 0-100.
+
+Scores depend only on file content, so they are cached by content hash in
+`.gitstory/cache/quality.json`; large uncached batches are scored on a
+process pool.
+
+Example:
+    >>> report = score_tree(Path("docs/tickets"))
+    >>> [s.ticket_id for s in report.ranked() if s.score < 70]
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.tickets import FENCE_PATTERN, HeaderField, iter_ticket_files, parse_header
+from gitstory.core.writer import atomic_write, content_hash, ignore_cache_errors
+from gitstory.models import InvalidTicketIdError, TicketId
+
+DEFAULT_QUALITY_CACHE_PATH = ".gitstory/cache/quality.json"
+# Bump when rules or weights change so cached scores are recomputed
+QUALITY_RULES_VERSION = 1
+# Uncached tickets needed before scoring moves to a process pool
+PARALLEL_MIN_TICKETS = 256
+# Tickets sent to a worker per task
+PARALLEL_CHUNK_SIZE = 64
+
+SEVERITY_PENALTY = {"high": 3, "medium": 2, "low": 1}
+# (minimum score, level), checked in order
+QUALITY_LEVELS = ((95, "agent_ready"), (85, "good"), (70, "needs_improvement"), (0, "not_ready"))
+
+
+@dataclass(frozen=True)
+class Criterion:
+    """Structural requirement for one ticket type.
+
+    Attributes:
+        id: Machine-readable name (e.g., "acceptance_criteria")
+        heading: `## ` heading that satisfies it (regex, case-insensitive)
+        field: Header field that satisfies it instead of a section
+        items: Require at least one list item (or table row) in the section
+        content: Regex the section text must match
+    """
+
+    id: str
+    heading: str | None = None
+    field: str | None = None
+    items: bool = False
+    content: str | None = None
+
+
+CRITERIA: dict[str, tuple[Criterion, ...]] = {
+    "initiative": (
+        Criterion("objective", heading=r"objective|overview"),
+        Criterion("key_results", heading=r"key results|success (?:metrics|criteria)", items=True),
+        Criterion("epics", heading=r"epics", items=True),
+        Criterion("dependencies", heading=r"dependencies"),
+        Criterion("risks", heading=r"risks.*"),
+        Criterion("owner", field="Owner"),
+    ),
+    "epic": (
+        Criterion("overview", heading=r"overview|objective"),
+        Criterion("stories", heading=r"stories", items=True),
+        Criterion("technical_approach", heading=r"technical (?:approach|design)"),
+        Criterion("deliverables", heading=r"deliverables.*", items=True),
+        Criterion("dependencies", heading=r"dependencies"),
+        Criterion("story_points", field="Story Points"),
+    ),
+    "story": (
+        Criterion("user_story", heading=r"user story", content=r"\bas an?\b[\s\S]*\bi want\b"),
+        Criterion("acceptance_criteria", heading=r"acceptance criteria", items=True),
+        Criterion("tasks", heading=r"tasks", items=True),
+        Criterion("technical_design", heading=r"technical (?:design|notes|approach)"),
+        Criterion("dependencies", heading=r"dependencies"),
+        Criterion("story_points", field="Story Points"),
+    ),
+    "task": (
+        Criterion("objective", heading=r"objective|description"),
+        Criterion(
+            "implementation_checklist", heading=r"implementation (?:checklist|steps)", items=True
+        ),
+        Criterion("files", heading=r"files to (?:create|modify|create/modify)"),
+        Criterion(
+            "success_criteria",
+            heading=r"(?:success|acceptance) criteria|definition of done",
+            items=True,
+        ),
+        Criterion("estimated_hours", field="Estimated Hours"),
+    ),
+    "bug": (
+        Criterion("description", heading=r"description|summary|objective"),
+        Criterion("steps_to_reproduce", heading=r"(?:steps to )?reproduc\w*", items=True),
+        Criterion("expected_behavior", heading=r"expected behaviou?r|expected"),
+        Criterion("acceptance_criteria", heading=r"(?:acceptance|success) criteria", items=True),
+    ),
+}
+
+# Vague language by category: (severity, {term: regex matching its forms})
+VAGUE_TERMS: dict[str, tuple[str, dict[str, str]]] = {
+    "placeholder": (
+        "high",
+        {
+            "TBD": r"(?-i:TBD|TODO|FIXME)",
+            "to be determined": r"to be (?:determined|defined|decided)",
+            "defined later": r"will be defined later",
+            "etc.": r"etc\.",
+            "and so on": r"and so on",
+            "as needed": r"as needed",
+        },
+    ),
+    "weasel_word": (
+        "medium",
+        {
+            "handle": r"handl(?:e[sd]?|ing)",
+            "support": r"support(?:s|ed|ing)?",
+            "improve": r"improv(?:e[sd]?|ing)",
+            "manage": r"manag(?:e[sd]?|ing)",
+            "deal with": r"deal(?:s|t)? with",
+            "various": r"various",
+            "simple": r"simple",
+            "basic": r"basic",
+        },
+    ),
+    "implicit_assumption": (
+        "low",
+        {
+            term: term
+            for term in (
+                "obviously",
+                "clearly",
+                "simply",
+                "just",
+                "easily",
+                "naturally",
+                "of course",
+            )
+        },
+    ),
+    "unquantified": (
+        "medium",
+        {
+            "fast": r"fast(?:er)?",
+            "slow": r"slow",
+            "efficient": r"efficient(?:ly)?",
+            "performant": r"performant",
+            "scalable": r"scalable",
+            "user-friendly": r"user-friendly",
+            "responsive": r"responsive",
+            "quick": r"quick(?:ly)?",
+        },
+    ),
+}
+
+# One named group per term ("category__index"), so a match names its term directly
+_VAGUE_GROUPS = {
+    f"{category}__{i}": (category, term)
+    for category, (_, terms) in VAGUE_TERMS.items()
+    for i, term in enumerate(terms)
+}
+_VAGUE_PATTERN = re.compile(
+    r"(?<![\w-])(?:"
+    + "|".join(
+        f"(?P<{category}__{i}>{regex})"
+        for category, (_, terms) in VAGUE_TERMS.items()
+        for i, regex in enumerate(terms.values())
+    )
+    + r")(?![\w-])",
+    re.IGNORECASE,
+)
+_HEADING_PATTERNS = {
+    ticket_type: [
+        re.compile(rf"(?:{c.heading})\s*", re.IGNORECASE) if c.heading else None for c in criteria
+    ]
+    for ticket_type, criteria in CRITERIA.items()
+}
+_CONTENT_PATTERNS = {
+    c.content: re.compile(c.content, re.IGNORECASE)
+    for criteria in CRITERIA.values()
+    for c in criteria
+    if c.content
+}
+_INLINE_CODE_PATTERN = re.compile(r"`[^`]*`")
+_LIST_ITEM_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+\S")
+_TABLE_ROW_PATTERN = re.compile(r"^\s*\|")
+_DIGIT_PATTERN = re.compile(r"\d")
+_PLACEHOLDER_VALUES = frozenset({"", "-", "?", "tbd", "todo", "n/a"})
+
+
+@dataclass(frozen=True)
+class QualityIssue:
+    """One quality finding.
+
+    Attributes:
+        category: missing_section, empty_section, missing_field or a VAGUE_TERMS category
+        severity: "high", "medium" or "low"
+        message: Human-readable description
+        line: 1-based line of the (first) occurrence, if any
+        count: Occurrences of a vague term (penalized once)
+    """
+
+    category: str
+    severity: str
+    message: str
+    line: int | None = None
+    count: int = 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the issue as a JSON-serializable dict."""
+        return {
+            "category": self.category,
+            "severity": self.severity,
+            "message": self.message,
+            "line": self.line,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QualityIssue":
+        """Rebuild an issue from to_dict() output."""
+        return cls(data["category"], data["severity"], data["message"], data["line"], data["count"])
+
+
+@dataclass
+class QualityScore:
+    """Quality score of one ticket file.
+
+    Attributes:
+        ticket_id: Ticket ID from the title line (None if missing)
+        ticket_type: initiative, epic, story, task or bug (None if unknown)
+        score: 0-100
+        level: agent_ready, good, needs_improvement or not_ready
+        checkpoints: Criteria plus list items the penalties are weighed against
+        issues: Findings, structural ones first
+        path: File path relative to the tickets root
+    """
+
+    ticket_id: str | None
+    ticket_type: str | None
+    score: int
+    level: str
+    checkpoints: int
+    issues: list[QualityIssue] = field(default_factory=list)
+    path: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the score as a JSON-serializable dict."""
+        return {
+            "ticket_id": self.ticket_id,
+            "type": self.ticket_type,
+            "path": self.path,
+            "score": self.score,
+            "level": self.level,
+            "checkpoints": self.checkpoints,
+            "issues": [issue.to_dict() for issue in self.issues],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QualityScore":
+        """Rebuild a score from to_dict() output."""
+        return cls(
+            ticket_id=data["ticket_id"],
+            ticket_type=data["type"],
+            score=data["score"],
+            level=data["level"],
+            checkpoints=data["checkpoints"],
+            issues=[QualityIssue.from_dict(i) for i in data["issues"]],
+            path=data["path"],
+        )
+
+
+@dataclass
+class QualityReport:
+    """Scores of a whole tickets root.
+
+    Attributes:
+        scores: Score per ticket file, in tree order
+        cached: Number of scores served from the cache
+    """
+
+    scores: list[QualityScore] = field(default_factory=list)
+    cached: int = 0
+
+    def ranked(self) -> list[QualityScore]:
+        """Scores from worst to best (tree order among equal scores)."""
+        return sorted(self.scores, key=lambda s: s.score)
+
+
+def quality_level(score: int) -> str:
+    """Map a 0-100 score to its quality level."""
+    return next(level for minimum, level in QUALITY_LEVELS if score >= minimum)
+
+
+def score_ticket(text: str, path: str = "") -> QualityScore:
+    """Score one ticket file.
+
+    Args:
+        text: Ticket markdown
+        path: File path relative to the tickets root (informational)
+
+    Returns:
+        QualityScore for the content
+    """
+    lines = text.splitlines()
+    header = parse_header(lines, path)
+    try:
+        ticket_type: str | None = TicketId.parse(header.ticket_id or "").type
+    except InvalidTicketIdError:
+        ticket_type = None
+    sections, items, prose = _scan(lines)
+
+    issues = []
+    criteria = CRITERIA.get(ticket_type or "", ())
+    for criterion, heading in zip(
+        criteria, _HEADING_PATTERNS.get(ticket_type or "", ()), strict=True
+    ):
+        issue = _check(criterion, heading, sections, header.fields)
+        if issue is not None:
+            issues.append(issue)
+    issues.extend(_vague_terms(prose))
+
+    checkpoints = max(1, len(criteria) + items)
+    penalty = sum(SEVERITY_PENALTY[issue.severity] for issue in issues)
+    score = max(0, min(100, round(100 - penalty * 100 / checkpoints)))
+    return QualityScore(
+        ticket_id=header.ticket_id,
+        ticket_type=ticket_type,
+        score=score,
+        level=quality_level(score),
+        checkpoints=checkpoints,
+        issues=issues,
+        path=path,
+    )
+
+
+def score_tree(
+    tickets_root: Path,
+    cache_path: Path | str | None = DEFAULT_QUALITY_CACHE_PATH,
+    max_workers: int | None = None,
+) -> QualityReport:
+    """Score every ticket under tickets_root, reusing cached scores by content hash.
+
+    Args:
+        tickets_root: Tickets root directory
+        cache_path: Score cache file (None disables caching)
+        max_workers: Process pool size for uncached tickets (default: CPUs;
+            1 scores in-process)
+
+    Returns:
+        QualityReport in tree order
+    """
+    cache = _load_cache(cache_path) if cache_path is not None else {}
+    report = QualityReport()
+    paths = list(iter_ticket_files(tickets_root))
+    hashes: list[str] = []
+    pending: dict[str, tuple[str, str]] = {}
+    for rel_path in paths:
+        data = (tickets_root / rel_path).read_bytes()
+        digest = content_hash(data)
+        hashes.append(digest)
+        if digest not in cache and digest not in pending:
+            pending[digest] = (data.decode("utf-8", "replace"), rel_path)
+
+    texts = list(pending.values())
+    workers = min(max_workers or os.cpu_count() or 1, len(texts) // PARALLEL_CHUNK_SIZE + 1)
+    if len(texts) >= PARALLEL_MIN_TICKETS and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(_score_item, texts, chunksize=PARALLEL_CHUNK_SIZE))
+    else:
+        fresh = [_score_item(item) for item in texts]
+    computed = dict(zip(pending, (s.to_dict() for s in fresh), strict=True))
+
+    for rel_path, digest in zip(paths, hashes, strict=True):
+        score = QualityScore.from_dict(cache.get(digest) or computed[digest])
+        score.path = rel_path
+        report.scores.append(score)
+    report.cached = len(hashes) - sum(1 for d in hashes if d in computed)
+
+    if cache_path is not None and (computed or cache.keys() - set(hashes)):
+        with ignore_cache_errors():
+            _save_cache(cache_path, {d: cache.get(d) or computed[d] for d in hashes})
+    return report
+
+
+def _score_item(item: tuple[str, str]) -> QualityScore:
+    """Pool entry point: score (text, path)."""
+    return score_ticket(*item)
+
+
+def _scan(lines: list[str]) -> tuple[dict[str, list[str]], int, list[tuple[int, str]]]:
+    """Split the body into sections; count list items; collect prose lines.
+
+    Returns:
+        (section lines by lowercased `## ` title, list items outside code,
+        (line number, text without inline code) for prose outside code and headers)
+    """
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    items = 0
+    prose = []
+    in_code = False
+    for lineno, line in enumerate(lines, start=1):
+        if FENCE_PATTERN.match(line):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        if line.startswith("## "):
+            current = sections.setdefault(line[3:].strip().lower(), [])
+            continue
+        if current is None:
+            continue  # title and header fields
+        current.append(line)
+        if _LIST_ITEM_PATTERN.match(line):
+            items += 1
+        if not line.startswith("#"):
+            prose.append((lineno, _INLINE_CODE_PATTERN.sub("", line)))
+    return sections, items, prose
+
+
+def _check(
+    criterion: Criterion,
+    heading: re.Pattern[str] | None,
+    sections: dict[str, list[str]],
+    fields: dict[str, HeaderField],
+) -> QualityIssue | None:
+    """Return the issue for an unmet criterion, or None."""
+    name = criterion.id.replace("_", " ")
+    if criterion.field is not None:
+        value = fields.get(criterion.field)
+        if value is None or value.value.strip().lower() in _PLACEHOLDER_VALUES:
+            return QualityIssue("missing_field", "high", f"Missing **{criterion.field}**")
+        return None
+    body = next(
+        (lines for title, lines in sections.items() if heading and heading.fullmatch(title)), None
+    )
+    if body is None:
+        return QualityIssue("missing_section", "high", f"Missing {name} section")
+    if not any(line.strip() for line in body):
+        return QualityIssue("empty_section", "high", f"Empty {name} section")
+    if criterion.items and not any(
+        _LIST_ITEM_PATTERN.match(line) or _TABLE_ROW_PATTERN.match(line) for line in body
+    ):
+        return QualityIssue("empty_section", "high", f"No list items under {name}")
+    if criterion.content and not _CONTENT_PATTERNS[criterion.content].search("\n".join(body)):
+        return QualityIssue("empty_section", "medium", f"Unexpected {name} format")
+    return None
+
+
+def _vague_terms(prose: Iterable[tuple[int, str]]) -> list[QualityIssue]:
+    """One issue per distinct vague term (with its first line and count)."""
+    found: dict[tuple[str, str], list[int]] = {}
+    for lineno, line in prose:
+        for match in _VAGUE_PATTERN.finditer(line):
+            category, term = _VAGUE_GROUPS[match.lastgroup or ""]
+            if category == "unquantified" and _DIGIT_PATTERN.search(line):
+                continue  # a number on the same line quantifies it
+            found.setdefault((category, term), []).append(lineno)
+    return [
+        QualityIssue(
+            category,
+            VAGUE_TERMS[category][0],
+            f"Vague term '{term}' ({category.replace('_', ' ')})",
+            line=lines[0],
+            count=len(lines),
+        )
+        for (category, term), lines in found.items()
+    ]
+
+
+def _load_cache(path: Path | str) -> dict[str, dict[str, Any]]:
+    """Cached score dicts by content hash (empty if missing, corrupt or outdated)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != QUALITY_RULES_VERSION:
+            return {}
+        return dict(data["scores"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _save_cache(path: Path | str, scores: dict[str, dict[str, Any]]) -> None:
+    """Write the cache atomically (see gitstory.core.writer.atomic_write)."""
+    data = {"version": QUALITY_RULES_VERSION, "scores": scores}
+    atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode())
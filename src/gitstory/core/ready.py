@@ -0,0 +1,219 @@
+"""Ready queue: unblocked, not-started tasks in priority order.
+
+A task is ready when its status maps to the workflow's start state, none of
+its ancestors is in a blocked state, and every blocker of the task and of
+its ancestors (see gitstory.core.graph) is in an end state.
+
+Ready tasks are kept in a binary heap ordered by:
+1. Parent order: the epic's position in the tree (INIT, EPIC numbers)
+2. Story points of the task's story: estimated stories first, smallest
+   first (then story number, so a story's tasks stay together)
+3. `**Estimated Hours**` of the task: estimated tasks first, smallest first
+4. Age: first commit of the task file (see creation_times), then task number
+
+Status changes are applied with update() (`gitstory execute` does so for
+the files it wrote), which re-evaluates only the tickets whose readiness can
+change (the ticket, its descendants and the tickets it blocks with their
+descendants); heap entries are invalidated lazily instead of being removed.
+
+Example:
+    >>> created = creation_times(tickets_root, index, load_history(tickets_root))
+    >>> queue = ReadyQueue(index, TicketGraph.from_index(index), workflow, created=created)
+    >>> queue.peek()
+    'TASK-0001.2.4.1'
+"""
+
+import heapq
+import math
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+from gitstory.core.graph import TicketGraph
+from gitstory.core.history import History
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import HeaderField, TicketHeader
+from gitstory.core.workflow import Workflow
+
+PriorityKey = tuple[
+    tuple[int, ...], bool, float, tuple[int, ...], bool, float, float, tuple[int, ...]
+]
+
+
+class ReadyQueue:
+    """Priority heap over ready tasks, maintained incrementally.
+
+    Args:
+        index: Ticket index (updated in place by update())
+        graph: Blocker graph built from index
+        workflow: Workflow used to classify statuses
+        scope: Only queue tasks below this ticket ID (e.g., a story), if given
+        created: Creation timestamp by ticket ID (see creation_times); tasks
+            without one are served after those with one
+    """
+
+    def __init__(
+        self,
+        index: TicketIndex,
+        graph: TicketGraph,
+        workflow: Workflow,
+        scope: str | None = None,
+        created: Mapping[str, float] | None = None,
+    ) -> None:
+        self.index = index
+        self.graph = graph
+        self.workflow = workflow
+        self.scope = scope
+        self.created = created or {}
+        self._heap: list[tuple[PriorityKey, str]] = []
+        self._ready: dict[str, PriorityKey] = {}
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._ready
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate ready task IDs in priority order (does not consume the queue)."""
+        return iter(sorted(self._ready, key=self._ready.__getitem__))
+
+    def peek(self) -> str | None:
+        """Return the highest-priority ready task without removing it."""
+        heap = self._heap
+        while heap and self._ready.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][1] if heap else None
+
+    def pop(self) -> str | None:
+        """Remove and return the highest-priority ready task."""
+        ticket_id = self.peek()
+        if ticket_id is not None:
+            heapq.heappop(self._heap)
+            del self._ready[ticket_id]
+        return ticket_id
+
+    def update(self, header: TicketHeader) -> None:
+        """Apply a changed ticket header and re-evaluate affected tasks.
+
+        A changed dependency list rebuilds the graph and the queue; a status
+        change only re-evaluates the tickets whose readiness depends on it.
+
+        Args:
+            header: New header of a ticket file already in the index
+        """
+        old = self.index.by_path.get(header.path)
+        self.index.add(header)
+        if old is None or (old.requires, old.blocks) != (header.requires, header.blocks):
+            self.graph = TicketGraph.from_index(self.index)
+            self._rebuild()
+            return
+        if header.ticket_id is None:
+            return
+        affected = [header.ticket_id, *self.graph.unblocks(header.ticket_id)]
+        for ticket_id in affected:
+            for task_id in self._tasks_under(ticket_id):
+                self._evaluate(task_id)
+
+    def is_ready(self, ticket_id: str) -> bool:
+        """Return True if ticket_id is a not-started task with no open blockers."""
+        header = self.index.get(ticket_id)
+        parsed = self.index.parse_id(ticket_id)
+        if header is None or parsed is None or parsed.type != "task":
+            return False
+        if self._state_type(header) != "start":
+            return False
+        for related in (ticket_id, *self.index.ancestor_ids(ticket_id)):
+            if related != ticket_id and self._state_type(self.index.get(related)) == "blocked":
+                return False
+            for blocker in self.graph.blockers(related):
+                if self._state_type(self.index.get(blocker)) != "end":
+                    return False
+        return True
+
+    def priority(self, ticket_id: str) -> PriorityKey:
+        """Return the heap ordering key for a task (smaller is served first)."""
+        header = self.index.by_id[ticket_id]
+        parts = self.index.parse_id(ticket_id)
+        position = parts.parts if parts else ()
+        story_id = self.index.parent_id(ticket_id)
+        story = self.index.get(story_id) if story_id else None
+        points = _number(story.fields.get("Story Points")) if story else None
+        hours = _number(header.fields.get("Estimated Hours"))
+        return (
+            position[:-2],
+            points is None,
+            points or 0.0,
+            position[:-1],
+            hours is None,
+            hours or 0.0,
+            self.created.get(ticket_id, math.inf),
+            position,
+        )
+
+    def _rebuild(self) -> None:
+        self._ready = {}
+        for ticket_id in self.index.by_id:
+            if self._in_scope(ticket_id) and self.is_ready(ticket_id):
+                self._ready[ticket_id] = self.priority(ticket_id)
+        self._heap = [(key, ticket_id) for ticket_id, key in self._ready.items()]
+        heapq.heapify(self._heap)
+
+    def _evaluate(self, ticket_id: str) -> None:
+        if not self._in_scope(ticket_id) or not self.is_ready(ticket_id):
+            self._ready.pop(ticket_id, None)
+            return
+        key = self.priority(ticket_id)
+        if self._ready.get(ticket_id) != key:
+            self._ready[ticket_id] = key
+            heapq.heappush(self._heap, (key, ticket_id))
+
+    def _tasks_under(self, ticket_id: str) -> Iterator[str]:
+        """Yield ticket_id and its descendants (readiness is only tracked for tasks)."""
+        stack = [ticket_id]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(self.index.children.get(current, ()))
+
+    def _in_scope(self, ticket_id: str) -> bool:
+        return self.scope is None or self.scope in (
+            ticket_id,
+            *self.index.ancestor_ids(ticket_id),
+        )
+
+    def _state_type(self, header: TicketHeader | None) -> str | None:
+        status = header.status if header else None
+        state = self.workflow.state_for_status(status) if status else None
+        return state.type if state else None
+
+
+def creation_times(tickets_root: Path, index: TicketIndex, history: History) -> dict[str, float]:
+    """Creation timestamp of every ticket: its first commit, else its file's mtime.
+
+    Args:
+        tickets_root: Tickets root directory
+        index: Ticket index of tickets_root
+        history: Status history mined from git (see gitstory.core.history.load_history)
+
+    Returns:
+        Timestamp by ticket ID (tickets whose file cannot be read are left out)
+    """
+    created: dict[str, float] = dict(history.created())
+    for ticket_id, header in index.by_id.items():
+        if ticket_id not in created:
+            try:
+                created[ticket_id] = (tickets_root / header.path).stat().st_mtime
+            except OSError:
+                continue
+    return created
+
+
+def _number(field: HeaderField | None) -> float | None:
+    """Parse a numeric header field value (e.g., "5" or "3 points")."""
+    if field is None or not field.value:
+        return None
+    try:
+        return float(field.value.split()[0])
+    except ValueError:
+        return None
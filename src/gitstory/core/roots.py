@@ -0,0 +1,178 @@
+"""Multiple ticket roots in one repository (monorepos).
+
+A project is a directory holding its own `docs/tickets` tree and, optionally,
+its own `.gitstory/workflow.yaml` and `.gitstory/cache/`. Commands given
+several projects (or --all-roots) run once per root on a process pool, so a
+monorepo pays CLI startup once and parses its trees in parallel; each worker
+builds its own index and only picklable results travel back.
+
+Example:
+    >>> roots = discover_roots(Path("."))
+    >>> indexes = map_roots(load_root_index, roots)
+"""
+
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from gitstory.core.index import TicketIndex
+from gitstory.core.snapshot import DEFAULT_SNAPSHOT_PATH, load_index
+from gitstory.core.workflow import DEFAULT_WORKFLOW_PATH
+from gitstory.models import DEFAULT_TICKETS_ROOT
+
+# Directories never searched for ticket roots
+SKIP_DIRS = frozenset({".git", ".hg", ".venv", "venv", "node_modules", "__pycache__"})
+# How deep below the start directory discover_roots() looks for projects
+DISCOVERY_MAX_DEPTH = 6
+
+
+@dataclass(frozen=True)
+class TicketRoot:
+    """One project's ticket tree and configuration.
+
+    Attributes:
+        name: Project path relative to where discovery started ("." for itself)
+        project: Project directory (parent of docs/ and .gitstory/)
+    """
+
+    name: str
+    project: Path
+
+    @property
+    def tickets(self) -> Path:
+        """Tickets root directory (project/docs/tickets)."""
+        return self.project / DEFAULT_TICKETS_ROOT
+
+    @property
+    def workflow(self) -> Path:
+        """Workflow file of the project (the default workflow applies if missing)."""
+        return self.project / DEFAULT_WORKFLOW_PATH
+
+    def cache(self, relative: str) -> Path:
+        """Resolve a project-relative cache path (e.g., DEFAULT_SNAPSHOT_PATH) for this root."""
+        return self.project / relative
+
+    def to_dict(self) -> dict[str, str]:
+        """Return the root as a JSON-serializable dict."""
+        return {"root": self.name, "path": self.tickets.as_posix()}
+
+
+def discover_roots(start: Path, max_depth: int = DISCOVERY_MAX_DEPTH) -> list[TicketRoot]:
+    """Find every project below start that has a docs/tickets directory.
+
+    Hidden directories and SKIP_DIRS are not searched, nor are ticket trees
+    themselves.
+
+    Args:
+        start: Directory to search from
+        max_depth: Maximum project depth below start
+
+    Returns:
+        Roots sorted by name
+    """
+    roots = []
+    trees: set[Path] = set()
+    base_depth = len(start.parts)
+    for dirpath, dirnames, _ in os.walk(start):
+        current = Path(dirpath)
+        if (current / DEFAULT_TICKETS_ROOT).is_dir():
+            roots.append(_root(current, start))
+            trees.add(current / DEFAULT_TICKETS_ROOT)
+        if len(current.parts) - base_depth >= max_depth:
+            dirnames.clear()
+            continue
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if d not in SKIP_DIRS and not d.startswith(".") and current / d not in trees
+        )
+    return sorted(roots, key=lambda r: r.name)
+
+
+def resolve_roots(paths: Iterable[str], start: Path = Path(".")) -> list[TicketRoot]:
+    """Turn --root arguments (project or tickets directories) into roots.
+
+    Args:
+        paths: Project directories, or their docs/tickets directories
+        start: Directory names are reported relative to
+
+    Returns:
+        Roots in argument order, duplicates removed
+
+    Raises:
+        FileNotFoundError: If a path has no tickets directory
+    """
+    roots: dict[Path, TicketRoot] = {}
+    for raw in paths:
+        project = Path(raw)
+        text = project.as_posix()
+        if text == DEFAULT_TICKETS_ROOT or text.endswith(f"/{DEFAULT_TICKETS_ROOT}"):
+            project = Path(text.removesuffix(DEFAULT_TICKETS_ROOT) or ".")
+        tickets = project / DEFAULT_TICKETS_ROOT
+        if not tickets.is_dir():
+            raise FileNotFoundError(f"Tickets directory not found: {tickets}")
+        roots.setdefault(project.resolve(), _root(project, start))
+    return list(roots.values())
+
+
+def select_roots(paths: Sequence[str] | None, all_roots: bool) -> list[TicketRoot] | None:
+    """Roots requested by the --root/--all-roots options, or None for single-root mode.
+
+    Raises:
+        FileNotFoundError: If a --root has no tickets directory, or none is discovered
+    """
+    if not paths and not all_roots:
+        return None
+    roots = resolve_roots(paths or ())
+    if all_roots:
+        known = {r.project.resolve() for r in roots}
+        roots += [r for r in discover_roots(Path(".")) if r.project.resolve() not in known]
+    if not roots:
+        raise FileNotFoundError(f"No {DEFAULT_TICKETS_ROOT} directory found below .")
+    return roots
+
+
+def map_roots[T](
+    fn: Callable[[TicketRoot], T], roots: Sequence[TicketRoot], max_workers: int | None = None
+) -> list[T]:
+    """Apply fn to every root concurrently, returning results in root order.
+
+    A single root runs in-process. Several roots run on a process pool (one
+    worker per root, at most one per CPU), falling back to threads where
+    processes are unavailable. fn must be a module-level function (or a
+    functools.partial of one) returning a picklable value.
+
+    Args:
+        fn: Work for one root
+        roots: Roots to process
+        max_workers: Worker limit (default: number of CPUs)
+
+    Returns:
+        fn(root) for each root
+    """
+    workers = min(len(roots), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [fn(root) for root in roots]
+    executor: Executor
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError):
+        executor = ThreadPoolExecutor(max_workers=workers)
+    with executor:
+        return list(executor.map(fn, roots))
+
+
+def load_root_index(root: TicketRoot) -> TicketIndex:
+    """Load a root's index through its own snapshot (project/.gitstory/cache/tree.snap)."""
+    return load_index(root.tickets, root.cache(DEFAULT_SNAPSHOT_PATH))
+
+
+def _root(project: Path, start: Path) -> TicketRoot:
+    """Build a root named by its path relative to start."""
+    try:
+        name = project.resolve().relative_to(start.resolve()).as_posix()
+    except ValueError:
+        name = project.as_posix()
+    return TicketRoot(name=name, project=project)
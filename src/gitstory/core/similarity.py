@@ -0,0 +1,293 @@
+"""Near-duplicate ticket detection with MinHash and locality-sensitive hashing.
+
+Each ticket's title, objective/overview/user story and acceptance criteria
+are normalized into word shingles and summarized as a MinHash signature of
+NUM_PERM values. Every shingle is hashed once with SHAKE-128, whose output
+provides the NUM_PERM independent hash values; the signature is their
+elementwise minimum. The fraction of equal positions in two signatures
+estimates the Jaccard similarity of the shingle sets.
+
+LSH splits signatures into LSH_BANDS bands of LSH_ROWS rows; tickets sharing
+any band are candidates, so only likely pairs are compared instead of all
+n^2. With 16 bands of 4 rows, pairs above ~0.5 similarity are found with
+high probability.
+
+Signatures are stored in `.gitstory/cache/minhash.snap` (marshal, keyed on
+each file's stat signature), so only changed tickets are re-shingled.
+
+Example:
+    >>> index = load_similarity_index(Path("docs/tickets"))
+    >>> index.duplicates(threshold=0.6)
+    >>> index.query(ticket_text(draft_markdown))
+"""
+
+import hashlib
+import marshal
+import os
+import re
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from gitstory.core.tickets import FENCE_PATTERN, TITLE_PATTERN, iter_ticket_files
+from gitstory.core.writer import atomic_write, ignore_cache_errors
+from gitstory.models import InvalidTicketIdError, TicketId
+
+DEFAULT_SIMILARITY_PATH = ".gitstory/cache/minhash.snap"
+SIMILARITY_MAGIC = b"GSMINH"
+SIMILARITY_VERSION = 1
+
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+SHINGLE_SIZE = 2
+DEFAULT_SIMILARITY_THRESHOLD = 0.5
+
+# Sections summarizing what a ticket is about (matched case-insensitively)
+SIMILARITY_SECTIONS = re.compile(
+    r"objective|overview|user story|description|summary|(?:acceptance|success) criteria",
+    re.IGNORECASE,
+)
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or that the this to with".split()
+)
+
+Signature = tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class SimilarMatch:
+    """A near-duplicate candidate that passed the similarity threshold.
+
+    Attributes:
+        ticket_id: Ticket ID of the match (None if its file has no title line)
+        path: File path of the match relative to the tickets root
+        similarity: Estimated Jaccard similarity (0-1)
+        other_id: The ticket it duplicates (None for a query draft)
+        other_path: Path of that ticket (None for a query draft)
+    """
+
+    ticket_id: str | None
+    path: str
+    similarity: float
+    other_id: str | None = None
+    other_path: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the match as a JSON-serializable dict."""
+        data: dict[str, Any] = {
+            "ticket_id": self.ticket_id,
+            "path": self.path,
+            "similarity": round(self.similarity, 3),
+        }
+        if self.other_path is not None:
+            data["other_id"] = self.other_id
+            data["other_path"] = self.other_path
+        return data
+
+
+def ticket_text(markdown: str) -> str:
+    """Keep the title line and the sections that describe the ticket's intent."""
+    kept = []
+    keep = False
+    in_code = False
+    for line in markdown.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        if line.startswith("## "):
+            keep = SIMILARITY_SECTIONS.fullmatch(line[3:].strip()) is not None
+            continue
+        if line.startswith("# "):
+            match = TITLE_PATTERN.match(line)
+            kept.append(match.group("title") if match else line[2:])
+        elif keep:
+            kept.append(line)
+    return "\n".join(kept)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Word n-grams of the normalized text (stop words dropped)."""
+    words = [w for w in _WORD_PATTERN.findall(text.lower()) if w not in _STOPWORDS]
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def signature(text: str) -> Signature | None:
+    """MinHash signature of the text's shingles, or None if it has no words."""
+    rows = [array("I", hashlib.shake_128(s.encode()).digest(4 * NUM_PERM)) for s in shingles(text)]
+    if not rows:
+        return None
+    return tuple(map(min, zip(*rows, strict=True)))
+
+
+def estimate(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity: the fraction of equal signature positions."""
+    return sum(x == y for x, y in zip(a, b, strict=True)) / NUM_PERM
+
+
+@dataclass
+class SimilarityIndex:
+    """MinHash signatures of a tickets root, with LSH buckets for candidate lookup.
+
+    Attributes:
+        root: Tickets root the paths are relative to
+        entries: (ticket_id, mtime_ns, size, signature) by path, in tree order
+    """
+
+    root: str
+    entries: dict[str, tuple[str | None, int, int, Signature]] = field(default_factory=dict)
+    _buckets: dict[tuple[int, Signature], list[str]] | None = field(default=None, repr=False)
+
+    def buckets(self) -> dict[tuple[int, Signature], list[str]]:
+        """Paths by (band, band values), built on first use."""
+        if self._buckets is None:
+            self._buckets = {}
+            for path, (_, _, _, sig) in self.entries.items():
+                for key in _bands(sig):
+                    self._buckets.setdefault(key, []).append(path)
+        return self._buckets
+
+    def duplicates(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> list[SimilarMatch]:
+        """Near-duplicate pairs at or above threshold, most similar first.
+
+        Tickets in the same lineage (a story and its own tasks) restate each
+        other by design and are not reported.
+        """
+        pairs: set[tuple[str, str]] = set()
+        for paths in self.buckets().values():
+            for i, a in enumerate(paths):
+                for b in paths[i + 1 :]:
+                    pairs.add((a, b))
+        matches = []
+        for a, b in pairs:
+            id_a, _, _, sig_a = self.entries[a]
+            id_b, _, _, sig_b = self.entries[b]
+            if _same_lineage(id_a, id_b):
+                continue
+            similarity = estimate(sig_a, sig_b)
+            if similarity >= threshold:
+                matches.append(SimilarMatch(id_b, b, similarity, id_a, a))
+        order = {path: i for i, path in enumerate(self.entries)}
+        return sorted(matches, key=lambda m: (-m.similarity, order[m.other_path or ""]))
+
+    def query(
+        self, text: str, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> list[SimilarMatch]:
+        """Existing tickets similar to a draft ticket's text, most similar first."""
+        sig = signature(text)
+        if sig is None:
+            return []
+        buckets = self.buckets()
+        candidates = dict.fromkeys(p for key in _bands(sig) for p in buckets.get(key, ()))
+        matches = []
+        for path in candidates:
+            ticket_id, _, _, other = self.entries[path]
+            similarity = estimate(sig, other)
+            if similarity >= threshold:
+                matches.append(SimilarMatch(ticket_id, path, similarity))
+        return sorted(matches, key=lambda m: -m.similarity)
+
+    @classmethod
+    def read(cls, path: Path | str) -> "SimilarityIndex | None":
+        """Load stored signatures, returning None if missing, corrupt or outdated."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if not data.startswith(SIMILARITY_MAGIC):
+                return None
+            version, python, num_perm, root, entries = marshal.loads(data[len(SIMILARITY_MAGIC) :])
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if (version, python, num_perm) != (SIMILARITY_VERSION, sys.version_info[:2], NUM_PERM):
+            return None
+        return cls(root, {e[0]: e[1:] for e in entries})
+
+    def write(self, path: Path | str) -> None:
+        """Write the signatures atomically (see gitstory.core.writer.atomic_write)."""
+        entries = tuple((p, *entry) for p, entry in self.entries.items())
+        payload = (SIMILARITY_VERSION, sys.version_info[:2], NUM_PERM, self.root, entries)
+        atomic_write(path, SIMILARITY_MAGIC + marshal.dumps(payload))
+
+
+def load_similarity_index(
+    tickets_root: Path,
+    cache_path: Path | str | None = DEFAULT_SIMILARITY_PATH,
+    save: bool = True,
+) -> SimilarityIndex:
+    """Build the similarity index, re-shingling only files whose stat signature changed.
+
+    Args:
+        tickets_root: Tickets root directory
+        cache_path: Signature store (None disables it)
+        save: Write the store back if anything changed
+
+    Returns:
+        SimilarityIndex for every ticket with text to compare
+    """
+    root = str(tickets_root)
+    stored = SimilarityIndex.read(cache_path) if cache_path is not None else None
+    previous = stored.entries if stored is not None and stored.root == root else {}
+    index = SimilarityIndex(root)
+    changed = False
+    for rel_path in iter_ticket_files(tickets_root):
+        file_path = tickets_root / rel_path
+        st = os.stat(file_path)
+        entry = previous.get(rel_path)
+        if entry is not None and entry[1:3] == (st.st_mtime_ns, st.st_size):
+            index.entries[rel_path] = entry
+            continue
+        changed = True
+        markdown = file_path.read_text(encoding="utf-8", errors="replace")
+        sig = signature(ticket_text(markdown))
+        if sig is not None:
+            index.entries[rel_path] = (_title_id(markdown), st.st_mtime_ns, st.st_size, sig)
+    changed = changed or previous.keys() != index.entries.keys()
+    if changed and save and cache_path is not None:
+        with ignore_cache_errors():
+            index.write(cache_path)
+    return index
+
+
+def _bands(sig: Signature) -> Iterator[tuple[int, Signature]]:
+    """LSH bucket keys of a signature."""
+    for band in range(LSH_BANDS):
+        yield band, sig[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+
+
+def _title_id(markdown: str) -> str | None:
+    """Ticket ID from the first `# ID: Title` line."""
+    for line in _head(markdown.splitlines()):
+        match = TITLE_PATTERN.match(line)
+        if match:
+            return match.group("id")
+    return None
+
+
+def _head(lines: Iterable[str]) -> Iterator[str]:
+    """Lines before the first `## ` section."""
+    for line in lines:
+        if line.startswith("## "):
+            return
+        yield line
+
+
+def _same_lineage(a: str | None, b: str | None) -> bool:
+    """True if one ticket is an ancestor of the other."""
+    if a is None or b is None:
+        return False
+    try:
+        id_a, id_b = TicketId.parse(a), TicketId.parse(b)
+    except InvalidTicketIdError:
+        return False
+    if id_a.bug or id_b.bug or id_a.depth == id_b.depth:
+        return False
+    short, long = sorted((id_a, id_b), key=lambda t: t.depth)
+    return long.parts[: short.depth] == short.parts
@@ -0,0 +1,244 @@
+"""Binary snapshot of the parsed ticket tree for fast cold loads.
+
+`.gitstory/cache/tree.snap` holds every parsed ticket header of one tickets
+root, serialized with marshal (flat tuples of builtins, so loading is a
+single read plus one C-level decode). A snapshot is trusted when its
+fingerprint still matches:
+
+- In a git repository, the fingerprint is the tree hash of the tickets root
+  at HEAD. Files that differ from HEAD, staged or not (`git diff HEAD`),
+  untracked files (`git ls-files -o`) and files that differed when the
+  snapshot was written are re-read, so uncommitted edits are never served
+  stale and no other file is touched.
+- Otherwise, or when the tree hash changed, the tree is walked and only files
+  whose (mtime_ns, size) differ from the snapshot are re-read.
+
+The snapshot is rewritten only when something was re-read. marshal data is
+specific to the Python version, which is part of the snapshot header.
+
+Example:
+    >>> index = load_index(Path("docs/tickets"))
+"""
+
+import gc
+import marshal
+import os
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from gitstory.core.git import GitError, run_git
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import (
+    HeaderField,
+    TicketHeader,
+    is_ticket_path,
+    iter_ticket_files,
+    read_header,
+)
+from gitstory.core.writer import atomic_write, ignore_cache_errors
+
+DEFAULT_SNAPSHOT_PATH = ".gitstory/cache/tree.snap"
+SNAPSHOT_MAGIC = b"GSSNAP"
+SNAPSHOT_VERSION = 1
+
+# path, ticket_id, title, (key, value, line, ...), requires, blocks, mtime_ns, size
+HeaderRecord = tuple[
+    str, str | None, str, tuple[str | int, ...], tuple[str, ...], tuple[str, ...], int, int
+]
+
+
+@dataclass
+class TreeSnapshot:
+    """Parsed headers of a tickets root plus the data needed to trust them.
+
+    Attributes:
+        root: Tickets root the paths are relative to
+        fingerprint: Git tree hash of root at HEAD when written (None outside git)
+        dirty: Paths that differed from HEAD when written
+        records: Header records by path, in tree order
+    """
+
+    root: str
+    fingerprint: str | None = None
+    dirty: tuple[str, ...] = ()
+    records: dict[str, HeaderRecord] = field(default_factory=dict)
+
+    @classmethod
+    def read(cls, path: Path | str = DEFAULT_SNAPSHOT_PATH) -> "TreeSnapshot | None":
+        """Load a snapshot, returning None if missing, corrupt or from another version."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if not data.startswith(SNAPSHOT_MAGIC):
+                return None
+            version, python, root, fingerprint, dirty, records = marshal.loads(
+                data[len(SNAPSHOT_MAGIC) :]
+            )
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != SNAPSHOT_VERSION or python != sys.version_info[:2]:
+            return None
+        return cls(root, fingerprint, dirty, {r[0]: r for r in records})
+
+    def write(self, path: Path | str = DEFAULT_SNAPSHOT_PATH) -> None:
+        """Write the snapshot atomically (see gitstory.core.writer.atomic_write)."""
+        payload = (
+            SNAPSHOT_VERSION,
+            sys.version_info[:2],
+            self.root,
+            self.fingerprint,
+            self.dirty,
+            tuple(self.records.values()),
+        )
+        atomic_write(path, SNAPSHOT_MAGIC + marshal.dumps(payload))
+
+    def headers(self) -> list[TicketHeader]:
+        """Rebuild TicketHeader objects from the records (trusted, not re-validated)."""
+        headers = []
+        # The rebuilt objects hold no cycles; collections triggered by
+        # allocating them would only rescan them
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for path, ticket_id, title, flat, requires, blocks, _, _ in self.records.values():
+                fields = {
+                    str(flat[i]): HeaderField(str(flat[i + 1]), int(flat[i + 2]))
+                    for i in range(0, len(flat), 3)
+                }
+                headers.append(TicketHeader(path, ticket_id, title, fields, requires, blocks))
+        finally:
+            if enabled:
+                gc.enable()
+        return headers
+
+
+def load_index(
+    tickets_root: Path,
+    snapshot_path: Path | str = DEFAULT_SNAPSHOT_PATH,
+    save: bool = True,
+) -> TicketIndex:
+    """Build the ticket index from the snapshot, re-reading only changed files.
+
+    Args:
+        tickets_root: Tickets root directory
+        snapshot_path: Snapshot file location
+        save: Write the refreshed snapshot back if anything was re-read
+
+    Returns:
+        TicketIndex equal to TicketIndex.scan(tickets_root)
+    """
+    return TicketIndex(load_snapshot(tickets_root, snapshot_path, save).headers())
+
+
+def load_snapshot(
+    tickets_root: Path,
+    snapshot_path: Path | str = DEFAULT_SNAPSHOT_PATH,
+    save: bool = True,
+) -> TreeSnapshot:
+    """Bring the snapshot up to date with the tree, re-reading only changed files.
+
+    Consumers that only stream records (e.g., export) use this directly and
+    skip building TicketHeader objects and the index.
+
+    Args:
+        tickets_root: Tickets root directory
+        snapshot_path: Snapshot file location
+        save: Write the refreshed snapshot back if anything was re-read
+
+    Returns:
+        Up-to-date snapshot with records in tree order
+    """
+    root = str(tickets_root)
+    snapshot = TreeSnapshot.read(snapshot_path)
+    if snapshot is None or snapshot.root != root:
+        snapshot = TreeSnapshot(root)
+    fingerprint, dirty = _git_state(tickets_root)
+
+    if fingerprint is not None and fingerprint == snapshot.fingerprint:
+        changed = _refresh_paths(snapshot, tickets_root, {*dirty, *snapshot.dirty})
+    else:
+        changed = _refresh_tree(snapshot, tickets_root)
+    if fingerprint != snapshot.fingerprint or tuple(sorted(dirty)) != snapshot.dirty:
+        snapshot.fingerprint = fingerprint
+        snapshot.dirty = tuple(sorted(dirty))
+        changed = True
+    if changed:
+        snapshot.records = dict(sorted(snapshot.records.items(), key=lambda r: _tree_key(r[0])))
+    if changed and save:
+        with ignore_cache_errors():
+            snapshot.write(snapshot_path)
+    return snapshot
+
+
+def _refresh_paths(snapshot: TreeSnapshot, tickets_root: Path, paths: Iterable[str]) -> bool:
+    """Re-read the given paths only (fingerprint matched)."""
+    changed = False
+    for rel_path in paths:
+        if not is_ticket_path(rel_path):
+            continue
+        changed |= _refresh_file(snapshot, tickets_root, rel_path)
+    return changed
+
+
+def _refresh_tree(snapshot: TreeSnapshot, tickets_root: Path) -> bool:
+    """Walk the tree, re-reading files whose stat signature changed."""
+    seen = set()
+    changed = False
+    for rel_path in iter_ticket_files(tickets_root):
+        seen.add(rel_path)
+        changed |= _refresh_file(snapshot, tickets_root, rel_path)
+    for rel_path in snapshot.records.keys() - seen:
+        del snapshot.records[rel_path]
+        changed = True
+    return changed
+
+
+def _refresh_file(snapshot: TreeSnapshot, tickets_root: Path, rel_path: str) -> bool:
+    """Update one record if its file changed or disappeared; return True if it did."""
+    file_path = tickets_root / rel_path
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return snapshot.records.pop(rel_path, None) is not None
+    record = snapshot.records.get(rel_path)
+    if record is not None and record[6:] == (st.st_mtime_ns, st.st_size):
+        return False
+    snapshot.records[rel_path] = _record(read_header(file_path, rel_path), st)
+    return True
+
+
+def _record(header: TicketHeader, st: os.stat_result) -> HeaderRecord:
+    flat: tuple[str | int, ...] = tuple(
+        item for key, (value, line) in header.fields.items() for item in (key, value, line)
+    )
+    return (
+        header.path,
+        header.ticket_id,
+        header.title,
+        flat,
+        header.requires,
+        header.blocks,
+        st.st_mtime_ns,
+        st.st_size,
+    )
+
+
+def _git_state(tickets_root: Path) -> tuple[str | None, set[str]]:
+    """Return (tree hash of tickets_root at HEAD, paths differing from HEAD), or (None, {})."""
+    try:
+        tree = run_git(["rev-parse", "--verify", "--quiet", "HEAD:./"], tickets_root).strip()
+        changed = run_git(
+            ["diff", "--name-only", "-z", "--no-renames", "--relative", "HEAD", "--", "."],
+            tickets_root,
+        )
+        untracked = run_git(["ls-files", "-z", "-o", "--exclude-standard", "--", "."], tickets_root)
+    except (GitError, OSError):
+        return None, set()
+    return tree or None, {p for p in f"{changed}\0{untracked}".split("\0") if p}
+
+
+def _tree_key(rel_path: str) -> tuple[str, ...]:
+    """Sort key reproducing iter_ticket_files() order (README.md before siblings)."""
+    return tuple("" if part == "README.md" else part for part in rel_path.split("/"))
@@ -0,0 +1,148 @@
+"""Compiled ticket markdown templates.
+
+Templates are markdown with `{{placeholder}}` slots. Compiling one splits it
+once into a list of literal parts with the slot positions precomputed, so
+rendering is a list copy, one assignment per slot and a single join; no
+parsing or regex work happens per ticket.
+
+Each ticket type has a built-in template (DEFAULT_TEMPLATES). A project can
+override any of them with `.gitstory/templates/<type>.md`. Compiled
+templates are cached by the content hash of their source, so a template is
+compiled once per process however many tickets are rendered, and an edited
+file is picked up on the next load.
+
+Placeholders (TEMPLATE_PLACEHOLDERS):
+    id, title, status, parent: ticket values
+    fields: extra `**Field**: value` lines, each ending with a newline (or "")
+    progress: initial `**Progress**` value of tickets with children
+    body: markdown below the header, preceded by a blank line (or "")
+
+Example:
+    >>> templates = TemplateSet.load(Path(".gitstory/templates"))
+    >>> templates["task"].render({"id": "TASK-0001.2.4.1", "title": "Parse", ...})
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from gitstory.core.writer import content_hash
+
+DEFAULT_TEMPLATE_DIR = ".gitstory/templates"
+TEMPLATE_PLACEHOLDERS = frozenset({"id", "title", "status", "parent", "fields", "progress", "body"})
+
+_HEADER = "# {{id}}: {{title}}\n\n"
+_TAIL = "**Status**: {{status}}\n{{fields}}"
+DEFAULT_TEMPLATES = {
+    "initiative": _HEADER + _TAIL + "**Progress**: {{progress}}\n{{body}}",
+    "epic": _HEADER
+    + "**Parent Initiative**: [{{parent}}](../README.md)\n"
+    + _TAIL
+    + "**Progress**: {{progress}}\n{{body}}",
+    "story": _HEADER
+    + "**Parent Epic**: [{{parent}}](../README.md)\n"
+    + _TAIL
+    + "**Progress**: {{progress}}\n{{body}}",
+    "task": _HEADER + "**Parent Story**: [{{parent}}](README.md)\n" + _TAIL + "{{body}}",
+    "bug": _HEADER + _TAIL + "{{body}}",
+}
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+# Compiled templates by source hash (shared by every TemplateSet in the process)
+_COMPILED: dict[str, "CompiledTemplate"] = {}
+
+
+class TemplateError(ValueError):
+    """Raised for a template with an unknown placeholder, or a render missing a value."""
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """A template split into literal parts and slots.
+
+    Attributes:
+        parts: Literal text, with an empty string at every slot position
+        slots: (position in parts, placeholder name) of every slot
+    """
+
+    parts: tuple[str, ...]
+    slots: tuple[tuple[int, str], ...]
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Fill every slot from values and join the parts.
+
+        Raises:
+            TemplateError: If a placeholder has no value
+        """
+        out = list(self.parts)
+        try:
+            for position, name in self.slots:
+                out[position] = values[name]
+        except KeyError as e:
+            raise TemplateError(f"No value for placeholder {{{{{e.args[0]}}}}}") from e
+        return "".join(out)
+
+
+def compile_template(source: str, name: str = "<template>") -> CompiledTemplate:
+    """Compile template source, reusing an earlier compilation of the same source.
+
+    Args:
+        source: Template text
+        name: Template name for error messages
+
+    Returns:
+        CompiledTemplate
+
+    Raises:
+        TemplateError: If the template uses an unknown placeholder
+    """
+    digest = content_hash(source.encode())
+    compiled = _COMPILED.get(digest)
+    if compiled is not None:
+        return compiled
+    parts: list[str] = []
+    slots = []
+    pos = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(source):
+        placeholder = match.group(1)
+        if placeholder not in TEMPLATE_PLACEHOLDERS:
+            raise TemplateError(f"{name}: unknown placeholder {match.group()}")
+        if match.start() > pos:
+            parts.append(source[pos : match.start()])
+        slots.append((len(parts), placeholder))
+        parts.append("")
+        pos = match.end()
+    if pos < len(source):
+        parts.append(source[pos:])
+    compiled = _COMPILED[digest] = CompiledTemplate(tuple(parts), tuple(slots))
+    return compiled
+
+
+class TemplateSet:
+    """Compiled templates by ticket type (built-in defaults, overridden by files)."""
+
+    def __init__(self, templates: Mapping[str, CompiledTemplate]) -> None:
+        self._templates = dict(templates)
+
+    @classmethod
+    def load(cls, directory: Path | str | None = DEFAULT_TEMPLATE_DIR) -> "TemplateSet":
+        """Compile the templates of every ticket type, preferring `<directory>/<type>.md`.
+
+        Raises:
+            TemplateError: If a template file uses an unknown placeholder
+        """
+        templates = {}
+        for ticket_type, default in DEFAULT_TEMPLATES.items():
+            source = default
+            if directory is not None:
+                path = Path(directory) / f"{ticket_type}.md"
+                try:
+                    source = path.read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    pass
+            templates[ticket_type] = compile_template(source, f"{ticket_type}.md")
+        return cls(templates)
+
+    def __getitem__(self, ticket_type: str) -> CompiledTemplate:
+        return self._templates[ticket_type]
@@ -0,0 +1,230 @@
+"""Ticket file discovery and header parsing.
+
+Ticket metadata lives in the header of each markdown file: the `# ID: Title`
+line followed by `**Field**: value` lines, up to the first `## ` section.
+Below the header, only the `## Dependencies` section is interpreted: the
+ticket IDs listed under `**Requires:**` and `**Blocks:**` become dependency
+edges (see gitstory.core.graph).
+
+Example header:
+    # STORY-0001.1.3: Implement GitStory CLI Foundation with Typer
+
+    **Parent Epic**: [EPIC-0001.1](../README.md)
+    **Status**: ✅ Complete
+    **Story Points**: 5
+
+    ## Dependencies
+
+    **Requires:**
+    - STORY-0001.1.2 complete (scaffold exists)
+"""
+
+import os
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+TITLE_PATTERN = re.compile(r"^#\s+(?P<id>[A-Z]+-[\d.]+)\s*:\s*(?P<title>.*?)\s*$")
+FIELD_PATTERN = re.compile(r"\*\*(?P<key>[^*]+?)\*\*\s*:\s*(?P<value>.*?)\s*(?=\||$)")
+TICKET_REF_PATTERN = re.compile(r"\b(?:INIT|EPIC|STORY|TASK|BUG)-\d{4}(?:\.\d+)*\b")
+# Opening or closing line of a fenced code block in a ticket body
+FENCE_PATTERN = re.compile(r"^\s*(?:```|~~~)")
+
+# `## Dependencies` labels (and equivalent header fields) mapped to edge direction
+DEPENDENCY_SECTION = "## Dependencies"
+DEPENDENCY_LABELS = {
+    "Requires": "requires",
+    "Depends On": "requires",
+    "Blocked By": "requires",
+    "Blocks": "blocks",
+}
+_LABEL_PATTERN = re.compile(r"^\*\*(?P<label>[^*]+?):?\*\*:?\s*(?P<rest>.*)$")
+_BULLET_REF_PATTERN = re.compile(
+    r"^\s*[-*+]\s+(?:\[[ xX]\]\s+)?(?P<id>" + TICKET_REF_PATTERN.pattern + ")"
+)
+
+# Directory and file name patterns for ticket files
+TICKET_DIR_PATTERN = re.compile(r"^(?:INIT|EPIC|STORY)-[\d.]+$")
+TICKET_FILE_PATTERN = re.compile(r"^(?:TASK|BUG)-[\d.]+\.md$")
+
+
+class HeaderField(NamedTuple):
+    """Header field value and the 1-based line it was found on."""
+
+    value: str
+    line: int
+
+
+@dataclass(slots=True)
+class TicketHeader:
+    """Parsed ticket header (lightweight mirror of gitstory.models.Ticket).
+
+    Not frozen, so rebuilding headers from a cache stays cheap; treat
+    instances as immutable and use dataclasses.replace() for changes.
+
+    Attributes:
+        path: File path relative to the tickets root (POSIX separators)
+        ticket_id: ID from the title line, or None if the title is missing
+        title: Title text after the ID
+        fields: Header fields by name (e.g., "Status", "Parent Story")
+        requires: IDs of tickets that must be completed before this one
+        blocks: IDs of tickets waiting on this one
+    """
+
+    path: str
+    ticket_id: str | None
+    title: str = ""
+    fields: dict[str, HeaderField] = field(default_factory=dict)
+    requires: tuple[str, ...] = ()
+    blocks: tuple[str, ...] = ()
+
+    @property
+    def status(self) -> str | None:
+        """Raw `**Status**` value, if present."""
+        status = self.fields.get("Status")
+        return status.value if status else None
+
+    @property
+    def file_ticket_id(self) -> str:
+        """Ticket ID implied by the file location (directory name for README.md)."""
+        return file_ticket_id(self.path)
+
+
+def file_ticket_id(rel_path: str) -> str:
+    """Ticket ID implied by a path relative to the tickets root.
+
+    Example:
+        >>> file_ticket_id("INIT-0001/EPIC-0001.1/README.md")
+        'EPIC-0001.1'
+    """
+    name = rel_path.rsplit("/", 1)[-1]
+    if name == "README.md":
+        return rel_path.rsplit("/", 2)[-2] if "/" in rel_path else ""
+    return name.removesuffix(".md")
+
+
+def parse_header(lines: Iterable[str], path: str) -> TicketHeader:
+    """Parse a ticket header (and its dependencies) from lines of markdown.
+
+    Args:
+        lines: Lines of the ticket file
+        path: File path relative to the tickets root
+
+    Returns:
+        TicketHeader (ticket_id is None if no `# ID: Title` line precedes the first section)
+    """
+    ticket_id: str | None = None
+    title = ""
+    fields: dict[str, HeaderField] = {}
+    edges: dict[str, list[str]] = {"requires": [], "blocks": []}
+    it = iter(enumerate(lines, start=1))
+    for lineno, line in it:
+        if line.startswith("## "):
+            _parse_dependencies(line, it, edges)
+            break
+        if ticket_id is None and line.startswith("# "):
+            match = TITLE_PATTERN.match(line)
+            if match:
+                ticket_id, title = match.group("id"), match.group("title")
+            continue
+        if line.startswith("**"):
+            for match in FIELD_PATTERN.finditer(line):
+                key, value = match.group("key"), match.group("value")
+                fields.setdefault(key, HeaderField(value, lineno))
+                if key in DEPENDENCY_LABELS:
+                    edges[DEPENDENCY_LABELS[key]].extend(TICKET_REF_PATTERN.findall(value))
+    return TicketHeader(
+        path=path,
+        ticket_id=ticket_id,
+        title=title,
+        fields=fields,
+        requires=tuple(dict.fromkeys(edges["requires"])),
+        blocks=tuple(dict.fromkeys(edges["blocks"])),
+    )
+
+
+def _parse_dependencies(
+    heading: str, lines: Iterator[tuple[int, str]], edges: dict[str, list[str]]
+) -> None:
+    """Collect ticket IDs leading the bullets under `**Requires:**` / `**Blocks:**`."""
+    in_section = heading.rstrip() == DEPENDENCY_SECTION
+    target: list[str] | None = None
+    for _, line in lines:
+        if line.startswith("## "):
+            if in_section:
+                return
+            in_section = line.rstrip() == DEPENDENCY_SECTION
+            continue
+        if not in_section:
+            continue
+        if line.startswith("**"):
+            match = _LABEL_PATTERN.match(line.rstrip())
+            label = DEPENDENCY_LABELS.get(match.group("label")) if match else None
+            target = edges[label] if label else None
+            if target is not None and match is not None:
+                target.extend(TICKET_REF_PATTERN.findall(match.group("rest")))
+            continue
+        if target is not None:
+            bullet = _BULLET_REF_PATTERN.match(line)
+            if bullet:
+                target.append(bullet.group("id"))
+
+
+def read_header(file_path: Path, rel_path: str) -> TicketHeader:
+    """Read and parse the header and dependencies of a ticket file.
+
+    Args:
+        file_path: Path to the ticket markdown file
+        rel_path: Path relative to the tickets root, stored on the header
+
+    Returns:
+        Parsed TicketHeader
+    """
+    with open(file_path, encoding="utf-8") as f:
+        return parse_header(f, rel_path)
+
+
+def is_ticket_path(rel_path: str) -> bool:
+    """Return True if a path relative to the tickets root names a ticket file.
+
+    Matches exactly the files iter_ticket_files() yields: README.md inside a
+    ticket directory, or a TASK-/BUG- file, below ticket directories only.
+    """
+    *dirs, name = rel_path.split("/")
+    if not all(TICKET_DIR_PATTERN.match(d) for d in dirs):
+        return False
+    return bool(TICKET_FILE_PATTERN.match(name)) or (name == "README.md" and bool(dirs))
+
+
+def iter_ticket_files(root: Path) -> Iterator[str]:
+    """Yield ticket file paths relative to root, parents before children.
+
+    Ticket files are README.md inside INIT-/EPIC-/STORY- directories, and
+    TASK-*.md / BUG-*.md files. Other markdown (e.g., CLAUDE.md) is skipped.
+
+    Args:
+        root: Tickets root directory (e.g., docs/tickets)
+
+    Yields:
+        POSIX paths relative to root
+    """
+    yield from _walk(str(root), "")
+
+
+def _walk(directory: str, prefix: str) -> Iterator[str]:
+    """Recursively yield ticket files below directory using os.scandir."""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if TICKET_DIR_PATTERN.match(entry.name):
+                rel_dir = f"{prefix}{entry.name}"
+                if os.path.isfile(os.path.join(entry.path, "README.md")):
+                    yield f"{rel_dir}/README.md"
+                yield from _walk(entry.path, f"{rel_dir}/")
+        elif TICKET_FILE_PATTERN.match(entry.name):
+            yield f"{prefix}{entry.name}"
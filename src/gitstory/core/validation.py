@@ -0,0 +1,210 @@
+"""Full and incremental validation of the workflow file and ticket tree.
+
+Every run records results in a ValidationManifest. In changed-only mode, a
+file is revalidated when its content hash differs from the manifest (or it
+is listed in `changed_paths`, e.g. from `git diff --name-only <base>`).
+Because cross-file rules depend on neighbours, the parents/ancestors,
+children and duplicate-ID siblings of changed or deleted tickets are
+rechecked too, and a changed workflow file rechecks every ticket (ticket
+statuses are validated against its states). Dependency graph rules (cycles,
+unknown or unresolved blockers) and link checks (broken links, links and
+mentions naming the wrong or unknown tickets) are cheap and global, so they
+run on every pass rather than being cached; links are extracted in the same
+read as the header and kept in the manifest.
+"""
+
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+from gitstory.core.graph import TicketGraph
+from gitstory.core.index import TicketIndex
+from gitstory.core.links import check_references, extract_references
+from gitstory.core.manifest import ManifestEntry, ValidationManifest
+from gitstory.core.tickets import TicketHeader, iter_ticket_files, parse_header
+from gitstory.core.workflow import DEFAULT_WORKFLOW, Workflow
+from gitstory.core.writer import content_hash
+from gitstory.validators.result import ValidationResult
+from gitstory.validators.ticket_validator import (
+    check_dependency_graph,
+    check_ticket_file,
+    check_ticket_relations,
+)
+from gitstory.validators.workflow_validator import validate_workflow
+
+
+@dataclass
+class TreeValidation:
+    """Outcome of a tree validation run.
+
+    Attributes:
+        result: Errors and warnings for the whole tree (cached + revalidated)
+        total: Number of ticket files in the tree
+        revalidated: Ticket paths whose rules were re-run in this pass
+        workflow_revalidated: True if the workflow file was re-checked
+    """
+
+    result: ValidationResult
+    total: int
+    revalidated: list[str] = field(default_factory=list)
+    workflow_revalidated: bool = False
+
+
+def validate_tree(
+    tickets_root: Path,
+    workflow_path: Path,
+    manifest: ValidationManifest,
+    changed_only: bool = False,
+    changed_paths: Iterable[str] | None = None,
+    paths: Iterable[str] | None = None,
+    advance: Callable[[int], None] | None = None,
+    trust_manifest: bool = False,
+) -> TreeValidation:
+    """Validate the workflow file and every ticket under tickets_root.
+
+    Args:
+        tickets_root: Tickets root directory
+        workflow_path: Path to workflow.yaml (default workflow is used if missing)
+        manifest: Manifest with previous results; updated in place
+        changed_only: Only revalidate files that changed since the manifest was written
+        changed_paths: Paths (relative to tickets_root, or equal to workflow_path) to
+            treat as changed regardless of hash, e.g. from `git diff --name-only`
+        paths: Ticket files relative to tickets_root (default: iter_ticket_files)
+        advance: Progress callback, called with the number of files scanned
+        trust_manifest: With changed_only, reuse manifest entries for files not in
+            changed_paths without stat'ing them (for callers, such as file
+            watchers, that know every changed path)
+
+    Returns:
+        TreeValidation with issues for the whole tree
+    """
+    forced = set(changed_paths or ())
+    report = TreeValidation(result=ValidationResult(), total=0)
+
+    workflow, workflow_changed = _check_workflow(
+        workflow_path, manifest, changed_only, str(workflow_path) in forced
+    )
+    report.workflow_revalidated = workflow_changed
+    if manifest.workflow is not None:
+        report.result.extend(manifest.workflow.issues)
+
+    # 1. Find dirty files: stat signature first, then content hash
+    previous = manifest.files
+    current: dict[str, ManifestEntry] = {}
+    dirty: dict[str, TicketHeader] = {}
+    for rel_path in paths if paths is not None else iter_ticket_files(tickets_root):
+        if advance is not None:
+            advance(1)
+        file_path = tickets_root / rel_path
+        entry = previous.get(rel_path)
+        if (
+            changed_only
+            and not workflow_changed
+            and entry is not None
+            and rel_path not in forced
+            and entry.header is not None
+        ):
+            if trust_manifest:
+                current[rel_path] = entry
+                continue
+            st = os.stat(file_path)
+            if (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
+                current[rel_path] = entry
+                continue
+            data = file_path.read_bytes()
+            digest = content_hash(data)
+            if digest == entry.hash:
+                entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+                current[rel_path] = entry
+                continue
+        else:
+            st = os.stat(file_path)
+            data = file_path.read_bytes()
+            digest = content_hash(data)
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        header = parse_header(lines, rel_path)
+        current[rel_path] = ManifestEntry(
+            digest, st.st_mtime_ns, st.st_size, header, references=extract_references(lines)
+        )
+        dirty[rel_path] = header
+    report.total = len(current)
+
+    deleted = [previous[p].header for p in previous.keys() - current.keys()]
+    index = TicketIndex(entry.header for entry in current.values() if entry.header is not None)
+
+    # 2. Expand to tickets whose cross-file rules depend on dirty/deleted tickets
+    affected = set(dirty)
+    touched_ids = {h.ticket_id for h in (*dirty.values(), *deleted) if h and h.ticket_id}
+    for rel_path in dirty:
+        old = previous.get(rel_path)
+        if old is not None and old.header is not None and old.header.ticket_id:
+            touched_ids.add(old.header.ticket_id)
+    for ticket_id in touched_ids:
+        affected.update(_dependent_paths(index, ticket_id))
+
+    # 3. Re-run rules for affected tickets, reuse cached issues for the rest
+    for rel_path in sorted(affected):
+        entry = current[rel_path]
+        ticket = entry.header
+        assert ticket is not None
+        entry.issues = check_ticket_file(ticket, workflow) + check_ticket_relations(
+            ticket, index, workflow
+        )
+    for entry in current.values():
+        report.result.extend(entry.issues)
+    report.result.extend(check_dependency_graph(TicketGraph.from_index(index), index, workflow))
+    report.result.extend(
+        check_references({p: e.references for p, e in current.items()}, index, tickets_root)
+    )
+
+    report.revalidated = sorted(affected)
+    manifest.files = current
+    return report
+
+
+def _check_workflow(
+    workflow_path: Path, manifest: ValidationManifest, changed_only: bool, forced: bool
+) -> tuple[Workflow, bool]:
+    """Validate the workflow file if changed and return (workflow, changed)."""
+    try:
+        data = workflow_path.read_bytes()
+    except FileNotFoundError:
+        changed = manifest.workflow is not None or not changed_only
+        manifest.workflow = None
+        return Workflow.from_dict(DEFAULT_WORKFLOW), changed
+
+    st = os.stat(workflow_path)
+    digest = content_hash(data)
+    cached = manifest.workflow
+    changed = not changed_only or forced or cached is None or cached.hash != digest
+    content = data.decode("utf-8", errors="replace")
+    if changed:
+        result = validate_workflow(content, path=str(workflow_path))
+        manifest.workflow = ManifestEntry(
+            digest, st.st_mtime_ns, st.st_size, issues=result.errors + result.warnings
+        )
+    # Ticket statuses are checked against the default states if the file is unusable
+    try:
+        workflow = Workflow.from_dict(yaml.safe_load(content))
+    except (yaml.YAMLError, ValueError):
+        workflow = Workflow.from_dict(DEFAULT_WORKFLOW)
+    if not workflow.states:
+        workflow = Workflow.from_dict(DEFAULT_WORKFLOW)
+    return workflow, changed
+
+
+def _dependent_paths(index: TicketIndex, ticket_id: str) -> set[str]:
+    """Paths of tickets whose cross-file rules read ticket_id's header."""
+    paths: set[str] = set()
+    for related in (*index.ancestor_ids(ticket_id), *index.children.get(ticket_id, ())):
+        header = index.get(related)
+        if header is not None:
+            paths.add(header.path)
+    paths.update(index.duplicates.get(ticket_id, ()))
+    header = index.get(ticket_id)
+    if header is not None:
+        paths.add(header.path)
+    return paths
@@ -0,0 +1,321 @@
+"""File watching for `gitstory validate --watch`.
+
+On Linux, InotifyWatcher asks the kernel for change events (via ctypes, no
+extra dependency) and blocks in select() while idle, so an idle watch costs
+no CPU regardless of tree size. Elsewhere, or when inotify is unavailable
+(e.g., watch limit reached, network filesystems), PollingWatcher compares
+stat signatures and backs off exponentially while nothing changes.
+
+Only ticket files (see gitstory.core.tickets) and explicitly listed files
+such as workflow.yaml are reported; editor swap files and the validation
+cache are ignored.
+"""
+
+import abc
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+
+from gitstory.core.tickets import TICKET_DIR_PATTERN, TICKET_FILE_PATTERN, iter_ticket_files
+
+# Quiet period that ends a burst of writes, and the longest a burst may delay a batch
+WATCH_DEBOUNCE = 0.2
+WATCH_MAX_DELAY = 2.0
+
+# Stat polling interval, doubled while idle up to the maximum
+POLL_INTERVAL = 0.5
+POLL_MAX_INTERVAL = 4.0
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (followed by len bytes of name)
+_READ_SIZE = 64 * 1024
+
+
+class FileWatcher(abc.ABC):
+    """Reports changed ticket files below root and changes to extra files.
+
+    Args:
+        root: Tickets root directory (watched recursively)
+        files: Additional files to watch (e.g., workflow.yaml)
+    """
+
+    def __init__(self, root: Path, files: Iterable[Path] = ()) -> None:
+        self.root = Path(root)
+        self.files = [Path(f) for f in files]
+
+    @abc.abstractmethod
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """Block until something changes or timeout seconds pass.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Changed paths (empty if the timeout expired)
+        """
+
+    def close(self) -> None:
+        """Release watcher resources."""
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class InotifyWatcher(FileWatcher):
+    """Linux inotify watcher with one watch per ticket directory.
+
+    Raises:
+        OSError: If inotify is unavailable or a watch cannot be added
+    """
+
+    def __init__(self, root: Path, files: Iterable[Path] = ()) -> None:
+        super().__init__(root, files)
+        self._libc = _load_libc()
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        # wd -> (directory, names to report or None for ticket files)
+        self._watches: dict[int, tuple[str, frozenset[str] | None]] = {}
+        try:
+            self._add_tree(str(self.root))
+            by_dir: dict[str, set[str]] = {}
+            for file in self.files:
+                by_dir.setdefault(str(file.parent), set()).add(file.name)
+            for directory, names in by_dir.items():
+                self._add_watch(directory, frozenset(names))
+        except OSError:
+            self.close()
+            raise
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """Block in select() until inotify events arrive (see FileWatcher.wait)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        return self._read_events() if ready else set()
+
+    def close(self) -> None:
+        """Close the inotify file descriptor (removes all watches)."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _add_watch(self, directory: str, names: frozenset[str] | None) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK | IN_ONLYDIR)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch failed: {os.strerror(err)}", directory)
+        self._watches[wd] = (directory, names)
+
+    def _add_tree(self, directory: str) -> None:
+        self._add_watch(directory, None)
+        try:
+            entries = list(os.scandir(directory))
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and TICKET_DIR_PATTERN.match(entry.name):
+                self._add_tree(entry.path)
+
+    def _read_events(self) -> set[str]:
+        changed: set[str] = set()
+        while True:
+            try:
+                buf = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(buf[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped: report the root so callers rescan everything
+                    changed.add(str(self.root))
+                    continue
+                watch = self._watches.get(wd)
+                if watch is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self._watches[wd]
+                    continue
+                directory, names = watch
+                path = os.path.join(directory, name)
+                if names is not None:
+                    if name in names:
+                        changed.add(path)
+                elif mask & IN_ISDIR:
+                    if TICKET_DIR_PATTERN.match(name):
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            changed.update(self._add_new_tree(path))
+                        changed.add(path)
+                elif name == "README.md" or TICKET_FILE_PATTERN.match(name):
+                    changed.add(path)
+
+    def _add_new_tree(self, directory: str) -> list[str]:
+        """Watch a directory created or moved in, returning ticket files already inside.
+
+        Files written before the watch was added produce no events of their own.
+        """
+        try:
+            self._add_tree(directory)
+        except OSError:
+            # Removed again before we could watch it; the deletion event follows
+            return []
+        found = [os.path.join(directory, rel) for rel in iter_ticket_files(Path(directory))]
+        readme = os.path.join(directory, "README.md")
+        if os.path.isfile(readme):
+            found.append(readme)
+        return found
+
+
+class PollingWatcher(FileWatcher):
+    """Portable watcher comparing (mtime_ns, size) of every watched file.
+
+    The interval doubles after each idle poll (up to max_interval) and resets
+    when a change is seen, keeping idle cost low on large trees.
+
+    Args:
+        root: Tickets root directory
+        files: Additional files to watch
+        interval: Seconds between polls after a change
+        max_interval: Upper bound for the idle backoff
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        files: Iterable[Path] = (),
+        interval: float = POLL_INTERVAL,
+        max_interval: float = POLL_MAX_INTERVAL,
+    ) -> None:
+        super().__init__(root, files)
+        self._min_interval = interval
+        self._max_interval = max_interval
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """Poll until a stat signature changes (see FileWatcher.wait)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self._interval
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+                if delay <= 0:
+                    return set()
+            time.sleep(delay)
+            current = self._scan()
+            changed = {
+                path
+                for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            if changed:
+                self._interval = self._min_interval
+                return changed
+            self._interval = min(self._interval * 2, self._max_interval)
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        root = str(self.root)
+        paths = [os.path.join(root, rel) for rel in iter_ticket_files(self.root)]
+        paths.extend(str(f) for f in self.files)
+        stats: dict[str, tuple[int, int]] = {}
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+
+def open_watcher(root: Path, files: Iterable[Path] = (), polling: bool = False) -> FileWatcher:
+    """Create the most efficient watcher available.
+
+    Args:
+        root: Tickets root directory
+        files: Additional files to watch (e.g., workflow.yaml)
+        polling: Force stat polling (e.g., for network filesystems)
+
+    Returns:
+        InotifyWatcher on Linux if inotify works, otherwise PollingWatcher
+    """
+    files = list(files)
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, files)
+        except OSError:
+            pass
+    return PollingWatcher(root, files)
+
+
+def watch_changes(
+    watcher: FileWatcher,
+    debounce: float = WATCH_DEBOUNCE,
+    max_delay: float = WATCH_MAX_DELAY,
+) -> Iterator[set[str]]:
+    """Yield batches of changed paths, coalescing bursts of writes.
+
+    A batch is yielded once no new change arrives for `debounce` seconds, or
+    `max_delay` seconds after its first change if writes keep coming.
+
+    Args:
+        watcher: Watcher to read changes from
+        debounce: Quiet period that ends a batch
+        max_delay: Maximum time a batch is held back
+
+    Yields:
+        Sets of changed paths
+    """
+    while True:
+        changed = watcher.wait(None)
+        if not changed:
+            continue
+        flush_at = time.monotonic() + max_delay
+        while (remaining := flush_at - time.monotonic()) > 0:
+            more = watcher.wait(min(debounce, remaining))
+            if not more:
+                break
+            changed |= more
+        yield changed
+
+
+def _load_libc() -> ctypes.CDLL:
+    """Load libc with errno support, raising OSError if inotify is missing."""
+    name = ctypes.util.find_library("c") or "libc.so.6"
+    libc = ctypes.CDLL(name, use_errno=True)
+    try:
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except AttributeError as e:
+        raise OSError("inotify is not available") from e
+    return libc
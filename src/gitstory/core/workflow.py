@@ -0,0 +1,161 @@
+"""Workflow state machine loading and ticket status mapping.
+
+Loads `.gitstory/workflow.yaml` (validated by gitstory.models.workflow) into
+lightweight slots-based State/Transition records and
+maps the `**Status**` text found in ticket headers (e.g., "🟡 In Progress")
+to workflow states. When no workflow file exists, the default 4-state
+workflow (not_started, in_progress, blocked, done) is used. The schema (and
+pydantic) is only imported once a workflow is loaded.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+if TYPE_CHECKING:
+    from gitstory.models.workflow import PluginSpecModel
+
+DEFAULT_WORKFLOW_PATH = ".gitstory/workflow.yaml"
+
+# Default simple workflow (STORY-0001.2.2), used when no workflow.yaml exists
+DEFAULT_WORKFLOW: dict[str, Any] = {
+    "metadata": {"config_version": "1.0", "name": "simple", "plugin_security": "warn"},
+    "workflow": {
+        "states": {
+            "not_started": {"name": "Not Started", "emoji": "🔵", "type": "start"},
+            "in_progress": {"name": "In Progress", "emoji": "🟡", "type": "active"},
+            "blocked": {"name": "Blocked", "emoji": "🔴", "type": "blocked"},
+            "done": {"name": "Done", "emoji": "🟢", "type": "end"},
+        },
+        "transitions": [
+            {"id": "start_work", "from": "not_started", "to": "in_progress"},
+            {
+                "id": "complete_work",
+                "from": "in_progress",
+                "to": "done",
+                "guards": ["all_children_done", "acceptance_criteria_met"],
+            },
+            {"id": "encounter_blocker", "from": "in_progress", "to": "blocked"},
+            {"id": "resolve_blocker", "from": "blocked", "to": "in_progress"},
+            {"id": "reopen_ticket", "from": "done", "to": "in_progress"},
+            {"id": "cancel", "from": "*", "to": "done"},
+        ],
+    },
+}
+
+# Status words used in existing tickets that map onto a state type rather than a name
+STATUS_TYPE_ALIASES = {"complete": "end", "completed": "end", "✅": "end"}
+
+# Leading emoji/symbols, then the status name: "🟡 In Progress" -> ("🟡", "In Progress")
+_STATUS_PATTERN = re.compile(r"^([^\w\s]*)\s*(.*)$")
+
+
+@dataclass(frozen=True, slots=True)
+class State:
+    """Workflow state (FSM node)."""
+
+    id: str
+    name: str
+    emoji: str = ""
+    type: str = "active"
+
+
+@dataclass(frozen=True, slots=True)
+class Transition:
+    """Workflow transition (FSM edge)."""
+
+    id: str
+    from_state: str
+    to_state: str
+    on: str = "user_command"
+    guards: "tuple[PluginSpecModel, ...]" = ()
+    actions: "tuple[PluginSpecModel, ...]" = ()
+
+
+@dataclass
+class Workflow:
+    """Loaded workflow state machine."""
+
+    states: dict[str, State]
+    transitions: list[Transition] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._by_status: dict[str, State] = {}
+        for state in self.states.values():
+            self._by_status[state.name.casefold()] = state
+            if state.emoji:
+                self._by_status.setdefault(state.emoji, state)
+        for alias, state_type in STATUS_TYPE_ALIASES.items():
+            match = next((s for s in self.states.values() if s.type == state_type), None)
+            if match is not None:
+                self._by_status.setdefault(alias, match)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Workflow":
+        """Build a workflow from parsed workflow.yaml data.
+
+        Raises:
+            pydantic.ValidationError: If data does not match the workflow schema
+        """
+        from gitstory.models.workflow import WORKFLOW_ADAPTER
+
+        section = WORKFLOW_ADAPTER.validate_python(data or {}).workflow
+        states = {
+            state_id: State(
+                id=state_id, name=spec.name or state_id, emoji=spec.emoji, type=spec.type
+            )
+            for state_id, spec in section.states.items()
+        }
+        transitions = [
+            Transition(
+                id=spec.id,
+                from_state=spec.from_state,
+                to_state=spec.to_state,
+                on=spec.on,
+                guards=spec.guards,
+                actions=spec.actions,
+            )
+            for spec in section.transitions
+        ]
+        return cls(states=states, transitions=transitions)
+
+    def state_for_status(self, status: str) -> State | None:
+        """Map ticket status text (e.g., "🟡 In Progress", "✅ Complete") to a state.
+
+        Matches the state name (case-insensitive) after stripping leading
+        emoji/punctuation, then falls back to the leading emoji.
+        """
+        match = _STATUS_PATTERN.match(status.strip())
+        if match is None:
+            return None
+        emoji, name = match.groups()
+        return self._by_status.get(name.casefold()) or self._by_status.get(emoji)
+
+    def status_text(self, state_id: str) -> str:
+        """Render a state as ticket status text (e.g., "🟡 In Progress")."""
+        state = self.states[state_id]
+        return f"{state.emoji} {state.name}".strip()
+
+
+def load_workflow(path: Path | str = DEFAULT_WORKFLOW_PATH) -> Workflow:
+    """Load workflow.yaml, falling back to the default workflow if it doesn't exist.
+
+    Args:
+        path: Path to workflow.yaml
+
+    Returns:
+        Loaded Workflow
+
+    Raises:
+        yaml.YAMLError: If the file exists but is not valid YAML
+        pydantic.ValidationError: If the file does not match the workflow schema
+    """
+    try:
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        data = DEFAULT_WORKFLOW
+    return Workflow.from_dict(data)
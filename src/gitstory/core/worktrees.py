@@ -0,0 +1,448 @@
+"""Parallel ticket execution in a pool of git worktrees.
+
+Each ticket runs on its own branch (BRANCH_PREFIX + ticket ID) checked out
+in a worktree below `.gitstory/cache/worktrees/`, so several tickets can be
+worked and transitioned at once without sharing a checkout. Worktrees are
+expensive to create (a full checkout) and cheap to switch, so they are
+kept in a pool of at most `size` slots and reused:
+
+- a ticket whose branch is already checked out in a slot reuses that slot;
+- otherwise a new slot is created while the pool has room;
+- otherwise the least recently used slot without uncommitted changes is
+  switched to the ticket's branch (recycled).
+
+Slots beyond the pool size are removed least recently used first. The pool
+is recorded in `pool.json` next to the worktrees, and each slot reports its
+status (clean, dirty, missing) for the JSON output.
+
+Jobs run on a process pool, one process per worktree: an optional command
+(e.g., an agent or the test suite) and then the ticket's transition, which
+is committed to the ticket's branch. The last STDERR_TAIL_BYTES of the
+command's stderr are kept in the result. The pool itself is managed by the
+calling process only: a slot is assigned to the next ticket as soon as the
+job holding it finishes, so one slow ticket never holds up the others.
+
+Example:
+    >>> pool = WorktreePool.load(Path("."), size=4)
+    >>> results = run_in_worktrees(pool, requests, "docs/tickets", ".gitstory/workflow.yaml")
+    >>> pool.save()
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+from collections.abc import Collection, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from gitstory.core.execute import ExecutionRequest, apply_with_retry, plan_execution
+from gitstory.core.git import GitError, commit_paths, run_git
+from gitstory.core.snapshot import DEFAULT_SNAPSHOT_PATH, load_index
+from gitstory.core.workflow import load_workflow
+from gitstory.core.writer import atomic_write
+
+DEFAULT_WORKTREE_DIR = ".gitstory/cache/worktrees"
+POOL_STATE_FILE = "pool.json"
+POOL_VERSION = 1
+# Worktrees kept (and tickets run at once) unless told otherwise
+WORKTREE_POOL_SIZE = 4
+BRANCH_PREFIX = "gitstory/"
+# End of a --run command's stderr kept in its result
+STDERR_TAIL_BYTES = 4096
+
+
+class WorktreeError(RuntimeError):
+    """Raised when no worktree can be assigned (e.g., every slot has uncommitted changes)."""
+
+
+@dataclass
+class WorktreeSlot:
+    """One pooled worktree.
+
+    Attributes:
+        name: Directory name below the pool directory (e.g., "wt-1")
+        branch: Checked-out branch
+        ticket_id: Ticket the branch belongs to
+        last_used: When a job was last assigned (Unix time; drives LRU recycling)
+        status: "clean", "dirty" (uncommitted changes) or "missing", as last checked
+    """
+
+    name: str
+    branch: str
+    ticket_id: str
+    last_used: float
+    status: str = "clean"
+
+    def to_dict(self, directory: Path) -> dict[str, Any]:
+        """Serialize for JSON output (with the worktree path)."""
+        return {**asdict(self), "path": (directory / self.name).as_posix()}
+
+
+@dataclass(frozen=True)
+class WorktreeJob:
+    """Work for one ticket in one worktree (picklable, runs in a worker process).
+
+    Attributes:
+        request: Transition to take
+        worktree: Worktree directory
+        branch: Ticket branch checked out there
+        tickets_path: Tickets root relative to the worktree
+        workflow_path: Workflow file relative to the worktree
+        command: Shell command to run first (the transition is skipped if it fails)
+        commit: Commit the transition to the branch
+    """
+
+    request: ExecutionRequest
+    worktree: str
+    branch: str
+    tickets_path: str
+    workflow_path: str
+    command: str | None = None
+    commit: bool = True
+
+
+@dataclass
+class WorktreeResult:
+    """Outcome of one job.
+
+    Attributes:
+        ticket_id: Ticket the job ran for
+        worktree: Worktree directory
+        branch: Ticket branch
+        status: "done", "unchanged" (no file needed a change) or "failed"
+        seconds: Wall time of the job
+        returncode: Exit code of the command, if one was run
+        stderr: Last STDERR_TAIL_BYTES of the command's stderr
+        commit: Commit of the transition, if any
+        changes: Transitions taken, as in ExecutionPlan.to_dict()
+        errors: Why the job failed
+    """
+
+    ticket_id: str
+    worktree: str
+    branch: str
+    status: str = "failed"
+    seconds: float = 0.0
+    returncode: int | None = None
+    stderr: str = ""
+    commit: str | None = None
+    changes: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return asdict(self)
+
+
+class WorktreePool:
+    """Worktree slots of a repository, recycled least recently used first.
+
+    Args:
+        repo: Any directory of the main checkout
+        directory: Pool directory (worktrees and pool.json)
+        size: Maximum number of worktrees kept
+        slots: Known slots (see load())
+    """
+
+    def __init__(
+        self, repo: Path, directory: Path, size: int, slots: Sequence[WorktreeSlot] = ()
+    ) -> None:
+        self.repo = repo
+        self.directory = directory
+        self.size = size
+        self.slots = {slot.name: slot for slot in slots}
+
+    @classmethod
+    def load(
+        cls, repo: Path, directory: Path | None = None, size: int = WORKTREE_POOL_SIZE
+    ) -> "WorktreePool":
+        """Load the pool of repo, dropping slots whose worktree no longer exists.
+
+        Raises:
+            GitError: If repo is not inside a git repository
+        """
+        top = Path(run_git(["rev-parse", "--show-toplevel"], repo).strip())
+        directory = (directory or top / DEFAULT_WORKTREE_DIR).resolve()
+        slots = []
+        try:
+            data = json.loads((directory / POOL_STATE_FILE).read_text(encoding="utf-8"))
+            if data.get("version") == POOL_VERSION:
+                slots = [WorktreeSlot(**slot) for slot in data["slots"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        pool = cls(top, directory, size, slots)
+        for slot in list(pool.slots.values()):
+            if not (directory / slot.name).is_dir():
+                del pool.slots[slot.name]
+        run_git(["worktree", "prune"], top)
+        return pool
+
+    def path(self, slot: WorktreeSlot) -> Path:
+        """Worktree directory of slot."""
+        return self.directory / slot.name
+
+    def acquire(self, ticket_id: str, base: str, busy: Collection[str] = ()) -> WorktreeSlot:
+        """Check out the branch of ticket_id in a slot (reused, new or recycled).
+
+        Args:
+            ticket_id: Ticket to work on
+            base: Commit new ticket branches start from
+            busy: Names of slots already assigned to other running jobs
+
+        Returns:
+            The slot, marked as just used
+
+        Raises:
+            WorktreeError: If every free slot has uncommitted changes
+            GitError: If git cannot create or switch the worktree
+        """
+        branch = BRANCH_PREFIX + ticket_id
+        slot = next((s for s in self.slots.values() if s.branch == branch), None)
+        if slot is None and len(self.slots) < self.size:
+            slot = self._create(ticket_id, branch, base)
+        elif slot is None:
+            slot = self._recycle(ticket_id, branch, base, busy)
+        slot.last_used = time.time()
+        return slot
+
+    def refresh(self) -> None:
+        """Update the status of every slot (clean, dirty or missing)."""
+        for slot in self.slots.values():
+            slot.status = self._status(slot)
+
+    def prune(self) -> list[str]:
+        """Remove least recently used worktrees beyond the pool size (their branches stay).
+
+        Dirty worktrees are kept, so no uncommitted work is lost.
+
+        Returns:
+            Names of removed slots
+        """
+        removed = []
+        excess = len(self.slots) - self.size
+        for slot in sorted(self.slots.values(), key=lambda s: s.last_used):
+            if excess <= 0:
+                break
+            if self._status(slot) == "dirty":
+                continue
+            run_git(["worktree", "remove", "--force", str(self.path(slot))], self.repo)
+            del self.slots[slot.name]
+            removed.append(slot.name)
+            excess -= 1
+        return removed
+
+    def save(self) -> None:
+        """Write pool.json atomically."""
+        data = {"version": POOL_VERSION, "slots": [asdict(s) for s in self.slots.values()]}
+        atomic_write(self.directory / POOL_STATE_FILE, json.dumps(data, indent=2).encode())
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        """Every slot, most recently used first."""
+        slots = sorted(self.slots.values(), key=lambda s: s.last_used, reverse=True)
+        return [slot.to_dict(self.directory) for slot in slots]
+
+    def _create(self, ticket_id: str, branch: str, base: str) -> WorktreeSlot:
+        """Add a worktree for branch in the first free slot name."""
+        number = 1
+        while f"wt-{number}" in self.slots or (self.directory / f"wt-{number}").exists():
+            number += 1
+        slot = WorktreeSlot(f"wt-{number}", branch, ticket_id, time.time())
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if _branch_exists(branch, self.repo):
+            run_git(["worktree", "add", "--quiet", str(self.path(slot)), branch], self.repo)
+        else:
+            run_git(
+                ["worktree", "add", "--quiet", "-b", branch, str(self.path(slot)), base], self.repo
+            )
+        self.slots[slot.name] = slot
+        return slot
+
+    def _recycle(
+        self, ticket_id: str, branch: str, base: str, busy: Collection[str]
+    ) -> WorktreeSlot:
+        """Switch the least recently used clean, idle slot to branch."""
+        for slot in sorted(self.slots.values(), key=lambda s: s.last_used):
+            if slot.name in busy or self._status(slot) != "clean":
+                continue
+            cwd = self.path(slot)
+            if _branch_exists(branch, self.repo):
+                run_git(["switch", "--quiet", branch], cwd)
+            else:
+                run_git(["switch", "--quiet", "-c", branch, base], cwd)
+            slot.branch, slot.ticket_id = branch, ticket_id
+            return slot
+        raise WorktreeError(
+            f"No worktree free for {ticket_id}: all {len(self.slots)} are busy or have "
+            "uncommitted changes (commit them or raise the pool size)"
+        )
+
+    def _status(self, slot: WorktreeSlot) -> str:
+        """Status of a slot's worktree (untracked files do not count as changes)."""
+        path = self.path(slot)
+        if not path.is_dir():
+            return "missing"
+        try:
+            changes = run_git(["status", "--porcelain", "--untracked-files=no"], path)
+        except GitError:
+            return "missing"
+        return "dirty" if changes.strip() else "clean"
+
+
+def run_in_worktrees(
+    pool: WorktreePool,
+    requests: Sequence[ExecutionRequest],
+    tickets_path: str,
+    workflow_path: str,
+    command: str | None = None,
+    base: str = "HEAD",
+    commit: bool = True,
+) -> list[WorktreeResult]:
+    """Run one job per request, up to pool.size at once, each in its ticket's worktree.
+
+    Requests are started in order on a process pool; whenever a job
+    finishes, its slot goes to the next request.
+
+    Args:
+        pool: Worktree pool (saved by the caller)
+        requests: One request per ticket (globs already expanded)
+        tickets_path: Tickets root relative to the repository top
+        workflow_path: Workflow file relative to the repository top
+        command: Shell command run in each worktree before its transition
+        base: Commit new ticket branches start from
+        commit: Commit each transition to its branch
+
+    Returns:
+        One result per request, in request order
+    """
+    base = run_git(["rev-parse", "--verify", f"{base}^{{commit}}"], pool.repo).strip()
+    results: list[WorktreeResult | None] = [None] * len(requests)
+    # Running jobs: their request position and slot name
+    running: dict[Future[WorktreeResult], tuple[int, str]] = {}
+
+    def collect(done: set[Future[WorktreeResult]]) -> None:
+        for future in done:
+            position, _ = running.pop(future)
+            results[position] = future.result()
+
+    with _executor(min(pool.size, len(requests))) as executor:
+        for position, request in enumerate(requests):
+            if len(running) >= pool.size:
+                collect(wait(running, return_when=FIRST_COMPLETED).done)
+            busy = {name for _, name in running.values()}
+            try:
+                slot = pool.acquire(request.ticket_id, base, busy)
+            except (WorktreeError, GitError) as e:
+                branch = BRANCH_PREFIX + request.ticket_id
+                results[position] = WorktreeResult(request.ticket_id, "", branch, errors=[str(e)])
+                continue
+            job = WorktreeJob(
+                request,
+                str(pool.path(slot)),
+                slot.branch,
+                tickets_path,
+                workflow_path,
+                command,
+                commit,
+            )
+            running[executor.submit(run_job, job)] = (position, slot.name)
+        collect(wait(running).done)
+    return [result for result in results if result is not None]
+
+
+def run_job(job: WorktreeJob) -> WorktreeResult:
+    """Run a job's command and transition in its worktree (worker process entry point)."""
+    started = time.monotonic()
+    result = WorktreeResult(job.request.ticket_id, job.worktree, job.branch)
+    worktree = Path(job.worktree)
+    written: list[Path] = []
+    try:
+        if job.command is not None:
+            env = {
+                **os.environ,
+                "GITSTORY_TICKET_ID": job.request.ticket_id,
+                "GITSTORY_WORKTREE": job.worktree,
+            }
+            with tempfile.TemporaryFile() as stderr:
+                completed = subprocess.run(
+                    job.command,
+                    shell=True,
+                    cwd=worktree,
+                    env=env,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr,
+                    check=False,
+                )
+                result.stderr = _tail(stderr, STDERR_TAIL_BYTES)
+            result.returncode = completed.returncode
+            if completed.returncode != 0:
+                last = result.stderr.strip().rpartition("\n")[2]
+                message = f"Command exited with {completed.returncode}"
+                result.errors.append(f"{message}: {last}" if last else message)
+                return result
+        tickets_root = worktree / job.tickets_path
+        workflow = load_workflow(worktree / job.workflow_path)
+        plan = plan_execution(
+            [job.request],
+            load_index(tickets_root, worktree / DEFAULT_SNAPSHOT_PATH),
+            tickets_root,
+            workflow,
+        )
+        if plan.ok:
+            plan, written = apply_with_retry(
+                [job.request],
+                plan,
+                tickets_root,
+                workflow,
+                lambda: load_index(tickets_root, worktree / DEFAULT_SNAPSHOT_PATH),
+            )
+        if not plan.ok:
+            result.errors += [e["message"] for e in plan.errors]
+            result.errors += [f"Guard {g.guard} failed" for g in plan.failed_guards]
+            return result
+        result.changes = [c.to_dict() for c in plan.changes]
+        if written and job.commit:
+            message = f"chore(tickets): update {job.request.ticket_id}\n"
+            result.commit = commit_paths(written, message, worktree)
+        result.status = "done" if written else "unchanged"
+    except (GitError, OSError, ValueError) as e:
+        result.errors.append(str(e))
+    finally:
+        result.seconds = round(time.monotonic() - started, 3)
+    return result
+
+
+def _executor(workers: int) -> Executor:
+    """Process pool for jobs (a thread for a single job, or where processes are unavailable)."""
+    if workers > 1:
+        try:
+            return ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError):
+            pass
+    return ThreadPoolExecutor(max_workers=max(workers, 1))
+
+
+def _tail(f: IO[bytes], size: int) -> str:
+    """Last size bytes of a binary file, decoded (a cut character is replaced)."""
+    end = f.seek(0, os.SEEK_END)
+    f.seek(max(end - size, 0))
+    return f.read().decode("utf-8", errors="replace")
+
+
+def _branch_exists(branch: str, repo: Path) -> bool:
+    """True if a local branch exists."""
+    try:
+        run_git(["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"], repo)
+    except GitError:
+        return False
+    return True
@@ -0,0 +1,377 @@
+"""Surgical ticket header rewriting.
+
+State transitions only touch a few header lines (`**Status**`,
+`**Progress**`, `**Actual Hours**`), so files are never re-rendered:
+scan_header() records the byte span of every header field value, and
+patch_header() splices new values into exactly those spans. Every other
+byte (line endings, body, field order, trailing spaces) is preserved, which
+keeps diffs to the changed values.
+
+Batches are staged before anything is replaced: each new file goes to a
+temporary file next to its target, all temporary files are fsynced
+together, and only then are targets replaced with os.replace() (followed
+by one fsync per directory). A failure while staging leaves every target
+untouched. Each replace is atomic, but the batch is not a transaction: if
+an os.replace() itself fails partway through, the targets before it keep
+their new contents. Files whose values are unchanged are not rewritten at
+all.
+
+Writes are optimistic read-modify-writes. A caller records the
+content_hash() of each file when it reads it and passes those hashes as
+`expected`. Just before the replace, write_files locks every target it is
+about to replace (a per-file lock, so unrelated writers never wait on each
+other) and checks every expected hash. If any file changed since it was
+read, nothing is replaced and WriteConflictError is raised so the caller
+can retry against fresh data. patch_files does this for its own reads.
+
+Single files (caches and state under .gitstory/) are replaced with
+atomic_write(), the one-file case of write_files; cache updates run inside
+ignore_cache_errors().
+
+Example:
+    >>> patch_files({Path("TASK-0001.2.4.3.md"): {"Status": "🟢 Done"}})
+    [PosixPath('TASK-0001.2.4.3.md')]
+"""
+
+import hashlib
+import os
+import re
+import sys
+import tempfile
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from gitstory.core.tickets import FIELD_PATTERN
+
+if sys.platform != "win32":
+    import fcntl
+
+# Temporary files kept open before their fsyncs are flushed (bounds open descriptors)
+FSYNC_BATCH = 128
+
+
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask() can only be queried by setting it, which races threads
+_UMASK = _read_umask()
+
+_FIELD_PATTERN = re.compile(FIELD_PATTERN.pattern.encode())
+
+
+class WriteConflictError(OSError):
+    """Raised when files changed after they were read; nothing has been replaced.
+
+    Attributes:
+        paths: Files whose content no longer matches the expected hash
+    """
+
+    def __init__(self, paths: list[Path]) -> None:
+        super().__init__(f"Changed since read: {', '.join(str(p) for p in paths)}")
+        self.paths = paths
+
+
+def content_hash(data: bytes) -> str:
+    """Hex content hash (blake2b, 16 bytes) of file contents.
+
+    The version checked by optimistic writes, and the key of cached results
+    (validation manifest, quality scores, import journal records, compiled
+    templates).
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass
+class HeaderSpans:
+    """Byte offsets of header field values.
+
+    Attributes:
+        values: (start, end) of each field's value, first occurrence wins
+        insert_at: Offset just after the last field line (where new fields go)
+        newline: Line ending used by that line
+    """
+
+    values: dict[str, tuple[int, int]] = field(default_factory=dict)
+    insert_at: int | None = None
+    newline: bytes = b"\n"
+
+
+def scan_header(data: bytes) -> HeaderSpans:
+    """Locate header field values (everything before the first `## ` section).
+
+    Args:
+        data: Raw ticket file contents
+
+    Returns:
+        HeaderSpans with byte offsets into data
+    """
+    spans = HeaderSpans()
+    pos = 0
+    size = len(data)
+    while pos < size:
+        newline = data.find(b"\n", pos)
+        end = size if newline < 0 else newline
+        next_pos = size if newline < 0 else newline + 1
+        if end > pos and data[end - 1] == 0x0D:
+            end -= 1
+        if data.startswith(b"## ", pos):
+            break
+        if data.startswith(b"**", pos):
+            line = data[pos:end]
+            for match in _FIELD_PATTERN.finditer(line):
+                key = match.group("key").decode("utf-8", "replace")
+                spans.values.setdefault(key, (pos + match.start("value"), pos + match.end("value")))
+            spans.insert_at = next_pos
+            spans.newline = data[end:next_pos] or b"\n"
+        pos = next_pos
+    return spans
+
+
+def patch_header(
+    data: bytes, updates: Mapping[str, str], spans: HeaderSpans | None = None
+) -> bytes:
+    """Replace header field values in place, adding missing fields after the last one.
+
+    Args:
+        data: Raw ticket file contents
+        updates: New values by field name
+        spans: Result of scan_header(data), if already computed
+
+    Returns:
+        Patched contents, or data itself if no value actually changes
+    """
+    spans = spans or scan_header(data)
+    edits: list[tuple[int, int, bytes]] = []
+    added = b""
+    for key, value in updates.items():
+        new = value.strip().encode("utf-8")
+        span = spans.values.get(key)
+        if span is None:
+            added += b"**" + key.encode("utf-8") + b"**: " + new + spans.newline
+        elif data[span[0] : span[1]] != new:
+            edits.append((span[0], span[1], new))
+    if added:
+        at = spans.insert_at
+        if at is None:
+            return data  # no header fields: not a ticket header we can extend
+        if at == len(data) and not data.endswith(b"\n"):
+            added = spans.newline + added.removesuffix(spans.newline)
+        edits.append((at, at, added))
+    if not edits:
+        return data
+    parts = []
+    last = len(data)
+    for start, end, new in sorted(edits, reverse=True):
+        parts.append(data[end:last])
+        parts.append(new)
+        last = start
+    parts.append(data[:last])
+    return b"".join(reversed(parts))
+
+
+def patch_files(updates: Mapping[Path, Mapping[str, str]], durable: bool = True) -> list[Path]:
+    """Patch header fields of several files and write the changed ones as a batch.
+
+    Args:
+        updates: New field values by file path
+        durable: fsync files and directories before returning
+
+    Returns:
+        Paths that were rewritten (files without a value change are skipped)
+
+    Raises:
+        WriteConflictError: If a file changed between its read and the write
+        OSError: If a file cannot be read or written (nothing has been replaced)
+    """
+    contents: dict[Path, bytes] = {}
+    expected: dict[Path, str] = {}
+    for path, fields in updates.items():
+        data = path.read_bytes()
+        patched = patch_header(data, fields)
+        if patched is not data:
+            contents[path] = patched
+            expected[path] = content_hash(data)
+    write_files(contents, durable=durable, expected=expected)
+    return list(contents)
+
+
+def write_files(
+    contents: Mapping[Path, bytes],
+    durable: bool = True,
+    expected: Mapping[Path, str] | None = None,
+) -> None:
+    """Write several files atomically as a batch.
+
+    Existing files keep their permission bits; new files get the usual
+    0o666 masked by the umask (mkstemp alone would make them owner-only).
+    If staging fails (writing or fsyncing a temporary file, or a conflict),
+    no target is replaced and temporary files are removed. The replaces
+    themselves are atomic one by one: if os.replace() fails partway, the
+    targets replaced before it keep their new contents and the rest are
+    left as they were.
+
+    Args:
+        contents: New contents by path
+        durable: fsync all temporary files before replacing (in batches of
+            FSYNC_BATCH), and each target directory once afterwards
+        expected: content_hash() of files as they were read, checked just
+            before replacing; may include files that are not written (inputs
+            the new contents were derived from)
+
+    Raises:
+        WriteConflictError: If an expected file changed (nothing has been replaced)
+        OSError: If a file cannot be written (nothing has been replaced unless
+            os.replace() itself failed, see above)
+    """
+    staged: list[tuple[str, Path]] = []
+    pending: list[int] = []
+    try:
+        for path, data in contents.items():
+            fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            staged.append((temp, path))
+            pending.append(fd)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            try:
+                mode = path.stat().st_mode & 0o7777
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(temp, mode)
+            if len(pending) >= FSYNC_BATCH:
+                _flush(pending, durable)
+        _flush(pending, durable)
+        with _verified(expected or {}, contents):
+            for temp, path in staged:
+                os.replace(temp, path)
+    except BaseException:
+        for fd in pending:
+            os.close(fd)
+        for temp, _ in staged:
+            Path(temp).unlink(missing_ok=True)
+        raise
+    if durable:
+        for directory in dict.fromkeys(path.parent for _, path in staged):
+            _fsync_directory(directory)
+
+
+def atomic_write(path: Path | str, data: bytes, durable: bool = False) -> None:
+    """Replace one file atomically, creating its directory.
+
+    Readers see the old or the new contents, never a partial file.
+
+    Args:
+        path: File to write
+        data: New contents
+        durable: fsync the file and its directory (see write_files)
+
+    Raises:
+        OSError: If the file cannot be written (the old file is left as it was)
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    write_files({target: data}, durable=durable)
+
+
+@contextmanager
+def ignore_cache_errors() -> Iterator[None]:
+    """Swallow OSError from updating a cache.
+
+    Caches only save work, so a read-only checkout (or a full disk) must not
+    fail the command that tried to update one.
+    """
+    try:
+        yield
+    except OSError:
+        pass
+
+
+@contextmanager
+def _verified(expected: Mapping[Path, str], written: Mapping[Path, bytes]) -> Iterator[None]:
+    """Hold locks on the expected files being written while checking every expected hash.
+
+    Locks are taken in path order (no deadlock between overlapping batches)
+    and released when the block exits, after the replaces.
+
+    Raises:
+        WriteConflictError: If any expected file is missing or has changed
+    """
+    fds: list[int] = []
+    try:
+        conflicts = []
+        for path in sorted(expected):
+            if path in written:
+                data = _read_locked(path, fds)
+            else:
+                try:
+                    data = path.read_bytes()
+                except FileNotFoundError:
+                    data = None
+            if data is None or content_hash(data) != expected[path]:
+                conflicts.append(path)
+        if conflicts:
+            raise WriteConflictError(conflicts)
+        yield
+    finally:
+        for fd in fds:
+            os.close(fd)  # releases its lock
+
+
+def _read_locked(path: Path, fds: list[int]) -> bytes | None:
+    """Lock the file currently at path and read it (None if missing).
+
+    A writer may replace the file between open() and the lock; the lock is
+    then on the replaced inode, so it is dropped and taken again on the new
+    one. Where advisory locks are unavailable, the file is only read.
+    """
+    if sys.platform == "win32":
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+    while True:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            current = os.stat(path).st_ino == os.fstat(fd).st_ino
+        except FileNotFoundError:
+            current = False
+        if current:
+            fds.append(fd)
+            chunks = []
+            while chunk := os.read(fd, 1 << 16):
+                chunks.append(chunk)
+            return b"".join(chunks)
+        os.close(fd)
+
+
+def _flush(fds: list[int], durable: bool) -> None:
+    """fsync (if durable) and close descriptors, emptying the list."""
+    while fds:
+        fd = fds[-1]
+        if durable:
+            os.fsync(fd)
+        os.close(fd)
+        fds.pop()
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist renames in directory (no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,97 @@
+"""GitStory data models.
+
+The pydantic models are imported on first access, so commands (and
+--help) that only need TicketId do not pay for importing pydantic.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from gitstory.models.ticket_id import DEFAULT_TICKETS_ROOT, InvalidTicketIdError, TicketId
+
+if TYPE_CHECKING:
+    from gitstory.models.plugin import (
+        PLUGIN_OUTPUT_MODELS,
+        ActionOutput,
+        EventOutput,
+        GuardOutput,
+        PluginOutput,
+        plugin_output_adapter,
+    )
+    from gitstory.models.ticket import (
+        SUBTREE_ADAPTER,
+        TICKET_IMPORT_ADAPTER,
+        TICKETS_ADAPTER,
+        Ticket,
+        TicketImport,
+        TicketSpec,
+    )
+    from gitstory.models.workflow import (
+        WORKFLOW_ADAPTER,
+        StateModel,
+        TransitionModel,
+        WorkflowConfig,
+        WorkflowSection,
+    )
+
+# Names of the pydantic-backed submodules, by submodule
+_LAZY_NAMES = {
+    "plugin": (
+        "PLUGIN_OUTPUT_MODELS",
+        "ActionOutput",
+        "EventOutput",
+        "GuardOutput",
+        "PluginOutput",
+        "plugin_output_adapter",
+    ),
+    "ticket": (
+        "SUBTREE_ADAPTER",
+        "TICKET_IMPORT_ADAPTER",
+        "TICKETS_ADAPTER",
+        "Ticket",
+        "TicketImport",
+        "TicketSpec",
+    ),
+    "workflow": (
+        "WORKFLOW_ADAPTER",
+        "StateModel",
+        "TransitionModel",
+        "WorkflowConfig",
+        "WorkflowSection",
+    ),
+}
+_LAZY = {name: module for module, names in _LAZY_NAMES.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a pydantic model or adapter from its submodule on first access."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "DEFAULT_TICKETS_ROOT",
+    "PLUGIN_OUTPUT_MODELS",
+    "SUBTREE_ADAPTER",
+    "TICKET_IMPORT_ADAPTER",
+    "TICKETS_ADAPTER",
+    "WORKFLOW_ADAPTER",
+    "ActionOutput",
+    "EventOutput",
+    "GuardOutput",
+    "InvalidTicketIdError",
+    "PluginOutput",
+    "StateModel",
+    "Ticket",
+    "TicketId",
+    "TicketImport",
+    "TicketSpec",
+    "TransitionModel",
+    "WorkflowConfig",
+    "WorkflowSection",
+    "plugin_output_adapter",
+]
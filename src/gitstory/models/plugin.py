@@ -0,0 +1,58 @@
+"""Validated plugin output.
+
+Plugins print one JSON object; plugin_output_adapter() parses and validates
+it straight from stdout (validate_json runs the JSON parser and the checks
+in pydantic-core). Only the result key is required, any other keys are
+kept as plugin-specific details. An adapter is compiled the first time its
+plugin type runs, not at import, so commands that run no plugin (and
+`--help`) do not pay for it.
+
+Example:
+    >>> plugin_output_adapter("guard").validate_json('{"passed": true, "pending": []}')
+    GuardOutput(passed=True, pending=[])
+"""
+
+from functools import cache
+
+from pydantic import BaseModel, ConfigDict, StrictBool, TypeAdapter
+
+
+class PluginOutput(BaseModel):
+    """Base for plugin output: extra keys are preserved."""
+
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+class GuardOutput(PluginOutput):
+    """Guard output: {"passed": bool, ...}."""
+
+    passed: StrictBool
+
+
+class EventOutput(PluginOutput):
+    """Event output: {"occurred": bool, ...}."""
+
+    occurred: StrictBool
+
+
+class ActionOutput(PluginOutput):
+    """Action output: {"success": bool, ...}."""
+
+    success: StrictBool
+
+
+PLUGIN_OUTPUT_MODELS: dict[str, type[PluginOutput]] = {
+    "guard": GuardOutput,
+    "event": EventOutput,
+    "action": ActionOutput,
+}
+
+
+@cache
+def plugin_output_adapter(plugin_type: str) -> TypeAdapter[PluginOutput]:
+    """Compiled adapter validating the output of a plugin type (built once, on first use).
+
+    Raises:
+        KeyError: If plugin_type is not a key of PLUGIN_OUTPUT_MODELS
+    """
+    return TypeAdapter(PLUGIN_OUTPUT_MODELS[plugin_type])
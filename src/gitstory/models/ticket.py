@@ -0,0 +1,108 @@
+"""Validated ticket model.
+
+Data from outside is validated with compiled TypeAdapters, so a whole list
+is validated in a single call into pydantic-core instead of per-object
+Python validation: lines of a `gitstory import` stream with
+TICKET_IMPORT_ADAPTER.validate_json, straight from the raw line, and
+subtree specs for `plan --spec` with SUBTREE_ADAPTER. TICKETS_ADAPTER does
+the same for ticket headers exchanged as JSON by tools built on this
+package; no command reads those yet.
+
+Data GitStory wrote itself (tree snapshot, validation manifest) is trusted
+and never re-validated: it is rebuilt as the slots-based TicketHeader
+mirror in gitstory.core.tickets, the type the index and every command work
+on, without a detour through this model (see
+tests/benchmarks/test_model_loading.py). model_construct is not used: it
+is slower than the mirror and would still need converting.
+
+Example:
+    >>> data = [{"path": "BUG-0001.md", "ticket_id": "BUG-0001"}]
+    >>> [ticket] = TICKETS_ADAPTER.validate_python(data)
+    >>> ticket.fields
+    {}
+"""
+
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+TicketIdStr = Annotated[str, Field(pattern=r"^(?:INIT|EPIC|STORY|TASK|BUG)-\d{4}(?:\.\d+)*$")]
+
+
+class Ticket(BaseModel):
+    """Parsed ticket header.
+
+    Attributes:
+        path: File path relative to the tickets root (POSIX separators)
+        ticket_id: ID from the title line, or None if the title is missing
+        title: Title text after the ID
+        fields: Header fields by name as (value, 1-based line)
+        requires: IDs of tickets that must be completed before this one
+        blocks: IDs of tickets waiting on this one
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    path: str
+    ticket_id: TicketIdStr | None
+    title: str = ""
+    fields: dict[str, tuple[str, int]] = Field(default_factory=dict)
+    requires: tuple[TicketIdStr, ...] = ()
+    blocks: tuple[TicketIdStr, ...] = ()
+
+
+class TicketImport(BaseModel):
+    """One ticket to create, as read from an import stream (one JSON object per line).
+
+    The ticket ID is allocated on import: below parent (an existing ticket
+    ID) or parent_key (the key of a ticket earlier in the stream), or as a
+    new initiative or bug when neither is given.
+
+    Attributes:
+        key: Caller's identifier (e.g., the other tracker's issue key)
+        type: Ticket type; derived from the parent when omitted
+        title: Ticket title
+        parent: ID of an existing parent ticket
+        parent_key: Key of a parent imported earlier in the same stream
+        status: Status text (default: the workflow's start state)
+        fields: Extra header fields (e.g., {"Story Points": "3"})
+        body: Markdown below the header (sections such as `## Objective`)
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    key: str | None = None
+    type: Literal["initiative", "epic", "story", "task", "bug"] | None = None
+    title: str = Field(min_length=1)
+    parent: TicketIdStr | None = None
+    parent_key: str | None = None
+    status: str | None = None
+    fields: dict[str, str] = Field(default_factory=dict)
+    body: str = ""
+
+
+class TicketSpec(BaseModel):
+    """One ticket of a subtree to create in a single call (`gitstory plan --spec`).
+
+    Attributes:
+        title: Ticket title
+        type: Ticket type; derived from the parent when omitted
+        status: Status text (default: the workflow's start state)
+        fields: Extra header fields (e.g., {"Estimated Hours": "2"})
+        body: Markdown below the header
+        children: Tickets to create below this one
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    title: str = Field(min_length=1)
+    type: Literal["initiative", "epic", "story", "task", "bug"] | None = None
+    status: str | None = None
+    fields: dict[str, str] = Field(default_factory=dict)
+    body: str = ""
+    children: list["TicketSpec"] = Field(default_factory=list)
+
+
+TICKETS_ADAPTER = TypeAdapter(list[Ticket])
+TICKET_IMPORT_ADAPTER = TypeAdapter(TicketImport)
+SUBTREE_ADAPTER = TypeAdapter(list[TicketSpec])
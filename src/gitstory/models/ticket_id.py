@@ -0,0 +1,240 @@
+"""Compact ticket ID value type with constant-time path resolution.
+
+Hierarchical ticket IDs encode their full ancestry, so parents, ancestors and
+file paths are derived arithmetically from the numeric parts without touching
+the filesystem:
+
+    TASK-0001.2.3.4 -> (1, 2, 3, 4)
+                    -> INIT-0001/EPIC-0001.2/STORY-0001.2.3/TASK-0001.2.3.4.md
+
+Example:
+    >>> from gitstory.models import TicketId
+    >>> tid = TicketId.parse("TASK-0001.2.3.4")
+    >>> str(tid.parent)
+    'STORY-0001.2.3'
+    >>> tid.relative_path
+    'INIT-0001/EPIC-0001.2/STORY-0001.2.3/TASK-0001.2.3.4.md'
+"""
+
+import re
+from functools import total_ordering
+from typing import Any
+
+# Hierarchy levels indexed by number of ID parts (parts[0] is the initiative)
+LEVELS = ("initiative", "epic", "story", "task")
+PREFIXES = ("INIT", "EPIC", "STORY", "TASK")
+
+DEFAULT_TICKETS_ROOT = "docs/tickets"
+
+_ID_PATTERN = re.compile(r"^(INIT|EPIC|STORY|TASK|BUG)-(\d{4})((?:\.\d+)*)$")
+_DEPTH = {"INIT": 1, "EPIC": 2, "STORY": 3, "TASK": 4, "BUG": 1}
+
+
+class InvalidTicketIdError(ValueError):
+    """Raised when a string is not a well-formed ticket ID."""
+
+
+@total_ordering
+class TicketId:
+    """Immutable ticket ID backed by a tuple of ints.
+
+    Hierarchical IDs sort depth-first (INIT-0001 < EPIC-0001.1 < STORY-0001.1.1 <
+    EPIC-0001.2), and bugs sort after all hierarchical tickets.
+
+    Args:
+        parts: Numeric ID parts, e.g. (1, 2, 3) for STORY-0001.2.3
+        bug: True for BUG-NNNN tickets (parts must then have length 1)
+    """
+
+    __slots__ = ("parts", "bug", "_hash")
+
+    parts: tuple[int, ...]
+    bug: bool
+
+    def __init__(self, parts: tuple[int, ...], bug: bool = False) -> None:
+        if not 1 <= len(parts) <= (1 if bug else len(LEVELS)):
+            raise InvalidTicketIdError(f"Invalid ticket ID parts: {parts}")
+        self.parts = parts
+        self.bug = bug
+        self._hash = hash((bug, parts))
+
+    @classmethod
+    def parse(cls, ticket_id: str) -> "TicketId":
+        """Parse a ticket ID string.
+
+        Args:
+            ticket_id: ID such as "STORY-0001.2.3" or "BUG-0042"
+
+        Returns:
+            Parsed TicketId
+
+        Raises:
+            InvalidTicketIdError: If the string is not a valid ticket ID
+        """
+        match = _ID_PATTERN.match(ticket_id)
+        if match is None:
+            raise InvalidTicketIdError(f"Invalid ticket ID format: {ticket_id}")
+        prefix, initiative, rest = match.groups()
+        parts = (int(initiative), *map(int, rest[1:].split("."))) if rest else (int(initiative),)
+        if len(parts) != _DEPTH[prefix]:
+            raise InvalidTicketIdError(f"Invalid ticket ID format: {ticket_id}")
+        return cls(parts, bug=prefix == "BUG")
+
+    @property
+    def type(self) -> str:
+        """Ticket type: initiative, epic, story, task or bug."""
+        return "bug" if self.bug else LEVELS[len(self.parts) - 1]
+
+    @property
+    def prefix(self) -> str:
+        """ID prefix: INIT, EPIC, STORY, TASK or BUG."""
+        return "BUG" if self.bug else PREFIXES[len(self.parts) - 1]
+
+    @property
+    def depth(self) -> int:
+        """Hierarchy depth (1 for initiatives and bugs, 4 for tasks)."""
+        return len(self.parts)
+
+    @property
+    def parent(self) -> "TicketId | None":
+        """Parent ticket ID, or None for initiatives and bugs."""
+        if self.bug or len(self.parts) == 1:
+            return None
+        return TicketId(self.parts[:-1])
+
+    @property
+    def ancestors(self) -> tuple["TicketId", ...]:
+        """Ancestor IDs ordered from the initiative down to the parent."""
+        if self.bug:
+            return ()
+        parts = self.parts
+        return tuple(TicketId(parts[:i]) for i in range(1, len(parts)))
+
+    def child(self, number: int) -> "TicketId":
+        """Return the ID of this ticket's child with the given number.
+
+        Raises:
+            InvalidTicketIdError: If this ticket type cannot have children
+        """
+        if self.bug or len(self.parts) == len(LEVELS):
+            raise InvalidTicketIdError(f"{self} cannot have children")
+        return TicketId((*self.parts, number))
+
+    def is_ancestor_of(self, other: "TicketId") -> bool:
+        """Return True if this ticket is a strict ancestor of other."""
+        if self.bug or other.bug:
+            return False
+        n = len(self.parts)
+        return n < len(other.parts) and other.parts[:n] == self.parts
+
+    @property
+    def directory(self) -> str:
+        """Directory containing the ticket file, relative to the tickets root ("" for bugs)."""
+        if self.bug:
+            return ""
+        return "/".join(_names(self.parts)[: len(LEVELS) - 1])
+
+    @property
+    def relative_path(self) -> str:
+        """Ticket markdown file path relative to the tickets root."""
+        if self.bug:
+            return f"{self}.md"
+        return _relative_path(_names(self.parts))
+
+    def path(self, root: str = DEFAULT_TICKETS_ROOT) -> str:
+        """Ticket markdown file path under root (POSIX separators)."""
+        return f"{root.rstrip('/')}/{self.relative_path}" if root else self.relative_path
+
+    @property
+    def children_pattern(self) -> str | None:
+        """Glob-style pattern matching child ticket IDs, or None if childless."""
+        if self.bug or len(self.parts) == len(LEVELS):
+            return None
+        return f"{PREFIXES[len(self.parts)]}-{_dotted(self.parts)}.*"
+
+    def to_dict(self, root: str = DEFAULT_TICKETS_ROOT) -> dict[str, Any]:
+        """Return parse_ticket metadata for this ID.
+
+        Args:
+            root: Tickets root prepended to the path
+
+        Returns:
+            Dictionary with ticket_id, type, initiative/epic/story/task components,
+            path, parent_type, parent_id and children_pattern
+        """
+        parts = self.parts
+        n = len(parts)
+        if self.bug:
+            ticket_id = str(self)
+            relative = f"{ticket_id}.md"
+        else:
+            names = _names(parts)
+            ticket_id = names[-1]
+            relative = _relative_path(names)
+        has_parent = not self.bug and n > 1
+        return {
+            "ticket_id": ticket_id,
+            "type": self.type,
+            "initiative": None if self.bug else f"{parts[0]:04d}",
+            "epic": str(parts[1]) if n > 1 else None,
+            "story": str(parts[2]) if n > 2 else None,
+            "task": str(parts[3]) if n > 3 else None,
+            "path": f"{root.rstrip('/')}/{relative}" if root else relative,
+            "parent_type": LEVELS[n - 2] if has_parent else None,
+            "parent_id": names[-2] if has_parent else None,
+            "children_pattern": self.children_pattern,
+        }
+
+    def _key(self) -> tuple[bool, tuple[int, ...]]:
+        return (self.bug, self.parts)
+
+    def __str__(self) -> str:
+        if self.bug:
+            return f"BUG-{self.parts[0]:04d}"
+        return _names(self.parts)[-1]
+
+    def __repr__(self) -> str:
+        return f"TicketId({str(self)!r})"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TicketId):
+            return NotImplemented
+        return self.bug == other.bug and self.parts == other.parts
+
+    def __lt__(self, other: "TicketId") -> bool:
+        if not isinstance(other, TicketId):
+            return NotImplemented
+        return self._key() < other._key()
+
+
+def _dotted(parts: tuple[int, ...]) -> str:
+    """Format ID parts as '0001.2.3'."""
+    return ".".join((f"{parts[0]:04d}", *map(str, parts[1:])))
+
+
+def _names(parts: tuple[int, ...]) -> list[str]:
+    """Format the IDs of a hierarchical ticket and all its ancestors in one pass.
+
+    Example:
+        >>> _names((1, 2))
+        ['INIT-0001', 'EPIC-0001.2']
+    """
+    dotted = f"{parts[0]:04d}"
+    names = [f"INIT-{dotted}"]
+    for level in range(1, len(parts)):
+        dotted = f"{dotted}.{parts[level]}"
+        names.append(f"{PREFIXES[level]}-{dotted}")
+    return names
+
+
+def _relative_path(names: list[str]) -> str:
+    """Build a hierarchical ticket's path from its ancestor chain of names."""
+    if len(names) == len(LEVELS):
+        return "/".join(names) + ".md"
+    return "/".join(names) + "/README.md"
+
+
+__all__ = ["DEFAULT_TICKETS_ROOT", "InvalidTicketIdError", "TicketId"]
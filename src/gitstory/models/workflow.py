@@ -0,0 +1,59 @@
+"""Validated workflow.yaml schema.
+
+WORKFLOW_ADAPTER validates parsed workflow.yaml data in one compiled
+pydantic-core call; gitstory.core.workflow converts the result into the
+slots-based State/Transition records used at runtime. Plugin specs are
+kept as given (name string, or inline/file mapping, see
+gitstory.core.plugins).
+
+Example:
+    >>> config = WORKFLOW_ADAPTER.validate_python(yaml.safe_load(text))
+    >>> config.workflow.transitions[0].from_state
+    'not_started'
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+PluginSpecModel = str | dict[str, Any]
+
+
+class StateModel(BaseModel):
+    """Workflow state (FSM node); name defaults to the state ID."""
+
+    model_config = ConfigDict(frozen=True, coerce_numbers_to_str=True)
+
+    name: str | None = None
+    emoji: str = ""
+    type: str = "active"
+
+
+class TransitionModel(BaseModel):
+    """Workflow transition (FSM edge)."""
+
+    model_config = ConfigDict(frozen=True, coerce_numbers_to_str=True, populate_by_name=True)
+
+    id: str = ""
+    from_state: str = Field("", alias="from")
+    to_state: str = Field("", alias="to")
+    on: str = "user_command"
+    guards: tuple[PluginSpecModel, ...] = ()
+    actions: tuple[PluginSpecModel, ...] = ()
+
+
+class WorkflowSection(BaseModel):
+    """The `workflow:` section: states by ID and transitions."""
+
+    states: dict[str, StateModel] = Field(default_factory=dict)
+    transitions: list[TransitionModel] = Field(default_factory=list)
+
+
+class WorkflowConfig(BaseModel):
+    """A whole workflow.yaml document."""
+
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    workflow: WorkflowSection = Field(default_factory=WorkflowSection)
+
+
+WORKFLOW_ADAPTER = TypeAdapter(WorkflowConfig)
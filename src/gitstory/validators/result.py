@@ -0,0 +1,71 @@
+"""Validation issue and result types shared by GitStory validators."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """Single validation error or warning.
+
+    Attributes:
+        type: Machine-readable issue type (e.g., "unreachable_state")
+        message: Human-readable description
+        line: 1-based line number, if known
+        path: File the issue was found in, if any
+        severity: "error" or "warning"
+    """
+
+    type: str
+    message: str
+    line: int | None = None
+    path: str | None = None
+    severity: str = "error"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the issue as a JSON-serializable dict."""
+        data: dict[str, Any] = {"line": self.line, "type": self.type, "message": self.message}
+        if self.path is not None:
+            data["path"] = self.path
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], severity: str = "error") -> "ValidationIssue":
+        """Rebuild an issue from to_dict() output."""
+        return cls(
+            type=data["type"],
+            message=data["message"],
+            line=data.get("line"),
+            path=data.get("path"),
+            severity=severity,
+        )
+
+
+@dataclass
+class ValidationResult:
+    """Validation result with errors and warnings."""
+
+    errors: list[ValidationIssue] = field(default_factory=list)
+    warnings: list[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """True if there are no errors (warnings do not fail validation)."""
+        return not self.errors
+
+    def add(self, issue: ValidationIssue) -> None:
+        """Add an issue to errors or warnings based on its severity."""
+        (self.warnings if issue.severity == "warning" else self.errors).append(issue)
+
+    def extend(self, issues: list[ValidationIssue]) -> None:
+        """Add several issues."""
+        for issue in issues:
+            self.add(issue)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result in validate_workflow JSON output format."""
+        return {
+            "valid": self.valid,
+            "errors": [issue.to_dict() for issue in self.errors],
+            "warnings": [issue.to_dict() for issue in self.warnings],
+        }
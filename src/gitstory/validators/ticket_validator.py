@@ -0,0 +1,239 @@
+"""Ticket structure validation.
+
+Rules are split by what they depend on, so incremental validation knows
+which tickets to recheck when a file changes:
+
+- File rules (check_ticket_file) depend only on the ticket's own header, its
+  location and the workflow states.
+- Cross-file rules (check_ticket_relations) also depend on the ticket's
+  parent (missing_parent) and children (incomplete_children), and on other
+  files declaring the same ID (duplicate_id).
+- Graph rules (check_dependency_graph, and core.links.check_references for
+  links and ticket mentions) depend on the whole tree and are recomputed on
+  every run instead of being cached per file.
+"""
+
+from gitstory.core.graph import TicketGraph
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import TicketHeader
+from gitstory.core.workflow import Workflow
+from gitstory.models import InvalidTicketIdError, TicketId
+from gitstory.validators.result import ValidationIssue
+
+REQUIRED_FIELDS = ("Status",)
+
+
+def check_ticket_file(header: TicketHeader, workflow: Workflow) -> list[ValidationIssue]:
+    """Validate a ticket header on its own.
+
+    Args:
+        header: Parsed ticket header
+        workflow: Workflow whose states define valid statuses
+
+    Returns:
+        Issues found (empty if valid)
+    """
+    path = header.path
+    if header.ticket_id is None:
+        return [
+            ValidationIssue(
+                type="missing_title",
+                message="Missing '# TICKET-ID: Title' line before the first section",
+                line=1,
+                path=path,
+            )
+        ]
+
+    issues: list[ValidationIssue] = []
+    try:
+        TicketId.parse(header.ticket_id)
+    except InvalidTicketIdError as e:
+        issues.append(ValidationIssue(type="invalid_ticket_id", message=str(e), line=1, path=path))
+
+    if header.ticket_id != header.file_ticket_id:
+        issues.append(
+            ValidationIssue(
+                type="id_mismatch",
+                message=(
+                    f"Title declares {header.ticket_id} but file location implies "
+                    f"{header.file_ticket_id}"
+                ),
+                line=1,
+                path=path,
+            )
+        )
+
+    misplaced = _misplaced(header)
+    if misplaced is not None:
+        issues.append(misplaced)
+
+    for name in REQUIRED_FIELDS:
+        if name not in header.fields:
+            issues.append(
+                ValidationIssue(
+                    type="missing_field", message=f"Missing required field: {name}", path=path
+                )
+            )
+
+    status = header.fields.get("Status")
+    if status is not None and workflow.state_for_status(status.value) is None:
+        known = ", ".join(workflow.status_text(s) for s in workflow.states)
+        issues.append(
+            ValidationIssue(
+                type="unknown_status",
+                message=f"Status '{status.value}' does not match a workflow state ({known})",
+                line=status.line,
+                path=path,
+            )
+        )
+    return issues
+
+
+def check_ticket_relations(
+    header: TicketHeader, index: TicketIndex, workflow: Workflow
+) -> list[ValidationIssue]:
+    """Validate rules that depend on other tickets in the index.
+
+    Args:
+        header: Parsed ticket header
+        index: Index of the whole ticket tree
+        workflow: Workflow used to classify statuses
+
+    Returns:
+        Issues found (empty if valid)
+    """
+    ticket_id = header.ticket_id
+    if ticket_id is None or index.parse_id(ticket_id) is None:
+        return []
+    path = header.path
+    issues: list[ValidationIssue] = []
+
+    duplicates = index.duplicates.get(ticket_id)
+    if duplicates:
+        others = ", ".join(p for p in duplicates if p != path)
+        issues.append(
+            ValidationIssue(
+                type="duplicate_id",
+                message=f"{ticket_id} is also declared in {others}",
+                line=1,
+                path=path,
+            )
+        )
+
+    parent = index.parent_id(ticket_id)
+    if parent is not None and parent not in index:
+        issues.append(
+            ValidationIssue(
+                type="missing_parent",
+                message=f"Parent ticket {parent} does not exist",
+                line=1,
+                path=path,
+            )
+        )
+
+    status = header.fields.get("Status")
+    state = workflow.state_for_status(status.value) if status else None
+    if status is not None and state is not None and state.type == "end":
+        open_children = [
+            child
+            for child in index.children.get(ticket_id, ())
+            if not _is_done(index.by_id[child], workflow)
+        ]
+        if open_children:
+            issues.append(
+                ValidationIssue(
+                    type="incomplete_children",
+                    message=f"Marked {status.value} but children are not done: "
+                    + ", ".join(open_children),
+                    line=status.line,
+                    path=path,
+                    severity="warning",
+                )
+            )
+    return issues
+
+
+def check_dependency_graph(
+    graph: TicketGraph, index: TicketIndex, workflow: Workflow
+) -> list[ValidationIssue]:
+    """Validate `Requires`/`Blocks` dependencies across the tree.
+
+    Reports dependency cycles (errors), references to unknown tickets and
+    tickets marked done while a blocker is still open (warnings).
+
+    Args:
+        graph: Blocker graph built from index
+        index: Index of the whole ticket tree
+        workflow: Workflow used to classify statuses
+
+    Returns:
+        Issues found (empty if valid)
+    """
+    issues: list[ValidationIssue] = []
+    for cycle in graph.cycles():
+        issues.append(
+            ValidationIssue(
+                type="dependency_cycle",
+                message="Tickets wait on each other and can never complete: " + ", ".join(cycle),
+                path=index.by_id[cycle[0]].path,
+            )
+        )
+    for ticket_id, unknown in sorted(graph.missing.items()):
+        issues.append(
+            ValidationIssue(
+                type="unknown_dependency",
+                message="Dependencies reference unknown tickets: " + ", ".join(unknown),
+                path=index.by_id[ticket_id].path,
+                severity="warning",
+            )
+        )
+    for ticket_id in sorted(graph.blocked_by):
+        header = index.by_id[ticket_id]
+        if not _is_done(header, workflow):
+            continue
+        open_blockers = [
+            b for b in graph.blockers(ticket_id) if not _is_done(index.by_id[b], workflow)
+        ]
+        if open_blockers:
+            status = header.fields["Status"]
+            issues.append(
+                ValidationIssue(
+                    type="unresolved_blocker",
+                    message=f"Marked {status.value} but blockers are not done: "
+                    + ", ".join(open_blockers),
+                    line=status.line,
+                    path=header.path,
+                    severity="warning",
+                )
+            )
+    return issues
+
+
+def _misplaced(header: TicketHeader) -> ValidationIssue | None:
+    """Report a ticket file whose directory is not its parent ticket's directory."""
+    try:
+        parent = TicketId.parse(header.file_ticket_id).parent
+    except InvalidTicketIdError:
+        return None
+    parts = header.path.split("/")
+    if parts[-1] == "README.md":
+        parts.pop()
+    container = parts[-2] if len(parts) > 1 else ""
+    expected = str(parent) if parent is not None else ""
+    if container == expected:
+        return None
+    where = f"in {container}" if container else "at the tickets root"
+    belongs = f"under {expected}" if expected else "at the tickets root"
+    return ValidationIssue(
+        type="misplaced_ticket",
+        message=f"{header.file_ticket_id} belongs {belongs} but is {where}",
+        line=1,
+        path=header.path,
+    )
+
+
+def _is_done(header: TicketHeader, workflow: Workflow) -> bool:
+    """Return True if the ticket's status maps to an end state."""
+    status = header.status
+    state = workflow.state_for_status(status) if status else None
+    return state is not None and state.type == "end"
@@ -0,0 +1,210 @@
+"""Schema and FSM validation for workflow.yaml.
+
+Validation categories (EPIC-0001.2 scope):
+1. YAML syntax
+2. Config version (metadata.config_version exists and is supported)
+3. FSM structure (start/end states, transition references, reachability)
+
+Plugin reference and hierarchy validation are deferred to EPIC-0001.4.
+"""
+
+from typing import Any
+
+import yaml
+
+from gitstory.validators.result import ValidationIssue, ValidationResult
+
+SUPPORTED_CONFIG_VERSIONS = ("1.0",)
+
+
+def validate_workflow(content: str, path: str | None = None) -> ValidationResult:
+    """Validate workflow.yaml content.
+
+    Args:
+        content: workflow.yaml text
+        path: File path attached to reported issues
+
+    Returns:
+        ValidationResult with line numbers where they can be determined
+    """
+    result = ValidationResult()
+
+    # Category 1: YAML Syntax (compose first so we keep node line numbers)
+    try:
+        loader = yaml.SafeLoader(content)
+        try:
+            node = loader.get_single_node()
+            workflow = loader.construct_document(node) if node is not None else None
+        finally:
+            loader.dispose()
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        result.add(
+            ValidationIssue(
+                type="yaml_syntax",
+                message=f"Invalid YAML syntax: {e}",
+                line=mark.line + 1 if mark is not None else None,
+                path=path,
+            )
+        )
+        return result
+
+    if node is None or not isinstance(workflow, dict):
+        result.add(
+            ValidationIssue(
+                type="invalid_structure", message="Workflow must be a YAML mapping", path=path
+            )
+        )
+        return result
+
+    lines = _LineIndex(node)
+
+    # Category 2: Config Version
+    metadata = workflow.get("metadata")
+    if not isinstance(metadata, dict):
+        result.add(
+            ValidationIssue(
+                type="missing_section", message="Missing required section: metadata", path=path
+            )
+        )
+    elif "config_version" not in metadata:
+        result.add(
+            ValidationIssue(
+                type="missing_field",
+                message="Missing required field: metadata.config_version",
+                line=lines.get("metadata"),
+                path=path,
+            )
+        )
+    elif str(metadata["config_version"]) not in SUPPORTED_CONFIG_VERSIONS:
+        result.add(
+            ValidationIssue(
+                type="unsupported_version",
+                message=f"Unsupported config_version: {metadata['config_version']}",
+                line=lines.get("metadata", "config_version"),
+                path=path,
+            )
+        )
+
+    # Category 3: FSM Structure
+    section = workflow.get("workflow")
+    if isinstance(section, dict):
+        result.extend(_validate_fsm_structure(section, lines, path))
+    else:
+        result.add(
+            ValidationIssue(
+                type="missing_section", message="Missing required section: workflow", path=path
+            )
+        )
+
+    return result
+
+
+def _validate_fsm_structure(
+    section: dict[str, Any], lines: "_LineIndex", path: str | None
+) -> list[ValidationIssue]:
+    """Validate finite state machine structure."""
+    errors: list[ValidationIssue] = []
+    states = section.get("states") or {}
+    transitions = section.get("transitions") or []
+
+    if not isinstance(states, dict) or not states:
+        errors.append(
+            ValidationIssue(
+                type="no_states",
+                message="Workflow must define at least one state",
+                line=lines.get("workflow"),
+                path=path,
+            )
+        )
+        return errors
+
+    def state_type(state_id: str) -> Any:
+        spec = states[state_id]
+        return spec.get("type") if isinstance(spec, dict) else None
+
+    if not any(state_type(s) == "start" for s in states):
+        errors.append(
+            ValidationIssue(
+                type="no_start_state",
+                message="No start state defined (at least one state needs type: start)",
+                line=lines.get("workflow", "states"),
+                path=path,
+            )
+        )
+    if not any(state_type(s) == "end" for s in states):
+        errors.append(
+            ValidationIssue(
+                type="no_end_state",
+                message="No end state defined (at least one state needs type: end)",
+                line=lines.get("workflow", "states"),
+                path=path,
+            )
+        )
+
+    # Transition references (backward transitions are allowed)
+    inbound: set[str] = set()
+    for i, transition in enumerate(transitions):
+        if not isinstance(transition, dict):
+            continue
+        line = lines.get("workflow", "transitions", i)
+        for key in ("from", "to"):
+            state = transition.get(key)
+            if key == "from" and state == "*":
+                continue
+            if state not in states:
+                errors.append(
+                    ValidationIssue(
+                        type="undefined_state",
+                        message=f"State '{state}' referenced but not defined",
+                        line=line,
+                        path=path,
+                    )
+                )
+        if transition.get("to") in states:
+            inbound.add(transition["to"])
+
+    # Reachability: non-start states need an inbound transition
+    for state_id in states:
+        if state_type(state_id) != "start" and state_id not in inbound:
+            errors.append(
+                ValidationIssue(
+                    type="unreachable_state",
+                    message=f"State '{state_id}' has no inbound transitions",
+                    line=lines.get("workflow", "states", state_id),
+                    path=path,
+                )
+            )
+
+    return errors
+
+
+class _LineIndex:
+    """Look up 1-based source lines of YAML nodes by key path."""
+
+    def __init__(self, root: yaml.Node) -> None:
+        self.root = root
+
+    def get(self, *keys: str | int) -> int | None:
+        """Return the line of the node at keys (mapping keys or sequence indexes).
+
+        Mapping entries report the line of their key (e.g., "abandoned:"),
+        sequence items the line where the item starts.
+        """
+        node: yaml.Node = self.root
+        line: int | None = None
+        for key in keys:
+            if isinstance(node, yaml.MappingNode) and isinstance(key, str):
+                entry = next((kv for kv in node.value if kv[0].value == key), None)
+                if entry is None:
+                    return None
+                line = entry[0].start_mark.line + 1
+                node = entry[1]
+            elif isinstance(node, yaml.SequenceNode) and isinstance(key, int):
+                if key >= len(node.value):
+                    return None
+                node = node.value[key]
+                line = node.start_mark.line + 1
+            else:
+                return None
+        return line
@@ -0,0 +1,77 @@
+"""Benchmark: export throughput and memory of streaming JSONL/CSV export.
+
+Exports synthetic snapshot records to a null stream and reports rows per
+second, then the peak memory allocated while exporting (tracemalloc, in a
+separate run since tracing slows allocation down). Peak memory must not grow
+with the number of tickets: it is bounded by one chunk.
+
+Set GITSTORY_BENCH_TICKETS to change the number of tickets (default 100000).
+"""
+
+import io
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from gitstory.core.export import DEFAULT_EXPORT_FIELDS, export_rows, iter_rows
+
+TICKETS = int(os.environ.get("GITSTORY_BENCH_TICKETS", "100000"))
+
+
+class NullStream(io.TextIOBase):
+    """Text stream discarding everything written to it."""
+
+    def write(self, s):
+        return len(s)
+
+
+def _record(n: int) -> tuple:
+    story = f"{n // 1000 + 1}.{n // 10 % 100 + 1}"
+    ticket_id = f"TASK-0001.{story}.{n % 10 + 1}"
+    return (
+        f"INIT-0001/EPIC-0001.{story.split('.')[0]}/STORY-0001.{story}/{ticket_id}.md",
+        ticket_id,
+        f"Task {n}",
+        ("Status", "🔵 Not Started", 3, "Estimated Hours", "2", 4),
+        (),
+        (),
+        0,
+        0,
+    )
+
+
+def _export(records, fmt):
+    return export_rows(
+        iter_rows(records, DEFAULT_EXPORT_FIELDS), DEFAULT_EXPORT_FIELDS, fmt, NullStream()
+    )
+
+
+def _peak(records, fmt):
+    tracemalloc.start()
+    _export(records, fmt)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+def test_export_streams_with_flat_memory(fmt, capsys):
+    small = [_record(n) for n in range(TICKETS // 10)]
+    large = [_record(n) for n in range(TICKETS)]
+
+    start = time.perf_counter()
+    count = _export(large, fmt)
+    seconds = time.perf_counter() - start
+    small_peak, large_peak = _peak(small, fmt), _peak(large, fmt)
+
+    assert count == TICKETS
+    assert large_peak < 2 * small_peak
+    with capsys.disabled():
+        print(
+            f"\n{fmt}: {TICKETS} tickets in {seconds * 1000:.1f} ms "
+            f"({TICKETS / seconds:,.0f} rows/s), peak {large_peak / 1024:.0f} KiB "
+            f"(vs {small_peak / 1024:.0f} KiB for {TICKETS // 10})"
+        )
@@ -0,0 +1,70 @@
+"""Benchmark: validated models vs the trusted TicketHeader mirror.
+
+Compares the two ways ticket data is turned into objects:
+- validated: TICKETS_ADAPTER.validate_python (data from outside)
+- mirror: TreeSnapshot.headers (our own cache, rebuilt without validation)
+
+Both must produce the same tickets; the timings are printed, not asserted.
+
+Set GITSTORY_BENCH_TICKETS to change the number of tickets (default 100000).
+"""
+
+import os
+import time
+
+import pytest
+
+from gitstory.core.snapshot import TreeSnapshot
+from gitstory.models import TICKETS_ADAPTER
+
+TICKETS = int(os.environ.get("GITSTORY_BENCH_TICKETS", "100000"))
+
+
+def _raw(n: int) -> dict:
+    story = f"{n // 1000 + 1}.{n // 10 % 100 + 1}"
+    return {
+        "path": f"INIT-0001/EPIC-0001.{story}/TASK-0001.{story}.{n % 10 + 1}.md",
+        "ticket_id": f"TASK-0001.{story}.{n % 10 + 1}",
+        "title": f"Task {n}",
+        "fields": {"Status": ("🔵 Not Started", 3), "Estimated Hours": ("2", 4)},
+        "requires": (),
+        "blocks": (),
+    }
+
+
+def _record(raw: dict) -> tuple:
+    flat = tuple(item for key, value in raw["fields"].items() for item in (key, *value))
+    return (raw["path"], raw["ticket_id"], raw["title"], flat, raw["requires"], raw["blocks"], 0, 0)
+
+
+def _timed(build, raw):
+    start = time.perf_counter()
+    objects = build(raw)
+    return time.perf_counter() - start, objects
+
+
+@pytest.mark.benchmark
+def test_validated_and_mirror_loading_agree(capsys):
+    raw = [_raw(n) for n in range(TICKETS)]
+
+    validated_s, validated = _timed(TICKETS_ADAPTER.validate_python, raw)
+    snapshot = TreeSnapshot("docs/tickets", records={r["path"]: _record(r) for r in raw})
+    mirror_s, mirrors = _timed(lambda s: s.headers(), snapshot)
+
+    assert len(validated) == len(mirrors) == TICKETS
+    for ticket, header in zip(validated, mirrors, strict=True):
+        assert (ticket.path, ticket.ticket_id, ticket.title) == (
+            header.path,
+            header.ticket_id,
+            header.title,
+        )
+        assert ticket.fields == {k: tuple(v) for k, v in header.fields.items()}
+    with capsys.disabled():
+        print(f"\n{TICKETS} tickets")
+        for name, seconds in [
+            ("validated (TypeAdapter)", validated_s),
+            ("slots mirror", mirror_s),
+        ]:
+            print(
+                f"  {name:<24} {seconds * 1000:8.1f} ms  {seconds / TICKETS * 1e6:6.2f} us/ticket"
+            )
@@ -0,0 +1,77 @@
+"""Shared fixtures for GitStory tests."""
+
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from gitstory.core.workflow import DEFAULT_WORKFLOW, Workflow
+from gitstory.models import TicketId
+
+TicketWriter = Callable[..., Path]
+GitRunner = Callable[..., str]
+
+
+@pytest.fixture
+def write_ticket(tmp_path: Path) -> TicketWriter:
+    """Fixture returning a function that writes a ticket file under tmp_path/docs/tickets.
+
+    The file is placed at the path implied by the ticket ID unless rel_path is given.
+    """
+    root = tmp_path / "docs" / "tickets"
+
+    def write(
+        ticket_id: str,
+        status: str = "🔵 Not Started",
+        title: str = "Example ticket",
+        extra: str = "",
+        body: str = "## Objective\n\nDo the thing.\n",
+        rel_path: str | None = None,
+    ) -> Path:
+        path = root / (rel_path or TicketId.parse(ticket_id).relative_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            f"# {ticket_id}: {title}\n\n**Status**: {status}\n{extra}\n{body}", encoding="utf-8"
+        )
+        return path
+
+    return write
+
+
+@pytest.fixture
+def ticket_tree(write_ticket: TicketWriter, tmp_path: Path) -> Path:
+    """Fixture creating a small valid ticket tree and returning its tickets root.
+
+    INIT-0001 > EPIC-0001.1 > STORY-0001.1.1 > TASK-0001.1.1.1 (done), TASK-0001.1.1.2
+    """
+    write_ticket("INIT-0001", status="🟡 In Progress")
+    write_ticket("EPIC-0001.1", status="🟡 In Progress")
+    write_ticket("STORY-0001.1.1", status="🟡 In Progress", extra="**Story Points**: 3\n")
+    write_ticket("TASK-0001.1.1.1", status="✅ Complete", extra="**Estimated Hours**: 2\n")
+    write_ticket("TASK-0001.1.1.2", extra="**Estimated Hours**: 3\n")
+    return tmp_path / "docs" / "tickets"
+
+
+@pytest.fixture
+def workflow() -> Workflow:
+    """Fixture returning the default workflow."""
+    return Workflow.from_dict(DEFAULT_WORKFLOW)
+
+
+@pytest.fixture
+def git(monkeypatch: pytest.MonkeyPatch) -> GitRunner:
+    """Fixture returning a function that runs git in cwd and returns its stripped stdout.
+
+    Commits made during the test get a fixed author and committer.
+    """
+    for key in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{key}_NAME", "t")
+        monkeypatch.setenv(f"GIT_{key}_EMAIL", "t@t")
+
+    def run(*args: str, cwd: Path) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    return run
@@ -1,9 +1,17 @@
 """Unit tests for GitStory CLI commands (placeholder implementations)."""
 
+import json
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from typer.testing import CliRunner
 
 from gitstory.cli import app
+from gitstory.core import importer
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell plugins")
 
 
 @pytest.fixture
@@ -35,7 +43,7 @@ def test_review_command(runner):
 
     assert result.exit_code == 0
     assert "Reviewing EPIC-0001.3" in result.stdout
-    assert "Coming in EPIC-0001.2" in result.stdout
+    assert "Coming in" not in result.stdout
 
 
 def test_review_command_with_focus(runner):
@@ -46,35 +54,75 @@ def test_review_command_with_focus(runner):
     assert "Reviewing STORY-0001.2.4" in result.stdout
 
 
-def test_execute_command(runner):
+def test_review_command_shows_dependencies(runner, write_ticket, ticket_tree, monkeypatch):
+    """Test review lists blockers and dependents from the dependency graph."""
+    write_ticket("TASK-0001.1.1.2", extra="**Requires**: TASK-0001.1.1.1")
+    monkeypatch.chdir(ticket_tree.parent.parent)
+
+    result = runner.invoke(app, ["--json", "review", "TASK-0001.1.1.1"])
+
+    assert result.exit_code == 0
+    table = next(json.loads(line) for line in result.stdout.splitlines() if '"table"' in line)
+    assert table["rows"] == [["unblocks", "TASK-0001.1.1.2", "🔵 Not Started"]]
+
+
+def test_review_all_ranks_tickets_below_threshold(runner, ticket_tree, monkeypatch):
+    """Test review --all returns ranked rule-based scores, filtered by --threshold."""
+    monkeypatch.chdir(ticket_tree.parent.parent)
+
+    result = runner.invoke(app, ["--json", "review", "--all"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert data["tickets"] == 5
+    scores = [r["score"] for r in data["results"]]
+    assert scores == sorted(scores)
+    assert Path(".gitstory/cache/quality.json").is_file()
+
+    result = runner.invoke(app, ["--json", "review", "--all", "--threshold", "1"])
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert data["cached"] == 5
+    assert data["results"] and all(r["score"] < 1 for r in data["results"])
+
+
+def test_review_requires_ticket_or_all(runner):
+    """Test review rejects a missing ticket ID and --threshold without --all."""
+    assert runner.invoke(app, ["review"]).exit_code == 2
+    assert runner.invoke(app, ["review", "TASK-0001.1.1.1", "--threshold", "50"]).exit_code == 2
+
+
+def test_execute_command(runner, ticket_tree, monkeypatch):
     """Test execute command with ticket ID argument."""
-    result = runner.invoke(app, ["execute", "TASK-0001.2.4.3"])
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    result = runner.invoke(app, ["execute", "TASK-0001.1.1.2", "--no-commit"])
 
     assert result.exit_code == 0
-    assert "Executing TASK-0001.2.4.3" in result.stdout
-    assert "Coming in EPIC-0001.2" in result.stdout
+    assert "start_work" in result.stdout
+    assert "Executed 1 transition(s)" in result.stdout
 
 
-def test_execute_command_dry_run(runner):
+def test_execute_command_dry_run(runner, ticket_tree, monkeypatch):
     """Test execute command with --dry-run option."""
-    result = runner.invoke(app, ["execute", "TASK-0001.2.4.3", "--dry-run"])
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    result = runner.invoke(app, ["execute", "TASK-0001.1.1.2", "--dry-run"])
 
     assert result.exit_code == 0
-    assert "Executing TASK-0001.2.4.3" in result.stdout
+    assert "Dry run: 1 transition(s), 1 file(s)" in result.stdout
 
 
-def test_validate_command(runner):
-    """Test validate command with default target."""
+def test_validate_command(runner, tmp_path, monkeypatch):
+    """Test validate command with default target (missing workflow.yaml)."""
+    monkeypatch.chdir(tmp_path)
     result = runner.invoke(app, ["validate"])
 
-    assert result.exit_code == 0
+    assert result.exit_code == 2
     assert "Validating workflow" in result.stdout
-    assert "Coming in EPIC-0001.2" in result.stdout
 
 
-def test_validate_command_with_path(runner):
+def test_validate_command_with_path(runner, ticket_tree, monkeypatch):
     """Test validate command with --path option."""
-    result = runner.invoke(app, ["validate", "ticket", "--path", ".gitstory/tickets"])
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    result = runner.invoke(app, ["validate", "ticket", "--path", "docs/tickets"])
 
     assert result.exit_code == 0
     assert "Validating ticket" in result.stdout
@@ -97,6 +145,85 @@ def test_test_plugin_command_with_ticket(runner):
     assert "Testing plugin all_children_done" in result.stdout
 
 
+@posix_only
+def test_test_plugin_bench_reports_budget(runner, tmp_path, monkeypatch):
+    """Test test-plugin --bench measures a project plugin and enforces the budget."""
+    plugin = tmp_path / ".gitstory/plugins/guards/fast"
+    plugin.parent.mkdir(parents=True)
+    plugin.write_text("#!/bin/sh\necho '{\"passed\": true}'\n")
+    plugin.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["--json", "test-plugin", "fast", "--bench", "--runs", "3"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert data["runs"] == 3
+    assert data["ticket_id"] == "STORY-0001.1.1"
+    assert data["exit_codes"] == {"0": 3}
+
+    result = runner.invoke(app, ["test-plugin", "fast", "--bench", "--runs", "1", "--budget", "0"])
+    assert result.exit_code == 1
+    result = runner.invoke(app, ["test-plugin", "missing", "--bench"])
+    assert result.exit_code == 2
+
+
+@posix_only
+def test_test_plugin_matrix_streams_results(runner, ticket_tree, tmp_path, monkeypatch):
+    """Test test-plugin --matrix runs a plugin per matching ticket and streams NDJSON."""
+    plugin = tmp_path / ".gitstory/plugins/guards/picky"
+    plugin.parent.mkdir(parents=True)
+    plugin.write_text(
+        '#!/bin/sh\ncase "$1" in TASK-*) echo bad ;; *) echo \'{"passed": true}\' ;; esac\n'
+    )
+    plugin.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        app, ["--json", "test-plugin", "picky", "--matrix", "--status", "in_progress"]
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.strip().splitlines()]
+    rows = [line for line in lines if line.get("type") == "plugin_result"]
+    assert sorted(r["ticket_id"] for r in rows) == ["EPIC-0001.1", "INIT-0001", "STORY-0001.1.1"]
+    assert lines[-1]["data"]["counts"] == {"pass": 3, "fail": 0, "error": 0}
+
+    result = runner.invoke(app, ["--json", "test-plugin", "picky", "--matrix", "-j", "2"])
+    assert result.exit_code == 1
+    summary = json.loads(result.stdout.strip().splitlines()[-1])["details"]
+    # Rows arrive in completion order
+    assert list(summary["violations"]) == ["invalid_json"]
+    assert sorted(summary["violations"]["invalid_json"]) == ["TASK-0001.1.1.1", "TASK-0001.1.1.2"]
+
+
+def test_events_reports_branches_since_the_cursor(runner, ticket_tree, monkeypatch):
+    """Test events records a baseline, then reports only new branch events."""
+    project = ticket_tree.parent.parent
+    for key in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{key}_NAME", "t")
+        monkeypatch.setenv(f"GIT_{key}_EMAIL", "t@t")
+    monkeypatch.chdir(project)
+    for args in (["init", "-q", "-b", "main"], ["add", "."], ["commit", "-q", "-m", "init"]):
+        subprocess.run(["git", *args], check=True)
+
+    assert runner.invoke(app, ["events"]).exit_code == 0
+    subprocess.run(["git", "branch", "gitstory/TASK-0001.1.1.2"], check=True)
+    result = runner.invoke(app, ["--json", "events", "--dry-run"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert [(e["type"], e["ticket_id"]) for e in data["events"]] == [
+        ("branch_created", "TASK-0001.1.1.2")
+    ]
+    result = runner.invoke(app, ["--json", "events"])
+    assert json.loads(result.stdout.strip().splitlines()[-1])["data"]["outcomes"][0]["status"] == (
+        "ignored"
+    )
+    result = runner.invoke(app, ["--json", "events"])
+    assert json.loads(result.stdout.strip().splitlines()[-1])["data"]["events"] == []
+
+
 def test_init_command(runner):
     """Test init command."""
     result = runner.invoke(app, ["init"])
@@ -125,3 +252,196 @@ def test_all_commands_in_help(runner):
     assert "validate" in result.stdout
     assert "test-plugin" in result.stdout
     assert "init" in result.stdout
+
+
+def test_review_duplicates_lists_near_duplicate_pairs(runner, write_ticket, tmp_path, monkeypatch):
+    """Test review --duplicates reports similar tickets outside each other's lineage."""
+    body = "## Objective\n\nCache parsed ticket headers so validation skips unchanged files.\n"
+    write_ticket("STORY-0001.1.1", title="Header cache", body=body)
+    write_ticket("STORY-0001.1.2", title="Header cache", body=body)
+    write_ticket("STORY-0001.1.3", title="Mermaid graphs", body="## Objective\n\nDraw graphs.\n")
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["--json", "review", "--duplicates", "--similarity", "0.9"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert data["tickets"] == 3
+    assert [(r["ticket_id"], r["other_id"]) for r in data["results"]] == [
+        ("STORY-0001.1.2", "STORY-0001.1.1")
+    ]
+    assert Path(".gitstory/cache/minhash.snap").is_file()
+    assert runner.invoke(app, ["review", "EPIC-0001.3", "--duplicates"]).exit_code == 2
+
+
+def test_plan_warns_about_similar_existing_tickets(runner, write_ticket, tmp_path, monkeypatch):
+    """Test plan --title/--draft lists existing tickets that look like the draft."""
+    body = "## Objective\n\nCache parsed ticket headers so validation skips unchanged files.\n"
+    write_ticket("STORY-0001.1.1", title="Header cache", body=body)
+    (tmp_path / "draft.md").write_text(body)
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        app, ["--json", "plan", "EPIC-0001.1", "--title", "Header cache", "--draft", "draft.md"]
+    )
+
+    assert result.exit_code == 0
+    table = next(json.loads(line) for line in result.stdout.splitlines() if '"table"' in line)
+    assert table["rows"][0][1] == "STORY-0001.1.1"
+    assert "look like this draft" in result.stdout
+    assert runner.invoke(app, ["plan", "EPIC-0001.1", "--draft", "missing.md"]).exit_code == 2
+
+
+def test_stats_reports_epics_from_git_history(runner, ticket_tree, monkeypatch):
+    """Test stats mines status history from git and reports per-epic metrics."""
+    root = ticket_tree.parent.parent
+    monkeypatch.chdir(root)
+    for args in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "init"]):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], check=True)
+
+    result = runner.invoke(app, ["--json", "stats", "INIT-0001"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert data["mined"] == 1
+    assert [e["epic_id"] for e in data["epics"]] == ["EPIC-0001.1"]
+    assert data["epics"][0]["completed"] == 1
+    assert runner.invoke(app, ["stats", "bogus"]).exit_code == 1
+
+
+def test_export_streams_tickets(runner, ticket_tree, monkeypatch, tmp_path):
+    """Test export writes JSON Lines to stdout and CSV to --output."""
+    monkeypatch.chdir(ticket_tree.parent.parent)
+
+    result = runner.invoke(app, ["export", "--fields", "ticket_id,status"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert lines[0] == {"ticket_id": "INIT-0001", "status": "🟡 In Progress"}
+    assert len(lines) == 5
+
+    target = tmp_path / "tickets.csv"
+    result = runner.invoke(app, ["--json", "export", "-f", "csv", "-o", str(target)])
+    assert json.loads(result.stdout)["data"]["tickets"] == 5
+    assert target.read_text().splitlines()[0] == ",".join(
+        ["ticket_id", "type", "title", "status", "parent", "path"]
+    )
+    assert runner.invoke(app, ["export", "-f", "xml"]).exit_code == 2
+
+
+def test_import_creates_tickets_from_jsonl(runner, ticket_tree, monkeypatch, tmp_path):
+    """Test import reads JSON Lines and reports created tickets and skipped lines."""
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    dump = tmp_path / "dump.jsonl"
+    dump.write_text(
+        '{"key": "S", "parent": "EPIC-0001.1", "title": "Imported story"}\n'
+        '{"parent_key": "S", "title": "Imported task"}\n'
+    )
+
+    result = runner.invoke(app, ["--json", "import", str(dump)])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert [c["ticket_id"] for c in data["created"]] == ["STORY-0001.1.2", "TASK-0001.1.2.1"]
+
+    result = runner.invoke(app, ["--json", "import", "-"], input='{"title": ""}\n')
+    assert result.exit_code == 1
+    assert json.loads(result.stdout)["details"]["errors"][0]["line"] == 1
+    assert runner.invoke(app, ["import", "missing.jsonl"]).exit_code == 2
+
+
+def test_import_failed_batch_asks_to_resume(runner, ticket_tree, monkeypatch):
+    """Test import reports a failed write with exit code 2 and how to resume."""
+
+    def fail(contents):
+        raise OSError("disk full")
+
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    monkeypatch.setattr(importer, "_write_batch", fail)
+
+    result = runner.invoke(app, ["--json", "import", "-"], input='{"title": "Lost?"}\n')
+
+    assert result.exit_code == 2
+    message = json.loads(result.stdout)["message"]
+    assert "disk full" in message
+    assert "run it again to resume" in message
+
+
+def test_plan_spec_creates_subtree(runner, ticket_tree, monkeypatch, tmp_path):
+    """Test plan --spec creates every ticket of a YAML spec below the planned ticket."""
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    spec = tmp_path / "stories.yaml"
+    spec.write_text("- title: Exports\n  children:\n    - title: CSV\n    - title: JSONL\n")
+
+    result = runner.invoke(app, ["--json", "plan", "EPIC-0001.1", "--spec", str(spec)])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert [c["ticket_id"] for c in data["created"]] == [
+        "STORY-0001.1.2",
+        "TASK-0001.1.2.1",
+        "TASK-0001.1.2.2",
+    ]
+    spec.write_text("- children: []\n")
+    assert runner.invoke(app, ["plan", "EPIC-0001.1", "--spec", str(spec)]).exit_code == 1
+
+
+def test_plan_spec_refuses_likely_duplicates(runner, write_ticket, tmp_path, monkeypatch):
+    """Test plan --spec creates nothing when a spec looks like an existing ticket."""
+    body = "## Objective\n\nCache parsed ticket headers so validation skips unchanged files.\n"
+    write_ticket("EPIC-0001.1", status="🟡 In Progress")
+    write_ticket("STORY-0001.1.1", title="Header cache", body=body)
+    spec = tmp_path / "stories.yaml"
+    spec.write_text(json.dumps([{"title": "Header cache", "body": body}, {"title": "Exports"}]))
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["--json", "plan", "EPIC-0001.1", "--spec", str(spec)])
+
+    assert result.exit_code == 1
+    [duplicate] = json.loads(result.stdout.strip().splitlines()[-1])["details"]["duplicates"]
+    assert (duplicate["spec"], duplicate["ticket_id"]) == ("1", "STORY-0001.1.1")
+    assert not (tmp_path / "docs/tickets/INIT-0001/EPIC-0001.1/STORY-0001.1.2").exists()
+
+    args = ["--json", "plan", "EPIC-0001.1", "--spec", str(spec), "--allow-duplicates"]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.stdout
+    assert len(json.loads(result.stdout.strip().splitlines()[-1])["data"]["created"]) == 2
+
+
+def test_ids_allocates_and_checks(runner, ticket_tree, monkeypatch):
+    """Test ids hands out distinct IDs across runs and checks the tree."""
+    monkeypatch.chdir(ticket_tree.parent.parent)
+
+    result = runner.invoke(app, ["--json", "ids", "EPIC-0001.1", "--count", "2"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["data"]["ids"] == ["STORY-0001.1.2", "STORY-0001.1.3"]
+    result = runner.invoke(app, ["--json", "ids", "EPIC-0001.1"])
+    assert json.loads(result.stdout)["data"]["ids"] == ["STORY-0001.1.4"]
+
+    assert runner.invoke(app, ["ids", "--check"]).exit_code == 0
+    assert runner.invoke(app, ["ids", "TASK-0001.1.1.1"]).exit_code == 1
+    assert runner.invoke(app, ["ids"]).exit_code == 1
+
+
+def test_execute_worktrees_reports_results_and_worktrees(runner, ticket_tree, monkeypatch):
+    """Test execute --worktrees commits each ticket on its own branch and reports the pool."""
+    root = ticket_tree.parent.parent
+    monkeypatch.chdir(root)
+    for key in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{key}_NAME", "t")
+        monkeypatch.setenv(f"GIT_{key}_EMAIL", "t@t")
+    (root / ".gitignore").write_text(".gitstory/cache/\n")
+    for args in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "init"]):
+        subprocess.run(["git", *args], check=True)
+
+    result = runner.invoke(
+        app, ["--json", "execute", "TASK-0001.1.1.2", "--worktrees", "--to", "in_progress"]
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert data["results"][0]["status"] == "done"
+    assert data["worktrees"][0]["branch"] == "gitstory/TASK-0001.1.1.2"
+    assert data["worktrees"][0]["status"] == "clean"
+    dry_run = ["execute", "TASK-0001.1.1.2", "--worktrees", "--dry-run"]
+    assert runner.invoke(app, dry_run).exit_code == 1
@@ -0,0 +1,136 @@
+"""Unit tests for the execute command."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from gitstory.cli import app
+from gitstory.core import execute as execute_core
+
+STORY_DIR = "docs/tickets/INIT-0001/EPIC-0001.1/STORY-0001.1.1"
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Fixture for typer CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def project(ticket_tree, git, monkeypatch):
+    """Run commands from a git repository with the ticket tree committed."""
+    root = ticket_tree.parent.parent
+    monkeypatch.chdir(root)
+    (root / ".gitignore").write_text(".gitstory/cache/\n")
+    git("init", "-q", "-b", "main", cwd=root)
+    git("add", ".", cwd=root)
+    git("commit", "-q", "-m", "init", cwd=root)
+    return root
+
+
+def test_execute_many_tickets_single_commit(runner, project, git):
+    result = runner.invoke(
+        app,
+        ["--json", "execute", "TASK-0001.1.1.2", "STORY-0001.1.1", "--transition", "cancel"],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    data = json.loads(result.stdout)["data"]
+    assert [c["ticket_id"] for c in data["changes"]] == ["TASK-0001.1.1.2", "STORY-0001.1.1"]
+    assert git("rev-list", "--count", "HEAD", cwd=project) == "2"
+    assert git("rev-parse", "HEAD", cwd=project) == data["commit"]
+    assert git("status", "--porcelain", cwd=project) == ""
+    assert "🟢 Done" in (project / STORY_DIR / "TASK-0001.1.1.2.md").read_text(encoding="utf-8")
+
+
+def test_execute_reports_unblocked_tasks(runner, project, write_ticket):
+    write_ticket("TASK-0001.1.1.3", extra="**Requires**: TASK-0001.1.1.2\n")
+
+    result = runner.invoke(app, ["--json", "execute", "TASK-0001.1.1.2", "-t", "cancel"])
+
+    assert result.exit_code == 0, result.stdout
+    data = json.loads(result.stdout)["data"]
+    assert data["unblocked"] == ["TASK-0001.1.1.3"]
+    assert data["next"] == "TASK-0001.1.1.3"
+
+
+def test_execute_reports_unblocked_tasks_after_a_conflict_retry(
+    runner, project, write_ticket, monkeypatch
+):
+    """Unblocked tasks come from the index the retry re-planned on, not the first one."""
+    real_apply = execute_core.apply_plan
+    calls = []
+
+    def apply_after_concurrent_edit(plan, tickets_root):
+        if not calls:
+            task = project / STORY_DIR / "TASK-0001.1.1.2.md"
+            task.write_text(task.read_text(encoding="utf-8") + "\nEdited.\n", encoding="utf-8")
+            write_ticket("TASK-0001.1.1.3", extra="**Requires**: TASK-0001.1.1.2\n")
+        calls.append(plan)
+        return real_apply(plan, tickets_root)
+
+    monkeypatch.setattr(execute_core, "apply_plan", apply_after_concurrent_edit)
+    monkeypatch.setattr(execute_core, "CONFLICT_BACKOFF", 0)
+
+    result = runner.invoke(app, ["--json", "execute", "TASK-0001.1.1.2", "-t", "cancel"])
+
+    assert result.exit_code == 0, result.stdout
+    assert len(calls) == 2
+    assert json.loads(result.stdout)["data"]["unblocked"] == ["TASK-0001.1.1.3"]
+
+
+def test_execute_reads_ndjson_from_stdin(runner, project, git):
+    stdin = '{"ticket_id": "TASK-0001.1.1.2"}\n\n{"ticket_id": "EPIC-0001.1", "to": "blocked"}\n'
+
+    result = runner.invoke(app, ["--json", "execute", "-", "--no-commit"], input=stdin)
+
+    assert result.exit_code == 0, result.stdout
+    changes = json.loads(result.stdout)["data"]["changes"]
+    assert [(c["ticket_id"], c["transition"]) for c in changes] == [
+        ("TASK-0001.1.1.2", "start_work"),
+        ("EPIC-0001.1", "encounter_blocker"),
+    ]
+    assert git("rev-list", "--count", "HEAD", cwd=project) == "1"
+
+
+def test_execute_failed_guard_changes_nothing(runner, project, git):
+    result = runner.invoke(app, ["execute", "STORY-0001.1.1", "--to", "done"])
+
+    assert result.exit_code == 1
+    assert "all_children_done" in result.stdout
+    assert "Nothing executed" in result.stdout
+    assert git("status", "--porcelain", cwd=project) == ""
+
+
+def test_execute_dry_run_writes_nothing(runner, project, git):
+    result = runner.invoke(app, ["execute", "TASK-0001.1.1.2", "--to", "in_progress", "--dry-run"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Dry run: 1 transition(s)" in result.stdout
+    assert git("status", "--porcelain", cwd=project) == ""
+
+
+def test_execute_invalid_stdin(runner, project):
+    result = runner.invoke(app, ["execute", "-"], input="not json\n")
+
+    assert result.exit_code == 1
+    assert "Invalid NDJSON on stdin line 1" in result.stdout
+
+
+def test_execute_invalid_workflow(runner, project):
+    (project / ".gitstory").mkdir(exist_ok=True)
+    (project / ".gitstory/workflow.yaml").write_text("states: [unclosed\n")
+
+    result = runner.invoke(app, ["--json", "execute", "TASK-0001.1.1.2", "--transition", "cancel"])
+
+    assert result.exit_code == 2
+    assert "Invalid workflow .gitstory/workflow.yaml" in json.loads(result.stdout)["message"]
+
+
+def test_execute_skips_files_without_changes(runner, project, git):
+    result = runner.invoke(app, ["execute", "TASK-0001.1.1.1", "--transition", "cancel"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "no file needed a change" in result.stdout
+    assert git("rev-list", "--count", "HEAD", cwd=project) == "1"
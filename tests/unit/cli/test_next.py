@@ -0,0 +1,142 @@
+"""Unit tests for the next command."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+from typer.testing import CliRunner
+
+from gitstory.cli import app
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Fixture for typer CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def project(ticket_tree, monkeypatch):
+    """Run commands from a git repository containing docs/tickets."""
+    root = ticket_tree.parent.parent
+    monkeypatch.chdir(root)
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=root, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=t",
+            "-c",
+            "user.email=t@t",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "init",
+        ],
+        cwd=root,
+        check=True,
+    )
+    return root
+
+
+def _data(result):
+    return json.loads(result.stdout.strip().splitlines()[-1])["data"]
+
+
+def test_next_returns_task_with_context(runner, project):
+    """The next task comes with story context, position and branch status."""
+    result = runner.invoke(app, ["--json", "next"])
+
+    assert result.exit_code == 0
+    data = _data(result)
+    assert data["task"]["id"] == "TASK-0001.1.1.2"
+    assert data["task"]["estimated_hours"] == "3"
+    assert data["story"]["id"] == "STORY-0001.1.1"
+    assert (data["position"], data["total"], data["ready"]) == (2, 2, 1)
+    assert data["branch"] == {
+        "name": "STORY-0001.1.1",
+        "exists": False,
+        "current": "main",
+        "checked_out": False,
+    }
+
+
+def test_next_reports_existing_story_branch(runner, project):
+    """A checked-out story branch is reported as such."""
+    subprocess.run(["git", "checkout", "-q", "-b", "STORY-0001.1.1"], cwd=project, check=True)
+
+    branch = _data(runner.invoke(app, ["--json", "next"]))["branch"]
+
+    assert branch["exists"] and branch["checked_out"]
+
+
+def test_next_with_scope_and_limit(runner, project, write_ticket):
+    """A scope restricts the queue; --limit lists the upcoming tasks."""
+    write_ticket("STORY-0001.1.2")
+    write_ticket("TASK-0001.1.2.1")
+    write_ticket("TASK-0001.1.2.2")
+
+    data = _data(runner.invoke(app, ["--json", "next", "STORY-0001.1.2", "--limit", "5"]))
+
+    assert data["task"]["id"] == "TASK-0001.1.2.1"
+    assert data["queue"] == ["TASK-0001.1.2.1", "TASK-0001.1.2.2"]
+
+
+def test_next_nothing_ready(runner, project, write_ticket):
+    """When every task is done, no task is returned."""
+    write_ticket("TASK-0001.1.1.2", status="✅ Complete")
+
+    result = runner.invoke(app, ["--json", "next"])
+
+    assert result.exit_code == 0
+    assert _data(result) == {"task": None, "ready": 0}
+
+
+def test_next_invalid_workflow(runner, project):
+    (project / ".gitstory").mkdir(exist_ok=True)
+    (project / ".gitstory/workflow.yaml").write_text("workflow:\n  states: [not, a, mapping]\n")
+
+    result = runner.invoke(app, ["next"])
+
+    assert result.exit_code == 2
+    assert "Invalid workflow" in result.stdout
+    (project / "other.yaml").write_text("workflow:\n  states: [not, a, mapping]\n")
+    (project / ".gitstory/workflow.yaml").unlink()
+    result = runner.invoke(app, ["next", "--workflow", "other.yaml"])
+    assert result.exit_code == 2
+    assert "other.yaml" in result.stdout
+
+
+def test_next_rich_output(runner, project):
+    """Rich mode prints a context table."""
+    result = runner.invoke(app, ["next"])
+
+    assert result.exit_code == 0
+    assert "TASK-0001.1.1.2" in result.stdout
+    assert "STORY-0001.1.1 (new)" in result.stdout
+
+
+def test_next_invalid_scope(runner, project):
+    """Malformed or unknown scopes exit with code 1."""
+    assert runner.invoke(app, ["next", "STORY-1"]).exit_code == 1
+    assert runner.invoke(app, ["next", "STORY-0009.1.1"]).exit_code == 1
+
+
+def test_next_lists_each_root(runner, project):
+    """--all-roots reports the next task of every tickets root."""
+    shutil.copytree(project / "docs/tickets", project / "teams/web/docs/tickets")
+
+    result = runner.invoke(app, ["--json", "next", "--all-roots"])
+
+    assert result.exit_code == 0
+    data = _data(result)
+    assert [(r["root"], r["task"]["id"]) for r in data["roots"]] == [
+        (".", "TASK-0001.1.1.2"),
+        ("teams/web", "TASK-0001.1.1.2"),
+    ]
+    assert data["roots"][1]["task"]["path"] == (
+        "teams/web/docs/tickets/INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"
+    )
+    assert data["ready"] == 2
@@ -280,6 +280,30 @@ def test_debug_method_json_mode(capsys):
     assert result["message"] == "Checking file paths..."
 
 
+def test_event_method_json_mode(capsys):
+    """Test event() emits one typed JSON line in JSON mode."""
+    from gitstory.cli.output import OutputFormatter
+
+    formatter = OutputFormatter(json_mode=True)
+    formatter.event("validation", {"valid": True, "revalidated": ["a.md"]})
+
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == {
+        "type": "validation",
+        "valid": True,
+        "revalidated": ["a.md"],
+    }
+
+
+def test_event_method_rich_mode(capsys):
+    """Test event() is silent in rich mode."""
+    from gitstory.cli.output import OutputFormatter
+
+    OutputFormatter(json_mode=False).event("validation", {"valid": True})
+
+    assert capsys.readouterr().out == ""
+
+
 def test_progress_context_manager_rich_mode(capsys):
     """Test progress() context manager in rich mode."""
     from gitstory.cli.output import OutputFormatter
@@ -287,27 +311,78 @@ def test_progress_context_manager_rich_mode(capsys):
     formatter = OutputFormatter(json_mode=False)
 
     with formatter.progress("Planning epic", total=5) as progress:
-        # Should be a no-op context manager
-        assert progress is not None
+        for _ in range(5):
+            progress.advance()
 
     captured = capsys.readouterr()
-    # Rich mode should print description
+    # Rich mode should print description and final count
     assert "Planning epic" in captured.out
+    assert "5/5" in captured.out
 
 
 def test_progress_context_manager_json_mode(capsys):
-    """Test progress() context manager in JSON mode (silent)."""
+    """Test progress() context manager in JSON mode emits a final progress event."""
     from gitstory.cli.output import OutputFormatter
 
     formatter = OutputFormatter(json_mode=True)
 
     with formatter.progress("Planning epic", total=5) as progress:
-        # Should be a no-op context manager
-        assert progress is not None
+        progress.advance(2)
+
+    captured = capsys.readouterr()
+    events = [json.loads(line) for line in captured.out.splitlines()]
+    assert events[-1]["type"] == "progress"
+    assert events[-1]["description"] == "Planning epic"
+    assert events[-1]["completed"] == 2
+    assert events[-1]["total"] == 5
+    assert "rate" in events[-1]
+    assert "eta" in events[-1]
+
+
+def test_progress_json_mode_coalesces_events(capsys):
+    """Test that tight-loop updates are coalesced to the configured event rate."""
+    from gitstory.cli.output import OutputFormatter
+
+    formatter = OutputFormatter(json_mode=True)
+
+    with formatter.progress("Validating", total=100_000, events_per_second=2) as progress:
+        for _ in range(100_000):
+            progress.advance()
 
     captured = capsys.readouterr()
-    # JSON mode should be silent
-    assert captured.out == ""
+    events = [json.loads(line) for line in captured.out.splitlines()]
+    # Loop finishes well under a second, so only the final event is emitted
+    assert len(events) <= 3
+    assert events[-1]["completed"] == 100_000
+    assert events[-1]["eta"] == 0.0
+
+
+def test_progress_tracker_emits_after_interval():
+    """Test ProgressTracker only calls emit once the interval has elapsed."""
+    from gitstory.cli.output import ProgressTracker
+
+    emitted: list[int] = []
+    tracker = ProgressTracker("Scan", 10, interval=0.0, emit=lambda t: emitted.append(t.completed))
+    tracker.advance()
+    tracker.advance(3)
+    assert emitted == [1, 4]
+
+    slow: list[int] = []
+    tracker = ProgressTracker("Scan", 10, interval=3600.0, emit=lambda t: slow.append(t.completed))
+    tracker.advance(5)
+    assert slow == []
+    tracker.finish()
+    assert slow == [5]
+
+
+def test_progress_tracker_snapshot_without_progress():
+    """Test snapshot reports no ETA before any items complete."""
+    from gitstory.cli.output import ProgressTracker
+
+    tracker = ProgressTracker("Scan", 10, interval=1.0, emit=lambda t: None)
+    snapshot = tracker.snapshot()
+    assert snapshot["completed"] == 0
+    assert snapshot["eta"] is None
 
 
 def test_table_method_rich_mode(capsys):
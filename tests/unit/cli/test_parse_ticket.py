@@ -0,0 +1,62 @@
+"""Unit tests for the parse-ticket command."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from gitstory.cli import app
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Fixture for typer CLI runner."""
+    return CliRunner()
+
+
+def test_parse_ticket_json_mode(runner):
+    """Test single-ID parsing emits metadata in JSON mode."""
+    result = runner.invoke(app, ["--json", "parse-ticket", "TASK-0001.2.3.4"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)["data"]
+    assert data["type"] == "task"
+    assert data["parent_id"] == "STORY-0001.2.3"
+    assert data["path"].endswith("STORY-0001.2.3/TASK-0001.2.3.4.md")
+
+
+def test_parse_ticket_invalid_id(runner):
+    """Test invalid IDs exit with code 1."""
+    result = runner.invoke(app, ["--json", "parse-ticket", "STORY-999"])
+
+    assert result.exit_code == 1
+    assert "Invalid ticket ID format" in json.loads(result.stdout)["message"]
+
+
+def test_parse_ticket_batch_emits_ndjson(runner):
+    """Test batch mode emits one NDJSON line per input ID, in order."""
+    ids = [f"TASK-0001.1.1.{n}" for n in range(1, 1001)]
+    result = runner.invoke(app, ["parse-ticket", "--batch"], input="\n".join(ids) + "\n\n")
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["ticket_id"] for line in lines] == ids
+
+
+def test_parse_ticket_batch_reports_invalid_ids(runner):
+    """Test batch mode keeps going past invalid IDs and exits 1."""
+    result = runner.invoke(
+        app, ["parse-ticket", "--batch", "--root", "tickets"], input="INIT-0002\nnope\n"
+    )
+
+    assert result.exit_code == 1
+    first, second = (json.loads(line) for line in result.stdout.splitlines())
+    assert first["path"] == "tickets/INIT-0002/README.md"
+    assert second == {"ticket_id": "nope", "error": "Invalid ticket ID format: nope"}
+
+
+def test_parse_ticket_requires_id(runner):
+    """Test missing ID without --batch is an error."""
+    result = runner.invoke(app, ["parse-ticket"])
+
+    assert result.exit_code == 1
@@ -0,0 +1,198 @@
+"""Unit tests for the validate command."""
+
+import json
+import os
+import shutil
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+from gitstory.cli import app
+
+WORKFLOW = """\
+metadata:
+  config_version: "1.0"
+workflow:
+  states:
+    todo: {name: Todo, emoji: "🔵", type: start}
+    done: {name: Done, emoji: "✅", type: end}
+  transitions:
+    - {id: finish, from: todo, to: done}
+"""
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Fixture for typer CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def project(ticket_tree, monkeypatch):
+    """Run commands from the directory containing docs/tickets."""
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    return ticket_tree.parent.parent
+
+
+def test_validate_workflow_valid(runner, project):
+    """A valid workflow.yaml passes."""
+    (project / ".gitstory").mkdir()
+    (project / ".gitstory" / "workflow.yaml").write_text(WORKFLOW)
+
+    result = runner.invoke(app, ["validate", "workflow"])
+
+    assert result.exit_code == 0
+    assert "is valid" in result.stdout
+
+
+def test_validate_workflow_reports_issues_as_json(runner, project):
+    """Workflow errors are reported with line numbers in JSON mode."""
+    (project / ".gitstory").mkdir()
+    (project / ".gitstory" / "workflow.yaml").write_text(WORKFLOW.replace("to: done", "to: gone"))
+
+    result = runner.invoke(app, ["--json", "validate", "workflow"])
+
+    assert result.exit_code == 1
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    assert data["details"]["valid"] is False
+    assert data["details"]["errors"][0]["type"] == "undefined_state"
+    assert data["details"]["errors"][0]["line"] == 8
+
+
+def test_validate_ticket_reports_errors(runner, project, write_ticket):
+    """Invalid tickets fail validation with exit code 1."""
+    write_ticket("TASK-0001.1.1.2", status="Someday")
+
+    result = runner.invoke(app, ["validate", "ticket"])
+
+    assert result.exit_code == 1
+    assert "unknown_status" in result.stdout
+
+
+def test_validate_ticket_changed_uses_manifest(runner, project, write_ticket):
+    """--changed revalidates only tickets changed since the previous run."""
+    assert runner.invoke(app, ["validate", "ticket"]).exit_code == 0
+    assert (project / ".gitstory" / "cache" / "validation.json").is_file()
+
+    result = runner.invoke(app, ["--json", "validate", "ticket", "--changed"])
+    assert json.loads(result.stdout.strip().splitlines()[-1])["data"]["revalidated"] == 0
+
+    write_ticket("TASK-0001.1.1.2", status="🟡 In Progress", title="Edited")
+    result = runner.invoke(app, ["--json", "validate", "ticket", "--changed"])
+    data = json.loads(result.stdout.strip().splitlines()[-1])["data"]
+    assert data["tickets"] == 5
+    assert data["revalidated"] == 4
+
+
+def test_validate_ticket_scoped_path(runner, project, write_ticket):
+    """A path inside the tree only reports issues under that path."""
+    write_ticket("INIT-0002", status="Someday")
+
+    assert (
+        runner.invoke(app, ["validate", "ticket", "--path", "docs/tickets/INIT-0001"]).exit_code
+        == 0
+    )
+    assert (
+        runner.invoke(app, ["validate", "ticket", "--path", "docs/tickets/INIT-0002"]).exit_code
+        == 1
+    )
+
+
+def test_validate_base_requires_changed(runner, project):
+    """--base without --changed is a usage error."""
+    result = runner.invoke(app, ["validate", "ticket", "--base", "main"])
+
+    assert result.exit_code == 2
+    assert "--base requires --changed" in result.stdout
+
+
+def test_validate_unknown_target(runner, project):
+    """Unknown targets exit with code 2."""
+    result = runner.invoke(app, ["validate", "everything"])
+
+    assert result.exit_code == 2
+    assert "Unknown validation target" in result.stdout
+
+
+def test_validate_watch_streams_incremental_results(runner, project, write_ticket, monkeypatch):
+    """--watch streams one validation event per batch of changes."""
+
+    def fake_changes(watcher):
+        yield {str(write_ticket("TASK-0001.1.1.2", status="Someday"))}
+        yield {"unchanged"}
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("gitstory.cli.validate.watch_changes", fake_changes)
+
+    result = runner.invoke(app, ["--json", "validate", "ticket", "--watch", "--poll"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.strip().splitlines()]
+    events = [line for line in lines if line.get("type") == "validation"]
+    assert len(events) == 2
+    assert events[0]["valid"] is True
+    assert len(events[0]["revalidated"]) == 5
+    assert events[1]["valid"] is False
+    assert events[1]["errors"][0]["type"] == "unknown_status"
+    assert "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md" in events[1]["revalidated"]
+    assert lines[-1]["message"] == "Stopped watching"
+
+
+def test_validate_watch_only_touches_changed_paths(runner, project, monkeypatch):
+    """A watch batch stats only the reported files and drops removed tickets and trees."""
+    story = project / "docs/tickets/INIT-0001/EPIC-0001.1/STORY-0001.1.1"
+    stats = []
+
+    def fake_changes(watcher):
+        spy = SimpleNamespace(stat=lambda path: stats.append(path) or os.stat(path))
+        monkeypatch.setattr("gitstory.core.validation.os", spy)
+        (story / "TASK-0001.1.1.2.md").unlink()
+        yield {str(story / "TASK-0001.1.1.2.md")}
+        shutil.rmtree(story)
+        yield {str(story)}
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("gitstory.cli.validate.watch_changes", fake_changes)
+
+    result = runner.invoke(app, ["--json", "validate", "ticket", "--watch", "--poll"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.strip().splitlines()]
+    events = [line for line in lines if line.get("type") == "validation"]
+    assert [event["tickets"] for event in events] == [5, 4, 2]
+    assert stats == []
+
+
+def test_validate_watch_requires_ticket_target(runner, project):
+    """--watch is rejected for other targets, and --poll requires --watch."""
+    assert runner.invoke(app, ["validate", "workflow", "--watch"]).exit_code == 2
+    assert runner.invoke(app, ["validate", "ticket", "--poll"]).exit_code == 2
+
+
+def test_validate_all_roots_merges_reports(runner, project, write_ticket):
+    """Every root is validated with its own workflow and reported once."""
+    shutil.copytree(project / "docs/tickets", project / "teams/web/docs/tickets")
+    (project / "teams/web/.gitstory").mkdir()
+    (project / "teams/web/.gitstory/workflow.yaml").write_text(WORKFLOW)
+    write_ticket("TASK-0001.1.1.3", status="🟣 Unknown")
+
+    result = runner.invoke(app, ["--json", "validate", "ticket", "--all-roots"])
+
+    assert result.exit_code == 1
+    details = json.loads(result.stdout.strip().splitlines()[-1])["details"]
+    assert details["tickets"] == 11
+    assert [(r["root"], r["valid"]) for r in details["roots"]] == [
+        (".", False),
+        ("teams/web", False),
+    ]
+    assert details["roots"][0]["errors"][0]["path"].endswith("TASK-0001.1.1.3.md")
+    # The web team's workflow has no In Progress state
+    assert {e["type"] for e in details["roots"][1]["errors"]} == {"unknown_status"}
+    assert (project / "teams/web/.gitstory/cache/validation.json").is_file()
+
+
+def test_validate_root_rejects_other_targets(runner, project):
+    result = runner.invoke(app, ["validate", "workflow", "--root", "."])
+
+    assert result.exit_code == 2
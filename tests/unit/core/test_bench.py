@@ -0,0 +1,49 @@
+"""Unit tests for plugin benchmarking."""
+
+import json
+import sys
+
+import pytest
+
+from gitstory.core.bench import BenchBudget, bench_plugin, percentile, write_fixture
+
+# Guard that checks the fixture story's tasks are all done
+_GUARD = """#!/bin/sh
+if grep -q 'In Progress' docs/tickets/*/*/STORY-0001.1.1/TASK-*.md; then
+  echo '{"passed": false, "message": "open tasks"}'; exit 1
+fi
+echo '{"passed": true}'
+"""
+
+
+def test_percentile_uses_nearest_rank():
+    values = [0.5, 0.1, 0.4, 0.2, 0.3]
+
+    assert percentile(values, 50) == 0.3
+    assert percentile(values, 95) == 0.5
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell plugin")
+def test_bench_measures_runs_against_fixture(tmp_path):
+    plugin = tmp_path / "guard.sh"
+    plugin.write_text(_GUARD)
+    plugin.chmod(0o755)
+    project = tmp_path / "project"
+    ticket_id = write_fixture(project)
+
+    report = bench_plugin("guard", {"file": str(plugin)}, ticket_id, runs=5, warmup=1, cwd=project)
+
+    assert len(report.wall) == 5
+    assert report.exit_codes == {1: 5}
+    assert report.p50 <= report.p95 <= report.max
+    assert max(report.output_bytes) == len('{"passed": false, "message": "open tasks"}\n')
+    assert report.peak_rss_bytes > 0
+    assert report.violations == []
+    assert json.dumps(report.to_dict())
+
+    tight = BenchBudget(max_seconds=0.0, max_output_bytes=10)
+    report = bench_plugin(
+        "guard", {"file": str(plugin)}, ticket_id, runs=1, warmup=0, budget=tight, cwd=project
+    )
+    assert len(report.violations) == 2
@@ -0,0 +1,112 @@
+"""Unit tests for incremental git ref event detection."""
+
+import pytest
+import yaml
+
+from gitstory.core.events import EventCursor, deliver_events, detect_ref_events
+from gitstory.core.snapshot import load_index
+from gitstory.core.workflow import DEFAULT_WORKFLOW, Workflow
+
+
+@pytest.fixture
+def repo(ticket_tree, git):
+    """Project with the ticket tree committed on main."""
+    project = ticket_tree.parent.parent
+    git("init", "-q", "-b", "main", cwd=project)
+    git("add", ".", cwd=project)
+    git("commit", "-q", "-m", "init", cwd=project)
+    return project
+
+
+def _work(git, repo, branch, name):
+    git("checkout", "-q", "-b", branch, "main", cwd=repo)
+    (repo / name).write_text(name)
+    git("add", name, cwd=repo)
+    git("commit", "-q", "-m", name, cwd=repo)
+    git("checkout", "-q", "main", cwd=repo)
+
+
+def _events(events):
+    return [(e.type, e.branch, e.ticket_id) for e in events]
+
+
+def test_only_changes_since_the_cursor_are_reported(repo, git, tmp_path):
+    events, cursor = detect_ref_events(repo, None)
+    assert events == []
+    cursor.write(tmp_path / "events.json")
+    cursor = EventCursor.read(tmp_path / "events.json")
+
+    git("branch", "gitstory/STORY-0001.1.1", cwd=repo)
+    _work(git, repo, "gitstory/TASK-0001.1.1.2", "a.txt")
+    _work(git, repo, "spike", "b.txt")
+    events, cursor = detect_ref_events(repo, cursor)
+    assert _events(events) == [
+        ("branch_created", "gitstory/STORY-0001.1.1", "STORY-0001.1.1"),
+        ("branch_created", "gitstory/TASK-0001.1.1.2", "TASK-0001.1.1.2"),
+        ("branch_created", "spike", None),
+    ]
+
+    git("merge", "-q", "--no-ff", "-m", "merge", "gitstory/TASK-0001.1.1.2", cwd=repo)
+    git("merge", "-q", "--no-ff", "-m", "merge spike", "spike", cwd=repo)
+    git("branch", "-D", "spike", cwd=repo)
+    events, cursor = detect_ref_events(repo, cursor)
+    assert _events(events) == [
+        ("branch_merged", "gitstory/TASK-0001.1.1.2", "TASK-0001.1.1.2"),
+        ("branch_merged", "spike", None),
+        ("branch_deleted", "spike", None),
+    ]
+    assert cursor.scanned == 4
+
+    events, cursor = detect_ref_events(repo, cursor)
+    assert events == []
+    assert cursor.scanned == 0
+
+    # A rewritten target is rescanned; merged branches are not reported again
+    _work(git, repo, "late", "c.txt")
+    git("reset", "-q", "--hard", "HEAD~1", cwd=repo)
+    git("merge", "-q", "--no-ff", "-m", "merge late", "late", cwd=repo)
+    events, cursor = detect_ref_events(repo, cursor)
+    assert _events(events) == [("branch_created", "late", None), ("branch_merged", "late", None)]
+
+    # ...including merged branches deleted while the target was rewritten
+    git("branch", "-D", "gitstory/TASK-0001.1.1.2", cwd=repo)
+    git("commit", "-q", "--amend", "-m", "merge late again", cwd=repo)
+    events, cursor = detect_ref_events(repo, cursor)
+    assert _events(events) == [
+        ("branch_deleted", "gitstory/TASK-0001.1.1.2", "TASK-0001.1.1.2"),
+    ]
+
+
+def test_events_take_the_transitions_declared_on_them(repo, git):
+    data = yaml.safe_load(yaml.safe_dump(DEFAULT_WORKFLOW))
+    data["workflow"]["transitions"] += [
+        {
+            "id": "branch_started",
+            "from": "not_started",
+            "to": "in_progress",
+            "on": "branch_created",
+        },
+        {"id": "branch_landed", "from": "in_progress", "to": "done", "on": "branch_merged"},
+    ]
+    workflow = Workflow.from_dict(data)
+    tickets_root = repo / "docs/tickets"
+    _, cursor = detect_ref_events(repo, None)
+
+    _work(git, repo, "gitstory/TASK-0001.1.1.2", "a.txt")
+    git("merge", "-q", "--no-ff", "-m", "merge", "gitstory/TASK-0001.1.1.2", cwd=repo)
+    git("branch", "other", cwd=repo)
+    events, cursor = detect_ref_events(repo, cursor)
+    outcomes, written = deliver_events(
+        events, tickets_root, workflow, lambda: load_index(tickets_root, save=False)
+    )
+
+    assert [(o["type"], o["transition"], o["status"]) for o in outcomes] == [
+        ("branch_created", "branch_started", "applied"),
+        ("branch_merged", "branch_landed", "applied"),
+        ("branch_created", None, "ignored"),
+    ]
+    assert written
+    assert (
+        "Done"
+        in (tickets_root / "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md").read_text()
+    )
@@ -0,0 +1,177 @@
+"""Unit tests for bulk transition planning and the batched writer."""
+
+import pytest
+
+from gitstory.core.execute import (
+    ExecutionError,
+    ExecutionRequest,
+    apply_plan,
+    apply_with_retry,
+    choose_transition,
+    plan_execution,
+    progress_bar,
+)
+from gitstory.core.guards import GuardContext, acceptance_criteria_met
+from gitstory.core.index import TicketIndex
+from gitstory.core.writer import WriteConflictError
+
+
+@pytest.fixture
+def project(ticket_tree, write_ticket, monkeypatch):
+    """Ticket tree with a Progress field on the story, run from its project root."""
+    write_ticket(
+        "STORY-0001.1.1",
+        status="🟡 In Progress",
+        extra="**Story Points**: 3\n**Progress**: █████░░░░░ 50%\n",
+        body="## Acceptance Criteria\n\n- [x] Works\n",
+    )
+    write_ticket("TASK-0001.1.1.2", status="🟡 In Progress")
+    monkeypatch.chdir(ticket_tree.parent.parent)
+    return ticket_tree
+
+
+def _plan(root, workflow, *requests):
+    return plan_execution(list(requests), TicketIndex.scan(root), root, workflow)
+
+
+def test_choose_transition(workflow):
+    assert choose_transition(workflow, "not_started").id == "start_work"
+    assert choose_transition(workflow, "in_progress", to_state="blocked").id == "encounter_blocker"
+    assert choose_transition(workflow, "blocked", transition="cancel").id == "cancel"
+    with pytest.raises(ExecutionError, match="No reopen_ticket allowed"):
+        choose_transition(workflow, "not_started", transition="reopen_ticket")
+
+
+def test_batch_completes_story_with_its_last_task(project, workflow):
+    plan = _plan(
+        project,
+        workflow,
+        ExecutionRequest("TASK-0001.1.1.2", to_state="done"),
+        ExecutionRequest("STORY-0001.1.1", to_state="done"),
+    )
+
+    assert plan.ok
+    assert [g.guard for g in plan.guards] == [
+        "all_children_done",
+        "acceptance_criteria_met",
+    ] * 2
+    story = "INIT-0001/EPIC-0001.1/STORY-0001.1.1/README.md"
+    assert sorted(plan.files) == [story, "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"]
+    assert "**Status**: 🟢 Done" in plan.files[story].decode()
+    assert "**Progress**: ██████████ 100% (2/2 tasks complete)" in plan.files[story].decode()
+
+
+def test_semantic_no_ops_are_not_written(project, workflow):
+    # cancel maps done -> done: the Status text and Progress percentage stay as they are
+    plan = _plan(project, workflow, ExecutionRequest("TASK-0001.1.1.1", transition="cancel"))
+
+    assert plan.ok
+    assert [c.to_state for c in plan.changes] == ["done"]
+    assert plan.files == {}
+    assert apply_plan(plan, project) == []
+
+
+def test_actual_hours_recorded(project, workflow):
+    request = ExecutionRequest("TASK-0001.1.1.2", to_state="done", actual_hours="4")
+    plan = _plan(project, workflow, request)
+
+    task = plan.files["INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"].decode()
+    assert "**Status**: 🟢 Done\n**Actual Hours**: 4\n" in task
+
+
+def test_failed_guard_writes_nothing(project, workflow):
+    story = project / "INIT-0001/EPIC-0001.1/STORY-0001.1.1/README.md"
+    before = story.read_text(encoding="utf-8")
+
+    plan = _plan(project, workflow, ExecutionRequest("STORY-0001.1.1", to_state="done"))
+
+    assert not plan.ok
+    assert plan.files == {}
+    [failed] = plan.failed_guards
+    assert failed.details == {"pending": ["TASK-0001.1.1.2"]}
+    with pytest.raises(ExecutionError):
+        apply_plan(plan, project)
+    assert story.read_text(encoding="utf-8") == before
+
+
+def test_invalid_request_aborts_batch(project, workflow):
+    plan = _plan(
+        project,
+        workflow,
+        ExecutionRequest("TASK-0001.1.1.2", to_state="done"),
+        ExecutionRequest("TASK-0001.9.9.9"),
+    )
+
+    assert not plan.ok
+    assert plan.errors == [
+        {"ticket_id": "TASK-0001.9.9.9", "message": "Ticket not found: TASK-0001.9.9.9"}
+    ]
+    assert plan.guards == []
+
+
+def test_glob_expands_in_tree_order(project, workflow):
+    plan = _plan(project, workflow, ExecutionRequest("TASK-0001.1.1.*", transition="cancel"))
+
+    assert [c.ticket_id for c in plan.changes] == ["TASK-0001.1.1.1", "TASK-0001.1.1.2"]
+    assert _plan(project, workflow, ExecutionRequest("TASK-0009.*")).errors
+
+
+def test_apply_plan_writes_each_file_once(project, workflow):
+    plan = _plan(project, workflow, ExecutionRequest("TASK-0001.1.1.2", to_state="done"))
+
+    written = apply_plan(plan, project)
+
+    assert len(written) == 2
+    task = project / "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"
+    assert "**Status**: 🟢 Done" in task.read_text(encoding="utf-8")
+
+
+def test_project_guard_plugin_overrides_builtin(project, workflow):
+    plugin = project.parent.parent / ".gitstory/plugins/guards/acceptance_criteria_met"
+    plugin.parent.mkdir(parents=True)
+    plugin.write_text('#!/bin/sh\necho \'{"passed": false, "reason": "nope"}\'\nexit 1\n')
+    plugin.chmod(0o755)
+
+    plan = _plan(project, workflow, ExecutionRequest("TASK-0001.1.1.2", to_state="done"))
+
+    [failed] = plan.failed_guards
+    assert (failed.guard, failed.source) == ("acceptance_criteria_met", "plugin")
+    assert failed.details["reason"] == "nope"
+
+
+def test_acceptance_criteria_met_only_checks_its_section(ticket_tree, workflow):
+    text = "# X\n\n## Acceptance Criteria\n\n- [x] a\n- [ ] b\n\n## Tasks\n\n- [ ] c\n"
+    ctx = GuardContext("STORY-0001.1.1", text, TicketIndex.scan(ticket_tree), workflow)
+
+    assert acceptance_criteria_met(ctx) == (False, {"unchecked": ["b"]})
+
+
+def test_progress_bar():
+    assert progress_bar(0, 0) == "░░░░░░░░░░ 0%"
+    assert progress_bar(1, 3) == "███░░░░░░░ 33%"
+    assert progress_bar(2, 2) == "██████████ 100%"
+
+
+def test_concurrent_runs_replan_instead_of_clobbering(project, workflow, write_ticket):
+    write_ticket("TASK-0001.1.1.3", status="🟡 In Progress")
+    first = _plan(project, workflow, ExecutionRequest("TASK-0001.1.1.2", to_state="done"))
+    second = _plan(project, workflow, ExecutionRequest("TASK-0001.1.1.3", to_state="done"))
+    apply_plan(first, project)
+
+    # Planned before the first run wrote the story's progress
+    with pytest.raises(WriteConflictError):
+        apply_plan(second, project)
+    requests = [ExecutionRequest("TASK-0001.1.1.3", to_state="done")]
+    plan, written = apply_with_retry(
+        requests, second, project, workflow, lambda: TicketIndex.scan(project)
+    )
+
+    assert plan.ok
+    assert len(written) == 2
+    story = TicketIndex.scan(project).by_id["STORY-0001.1.1"]
+    assert story.fields["Progress"].value == "██████████ 100% (3/3 tasks complete)"
+    again, written = apply_with_retry(
+        requests, second, project, workflow, lambda: TicketIndex.scan(project)
+    )
+    assert not again.ok
+    assert written == []
@@ -0,0 +1,63 @@
+"""Unit tests for streaming ticket export."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from gitstory.core.export import DEFAULT_EXPORT_FIELDS, export_rows, iter_rows
+from gitstory.core.snapshot import load_snapshot
+
+
+class CountingStream(io.StringIO):
+    """StringIO recording how many write calls it received."""
+
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.fixture
+def records(ticket_tree, tmp_path):
+    return list(load_snapshot(ticket_tree, tmp_path / "tree.snap").records.values())
+
+
+def test_iter_rows_reads_builtin_and_header_fields(records):
+    rows = list(iter_rows(records, ["ticket_id", "type", "parent", "status", "Story Points"]))
+
+    assert rows[0] == ("INIT-0001", "initiative", None, "🟡 In Progress", None)
+    assert rows[2] == ("STORY-0001.1.1", "story", "EPIC-0001.1", "🟡 In Progress", "3")
+    assert len(rows) == 5
+
+
+def test_jsonl_export_writes_in_chunks(records):
+    out = CountingStream()
+
+    count = export_rows(
+        iter_rows(records, DEFAULT_EXPORT_FIELDS), DEFAULT_EXPORT_FIELDS, "jsonl", out, chunk_rows=2
+    )
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert count == 5
+    assert out.writes == 3
+    assert lines[-1]["ticket_id"] == "TASK-0001.1.1.2"
+    assert list(lines[-1]) == list(DEFAULT_EXPORT_FIELDS)
+
+
+def test_csv_export_has_header_and_flattened_values(records):
+    out = io.StringIO()
+    fields = ["ticket_id", "requires", "Estimated Hours"]
+
+    assert export_rows(iter_rows(records, fields), fields, "csv", out) == 5
+
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == fields
+    assert rows[4] == ["TASK-0001.1.1.1", "", "2"]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export_rows([], ["ticket_id"], "xml", io.StringIO())
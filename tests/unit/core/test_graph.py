@@ -0,0 +1,88 @@
+"""Unit tests for the ticket dependency graph."""
+
+from gitstory.core.graph import TicketGraph
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import TicketHeader
+
+
+def _index(*tickets):
+    """Build an index from (ticket_id, requires, blocks) tuples."""
+    return TicketIndex(
+        TicketHeader(path=f"{t[0]}.md", ticket_id=t[0], requires=t[1], blocks=t[2]) for t in tickets
+    )
+
+
+def test_blockers_and_unblocks_from_requires_and_blocks():
+    """Requires and Blocks lists produce the same edges, deduplicated."""
+    index = _index(
+        ("STORY-0001.1.1", (), ("STORY-0001.1.2",)),
+        ("STORY-0001.1.2", ("STORY-0001.1.1",), ()),
+        ("STORY-0001.1.3", ("STORY-0001.1.2",), ()),
+    )
+    graph = TicketGraph.from_index(index)
+
+    assert graph.blockers("STORY-0001.1.2") == ["STORY-0001.1.1"]
+    assert graph.blockers("STORY-0001.1.3") == ["STORY-0001.1.2"]
+    assert graph.blockers("STORY-0001.1.3", transitive=True) == [
+        "STORY-0001.1.2",
+        "STORY-0001.1.1",
+    ]
+    assert graph.unblocks("STORY-0001.1.1") == ["STORY-0001.1.2"]
+    assert graph.unblocks("STORY-0001.1.1", transitive=True) == [
+        "STORY-0001.1.2",
+        "STORY-0001.1.3",
+    ]
+    assert graph.blockers("STORY-0001.1.1") == []
+    assert graph.cycles() == []
+
+
+def test_missing_dependencies_are_reported_on_source():
+    """Unknown IDs in either list are reported on the ticket listing them."""
+    graph = TicketGraph.from_index(
+        _index(("STORY-0001.1.1", ("STORY-0009.1.1",), ("EPIC-0009.1",)))
+    )
+    assert graph.missing == {"STORY-0001.1.1": ["STORY-0009.1.1", "EPIC-0009.1"]}
+    assert graph.blocked_by == {}
+
+
+def test_dependency_cycle():
+    """Tickets that require each other form a cycle."""
+    graph = TicketGraph(
+        {"TASK-0001.1.1.1", "TASK-0001.1.1.2", "TASK-0001.1.1.3", "TASK-0001.1.1.4"},
+        {
+            "TASK-0001.1.1.1": ["TASK-0001.1.1.3"],
+            "TASK-0001.1.1.2": ["TASK-0001.1.1.1"],
+            "TASK-0001.1.1.3": ["TASK-0001.1.1.2"],
+            "TASK-0001.1.1.4": ["TASK-0001.1.1.3"],
+        },
+    )
+    assert graph.cycles() == [["TASK-0001.1.1.1", "TASK-0001.1.1.2", "TASK-0001.1.1.3"]]
+
+
+def test_self_dependency_is_a_cycle():
+    """A ticket requiring itself is reported."""
+    graph = TicketGraph({"BUG-0001"}, {"BUG-0001": ["BUG-0001"]})
+    assert graph.cycles() == [["BUG-0001"]]
+
+
+def test_requiring_an_ancestor_is_a_cycle():
+    """A child requiring its ancestor deadlocks, since parents complete after children."""
+    ids = {"INIT-0001", "EPIC-0001.1", "STORY-0001.1.1", "TASK-0001.1.1.1", "EPIC-0001.2"}
+    graph = TicketGraph(ids, {"TASK-0001.1.1.1": ["EPIC-0001.1"], "EPIC-0001.2": ["EPIC-0001.1"]})
+    assert graph.cycles() == [["EPIC-0001.1", "STORY-0001.1.1", "TASK-0001.1.1.1"]]
+
+
+def test_requiring_a_descendant_is_not_a_cycle():
+    """A parent requiring its own child is redundant but not a cycle."""
+    ids = {"EPIC-0001.1", "STORY-0001.1.1"}
+    graph = TicketGraph(ids, {"EPIC-0001.1": ["STORY-0001.1.1"]})
+    assert graph.cycles() == []
+
+
+def test_large_chain_does_not_recurse():
+    """Cycle detection is iterative, so long dependency chains are fine."""
+    ids = [f"BUG-{n:04d}" for n in range(1, 5001)]
+    requires = {ids[n]: [ids[n - 1]] for n in range(1, len(ids))}
+    requires[ids[0]] = [ids[-1]]
+    graph = TicketGraph(set(ids), requires)
+    assert graph.cycles() == [sorted(ids)]
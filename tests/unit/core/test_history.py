@@ -0,0 +1,97 @@
+"""Unit tests for status history mining and flow metrics."""
+
+import os
+import subprocess
+
+from gitstory.core.history import History, epic_stats, load_history, parse_log, ticket_flow
+from gitstory.core.index import TicketIndex
+
+TASK = "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"
+HOUR = 3600
+T0 = 1_700_000_000
+
+
+def _commit(root, timestamp, message="change"):
+    env = {**os.environ, "GIT_AUTHOR_DATE": f"@{timestamp}", "GIT_COMMITTER_DATE": f"@{timestamp}"}
+    for args in (["add", "-A"], ["commit", "-q", "-m", message]):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            env=env,
+        )
+
+
+def _set_status(tickets_root, status, hours=""):
+    (tickets_root / TASK).write_text(
+        f"# TASK-0001.1.1.2: Example ticket\n\n**Status**: {status}\n{hours}\n"
+    )
+
+
+def test_parse_log_reads_added_status_lines_of_ticket_files():
+    log = (
+        "\0abc 100\n\ndiff --git a/x b/x\n--- a/INIT-0001/README.md\n+++ b/INIT-0001/README.md\n"
+        "@@ -3 +3 @@\n-**Status**: 🔵 Not Started\n+**Status**: 🟡 In Progress | **Owner**: me\n"
+        "+++ b/notes.md\n+**Status**: ignored\n"
+        "\0def 200\n\n--- a/INIT-0001/EPIC-0001.1/README.md\n+++ /dev/null\n-**Status**: x\n"
+    )
+
+    assert parse_log(log) == [("abc", 100, [("INIT-0001", "🟡 In Progress")]), ("def", 200, [])]
+
+
+def test_ticket_flow_measures_lead_cycle_and_time_in_state(workflow):
+    changes = [
+        (T0, "🔵 Not Started"),
+        (T0 + 2 * HOUR, "🟡 In Progress"),
+        (T0 + 3 * HOUR, "🔴 Blocked"),
+        (T0 + 7 * HOUR, "🟡 In Progress"),
+        (T0 + 8 * HOUR, "✅ Complete"),
+    ]
+
+    flow = ticket_flow("TASK-0001.1.1.2", changes, workflow, now=T0 + 100 * HOUR)
+
+    assert flow.lead_time == 8
+    assert flow.cycle_time == 6
+    assert flow.time_in_state == {"not_started": 2, "in_progress": 2, "blocked": 4}
+
+    reopened = ticket_flow("T", [*changes, (T0 + 9 * HOUR, "🟡 In Progress")], workflow, T0)
+    assert reopened.lead_time is None and reopened.cycle_time is None
+
+
+def test_history_is_mined_incrementally(ticket_tree, tmp_path, workflow):
+    root = ticket_tree.parent.parent
+    cache = tmp_path / "cache" / "history.json"
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    _commit(root, T0)
+    _set_status(ticket_tree, "🟡 In Progress")
+    _commit(root, T0 + 4 * HOUR)
+
+    history = load_history(ticket_tree, cache)
+    assert history.mined == 2
+    assert History.read(cache).commits == history.commits
+
+    _set_status(ticket_tree, "🟢 Done", "**Estimated Hours**: 3\n**Actual Hours**: 6")
+    _commit(root, T0 + 10 * HOUR)
+    history = load_history(ticket_tree, cache)
+    assert history.mined == 1
+    assert [t for t, _ in history.transitions()["TASK-0001.1.1.2"]] == [
+        T0,
+        T0 + 4 * HOUR,
+        T0 + 10 * HOUR,
+    ]
+    assert load_history(ticket_tree, cache).mined == 0
+
+    (stats,) = epic_stats(history, TicketIndex.scan(ticket_tree), workflow, now=T0 + 10 * HOUR)
+    assert stats.epic_id == "EPIC-0001.1"
+    assert stats.tickets == 4
+    assert stats.completed == 2
+    assert stats.cycle_time == 6
+    assert (stats.estimated_hours, stats.actual_hours, stats.estimate_ratio) == (3, 6, 2)
+
+
+def test_history_outside_git_is_empty(ticket_tree, tmp_path):
+    history = load_history(ticket_tree, tmp_path / "history.json")
+
+    assert history.head is None
+    assert history.commits == []
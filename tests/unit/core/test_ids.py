@@ -0,0 +1,95 @@
+"""Unit tests for shared ticket ID allocation."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from gitstory.core.ids import IdAllocator, check_ids, repair_ids
+from gitstory.core.index import TicketIndex
+from gitstory.models import TicketId
+
+EPIC = TicketId.parse("EPIC-0001.1")
+STORY = TicketId.parse("STORY-0001.1.1")
+
+
+def _allocate_stories(tickets_root: Path, counters: Path, count: int) -> list[str]:
+    index = TicketIndex.scan(tickets_root)
+    allocated = []
+    for _ in range(count):
+        with IdAllocator(index, tickets_root, counters) as ids:
+            allocated.append(str(ids.allocate(EPIC)))
+    return allocated
+
+
+def test_allocation_continues_from_shared_counters(ticket_tree, tmp_path):
+    counters = tmp_path / "ids.json"
+    index = TicketIndex.scan(ticket_tree)
+
+    with IdAllocator(index, ticket_tree, counters) as ids:
+        assert str(ids.allocate(STORY)) == "TASK-0001.1.1.3"
+        assert str(ids.allocate(None)) == "INIT-0002"
+        assert str(ids.allocate(None, bug=True)) == "BUG-0001"
+    # Another worktree sees the same counters, though not the files
+    with IdAllocator(index, ticket_tree, counters) as ids:
+        assert str(ids.allocate(STORY)) == "TASK-0001.1.1.4"
+    (ticket_tree / TicketId.parse("TASK-0001.1.1.5").relative_path).write_text("# manual\n")
+    with IdAllocator(index, ticket_tree, counters) as ids:
+        assert str(ids.allocate(STORY)) == "TASK-0001.1.1.6"
+
+    assert json.loads(counters.read_text())["counters"] == {
+        "BUG": 1,
+        "INIT": 2,
+        "STORY-0001.1.1": 6,
+    }
+    with pytest.raises(RuntimeError):
+        IdAllocator(index, ticket_tree, counters).allocate(STORY)
+
+
+def test_parallel_processes_never_collide(ticket_tree, tmp_path):
+    counters = tmp_path / "ids.json"
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_allocate_stories, ticket_tree, counters, 10) for _ in range(4)]
+        allocated = [ticket_id for f in futures for ticket_id in f.result()]
+
+    assert sorted(allocated, key=lambda t: TicketId.parse(t).parts) == [
+        f"STORY-0001.1.{n}" for n in range(2, 42)
+    ]
+
+
+def test_check_and_repair(write_ticket, ticket_tree, tmp_path):
+    counters = tmp_path / "ids.json"
+    counters.write_text(json.dumps({"version": 1, "counters": {"STORY-0001.1.1": 1}}))
+    story_dir = "INIT-0001/EPIC-0001.1/STORY-0001.1.1"
+    # Hand-copied files that kept the ID of their original
+    write_ticket("TASK-0001.1.1.1", rel_path=f"{story_dir}/TASK-0001.1.1.2.md")
+    write_ticket("TASK-0001.1.1.2", rel_path=f"{story_dir}/TASK-0001.1.1.3.md")
+    write_ticket("TASK-0001.1.1.6")
+    write_ticket("BUG-0002", rel_path="BUG-0001.md")
+    write_ticket("BUG-0002")
+    index = TicketIndex.scan(ticket_tree)
+
+    with IdAllocator(index, ticket_tree, counters) as ids:
+        report = check_ids(ids)
+    assert report.duplicates == {
+        "BUG-0002": ["BUG-0001.md", "BUG-0002.md"],
+        "TASK-0001.1.1.1": [f"{story_dir}/TASK-0001.1.1.1.md", f"{story_dir}/TASK-0001.1.1.2.md"],
+    }
+    assert report.gaps == {"BUG": [1], "STORY-0001.1.1": [3, 4, 5]}
+    assert report.stale_counters == {"STORY-0001.1.1": (1, 6)}
+    assert not report.ok
+
+    with IdAllocator(index, ticket_tree, counters) as ids:
+        report = repair_ids(ids)
+
+    assert report.renumbered == [
+        ("BUG-0001.md", "BUG-0002", "BUG-0001"),
+        (f"{story_dir}/TASK-0001.1.1.2.md", "TASK-0001.1.1.1", "TASK-0001.1.1.7"),
+    ]
+    assert report.unrepaired == []
+    assert not (ticket_tree / story_dir / "TASK-0001.1.1.2.md").exists()
+    repaired = TicketIndex.scan(ticket_tree)
+    assert repaired.duplicates == {}
+    assert repaired.by_id["TASK-0001.1.1.7"].path == f"{story_dir}/TASK-0001.1.1.7.md"
+    assert json.loads(counters.read_text())["counters"]["STORY-0001.1.1"] == 7
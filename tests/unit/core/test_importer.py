@@ -0,0 +1,180 @@
+"""Unit tests for bulk ticket import."""
+
+import json
+
+import pytest
+
+from gitstory.core import importer as importer_module
+from gitstory.core.importer import (
+    ImportRecordError,
+    create_subtree,
+    import_tickets,
+    journal_path,
+    parse_subtree_spec,
+)
+from gitstory.core.index import TicketIndex
+
+STORY_DIR = "INIT-0001/EPIC-0001.1/STORY-0001.1.1"
+
+
+@pytest.fixture(autouse=True)
+def _cwd(tmp_path, monkeypatch):
+    # Outside git, ID counters live in the working directory's cache
+    monkeypatch.chdir(tmp_path)
+
+
+def _lines(*records):
+    return [json.dumps(r) + "\n" for r in records]
+
+
+def test_import_allocates_ids_below_existing_tickets(write_ticket, ticket_tree, tmp_path, workflow):
+    write_ticket("STORY-0001.1.1", extra="**Progress**: ░░░░░░░░░░ 0%\n")
+    lines = _lines(
+        {"key": "E", "parent": "INIT-0001", "title": "Billing"},
+        {"key": "S", "parent_key": "E", "title": "Invoices", "fields": {"Story Points": "5"}},
+        {"parent_key": "S", "title": "Render PDF", "body": "## Objective\n\nRender."},
+        {"parent": "STORY-0001.1.1", "title": "Late task", "status": "🟢 Done"},
+        {"type": "bug", "title": "Crash"},
+    )
+
+    report = import_tickets(lines, ticket_tree, workflow, snapshot_path=tmp_path / "tree.snap")
+
+    assert [c["ticket_id"] for c in report.created] == [
+        "EPIC-0001.2",
+        "STORY-0001.2.1",
+        "TASK-0001.2.1.1",
+        "TASK-0001.1.1.3",
+        "BUG-0001",
+    ]
+    assert report.errors == []
+    index = TicketIndex.scan(ticket_tree)
+    task = index.by_id["TASK-0001.2.1.1"]
+    assert task.fields["Parent Story"].value == "[STORY-0001.2.1](README.md)"
+    assert task.fields["Status"].value == "🔵 Not Started"
+    assert index.by_id["STORY-0001.2.1"].fields["Story Points"].value == "5"
+    assert report.rollups == [f"{STORY_DIR}/README.md"]
+    progress = index.by_id["STORY-0001.1.1"].fields["Progress"].value
+    assert progress == "██████░░░░ 67% (2/3 tasks complete)"
+
+
+def test_invalid_records_are_skipped_with_line_numbers(ticket_tree, tmp_path, workflow):
+    lines = [
+        *_lines({"key": "A", "parent": "EPIC-0001.1", "title": "Kept"}),
+        "not json\n",
+        "\n",
+        *_lines(
+            {"key": "A", "parent": "EPIC-0001.1", "title": "Duplicate key"},
+            {"parent_key": "missing", "title": "Orphan"},
+            {"parent": "TASK-0001.1.1.1", "title": "Child of a task"},
+            {"type": "task", "title": "No parent"},
+        ),
+    ]
+
+    report = import_tickets(lines, ticket_tree, workflow, snapshot_path=tmp_path / "tree.snap")
+
+    assert [c["ticket_id"] for c in report.created] == ["STORY-0001.1.2"]
+    assert [e["line"] for e in report.errors] == [2, 4, 5, 6, 7]
+    assert "Duplicate key" in report.errors[1]["message"]
+    assert "cannot have children" in report.errors[3]["message"]
+
+
+def test_interrupted_import_resumes_without_duplicates(
+    ticket_tree, tmp_path, workflow, monkeypatch
+):
+    lines = _lines(*({"parent": "STORY-0001.1.1", "title": f"Task {n}"} for n in range(5)))
+    journal = journal_path("dump.jsonl", tmp_path / "journal")
+    snap = tmp_path / "tree.snap"
+    write_batch = importer_module._write_batch
+    calls = []
+
+    def fail_second_batch(contents):
+        calls.append(contents)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        write_batch(contents)
+
+    monkeypatch.setattr(importer_module, "IMPORT_CHUNK_FILES", 2)
+    monkeypatch.setattr(importer_module, "_write_batch", fail_second_batch)
+    with pytest.raises(OSError, match="disk full"):
+        import_tickets(lines, ticket_tree, workflow, journal, snap, max_workers=1)
+    assert journal.is_file()
+
+    monkeypatch.setattr(importer_module, "_write_batch", write_batch)
+    report = import_tickets(lines, ticket_tree, workflow, journal, snap)
+
+    ids = [c["ticket_id"] for c in report.created]
+    assert report.resumed == 2
+    assert ids == [f"TASK-0001.1.1.{n}" for n in range(5, 8)]
+    tasks = sorted(p.name for p in (ticket_tree / STORY_DIR).glob("TASK-*.md"))
+    assert len(tasks) == 7
+    assert not journal.exists()
+
+
+def test_unrelated_import_from_the_same_source_is_not_resumed(
+    ticket_tree, tmp_path, workflow, monkeypatch
+):
+    journal = journal_path("-", tmp_path / "journal")
+    snap = tmp_path / "tree.snap"
+    first = _lines(*({"parent": "STORY-0001.1.1", "title": f"Old {n}"} for n in range(3)))
+    write_batch = importer_module._write_batch
+
+    def fail_second_batch(contents):
+        if any("Old 2" in data.decode() for data in contents.values()):
+            raise OSError("disk full")
+        write_batch(contents)
+
+    monkeypatch.setattr(importer_module, "IMPORT_CHUNK_FILES", 2)
+    monkeypatch.setattr(importer_module, "_write_batch", fail_second_batch)
+    with pytest.raises(OSError, match="disk full"):
+        import_tickets(first, ticket_tree, workflow, journal, snap, max_workers=1)
+
+    monkeypatch.setattr(importer_module, "_write_batch", write_batch)
+    second = _lines({"parent": "STORY-0001.1.1", "title": "New"})
+    report = import_tickets(second, ticket_tree, workflow, journal, snap)
+
+    assert report.resumed == 0
+    [created] = report.created
+    text = (ticket_tree / created["path"]).read_text(encoding="utf-8")
+    assert "New" in text
+    assert not journal.exists()
+
+
+def test_journal_is_removed_when_lines_are_skipped(ticket_tree, tmp_path, workflow):
+    journal = journal_path("dump.jsonl", tmp_path / "journal")
+    lines = [*_lines({"parent": "STORY-0001.1.1", "title": "Kept"}), "not json\n"]
+
+    report = import_tickets(lines, ticket_tree, workflow, journal, tmp_path / "tree.snap")
+
+    assert len(report.created) == 1
+    assert len(report.errors) == 1
+    assert not journal.exists()
+
+
+def test_create_subtree_from_spec(ticket_tree, tmp_path, workflow):
+    specs = parse_subtree_spec(
+        """
+tickets:
+  - title: Invoices
+    fields: {Story Points: "3"}
+    children:
+      - title: Render PDF
+        body: "## Objective\\n\\nRender."
+      - title: Email PDF
+  - title: Refunds
+    type: task
+"""
+    )
+
+    report = create_subtree(specs, "EPIC-0001.1", ticket_tree, workflow, tmp_path / "tree.snap")
+
+    assert [(c["key"], c["ticket_id"]) for c in report.created] == [
+        ("1", "STORY-0001.1.2"),
+        ("1.1", "TASK-0001.1.2.1"),
+        ("1.2", "TASK-0001.1.2.2"),
+    ]
+    assert report.errors == [{"line": 4, "message": "A task cannot be a child of EPIC-0001.1"}]
+    story = TicketIndex.scan(ticket_tree).by_id["STORY-0001.1.2"]
+    assert story.fields["Story Points"].value == "3"
+    assert story.fields["Progress"].value == "░░░░░░░░░░ 0%"
+    with pytest.raises(ImportRecordError, match="title"):
+        parse_subtree_spec("[{children: []}]")
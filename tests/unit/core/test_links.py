@@ -0,0 +1,52 @@
+"""Unit tests for link and ticket-mention extraction and checking."""
+
+from gitstory.core.index import TicketIndex
+from gitstory.core.links import Reference, check_references, extract_references
+
+STORY = "INIT-0001/EPIC-0001.1/STORY-0001.1.1/README.md"
+TASK = "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"
+
+
+def test_extract_references_skips_code():
+    lines = [
+        "**Parent Story**: [STORY-0001.1.1](README.md)",
+        'See [docs](<../spec file.md#usage> "title") and TASK-0001.1.1.1, not `TASK-0009.9.9.9`.',
+        "```",
+        "[EPIC-0001.9](../../EPIC-0001.9/README.md)",
+        "```",
+        "[both INIT-0001 and EPIC-0001.1](../README.md)",
+    ]
+
+    assert extract_references(lines) == (
+        Reference(1, "README.md", "STORY-0001.1.1"),
+        Reference(2, "../spec file.md#usage", None),
+        Reference(2, None, "TASK-0001.1.1.1"),
+        Reference(6, "../README.md", None),
+    )
+
+
+def test_check_references(ticket_tree):
+    index = TicketIndex.scan(ticket_tree)
+    (ticket_tree / "INIT-0001/EPIC-0001.1/diagram.png").write_bytes(b"")
+    refs = {
+        TASK: extract_references(
+            [
+                "**Parent Story**: [STORY-0001.1.2](README.md)",
+                "[epic](../README.md) [story dir](./) [asset](../diagram.png#x)",
+                "[web](https://example.com) [top](#objective) [root](/abs.md)",
+                "[gone](TASK-0001.1.1.9.md) STORY-0001.1.1 EPIC-0001.7 EPIC-0001.7",
+            ]
+        ),
+        STORY: (Reference(9, "../../../README.md", None),),
+    }
+
+    issues = check_references(refs, index, ticket_tree)
+
+    assert [(i.path, i.type, i.line, i.severity) for i in issues] == [
+        (STORY, "broken_link", 9, "error"),
+        (TASK, "link_id_mismatch", 1, "warning"),
+        (TASK, "broken_link", 4, "error"),
+        (TASK, "unknown_reference", 4, "warning"),
+    ]
+    assert issues[1].message == "Link text names STORY-0001.1.2 but README.md is STORY-0001.1.1"
+    assert issues[3].message == "Mentions tickets that do not exist: EPIC-0001.7"
@@ -0,0 +1,47 @@
+"""Unit tests for running a plugin across many tickets."""
+
+import json
+import sys
+
+import pytest
+
+from gitstory.core.matrix import MatrixSummary, run_matrix
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell plugin")
+
+# Guard misbehaving differently per ticket
+_GUARD = """#!/bin/sh
+case "$1" in
+  *.1) echo '{"passed": true}' ;;
+  *.2) echo '{"passed": false, "message": "not yet"}'; exit 1 ;;
+  *.3) echo 'oops' ;;
+  *.4) exit 3 ;;
+  *) sleep 5 ;;
+esac
+"""
+
+
+def test_matrix_streams_rows_and_summarizes_violations(tmp_path):
+    plugin = tmp_path / "guard.sh"
+    plugin.write_text(_GUARD)
+    plugin.chmod(0o755)
+    ticket_ids = [f"TASK-0001.1.1.{n}" for n in range(1, 6)]
+
+    summary = MatrixSummary("guard", "check")
+    rows = {}
+    for row in run_matrix("guard", {"file": str(plugin)}, ticket_ids, workers=2, timeout=0.5):
+        summary.add(row)
+        rows[row.ticket_id] = row
+
+    assert set(rows) == set(ticket_ids)
+    assert rows["TASK-0001.1.1.1"].status == "pass"
+    assert rows["TASK-0001.1.1.2"].status == "fail"
+    assert rows["TASK-0001.1.1.2"].message == "not yet"
+    assert summary.counts == {"pass": 1, "fail": 1, "error": 3}
+    assert summary.violations == {
+        "invalid_json": ["TASK-0001.1.1.3"],
+        "exit_code": ["TASK-0001.1.1.4"],
+        "timeout": ["TASK-0001.1.1.5"],
+    }
+    assert not summary.ok
+    assert json.dumps(summary.to_dict())
@@ -0,0 +1,126 @@
+"""Unit tests for plugin resolution and execution."""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from gitstory.core.plugins import PluginNotFoundError, resolve_plugin, run_plugin
+
+# Plugins here are shell scripts using ulimit and /dev/zero
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell plugins")
+
+
+def _alive(pid):
+    """True if pid runs (zombies waiting to be reaped count as gone)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return True
+    return stat.rpartition(")")[2].split()[0] != "Z"
+
+
+def test_string_plugin_resolves_project_before_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    user = tmp_path / "home/.claude/skills/gitstory/plugins/guards/check"
+    project = tmp_path / ".gitstory/plugins/guards/check"
+    for path in (user, project):
+        path.parent.mkdir(parents=True)
+        path.write_text("#!/bin/sh\necho '{\"passed\": true}'\n")
+        path.chmod(0o755)
+
+    assert resolve_plugin("guard", "check", tmp_path) == project
+    project.unlink()
+    assert resolve_plugin("guard", "check", tmp_path) == user
+    with pytest.raises(PluginNotFoundError):
+        run_plugin("guard", "other", "TASK-0001.1.1.1", cwd=tmp_path)
+
+
+def test_inline_plugin_receives_ticket_and_config():
+    spec = {
+        "inline": """printf '{"passed": true, "ticket": "%s", "config": %s}' """
+        '"$1" "$GITSTORY_PLUGIN_CONFIG"',
+        "config": {"min": 2},
+    }
+
+    result = run_plugin("guard", spec, "TASK-0001.1.1.1")
+
+    assert result.ok
+    assert result.output == {"passed": True, "ticket": "TASK-0001.1.1.1", "config": {"min": 2}}
+
+
+@pytest.mark.parametrize(
+    ("code", "stderr"),
+    [
+        ("echo not-json", "valid JSON"),
+        ("echo '{\"success\": true}'", '"passed": bool'),
+        ("sleep 5", "timed out"),
+    ],
+)
+def test_contract_violations_are_errors(code, stderr):
+    result = run_plugin("guard", {"inline": code}, "TASK-0001.1.1.1", timeout=0.5)
+
+    assert result.exit_code == 2
+    assert not result.ok
+    assert stderr in result.stderr
+    assert json.dumps(result.to_dict())
+
+
+def test_output_beyond_cap_is_dropped_and_reported():
+    spec = {"inline": "head -c 100000 /dev/zero | tr '\\0' x", "limits": {"output_bytes": 1000}}
+
+    result = run_plugin("guard", spec, "TASK-0001.1.1.1")
+
+    assert result.violation == "output_limit"
+    assert result.exit_code == 2
+    assert result.output_bytes == 100000
+    assert len(result.stderr) < 1000
+
+
+def test_cpu_limit_kills_busy_plugin():
+    result = run_plugin(
+        "guard", {"inline": "while :; do :; done", "limits": {"cpu_seconds": 1}}, "TASK-0001.1.1.1"
+    )
+
+    assert result.violation == "cpu_limit"
+    assert result.cpu_seconds > 0.5
+    assert result.to_dict()["resources"]["max_rss_bytes"] > 0
+
+
+def test_timeout_kills_the_whole_process_group(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    # The child writes its pid first; the plugin waits for it before the timeout
+    spec = {
+        "inline": f"sh -c 'echo $$ > {pid_file}; exec sleep 30' & "
+        f"until [ -s {pid_file} ]; do sleep 0.01; done; wait"
+    }
+
+    result = run_plugin("guard", spec, "TASK-0001.1.1.1", timeout=1.0)
+
+    assert result.violation == "timeout"
+    assert result.duration < 5
+    child = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while _alive(child) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not _alive(child)
+
+
+def test_limits_apply_to_plugins_launched_from_threads():
+    spec = {
+        "inline": """printf '{"passed": true, "files": %s}' "$(ulimit -n)" """,
+        "limits": {"open_files": 64},
+    }
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: run_plugin("guard", spec, "TASK-0001.1.1.1"), range(32)))
+
+    assert {r.output.get("files") for r in results} == {64}
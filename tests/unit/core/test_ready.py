@@ -0,0 +1,150 @@
+"""Unit tests for the ready-task priority queue."""
+
+import os
+from dataclasses import replace
+
+from gitstory.core.graph import TicketGraph
+from gitstory.core.history import History
+from gitstory.core.index import TicketIndex
+from gitstory.core.ready import ReadyQueue, creation_times
+from gitstory.core.tickets import HeaderField, TicketHeader
+from gitstory.core.workflow import DEFAULT_WORKFLOW, Workflow
+
+WORKFLOW = Workflow.from_dict(DEFAULT_WORKFLOW)
+
+
+def _ticket(ticket_id, status="🔵 Not Started", requires=(), **fields):
+    return TicketHeader(
+        path=f"{ticket_id}.md",
+        ticket_id=ticket_id,
+        fields={
+            "Status": HeaderField(status, 3),
+            **{k.replace("_", " "): HeaderField(v, 4) for k, v in fields.items()},
+        },
+        requires=requires,
+    )
+
+
+def _queue(*headers, scope=None, created=None):
+    index = TicketIndex(headers)
+    return ReadyQueue(index, TicketGraph.from_index(index), WORKFLOW, scope=scope, created=created)
+
+
+def _backlog():
+    return [
+        _ticket("INIT-0001", "🟡 In Progress"),
+        _ticket("EPIC-0001.1", "🟡 In Progress"),
+        _ticket("STORY-0001.1.1", "🟡 In Progress"),
+        _ticket("TASK-0001.1.1.1", "✅ Complete"),
+        _ticket("TASK-0001.1.1.2"),
+        _ticket("TASK-0001.1.1.3", requires=("TASK-0001.1.1.2",)),
+        _ticket("STORY-0001.1.2", requires=("STORY-0001.1.1",)),
+        _ticket("TASK-0001.1.2.1"),
+    ]
+
+
+def test_only_unblocked_not_started_tasks_are_ready():
+    """Done tasks, blocked tasks and tasks of blocked stories are not queued."""
+    queue = _queue(*_backlog())
+
+    assert list(queue) == ["TASK-0001.1.1.2"]
+    assert queue.peek() == "TASK-0001.1.1.2"
+    assert "TASK-0001.1.1.3" not in queue
+    assert "TASK-0001.1.2.1" not in queue
+    assert "STORY-0001.1.1" not in queue
+
+
+def test_priority_order_parent_then_points_then_hours_then_age():
+    """Earlier epics first; then smaller stories, smaller tasks and older tasks."""
+    queue = _queue(
+        _ticket("STORY-0001.1.1", Story_Points="5"),
+        _ticket("STORY-0001.1.2", Story_Points="3"),
+        _ticket("STORY-0001.2.1", Story_Points="1"),
+        _ticket("TASK-0001.2.1.1", Estimated_Hours="1"),
+        _ticket("TASK-0001.1.1.1"),
+        _ticket("TASK-0001.1.1.2", Estimated_Hours="4"),
+        _ticket("TASK-0001.1.1.3", Estimated_Hours="2"),
+        _ticket("TASK-0001.1.1.4", Estimated_Hours="2"),
+        _ticket("TASK-0001.1.2.1", Estimated_Hours="8"),
+        created={"TASK-0001.1.1.3": 200.0, "TASK-0001.1.1.4": 100.0},
+    )
+    assert list(queue) == [
+        "TASK-0001.1.2.1",
+        "TASK-0001.1.1.4",
+        "TASK-0001.1.1.3",
+        "TASK-0001.1.1.2",
+        "TASK-0001.1.1.1",
+        "TASK-0001.2.1.1",
+    ]
+
+
+def test_creation_times_prefer_git_history_over_mtime(ticket_tree):
+    """Tickets never committed fall back to their file's modification time."""
+    index = TicketIndex.scan(ticket_tree)
+    task = ticket_tree / index.by_id["TASK-0001.1.1.2"].path
+    os.utime(task, (1000, 1000))
+    history = History(str(ticket_tree), "abc", [("abc", 50, [("TASK-0001.1.1.1", "Done")])])
+
+    created = creation_times(ticket_tree, index, history)
+
+    assert created["TASK-0001.1.1.1"] == 50
+    assert created["TASK-0001.1.1.2"] == 1000
+    assert set(created) == set(index.by_id)
+
+
+def test_pop_drains_in_priority_order():
+    """pop() returns tasks in the same order as iteration."""
+    queue = _queue(_ticket("TASK-0001.1.1.2"), _ticket("TASK-0001.1.1.1"), _ticket("BUG-0001"))
+    assert [queue.pop(), queue.pop(), queue.pop()] == ["TASK-0001.1.1.1", "TASK-0001.1.1.2", None]
+
+
+def test_update_completes_blocker_and_unblocks_dependents():
+    """Completing tasks and stories incrementally releases what they block."""
+    tickets = _backlog()
+    queue = _queue(*tickets)
+    by_id = {t.ticket_id: t for t in tickets}
+
+    queue.update(replace(by_id["TASK-0001.1.1.2"], fields={"Status": HeaderField("🟢 Done", 3)}))
+    assert list(queue) == ["TASK-0001.1.1.3"]
+
+    queue.update(replace(by_id["STORY-0001.1.1"], fields={"Status": HeaderField("Done", 3)}))
+    assert list(queue) == ["TASK-0001.1.1.3", "TASK-0001.1.2.1"]
+
+    queue.update(replace(by_id["TASK-0001.1.1.3"], fields={"Status": HeaderField("🟡", 3)}))
+    assert queue.peek() == "TASK-0001.1.2.1"
+    assert len(queue) == 1
+
+
+def test_blocked_story_hides_its_tasks():
+    """Moving a story to a blocked state removes its tasks from the queue."""
+    tickets = _backlog()
+    queue = _queue(*tickets)
+    story = next(t for t in tickets if t.ticket_id == "STORY-0001.1.1")
+
+    queue.update(replace(story, fields={"Status": HeaderField("🔴 Blocked", 3)}))
+
+    assert queue.peek() is None
+
+
+def test_update_with_new_dependencies_rebuilds_graph():
+    """Changing a Requires list rebuilds the graph and queue."""
+    tickets = _backlog()
+    queue = _queue(*tickets)
+    task = next(t for t in tickets if t.ticket_id == "TASK-0001.1.1.2")
+
+    queue.update(replace(task, requires=("TASK-0001.1.2.1",)))
+
+    assert queue.peek() is None
+    assert queue.graph.blockers("TASK-0001.1.1.2") == ["TASK-0001.1.2.1"]
+
+
+def test_scope_limits_queue_to_a_story():
+    """A scope only queues tasks below the given ticket."""
+    queue = _queue(
+        _ticket("STORY-0001.1.1"),
+        _ticket("STORY-0001.1.2"),
+        _ticket("TASK-0001.1.1.1"),
+        _ticket("TASK-0001.1.2.1"),
+        scope="STORY-0001.1.2",
+    )
+    assert list(queue) == ["TASK-0001.1.2.1"]
@@ -0,0 +1,70 @@
+"""Unit tests for multi-root discovery and the per-root worker pool."""
+
+import shutil
+
+import pytest
+
+from gitstory.core.roots import (
+    TicketRoot,
+    discover_roots,
+    load_root_index,
+    map_roots,
+    resolve_roots,
+    select_roots,
+)
+
+
+@pytest.fixture
+def monorepo(ticket_tree, tmp_path, monkeypatch):
+    """Two team projects plus a vendored tree that discovery must skip."""
+    for project in ("services/api", "services/web", "node_modules/pkg"):
+        shutil.copytree(ticket_tree, tmp_path / project / "docs/tickets")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _name(root: TicketRoot) -> str:
+    return root.name
+
+
+def test_discover_roots_skips_vendored_and_ticket_trees(monorepo):
+    roots = discover_roots(monorepo)
+
+    assert [r.name for r in roots] == [".", "services/api", "services/web"]
+    assert roots[1].tickets == monorepo / "services/api/docs/tickets"
+    assert roots[1].workflow == monorepo / "services/api/.gitstory/workflow.yaml"
+    assert [r.name for r in discover_roots(monorepo, max_depth=1)] == ["."]
+
+
+def test_resolve_roots_accepts_project_or_tickets_dirs(monorepo):
+    roots = resolve_roots(["services/api", "services/api/docs/tickets", "docs/tickets"])
+
+    assert [r.name for r in roots] == ["services/api", "."]
+    with pytest.raises(FileNotFoundError, match="services/none"):
+        resolve_roots(["services/none"])
+
+
+def test_select_roots(monorepo):
+    assert select_roots(None, False) is None
+    assert [r.name for r in select_roots(["services/web"], True) or []] == [
+        "services/web",
+        ".",
+        "services/api",
+    ]
+
+
+def test_map_roots_keeps_root_order(monorepo):
+    roots = discover_roots(monorepo)
+
+    assert map_roots(_name, roots) == [".", "services/api", "services/web"]
+    assert map_roots(_name, roots, max_workers=1) == [".", "services/api", "services/web"]
+
+
+def test_each_root_has_its_own_snapshot(monorepo):
+    roots = discover_roots(monorepo)
+
+    indexes = map_roots(load_root_index, roots)
+
+    assert [len(index.by_id) for index in indexes] == [5, 5, 5]
+    assert (monorepo / "services/api/.gitstory/cache/tree.snap").is_file()
+    assert (monorepo / ".gitstory/cache/tree.snap").is_file()
@@ -0,0 +1,106 @@
+"""Unit tests for MinHash/LSH near-duplicate detection."""
+
+import pytest
+
+from gitstory.core import similarity as similarity_module
+from gitstory.core.similarity import (
+    SimilarityIndex,
+    estimate,
+    load_similarity_index,
+    shingles,
+    signature,
+    ticket_text,
+)
+
+CACHE_BODY = (
+    "## Objective\n\nCache parsed ticket headers on disk so repeated validation runs "
+    "skip unchanged files and finish in milliseconds.\n\n"
+    "## Acceptance Criteria\n\n- Unchanged files are never re-read\n"
+)
+OTHER_BODY = (
+    "## Objective\n\nRender the dependency graph of a story as Mermaid diagram text "
+    "for the generated documentation site.\n"
+)
+
+
+@pytest.fixture
+def signed(monkeypatch):
+    """Record the texts signed by load_similarity_index."""
+    texts: list[str] = []
+    original = similarity_module.signature
+
+    def sign(text):
+        texts.append(text)
+        return original(text)
+
+    monkeypatch.setattr(similarity_module, "signature", sign)
+    return texts
+
+
+def test_ticket_text_keeps_title_and_intent_sections():
+    markdown = (
+        "# TASK-0001.1.1.1: Cache headers\n\n**Status**: x\n\n## Objective\n\nSpeed up.\n"
+        "```\ncode here\n```\n\n## Implementation Notes\n\nNot compared.\n"
+    )
+
+    assert ticket_text(markdown).split() == ["Cache", "headers", "Speed", "up."]
+
+
+def test_signature_estimates_jaccard_similarity():
+    same = signature("cache parsed ticket headers on disk")
+
+    assert shingles("The cache of the headers") == {"cache headers"}
+    assert signature("the of and") is None
+    assert estimate(same, signature("Cache parsed ticket headers, on disk!")) == 1.0
+    assert estimate(same, signature("render mermaid diagram text for docs")) < 0.2
+
+
+def test_duplicates_skip_own_lineage(write_ticket, tmp_path):
+    root = tmp_path / "docs" / "tickets"
+    write_ticket("STORY-0001.1.1", title="Header cache", body=CACHE_BODY)
+    write_ticket("TASK-0001.1.1.1", title="Header cache", body=CACHE_BODY)
+    write_ticket("STORY-0001.1.2", title="Header cache", body=CACHE_BODY)
+    write_ticket("STORY-0001.1.3", title="Mermaid graphs", body=OTHER_BODY)
+
+    matches = load_similarity_index(root, None).duplicates(0.8)
+
+    assert {(m.ticket_id, m.other_id) for m in matches} == {
+        ("STORY-0001.1.2", "STORY-0001.1.1"),
+        ("STORY-0001.1.2", "TASK-0001.1.1.1"),
+    }
+    assert all(m.similarity == 1.0 for m in matches)
+
+
+def test_query_finds_existing_tickets_like_a_draft(write_ticket, tmp_path):
+    root = tmp_path / "docs" / "tickets"
+    write_ticket("STORY-0001.1.1", title="Header cache", body=CACHE_BODY)
+    write_ticket("STORY-0001.1.3", title="Mermaid graphs", body=OTHER_BODY)
+    index = load_similarity_index(root, None)
+
+    matches = index.query("Header cache\n" + ticket_text(CACHE_BODY))
+
+    assert [(m.ticket_id, m.similarity) for m in matches] == [("STORY-0001.1.1", 1.0)]
+    assert index.query("nothing alike whatsoever here") == []
+
+
+def test_signatures_are_cached_by_stat_signature(ticket_tree, tmp_path, signed):
+    cache = tmp_path / "cache" / "minhash.snap"
+
+    first = load_similarity_index(ticket_tree, cache)
+    assert len(signed) == 5
+    assert SimilarityIndex.read(cache).entries == first.entries
+
+    signed.clear()
+    load_similarity_index(ticket_tree, cache)
+    assert signed == []
+
+    task = ticket_tree / "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"
+    task.write_text("# TASK-0001.1.1.2: Renamed task\n\n## Objective\n\nSomething new.\n")
+    index = load_similarity_index(ticket_tree, cache)
+    assert len(signed) == 1
+    assert index.entries["INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"][0] == (
+        "TASK-0001.1.1.2"
+    )
+
+    cache.write_bytes(b"GSMINH garbage")
+    assert SimilarityIndex.read(cache) is None
@@ -0,0 +1,103 @@
+"""Unit tests for the ticket tree snapshot."""
+
+import pytest
+
+from gitstory.core import snapshot as snapshot_module
+from gitstory.core.index import TicketIndex
+from gitstory.core.snapshot import TreeSnapshot, load_index
+
+TASK = "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Record the paths re-read from disk by load_index."""
+    paths: list[str] = []
+    original = snapshot_module.read_header
+
+    def read_header(file_path, rel_path):
+        paths.append(rel_path)
+        return original(file_path, rel_path)
+
+    monkeypatch.setattr(snapshot_module, "read_header", read_header)
+    return paths
+
+
+def _same(index, root):
+    assert index.by_path == TicketIndex.scan(root).by_path
+    assert list(index.by_path) == list(TicketIndex.scan(root).by_path)
+
+
+def test_snapshot_round_trip_outside_git(ticket_tree, tmp_path, reads):
+    snap = tmp_path / "tree.snap"
+
+    _same(load_index(ticket_tree, snap), ticket_tree)
+    assert len(reads) == 5
+    assert TreeSnapshot.read(snap).fingerprint is None
+
+    reads.clear()
+    _same(load_index(ticket_tree, snap), ticket_tree)
+    assert reads == []
+
+    (ticket_tree / TASK).write_text("# TASK-0001.1.1.2: Renamed\n\n**Status**: 🟢 Done\n")
+    (ticket_tree / "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.1.md").unlink()
+    index = load_index(ticket_tree, snap)
+    assert reads == [TASK]
+    assert index.by_id["TASK-0001.1.1.2"].title == "Renamed"
+    _same(index, ticket_tree)
+
+
+def test_git_fingerprint_rereads_only_dirty_files(ticket_tree, tmp_path, reads, git):
+    root = ticket_tree.parent.parent
+    snap = tmp_path / "cache" / "tree.snap"
+    git("init", "-q", cwd=root)
+    git("add", ".", cwd=root)
+    git("commit", "-q", "-m", "init", cwd=root)
+
+    load_index(ticket_tree, snap)
+    assert TreeSnapshot.read(snap).fingerprint
+    reads.clear()
+    load_index(ticket_tree, snap)
+    assert reads == []
+
+    (ticket_tree / TASK).write_text("# TASK-0001.1.1.2: Edited in place\n\n**Status**: x\n")
+    assert load_index(ticket_tree, snap).by_id["TASK-0001.1.1.2"].title == "Edited in place"
+    assert reads == [TASK]
+
+    # Reverting the edit removes the file from `git diff HEAD`; it must still be re-read
+    reads.clear()
+    git("checkout", "--", ".", cwd=root)
+    index = load_index(ticket_tree, snap)
+    assert reads == [TASK]
+    _same(index, ticket_tree)
+
+
+def test_git_fingerprint_rereads_staged_edits(ticket_tree, tmp_path, reads, git):
+    root = ticket_tree.parent.parent
+    snap = tmp_path / "cache" / "tree.snap"
+    git("init", "-q", cwd=root)
+    git("add", ".", cwd=root)
+    git("commit", "-q", "-m", "init", cwd=root)
+    load_index(ticket_tree, snap)
+
+    # Staged, the edit matches the index: only a diff against HEAD finds it
+    (ticket_tree / TASK).write_text("# TASK-0001.1.1.2: Staged edit\n\n**Status**: x\n")
+    git("add", ".", cwd=root)
+    reads.clear()
+    index = load_index(ticket_tree, snap)
+
+    assert reads == [TASK]
+    assert index.by_id["TASK-0001.1.1.2"].title == "Staged edit"
+    _same(index, ticket_tree)
+
+
+def test_unusable_snapshots_are_rebuilt(ticket_tree, tmp_path, reads):
+    snap = tmp_path / "tree.snap"
+    snap.write_bytes(b"GSSNAP garbage")
+    _same(load_index(ticket_tree, snap), ticket_tree)
+
+    TreeSnapshot("elsewhere").write(snap)
+    reads.clear()
+    _same(load_index(ticket_tree, snap, save=False), ticket_tree)
+    assert len(reads) == 5
+    assert TreeSnapshot.read(snap).root == "elsewhere"
@@ -0,0 +1,53 @@
+"""Unit tests for compiled ticket templates."""
+
+import pytest
+
+from gitstory.core.templates import (
+    DEFAULT_TEMPLATES,
+    TemplateError,
+    TemplateSet,
+    compile_template,
+)
+
+VALUES = {
+    "id": "TASK-0001.1.1.1",
+    "title": "Parse headers",
+    "status": "🔵 Not Started",
+    "parent": "STORY-0001.1.1",
+    "fields": "**Estimated Hours**: 2\n",
+    "progress": "",
+    "body": "\n## Objective\n\nParse.\n",
+}
+
+
+def test_compiled_template_renders_slots_and_is_cached():
+    compiled = compile_template(DEFAULT_TEMPLATES["task"])
+
+    assert compiled.render(VALUES) == (
+        "# TASK-0001.1.1.1: Parse headers\n\n"
+        "**Parent Story**: [STORY-0001.1.1](README.md)\n"
+        "**Status**: 🔵 Not Started\n"
+        "**Estimated Hours**: 2\n"
+        "\n## Objective\n\nParse.\n"
+    )
+    assert compile_template(str(DEFAULT_TEMPLATES["task"])) is compiled
+    assert compile_template("{{ id }}{{id}}").render({"id": "X"}) == "XX"
+
+
+def test_template_errors():
+    with pytest.raises(TemplateError, match="unknown placeholder"):
+        compile_template("# {{id}}: {{summary}}\n", "task.md")
+    with pytest.raises(TemplateError, match="title"):
+        compile_template("{{title}}").render({})
+
+
+def test_template_files_override_defaults(tmp_path):
+    (tmp_path / "bug.md").write_text("# {{id}}: {{title}}\n\n**Severity**: high\n{{body}}")
+
+    templates = TemplateSet.load(tmp_path)
+
+    assert templates["bug"].render(VALUES).splitlines()[2] == "**Severity**: high"
+    assert templates["task"] is compile_template(DEFAULT_TEMPLATES["task"])
+    (tmp_path / "task.md").write_text("{{oops}}")
+    with pytest.raises(TemplateError, match="task.md"):
+        TemplateSet.load(tmp_path)
@@ -0,0 +1,131 @@
+"""Unit tests for ticket discovery, header parsing and the ticket index."""
+
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import iter_ticket_files, parse_header
+
+
+def test_parse_header_extracts_title_and_fields():
+    """Test title and **Field**: value lines are parsed with line numbers."""
+    lines = [
+        "# STORY-0001.1.3: Implement CLI\n",
+        "\n",
+        "**Parent Epic**: [EPIC-0001.1](../README.md)\n",
+        "**Status**: ✅ Complete\n",
+        "## User Story\n",
+        "**Ignored**: body field\n",
+    ]
+    header = parse_header(lines, "INIT-0001/EPIC-0001.1/STORY-0001.1.3/README.md")
+
+    assert header.ticket_id == "STORY-0001.1.3"
+    assert header.title == "Implement CLI"
+    assert header.status == "✅ Complete"
+    assert header.fields["Status"].line == 4
+    assert header.fields["Parent Epic"].value == "[EPIC-0001.1](../README.md)"
+    assert "Ignored" not in header.fields
+
+
+def test_parse_header_pipe_separated_fields():
+    """Test template-style headers with several fields on one line."""
+    header = parse_header(
+        ["# EPIC-0001.1: Title\n", "**Parent**: [INIT-0001](../README.md) | **Status**: 🔵\n"],
+        "INIT-0001/EPIC-0001.1/README.md",
+    )
+    assert header.fields["Parent"].value == "[INIT-0001](../README.md)"
+    assert header.status == "🔵"
+
+
+def test_parse_header_collects_dependencies():
+    """Test IDs leading bullets under **Requires:**/**Blocks:** become dependencies."""
+    lines = [
+        "# STORY-0001.2.4: Plugin runner\n",
+        "**Status**: 🔵 Not Started\n",
+        "## Dependencies\n",
+        "\n",
+        "**Requires:**\n",
+        "- STORY-0001.2.1 complete (schema, see STORY-0001.2.9)\n",
+        "- [x] STORY-0001.2.2 complete\n",
+        "- skills/gitstory/ directory exists\n",
+        "\n",
+        "**Blocks:**\n",
+        "- EPIC-0001.3 (commands need the runner)\n",
+        "**Note:**\n",
+        "- STORY-0001.2.8 is only mentioned\n",
+        "## Risks\n",
+        "- STORY-0001.2.7\n",
+    ]
+    header = parse_header(lines, "INIT-0001/EPIC-0001.2/STORY-0001.2.4/README.md")
+
+    assert header.requires == ("STORY-0001.2.1", "STORY-0001.2.2")
+    assert header.blocks == ("EPIC-0001.3",)
+
+
+def test_parse_header_dependency_fields():
+    """Test dependency header fields such as **Blocked By** are recognized."""
+    header = parse_header(
+        ["# TASK-0001.1.1.2: Task\n", "**Blocked By**: TASK-0001.1.1.1, BUG-0003\n"],
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md",
+    )
+    assert header.requires == ("TASK-0001.1.1.1", "BUG-0003")
+    assert header.blocks == ()
+
+
+def test_parse_header_without_title():
+    """Test files without a title line have no ticket ID."""
+    header = parse_header(["Some text\n", "## Section\n"], "INIT-0001/README.md")
+    assert header.ticket_id is None
+    assert header.status is None
+
+
+def test_file_ticket_id():
+    """Test the ID implied by the file location."""
+    readme = parse_header([], "INIT-0001/EPIC-0001.2/README.md")
+    task = parse_header([], "INIT-0001/EPIC-0001.2/STORY-0001.2.3/TASK-0001.2.3.4.md")
+    assert readme.file_ticket_id == "EPIC-0001.2"
+    assert task.file_ticket_id == "TASK-0001.2.3.4"
+
+
+def test_iter_ticket_files_skips_non_tickets(ticket_tree):
+    """Test only ticket READMEs and TASK/BUG files are discovered, parents first."""
+    (ticket_tree / "CLAUDE.md").write_text("# Guidelines\n")
+    (ticket_tree / "INIT-0001" / "notes.md").write_text("# Notes\n")
+    (ticket_tree / "BUG-0001.md").write_text("# BUG-0001: Crash\n")
+
+    assert list(iter_ticket_files(ticket_tree)) == [
+        "BUG-0001.md",
+        "INIT-0001/README.md",
+        "INIT-0001/EPIC-0001.1/README.md",
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/README.md",
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.1.md",
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md",
+    ]
+
+
+def test_iter_ticket_files_missing_root(tmp_path):
+    """Test a missing root yields nothing."""
+    assert list(iter_ticket_files(tmp_path / "missing")) == []
+
+
+def test_index_children_and_ancestors(ticket_tree):
+    """Test the index derives children from IDs in numeric order."""
+    index = TicketIndex.scan(ticket_tree)
+
+    assert len(index) == 5
+    assert "STORY-0001.1.1" in index
+    assert index.children["STORY-0001.1.1"] == ["TASK-0001.1.1.1", "TASK-0001.1.1.2"]
+    assert index.ancestor_ids("TASK-0001.1.1.2") == ["INIT-0001", "EPIC-0001.1", "STORY-0001.1.1"]
+    assert index.parent_id("INIT-0001") is None
+
+
+def test_index_tracks_and_removes_duplicates():
+    """Test duplicate IDs are recorded and resolved when a copy is removed."""
+    first = parse_header(["# TASK-0001.1.1.1: A\n"], "a/TASK-0001.1.1.1.md")
+    second = parse_header(["# TASK-0001.1.1.1: B\n"], "b/TASK-0001.1.1.1.md")
+    index = TicketIndex([first, second])
+
+    assert index.duplicates == {"TASK-0001.1.1.1": ["a/TASK-0001.1.1.1.md", "b/TASK-0001.1.1.1.md"]}
+    index.remove("a/TASK-0001.1.1.1.md")
+    assert index.duplicates == {}
+    assert index.get("TASK-0001.1.1.1") is second
+    index.remove("b/TASK-0001.1.1.1.md")
+    assert "TASK-0001.1.1.1" not in index
+    assert index.children["STORY-0001.1.1"] == []
@@ -0,0 +1,177 @@
+"""Unit tests for full and incremental tree validation."""
+
+import os
+
+from gitstory.core.manifest import ValidationManifest
+from gitstory.core.validation import validate_tree
+
+
+def _run(root, manifest, **kwargs):
+    return validate_tree(root, root.parent / "workflow.yaml", manifest, **kwargs)
+
+
+def _touch_later(path):
+    """Bump mtime so stat signatures differ even on coarse-grained filesystems."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_full_validation_records_manifest(ticket_tree):
+    """A full pass validates every ticket and records hashes and headers."""
+    manifest = ValidationManifest()
+    report = _run(ticket_tree, manifest)
+
+    assert report.result.valid
+    assert report.total == 5
+    assert len(report.revalidated) == 5
+    entry = manifest.files["INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.1.md"]
+    assert entry.header is not None
+    assert entry.header.ticket_id == "TASK-0001.1.1.1"
+    assert len(entry.hash) == 32
+
+
+def test_changed_only_skips_unchanged_tree(ticket_tree):
+    """With nothing changed, no ticket is revalidated."""
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+
+    report = _run(ticket_tree, manifest, changed_only=True)
+    assert report.revalidated == []
+    assert report.total == 5
+
+
+def test_touch_without_content_change_is_not_revalidated(ticket_tree):
+    """A changed mtime with an identical hash does not trigger revalidation."""
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+    _touch_later(ticket_tree / "INIT-0001" / "README.md")
+
+    assert _run(ticket_tree, manifest, changed_only=True).revalidated == []
+
+
+def test_changed_task_revalidates_ancestors(ticket_tree, write_ticket):
+    """Changing a task rechecks it and its ancestors, not its sibling."""
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+    _touch_later(write_ticket("TASK-0001.1.1.2", status="🟡 In Progress"))
+
+    report = _run(ticket_tree, manifest, changed_only=True)
+    assert report.revalidated == [
+        "INIT-0001/EPIC-0001.1/README.md",
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/README.md",
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md",
+        "INIT-0001/README.md",
+    ]
+
+
+def test_changed_parent_revalidates_children(ticket_tree, write_ticket):
+    """Completing a story with an open task surfaces the cross-file warning."""
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+    _touch_later(write_ticket("STORY-0001.1.1", status="✅ Complete"))
+
+    report = _run(ticket_tree, manifest, changed_only=True)
+    assert "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.1.md" in report.revalidated
+    assert [w.type for w in report.result.warnings] == ["incomplete_children"]
+
+
+def test_deleted_parent_reports_orphans(ticket_tree):
+    """Deleting a ticket revalidates its children, which lose their parent."""
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+    (ticket_tree / "INIT-0001" / "EPIC-0001.1" / "README.md").unlink()
+
+    report = _run(ticket_tree, manifest, changed_only=True)
+    assert report.revalidated == [
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/README.md",
+        "INIT-0001/README.md",
+    ]
+    assert [e.type for e in report.result.errors] == ["missing_parent"]
+    assert "INIT-0001/EPIC-0001.1/README.md" not in manifest.files
+
+
+def test_cached_issues_are_reported_again(ticket_tree, write_ticket):
+    """Issues of unchanged files come from the manifest on later runs."""
+    write_ticket("TASK-0001.1.1.2", status="Someday")
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+
+    report = _run(ticket_tree, manifest, changed_only=True)
+    assert report.revalidated == []
+    assert [e.type for e in report.result.errors] == ["unknown_status"]
+
+
+def test_forced_paths_are_revalidated(ticket_tree):
+    """Paths from git diff are revalidated even if their hash matches."""
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+
+    report = _run(ticket_tree, manifest, changed_only=True, changed_paths={"INIT-0001/README.md"})
+    assert report.revalidated == ["INIT-0001/EPIC-0001.1/README.md", "INIT-0001/README.md"]
+
+
+def test_workflow_change_revalidates_everything(ticket_tree):
+    """Editing workflow.yaml rechecks all tickets against its states."""
+    manifest = ValidationManifest()
+    _run(ticket_tree, manifest)
+    (ticket_tree.parent / "workflow.yaml").write_text(
+        "metadata:\n  config_version: '1.0'\nworkflow:\n  states:\n"
+        "    todo: {name: Todo, type: start}\n    done: {name: Done, type: end}\n"
+        "  transitions:\n    - {id: finish, from: todo, to: done}\n"
+    )
+
+    report = _run(ticket_tree, manifest, changed_only=True)
+    assert report.workflow_revalidated
+    assert len(report.revalidated) == 5
+    assert {e.type for e in report.result.errors} == {"unknown_status"}
+
+
+def test_manifest_round_trip(ticket_tree, tmp_path):
+    """Saved manifests load back with headers and issues intact."""
+    manifest = ValidationManifest(root=str(ticket_tree))
+    (ticket_tree / "INIT-0001" / "README.md").write_text("# INIT-0001: Goal\n\n**Status**: Meh\n")
+    _run(ticket_tree, manifest)
+    path = tmp_path / ".gitstory" / "cache" / "validation.json"
+    manifest.save(path)
+
+    loaded = ValidationManifest.load(path)
+    assert loaded.root == str(ticket_tree)
+    assert loaded.files.keys() == manifest.files.keys()
+    entry = loaded.files["INIT-0001/README.md"]
+    assert entry.header == manifest.files["INIT-0001/README.md"].header
+    assert [i.type for i in entry.issues] == ["unknown_status"]
+
+
+def test_manifest_load_ignores_corrupt_file(tmp_path):
+    """Corrupt or missing manifests load as empty."""
+    path = tmp_path / "validation.json"
+    path.write_text("{not json")
+    assert ValidationManifest.load(path).files == {}
+    assert ValidationManifest.load(tmp_path / "missing.json").files == {}
+
+
+def test_dependency_rules_run_on_every_pass(ticket_tree, write_ticket):
+    """A new dependency cycle is reported even though only one file changed."""
+    manifest = ValidationManifest()
+    write_ticket("TASK-0001.1.1.1", status="🔵 Not Started", extra="**Requires**: TASK-0001.1.1.2")
+    _run(ticket_tree, manifest)
+    _touch_later(
+        write_ticket("TASK-0001.1.1.2", extra="**Requires**: TASK-0001.1.1.1"),
+    )
+
+    report = _run(ticket_tree, manifest, changed_only=True)
+    assert [e.type for e in report.result.errors] == ["dependency_cycle"]
+    assert "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.1.md" not in report.revalidated
+
+
+def test_link_rules_use_cached_references(ticket_tree, write_ticket):
+    """Deleting a link target breaks the link without re-reading the linking file."""
+    manifest = ValidationManifest()
+    write_ticket("TASK-0001.1.1.2", body="## Objective\n\nAfter [t1](TASK-0001.1.1.1.md).\n")
+    assert _run(ticket_tree, manifest).result.valid
+
+    (ticket_tree / "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.1.md").unlink()
+    report = _run(ticket_tree, manifest, changed_only=True)
+
+    assert [(e.type, e.line) for e in report.result.errors] == [("broken_link", 7)]
+    assert "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md" not in report.revalidated
@@ -0,0 +1,136 @@
+"""Unit tests for file watchers and change debouncing."""
+
+import sys
+import time
+
+import pytest
+
+from gitstory.core.watch import (
+    FileWatcher,
+    InotifyWatcher,
+    PollingWatcher,
+    open_watcher,
+    watch_changes,
+)
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+def _watchers():
+    params = [pytest.param(lambda root, files: PollingWatcher(root, files, 0.01, 0.02), id="poll")]
+    if sys.platform.startswith("linux"):
+        params.append(pytest.param(InotifyWatcher, id="inotify"))
+    return params
+
+
+@pytest.fixture
+def workflow(ticket_tree):
+    """A workflow.yaml outside the tickets root."""
+    path = ticket_tree.parent / "workflow.yaml"
+    path.write_text("workflow: {}\n")
+    return path
+
+
+@pytest.mark.parametrize("make_watcher", _watchers())
+def test_reports_modified_ticket(make_watcher, ticket_tree, write_ticket, workflow):
+    """Writing a ticket file is reported."""
+    with make_watcher(ticket_tree, [workflow]) as watcher:
+        path = write_ticket("TASK-0001.1.1.2", status="🟡 In Progress", title="Changed title")
+        assert str(path) in watcher.wait(2.0)
+
+
+@pytest.mark.parametrize("make_watcher", _watchers())
+def test_reports_workflow_and_ignores_other_files(make_watcher, ticket_tree, workflow):
+    """Listed files are reported; swap files and siblings of listed files are not."""
+    with make_watcher(ticket_tree, [workflow]) as watcher:
+        (ticket_tree / "INIT-0001" / ".README.md.swp").write_text("x")
+        (workflow.parent / "other.yaml").write_text("x")
+        assert watcher.wait(0.1) == set()
+
+        workflow.write_text("workflow: {states: {}}\n")
+        assert watcher.wait(2.0) == {str(workflow)}
+
+
+@pytest.mark.parametrize("make_watcher", _watchers())
+def test_reports_new_directories_and_their_files(make_watcher, ticket_tree, write_ticket):
+    """Tickets in directories created while watching are reported."""
+    with make_watcher(ticket_tree, []) as watcher:
+        write_ticket("EPIC-0001.2")
+        assert watcher.wait(2.0)
+        watcher.wait(0.1)
+
+        path = write_ticket("STORY-0001.2.1")
+        assert str(path) in watcher.wait(2.0) | watcher.wait(0.2)
+
+
+@pytest.mark.parametrize("make_watcher", _watchers())
+def test_reports_deleted_ticket(make_watcher, ticket_tree):
+    """Deleting a ticket file is reported."""
+    path = ticket_tree / "INIT-0001" / "EPIC-0001.1" / "STORY-0001.1.1" / "TASK-0001.1.1.1.md"
+    with make_watcher(ticket_tree, []) as watcher:
+        path.unlink()
+        assert str(path) in watcher.wait(2.0)
+
+
+@linux_only
+def test_inotify_idle_wait_uses_no_cpu(ticket_tree):
+    """Idle waiting blocks in the kernel instead of spinning."""
+    with InotifyWatcher(ticket_tree) as watcher:
+        start = time.process_time()
+        assert watcher.wait(0.3) == set()
+        assert time.process_time() - start < 0.05
+
+
+def test_open_watcher_polling_fallback(ticket_tree):
+    """polling=True forces the portable watcher."""
+    with open_watcher(ticket_tree, polling=True) as watcher:
+        assert isinstance(watcher, PollingWatcher)
+
+
+def test_polling_backs_off_while_idle(ticket_tree):
+    """The poll interval grows while nothing changes and resets on change."""
+    watcher = PollingWatcher(ticket_tree, interval=0.01, max_interval=0.04)
+    watcher.wait(0.1)
+    assert watcher._interval == 0.04
+
+
+class FakeWatcher(FileWatcher):
+    """Replays scripted batches; None stands for a timeout."""
+
+    def __init__(self, script):
+        super().__init__(".")
+        self.script = list(script)
+        self.timeouts = []
+
+    def wait(self, timeout=None):
+        self.timeouts.append(timeout)
+        if not self.script:
+            raise KeyboardInterrupt
+        item = self.script.pop(0)
+        return set() if item is None else {item}
+
+
+def test_watch_changes_coalesces_bursts():
+    """Changes arriving within the debounce window form one batch."""
+    watcher = FakeWatcher(["a", "b", "c", None, "d", None])
+    batches = watch_changes(watcher, debounce=0.05)
+
+    assert next(batches) == {"a", "b", "c"}
+    assert next(batches) == {"d"}
+    assert watcher.timeouts[:4] == [None, 0.05, 0.05, 0.05]
+
+
+def test_watch_changes_caps_batch_delay():
+    """A continuous stream of writes is flushed after max_delay."""
+
+    class Busy(FileWatcher):
+        def wait(self, timeout=None):
+            time.sleep(0.01)
+            return {"a"}
+
+    batches = watch_changes(Busy("."), debounce=0.05, max_delay=0.05)
+    start = time.monotonic()
+    assert next(batches) == {"a"}
+    assert time.monotonic() - start < 0.5
@@ -0,0 +1,108 @@
+"""Unit tests for parallel execution in pooled git worktrees."""
+
+import json
+
+import pytest
+
+from gitstory.core.execute import ExecutionRequest
+from gitstory.core.worktrees import (
+    POOL_STATE_FILE,
+    STDERR_TAIL_BYTES,
+    WorktreeError,
+    WorktreePool,
+    run_in_worktrees,
+)
+
+
+@pytest.fixture
+def repo(ticket_tree, write_ticket, git, monkeypatch):
+    """Project with the ticket tree committed, run from its root."""
+    write_ticket("TASK-0001.1.1.3")
+    project = ticket_tree.parent.parent
+    git("init", "-q", "-b", "main", cwd=project)
+    (project / ".gitignore").write_text(".gitstory/cache/\n")
+    git("add", ".", cwd=project)
+    git("commit", "-q", "-m", "init", cwd=project)
+    monkeypatch.chdir(project)
+    return project
+
+
+def _run(pool, *ticket_ids, command=None):
+    requests = [ExecutionRequest(t, to_state="in_progress") for t in ticket_ids]
+    return run_in_worktrees(pool, requests, "docs/tickets", ".gitstory/workflow.yaml", command)
+
+
+def test_tickets_run_in_parallel_on_their_own_branches(repo, git):
+    pool = WorktreePool.load(repo, size=2)
+
+    results = _run(
+        pool, "TASK-0001.1.1.2", "TASK-0001.1.1.3", command="test -n $GITSTORY_TICKET_ID"
+    )
+    pool.save()
+
+    assert [(r.status, r.returncode) for r in results] == [("done", 0), ("done", 0)]
+    assert {r.worktree for r in results} == {str(pool.path(s)) for s in pool.slots.values()}
+    log = git("log", "-1", "--format=%s", "gitstory/TASK-0001.1.1.3", cwd=repo)
+    assert log == "chore(tickets): update TASK-0001.1.1.3"
+    # The main checkout is untouched
+    assert (
+        "Not Started"
+        in (
+            repo / "docs/tickets/INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.2.md"
+        ).read_text()
+    )
+    state = json.loads((pool.directory / POOL_STATE_FILE).read_text())
+    assert sorted(s["branch"] for s in state["slots"]) == [
+        "gitstory/TASK-0001.1.1.2",
+        "gitstory/TASK-0001.1.1.3",
+    ]
+
+    failed = _run(
+        WorktreePool.load(repo, size=2), "TASK-0001.1.1.2", command="echo oops >&2; exit 3"
+    )
+    assert (failed[0].status, failed[0].returncode) == ("failed", 3)
+    assert failed[0].stderr == "oops\n"
+    assert failed[0].errors == ["Command exited with 3: oops"]
+    [noisy] = _run(pool, "TASK-0001.1.1.3", command="yes x | head -c 10000 >&2")
+    assert noisy.stderr == "x\n" * (STDERR_TAIL_BYTES // 2)
+
+
+def test_a_slot_goes_to_the_next_ticket_as_soon_as_its_job_finishes(repo, tmp_path):
+    pool = WorktreePool.load(repo, size=2)
+    mark = tmp_path / "started"
+    # TASK-0001.1.1.2 only succeeds once TASK-0001.1.1.1, third in line, has started
+    command = (
+        f"case $GITSTORY_TICKET_ID in "
+        f"*.1.1.1) touch {mark};; "
+        f"*.1.1.2) for i in $(seq 100); do test -f {mark} && exit 0; sleep 0.05; done; exit 1;; "
+        f"esac"
+    )
+
+    results = _run(pool, "TASK-0001.1.1.2", "TASK-0001.1.1.3", "TASK-0001.1.1.1", command=command)
+
+    assert [(r.ticket_id, r.status) for r in results] == [
+        ("TASK-0001.1.1.2", "done"),
+        ("TASK-0001.1.1.3", "done"),
+        ("TASK-0001.1.1.1", "done"),
+    ]
+
+
+def test_worktrees_are_recycled_least_recently_used_first(repo):
+    pool = WorktreePool.load(repo, size=2)
+    _run(pool, "TASK-0001.1.1.2")
+    _run(pool, "TASK-0001.1.1.3")
+    first = next(s for s in pool.slots.values() if s.ticket_id == "TASK-0001.1.1.2")
+
+    [result] = _run(pool, "TASK-0001.1.1.1")
+
+    assert result.worktree == str(pool.path(first))
+    assert first.branch == "gitstory/TASK-0001.1.1.1"
+    # Dirty worktrees are never recycled or pruned
+    for slot in pool.slots.values():
+        (pool.path(slot) / "docs/tickets/INIT-0001/README.md").write_text("edited\n")
+    with pytest.raises(WorktreeError):
+        pool.acquire("TASK-0001.1.1.2", "HEAD")
+    pool.size = 1
+    assert pool.prune() == []
+    pool.refresh()
+    assert {s.status for s in pool.slots.values()} == {"dirty"}
@@ -0,0 +1,141 @@
+"""Unit tests for the surgical header writer."""
+
+import os
+
+import pytest
+
+from gitstory.core import writer
+from gitstory.core.writer import (
+    WriteConflictError,
+    atomic_write,
+    content_hash,
+    ignore_cache_errors,
+    patch_files,
+    patch_header,
+    scan_header,
+    write_files,
+)
+
+TICKET = (
+    "# TASK-0001.1.1.1: Title\r\n"
+    "\r\n"
+    "**Status**: 🔵 Not Started | **Points**: 3  \r\n"
+    "**Progress**: ░░░░░░░░░░ 0%\r\n"
+    "\r\n"
+    "## Body\r\n"
+    "**Status**: not a header field\r\n"
+).encode()
+
+
+def test_scan_header_records_value_offsets():
+    spans = scan_header(TICKET)
+
+    start, end = spans.values["Status"]
+    assert TICKET[start:end] == "🔵 Not Started".encode()
+    start, end = spans.values["Points"]
+    assert TICKET[start:end] == b"3"
+    assert TICKET[spans.insert_at :].startswith(b"\r\n## Body")
+    assert spans.newline == b"\r\n"
+
+
+def test_patch_header_only_touches_values():
+    patched = patch_header(TICKET, {"Status": "🟡 In Progress", "Points": "5"})
+
+    expected = TICKET.replace("🔵 Not Started".encode(), "🟡 In Progress".encode(), 1)
+    assert patched == expected.replace(b"**Points**: 3", b"**Points**: 5")
+
+
+def test_patch_header_adds_missing_fields_after_header():
+    patched = patch_header(TICKET, {"Actual Hours": "2"})
+
+    assert b"0%\r\n**Actual Hours**: 2\r\n\r\n## Body" in patched
+    assert patch_header(b"# T: x\n\n## Body\n", {"Actual Hours": "2"}) == b"# T: x\n\n## Body\n"
+    assert patch_header(b"# T: x\n**A**: 1", {"B": "2"}) == b"# T: x\n**A**: 1\n**B**: 2"
+
+
+def test_unchanged_values_return_same_object():
+    assert patch_header(TICKET, {"Points": "3", "Status": " 🔵 Not Started "}) is TICKET
+
+
+def test_patch_files_skips_unchanged_files(tmp_path):
+    same, changed = tmp_path / "a.md", tmp_path / "b.md"
+    for path in (same, changed):
+        path.write_bytes(TICKET)
+    mtime = same.stat().st_mtime_ns
+
+    written = patch_files({same: {"Points": "3"}, changed: {"Points": "8"}})
+
+    assert written == [changed]
+    assert same.stat().st_mtime_ns == mtime
+    assert b"**Points**: 8" in changed.read_bytes()
+
+
+def test_write_files_keeps_mode_and_cleans_up_on_failure(tmp_path):
+    good = tmp_path / "a.md"
+    good.write_text("old")
+    good.chmod(0o640)
+
+    write_files({good: b"new"})
+    assert good.read_text() == "new"
+    assert good.stat().st_mode & 0o777 == 0o640
+
+    with pytest.raises(OSError):
+        write_files({good: b"newer", tmp_path / "missing" / "b.md": b"x"})
+    assert good.read_text() == "new"
+    assert os.listdir(tmp_path) == ["a.md"]
+
+
+def test_write_files_creates_new_files_with_umask_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(writer, "_UMASK", 0o022)
+    created = tmp_path / "TASK-0001.md"
+
+    write_files({created: b"new"}, durable=False)
+
+    assert created.stat().st_mode & 0o777 == 0o644
+
+
+def test_write_files_batches_fsync(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(writer, "FSYNC_BATCH", 2)
+    monkeypatch.setattr(writer.os, "fsync", synced.append)
+    paths = [tmp_path / f"{n}.md" for n in range(5)]
+
+    write_files({path: b"x" for path in paths})
+
+    # 5 files plus one directory; no file descriptor is left open
+    assert len(synced) == 6
+    assert all(path.read_bytes() == b"x" for path in paths)
+    assert write_files({}, durable=False) is None
+
+
+def test_write_files_rejects_files_changed_since_read(tmp_path):
+    target = tmp_path / "a.md"
+    source = tmp_path / "b.md"
+    target.write_bytes(b"v1")
+    source.write_bytes(b"input")
+    expected = {target: content_hash(b"v1"), source: content_hash(b"input")}
+    source.write_bytes(b"input changed by another run")
+
+    with pytest.raises(WriteConflictError) as excinfo:
+        write_files({target: b"v2"}, expected=expected)
+    assert excinfo.value.paths == [source]
+    assert target.read_bytes() == b"v1"
+    assert sorted(os.listdir(tmp_path)) == ["a.md", "b.md"]
+
+    expected[source] = content_hash(source.read_bytes())
+    write_files({target: b"v2"}, expected=expected)
+    assert target.read_bytes() == b"v2"
+    with pytest.raises(WriteConflictError):
+        write_files({target: b"v3"}, expected=expected)
+
+
+def test_atomic_write_creates_directories_and_cache_errors_are_ignored(tmp_path):
+    target = tmp_path / "cache" / "state.json"
+
+    atomic_write(target, b"v1")
+    atomic_write(target, b"v2")
+
+    assert target.read_bytes() == b"v2"
+    assert [p.name for p in target.parent.iterdir()] == ["state.json"]
+    with ignore_cache_errors():
+        atomic_write(target / "not-a-directory", b"x")
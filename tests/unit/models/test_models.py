@@ -0,0 +1,66 @@
+"""Unit tests for the pydantic ticket, workflow and plugin output models."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from gitstory.core.workflow import DEFAULT_WORKFLOW, Workflow
+from gitstory.models import (
+    TICKETS_ADAPTER,
+    WORKFLOW_ADAPTER,
+    plugin_output_adapter,
+)
+
+RAW_TICKET = {
+    "path": "INIT-0001/README.md",
+    "ticket_id": "INIT-0001",
+    "title": "Init",
+    "fields": {"Status": ["🔵 Not Started", 3]},
+    "requires": ["BUG-0001"],
+}
+
+
+def test_tickets_adapter_validates_and_coerces():
+    [ticket] = TICKETS_ADAPTER.validate_python([RAW_TICKET])
+
+    assert ticket.fields == {"Status": ("🔵 Not Started", 3)}
+    assert ticket.requires == ("BUG-0001",)
+    with pytest.raises(ValidationError):
+        TICKETS_ADAPTER.validate_python([{**RAW_TICKET, "ticket_id": "TASK-1"}])
+    with pytest.raises(ValidationError):
+        TICKETS_ADAPTER.validate_python([{**RAW_TICKET, "unknown": 1}])
+
+
+def test_workflow_adapter_reads_yaml_aliases():
+    config = WORKFLOW_ADAPTER.validate_python(DEFAULT_WORKFLOW)
+
+    complete = config.workflow.transitions[1]
+    assert (complete.from_state, complete.to_state) == ("in_progress", "done")
+    assert complete.guards == ("all_children_done", "acceptance_criteria_met")
+    with pytest.raises(ValidationError):
+        Workflow.from_dict({"workflow": {"states": ["not", "a", "mapping"]}})
+
+
+def test_workflow_state_name_defaults_to_id():
+    workflow = Workflow.from_dict({"workflow": {"states": {"todo": {"type": "start"}}}})
+
+    assert workflow.states["todo"].name == "todo"
+
+
+@pytest.mark.parametrize(
+    ("plugin_type", "stdout", "valid"),
+    [
+        ("guard", '{"passed": true, "pending": []}', True),
+        ("guard", '{"passed": "yes"}', False),
+        ("event", '{"occurred": false}', True),
+        ("action", '{"passed": true}', False),
+    ],
+)
+def test_plugin_output_adapters(plugin_type, stdout, valid):
+    adapter = plugin_output_adapter(plugin_type)
+    if valid:
+        assert adapter.validate_json(stdout).model_dump() == json.loads(stdout)
+    else:
+        with pytest.raises(ValidationError):
+            adapter.validate_json(stdout)
@@ -0,0 +1,125 @@
+"""Unit tests for TicketId value type."""
+
+import pytest
+
+from gitstory.models import InvalidTicketIdError, TicketId
+
+
+@pytest.mark.parametrize(
+    ("raw", "ticket_type", "parts"),
+    [
+        ("INIT-0001", "initiative", (1,)),
+        ("EPIC-0001.2", "epic", (1, 2)),
+        ("STORY-0001.2.3", "story", (1, 2, 3)),
+        ("TASK-0001.2.3.4", "task", (1, 2, 3, 4)),
+        ("BUG-0042", "bug", (42,)),
+    ],
+)
+def test_parse_all_ticket_types(raw, ticket_type, parts):
+    """Test parsing each ticket type and round-tripping to string."""
+    tid = TicketId.parse(raw)
+    assert tid.type == ticket_type
+    assert tid.parts == parts
+    assert str(tid) == raw
+
+
+@pytest.mark.parametrize(
+    "raw", ["STORY-999", "STORY-0001.2", "TASK-0001.2.3", "EPIC-1.2", "BUG-0001.1", "FOO-0001", ""]
+)
+def test_parse_rejects_invalid_ids(raw):
+    """Test malformed IDs raise InvalidTicketIdError."""
+    with pytest.raises(InvalidTicketIdError, match="Invalid ticket ID format"):
+        TicketId.parse(raw)
+
+
+def test_parent_and_ancestors():
+    """Test parent/ancestor derivation from ID parts."""
+    tid = TicketId.parse("TASK-0001.2.3.4")
+    assert str(tid.parent) == "STORY-0001.2.3"
+    assert [str(a) for a in tid.ancestors] == ["INIT-0001", "EPIC-0001.2", "STORY-0001.2.3"]
+    assert TicketId.parse("INIT-0001").parent is None
+    assert TicketId.parse("BUG-0042").parent is None
+    assert TicketId.parse("BUG-0042").ancestors == ()
+
+
+def test_child_and_is_ancestor_of():
+    """Test child construction and ancestry checks."""
+    story = TicketId.parse("STORY-0001.2.3")
+    task = story.child(4)
+    assert str(task) == "TASK-0001.2.3.4"
+    assert story.is_ancestor_of(task)
+    assert TicketId.parse("INIT-0001").is_ancestor_of(task)
+    assert not task.is_ancestor_of(story)
+    assert not story.is_ancestor_of(story)
+    with pytest.raises(InvalidTicketIdError):
+        task.child(1)
+
+
+@pytest.mark.parametrize(
+    ("raw", "path"),
+    [
+        ("INIT-0001", "docs/tickets/INIT-0001/README.md"),
+        ("EPIC-0001.2", "docs/tickets/INIT-0001/EPIC-0001.2/README.md"),
+        ("STORY-0001.2.3", "docs/tickets/INIT-0001/EPIC-0001.2/STORY-0001.2.3/README.md"),
+        (
+            "TASK-0001.2.3.4",
+            "docs/tickets/INIT-0001/EPIC-0001.2/STORY-0001.2.3/TASK-0001.2.3.4.md",
+        ),
+        ("BUG-0042", "docs/tickets/BUG-0042.md"),
+    ],
+)
+def test_path_computation(raw, path):
+    """Test direct path computation for each ticket type."""
+    assert TicketId.parse(raw).path() == path
+
+
+def test_path_custom_root():
+    """Test path under a custom or empty root."""
+    tid = TicketId.parse("EPIC-0001.2")
+    assert tid.path("tickets/") == "tickets/INIT-0001/EPIC-0001.2/README.md"
+    assert tid.path("") == "INIT-0001/EPIC-0001.2/README.md"
+
+
+def test_total_ordering_is_depth_first():
+    """Test IDs sort depth-first with numeric (not lexical) parts, bugs last."""
+    ids = [
+        TicketId.parse(raw)
+        for raw in ["BUG-0001", "EPIC-0001.10", "STORY-0001.2.1", "EPIC-0001.2", "INIT-0001"]
+    ]
+    assert [str(t) for t in sorted(ids)] == [
+        "INIT-0001",
+        "EPIC-0001.2",
+        "STORY-0001.2.1",
+        "EPIC-0001.10",
+        "BUG-0001",
+    ]
+    assert TicketId.parse("EPIC-0001.2") <= TicketId.parse("EPIC-0001.2")
+    assert TicketId.parse("EPIC-0001.3") > TicketId.parse("EPIC-0001.2")
+
+
+def test_equality_and_hashing():
+    """Test equal IDs hash equally and bugs differ from initiatives."""
+    assert TicketId.parse("STORY-0001.2.3") == TicketId((1, 2, 3))
+    assert len({TicketId.parse("STORY-0001.2.3"), TicketId((1, 2, 3))}) == 1
+    assert TicketId.parse("BUG-0001") != TicketId.parse("INIT-0001")
+    assert TicketId.parse("INIT-0001") != "INIT-0001"
+
+
+def test_to_dict_matches_parse_ticket_contract():
+    """Test metadata dict matches the parse_ticket output contract."""
+    assert TicketId.parse("STORY-0001.2.3").to_dict() == {
+        "ticket_id": "STORY-0001.2.3",
+        "type": "story",
+        "initiative": "0001",
+        "epic": "2",
+        "story": "3",
+        "task": None,
+        "path": "docs/tickets/INIT-0001/EPIC-0001.2/STORY-0001.2.3/README.md",
+        "parent_type": "epic",
+        "parent_id": "EPIC-0001.2",
+        "children_pattern": "TASK-0001.2.3.*",
+    }
+    bug = TicketId.parse("BUG-0042").to_dict()
+    assert bug["parent_type"] is None
+    assert bug["initiative"] is None
+    assert bug["children_pattern"] is None
@@ -0,0 +1,125 @@
+"""Unit tests for ticket structure validation."""
+
+from gitstory.core.graph import TicketGraph
+from gitstory.core.index import TicketIndex
+from gitstory.core.tickets import parse_header
+from gitstory.core.workflow import DEFAULT_WORKFLOW, Workflow
+from gitstory.validators.ticket_validator import (
+    check_dependency_graph,
+    check_ticket_file,
+    check_ticket_relations,
+)
+
+WORKFLOW = Workflow.from_dict(DEFAULT_WORKFLOW)
+
+
+def _header(path: str, *lines: str):
+    return parse_header([f"{line}\n" for line in lines], path)
+
+
+def test_valid_ticket_has_no_issues() -> None:
+    """A well-formed ticket passes file rules."""
+    header = _header("INIT-0001/README.md", "# INIT-0001: Goal", "**Status**: 🟡 In Progress")
+    assert check_ticket_file(header, WORKFLOW) == []
+
+
+def test_missing_title() -> None:
+    """Files without a title line report missing_title only."""
+    issues = check_ticket_file(_header("INIT-0001/README.md", "**Status**: 🔵"), WORKFLOW)
+    assert [i.type for i in issues] == ["missing_title"]
+
+
+def test_id_mismatch_and_missing_status() -> None:
+    """Title/location mismatches and missing Status are reported."""
+    header = _header("INIT-0001/EPIC-0001.2/README.md", "# EPIC-0001.3: Wrong")
+    assert [i.type for i in check_ticket_file(header, WORKFLOW)] == ["id_mismatch", "missing_field"]
+
+
+def test_invalid_ticket_id() -> None:
+    """Malformed IDs in the title are reported."""
+    header = _header("STORY-1/README.md", "# STORY-1: Bad", "**Status**: 🔵 Not Started")
+    assert [i.type for i in check_ticket_file(header, WORKFLOW)] == ["invalid_ticket_id"]
+
+
+def test_unknown_status_reports_field_line() -> None:
+    """Statuses that match no workflow state are reported at their line."""
+    header = _header("INIT-0001/README.md", "# INIT-0001: Goal", "", "**Status**: Someday")
+    (issue,) = check_ticket_file(header, WORKFLOW)
+    assert issue.type == "unknown_status"
+    assert issue.line == 3
+
+
+def test_missing_parent_and_incomplete_children() -> None:
+    """Cross-file rules check parent existence and done-with-open-children."""
+    story = _header(
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/README.md",
+        "# STORY-0001.1.1: Story",
+        "**Status**: ✅ Complete",
+    )
+    task = _header(
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.1/TASK-0001.1.1.1.md",
+        "# TASK-0001.1.1.1: Task",
+        "**Status**: 🟡 In Progress",
+    )
+    index = TicketIndex([story, task])
+
+    issues = check_ticket_relations(story, index, WORKFLOW)
+    assert [i.type for i in issues] == ["missing_parent", "incomplete_children"]
+    assert issues[1].severity == "warning"
+    assert "TASK-0001.1.1.1" in issues[1].message
+    assert check_ticket_relations(task, index, WORKFLOW) == []
+
+
+def test_duplicate_ids() -> None:
+    """Both files declaring the same ID are reported."""
+    a = _header("INIT-0001/README.md", "# INIT-0001: A", "**Status**: 🔵")
+    b = _header("INIT-0002/README.md", "# INIT-0001: B", "**Status**: 🔵")
+    index = TicketIndex([a, b])
+    assert [i.type for i in check_ticket_relations(a, index, WORKFLOW)] == ["duplicate_id"]
+    assert "INIT-0002/README.md" in check_ticket_relations(a, index, WORKFLOW)[0].message
+
+
+def test_dependency_graph_rules():
+    """Cycles, unknown dependencies and done-while-blocked are reported."""
+    a = _header(
+        "INIT-0001/README.md",
+        "# INIT-0001: A",
+        "**Status**: ✅ Complete",
+        "**Blocked By**: INIT-0002, INIT-0009",
+    )
+    b = _header(
+        "INIT-0002/README.md", "# INIT-0002: B", "**Status**: 🔵", "**Requires**: INIT-0003"
+    )
+    c = _header(
+        "INIT-0003/README.md", "# INIT-0003: C", "**Status**: 🔵", "**Requires**: INIT-0002"
+    )
+    index = TicketIndex([a, b, c])
+
+    issues = check_dependency_graph(TicketGraph.from_index(index), index, WORKFLOW)
+
+    assert [(i.type, i.path) for i in issues] == [
+        ("dependency_cycle", "INIT-0002/README.md"),
+        ("unknown_dependency", "INIT-0001/README.md"),
+        ("unresolved_blocker", "INIT-0001/README.md"),
+    ]
+    assert issues[0].severity == "error"
+    assert "INIT-0009" in issues[1].message
+    assert issues[2].line == 2
+
+
+def test_misplaced_ticket() -> None:
+    """Ticket files must sit in their parent ticket's directory."""
+    task = _header(
+        "INIT-0001/EPIC-0001.1/STORY-0001.1.4/TASK-0001.1.3.1.md",
+        "# TASK-0001.1.3.1: Task",
+        "**Status**: 🔵 Not Started",
+    )
+    epic = _header("EPIC-0001.2/README.md", "# EPIC-0001.2: Epic", "**Status**: 🔵 Not Started")
+    bug = _header("INIT-0001/BUG-0001.md", "# BUG-0001: Bug", "**Status**: 🔵 Not Started")
+
+    messages = [i.message for h in (task, epic, bug) for i in check_ticket_file(h, WORKFLOW)]
+    assert messages == [
+        "TASK-0001.1.3.1 belongs under STORY-0001.1.3 but is in STORY-0001.1.4",
+        "EPIC-0001.2 belongs under INIT-0001 but is at the tickets root",
+        "BUG-0001 belongs at the tickets root but is in INIT-0001",
+    ]
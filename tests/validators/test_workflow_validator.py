@@ -0,0 +1,85 @@
+"""Unit tests for workflow.yaml validation."""
+
+import yaml
+
+from gitstory.core.workflow import DEFAULT_WORKFLOW
+from gitstory.validators.workflow_validator import validate_workflow
+
+VALID = yaml.safe_dump(DEFAULT_WORKFLOW, sort_keys=False, allow_unicode=True)
+
+
+def _types(result) -> list[str]:
+    return [issue.type for issue in result.errors]
+
+
+def test_default_workflow_is_valid() -> None:
+    """The default 4-state workflow (with backward transitions) passes."""
+    result = validate_workflow(VALID)
+    assert result.valid
+    assert result.to_dict() == {"valid": True, "errors": [], "warnings": []}
+
+
+def test_yaml_syntax_error_has_line() -> None:
+    """Invalid YAML reports yaml_syntax with a line number."""
+    result = validate_workflow("metadata:\n  config_version: '1.0'\n bad: [\n")
+    assert _types(result) == ["yaml_syntax"]
+    assert result.errors[0].line is not None
+
+
+def test_non_mapping_workflow() -> None:
+    """A YAML scalar or list is not a workflow."""
+    assert _types(validate_workflow("- a\n- b\n")) == ["invalid_structure"]
+    assert _types(validate_workflow("")) == ["invalid_structure"]
+
+
+def test_missing_config_version() -> None:
+    """Missing metadata.config_version is reported."""
+    content = VALID.replace("  config_version: '1.0'\n", "")
+    result = validate_workflow(content)
+    assert "missing_field" in _types(result)
+    assert any("metadata.config_version" in e.message for e in result.errors)
+
+
+def test_unsupported_config_version_line() -> None:
+    """Unsupported versions are reported at the config_version line."""
+    result = validate_workflow(VALID.replace("config_version: '1.0'", "config_version: '9.9'"))
+    assert _types(result) == ["unsupported_version"]
+    assert result.errors[0].line == 2
+
+
+def test_missing_sections() -> None:
+    """Missing metadata and workflow sections are reported."""
+    assert _types(validate_workflow("other: 1\n")) == ["missing_section", "missing_section"]
+
+
+def test_no_states() -> None:
+    """A workflow without states is reported."""
+    content = "metadata:\n  config_version: '1.0'\nworkflow:\n  states: {}\n"
+    assert _types(validate_workflow(content)) == ["no_states"]
+
+
+def test_undefined_state_reference_has_transition_line() -> None:
+    """Transitions to undefined states are reported at the transition line."""
+    content = VALID.replace("    to: done\n    guards:", "    to: nonexistent_state\n    guards:")
+    result = validate_workflow(content)
+    undefined = [e for e in result.errors if e.type == "undefined_state"]
+    assert len(undefined) == 1
+    assert "nonexistent_state" in undefined[0].message
+    assert content.splitlines()[undefined[0].line - 1].strip() == "- id: complete_work"
+
+
+def test_unreachable_state_and_missing_start() -> None:
+    """States without inbound transitions and missing start/end states are reported."""
+    content = (
+        "metadata:\n  config_version: '1.0'\n"
+        "workflow:\n  states:\n"
+        "    todo: {type: active}\n"
+        "    abandoned: {type: active}\n"
+        "  transitions:\n"
+        "    - {id: t, from: abandoned, to: todo}\n"
+    )
+    result = validate_workflow(content, path="wf.yaml")
+    assert _types(result) == ["no_start_state", "no_end_state", "unreachable_state"]
+    unreachable = result.errors[-1]
+    assert unreachable.line == 6
+    assert unreachable.path == "wf.yaml"